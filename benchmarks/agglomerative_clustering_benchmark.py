@@ -0,0 +1,105 @@
+"""Benchmark of the agglomerative clustering engines run time and peak memory.
+
+The script generates Gaussian blobs of embedding-like points and clusters them with
+the exact, k nearest neighbours graph and two-stage engines, with the default
+cosine metric, average linkage and a distance threshold. Each run happens in a fresh
+process, which reports its run time, its peak resident memory before the clustering
+(imports and points) and after it, and the adjusted Rand index against the blobs.
+The exact engine needs quadratic memory and the k nearest neighbours graph is computed
+by brute force, so they are skipped above --max-exact-points and --max-knn-points.
+Runs whose process is killed, e.g., by lack of memory, are reported as failed.
+
+Usage: python -m benchmarks.agglomerative_clustering_benchmark --nb-points 10000 100000 1000000
+"""
+import argparse
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple
+
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+
+from olaf.algorithm import AgglomerativeClustering
+
+
+def run_clustering(
+    nb_points: int, engine: str, args: argparse.Namespace
+) -> Tuple[float, float, float, int, float]:
+    """Cluster generated points and return the run time, the peak resident memory in MB
+    before and after the clustering, the number of clusters and the adjusted Rand index."""
+    points, blobs = make_blobs(
+        nb_points, n_features=args.dim, centers=args.nb_blobs, random_state=0
+    )
+    base_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+    start = time.perf_counter()
+    clustering = AgglomerativeClustering(
+        points,
+        nb_clusters=None,
+        distance_threshold=args.distance_threshold,
+        engine=engine,
+        nb_neighbours=args.nb_neighbours,
+        nb_centroids=args.nb_centroids,
+    )
+    clustering.compute_agglomerative_clustering()
+    run_time = time.perf_counter() - start
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+    labels = clustering.clustering_labels
+    return (
+        run_time,
+        base_memory,
+        peak_memory,
+        len(set(labels)),
+        adjusted_rand_score(blobs, labels),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nb-points", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--nb-blobs", type=int, default=50)
+    parser.add_argument("--distance-threshold", type=float, default=0.5)
+    parser.add_argument("--nb-neighbours", type=int, default=15)
+    parser.add_argument("--nb-centroids", type=int, default=1000)
+    parser.add_argument("--max-exact-points", type=int, default=30000)
+    parser.add_argument("--max-knn-points", type=int, default=100000)
+    args = parser.parse_args()
+
+    max_points = {
+        "exact": args.max_exact_points,
+        "knn_graph": args.max_knn_points,
+        "two_stage": None,
+    }
+
+    print(
+        f"{'nb points':>9} | {'engine':>9} | {'time (s)':>8} | {'base (MB)':>9} | "
+        f"{'peak (MB)':>9} | {'nb clusters':>11} | {'ARI':>5}"
+    )
+    spawn_context = multiprocessing.get_context("spawn")
+    for nb_points in args.nb_points:
+        for engine, engine_max_points in max_points.items():
+            if engine_max_points is not None and nb_points > engine_max_points:
+                print(f"{nb_points:>9} | {engine:>9} | {'skipped':>8} |")
+                continue
+
+            try:
+                with ProcessPoolExecutor(1, mp_context=spawn_context) as executor:
+                    run_time, base_memory, peak_memory, nb_clusters, ari = (
+                        executor.submit(run_clustering, nb_points, engine, args).result()
+                    )
+            except BrokenProcessPool:
+                # The run process was killed, usually when running out of memory.
+                print(f"{nb_points:>9} | {engine:>9} | {'failed':>8} |")
+                continue
+            print(
+                f"{nb_points:>9} | {engine:>9} | {run_time:>8.1f} | {base_memory:>9.0f} | "
+                f"{peak_memory:>9.0f} | {nb_clusters:>11} | {ari:>5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
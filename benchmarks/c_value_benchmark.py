@@ -0,0 +1,83 @@
+"""Benchmark of the C-value engines.
+
+The script generates synthetic space-tokenised token sequences with a Zipf distributed
+vocabulary, computes the C-values with Cvalue, Cvalue counting the terms with several
+processes and VectorisedCvalue, checks that the engines return the same C-values and reports
+their run times.
+
+Usage: python -m benchmarks.c_value_benchmark --nb-sequences 100000 500000 --n-process 4
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from olaf.algorithm import Cvalue, VectorisedCvalue
+
+
+def generate_token_sequences(
+    nb_sequences: int, vocabulary_size: int, max_sequence_length: int
+) -> List[str]:
+    """Generate space-tokenised token sequences with a Zipf distributed vocabulary."""
+    rng = np.random.default_rng(42)
+    vocabulary = np.array([f"token{i}" for i in range(vocabulary_size)])
+    token_sequences = []
+    for _ in range(nb_sequences):
+        token_ranks = rng.zipf(1.3, size=rng.integers(1, max_sequence_length + 1))
+        token_ids = np.minimum(token_ranks, vocabulary_size) - 1
+        token_sequences.append(" ".join(vocabulary[token_ids]))
+    return token_sequences
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nb-sequences", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--vocabulary-size", type=int, default=20000)
+    parser.add_argument("--max-sequence-length", type=int, default=12)
+    parser.add_argument("--max-term-token-length", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=2.0)
+    parser.add_argument("--n-process", type=int, default=4)
+    args = parser.parse_args()
+
+    engines = {
+        "Cvalue (s)": lambda **kwargs: Cvalue(**kwargs),
+        f"Cvalue {args.n_process} proc (s)": lambda **kwargs: Cvalue(
+            n_process=args.n_process, **kwargs
+        ),
+        "Vectorised (s)": lambda **kwargs: VectorisedCvalue(**kwargs),
+    }
+
+    print(f"{'nb sequences':>12} | " + " | ".join(engines))
+    for nb_sequences in args.nb_sequences:
+        token_sequences = generate_token_sequences(
+            nb_sequences, args.vocabulary_size, args.max_sequence_length
+        )
+
+        run_times = []
+        c_values = []
+        for engine in engines.values():
+            start = time.perf_counter()
+            c_value = engine(
+                corpus_terms=token_sequences,
+                max_term_token_length=args.max_term_token_length,
+                c_value_threshold=args.threshold,
+            )
+            c_value.compute_c_values()
+            run_times.append(time.perf_counter() - start)
+            c_values.append(c_value.c_values)
+
+        assert all(
+            engine_c_values == c_values[0] for engine_c_values in c_values
+        ), "The C-value engines results differ."
+        print(
+            f"{nb_sequences:>12} | "
+            + " | ".join(
+                f"{run_time:>{len(name)}.2f}"
+                for name, run_time in zip(engines, run_times)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark of the ConceptNet snapshot knowledge source build time and lookup latency.
+
+The script writes a synthetic ConceptNet assertions dump, with external URLs, synonyms,
+antonyms and IsA edges between random terms, and builds its snapshot. It then reports the
+mean time per term of the external concepts matching and of the synonyms, hypernyms and
+hyponyms lookups, for single terms and for batches of terms.
+A real dump, e.g., conceptnet-assertions-5.7.0.csv.gz, can be benchmarked with --dump.
+
+Usage: python -m benchmarks.conceptnet_snapshot_benchmark --nb-terms 100000 1000000
+"""
+import argparse
+import gzip
+import os
+import random
+import tempfile
+import time
+
+from olaf.repository.knowledge_source.conceptnet_snapshot_kg import (
+    ConceptNetSnapshotKnowledgeResource,
+    build_conceptnet_snapshot,
+)
+
+
+def write_dump(dump_path: str, nb_terms: int, seed: int = 0) -> None:
+    """Write a synthetic ConceptNet assertions dump with about 5 edges per term."""
+    rng = random.Random(seed)
+    with gzip.open(dump_path, "wt", encoding="utf8") as dump_file:
+        for term_id in range(nb_terms):
+            start = f"/c/en/term_{term_id}/n"
+            edges = [
+                ("/r/ExternalURL", f"http://dbpedia.org/resource/Term_{term_id}"),
+                ("/r/Synonym", f"/c/en/term_{rng.randrange(nb_terms)}/n"),
+                ("/r/Antonym", f"/c/en/term_{rng.randrange(nb_terms)}"),
+                ("/r/IsA", f"/c/en/term_{rng.randrange(nb_terms)}/n"),
+                ("/r/RelatedTo", f"/c/fr/terme_{rng.randrange(nb_terms)}"),
+            ]
+            for rel, end in edges:
+                dump_file.write(f"/a/[{rel},{start},{end}]\t{rel}\t{start}\t{end}\t{{}}\n")
+
+
+def time_lookup(lookup, term_batches) -> float:
+    """Return the mean time per term in microseconds of a lookup over term batches."""
+    start = time.perf_counter()
+    for terms in term_batches:
+        lookup(terms)
+    nb_terms = sum(len(terms) for terms in term_batches)
+    return (time.perf_counter() - start) / nb_terms * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nb-terms", type=int, nargs="+", default=[100000])
+    parser.add_argument("--dump", help="A ConceptNet dump to benchmark instead.")
+    parser.add_argument("--nb-lookups", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"{'nb terms':>9} | {'build (s)':>9} | {'size (MB)':>9} | {'lookup':>10} | "
+        f"{'single (µs)':>11} | {'batch (µs)':>10}"
+    )
+    for nb_terms in [None] if args.dump else args.nb_terms:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_path = args.dump
+            if dump_path is None:
+                dump_path = os.path.join(tmp_dir, "assertions.csv.gz")
+                write_dump(dump_path, nb_terms)
+            snapshot_path = os.path.join(tmp_dir, "conceptnet.db")
+
+            start = time.perf_counter()
+            build_conceptnet_snapshot(dump_path, snapshot_path, langs={"en"})
+            build_time = time.perf_counter() - start
+            snapshot_size = os.path.getsize(snapshot_path) / 1e6
+
+            kg = ConceptNetSnapshotKnowledgeResource(snapshot_path)
+            rng = random.Random(1)
+            query_range = nb_terms if nb_terms else 100000
+            terms = [
+                f"term {rng.randrange(query_range)}" for _ in range(args.nb_lookups)
+            ]
+            single_batches = [{term} for term in terms]
+            batches = [
+                set(terms[batch_start : batch_start + args.batch_size])
+                for batch_start in range(0, len(terms), args.batch_size)
+            ]
+
+            lookups = {
+                "match": kg.match_external_concepts,
+                "synonyms": kg.fetch_terms_synonyms,
+                "hypernyms": kg.fetch_terms_hypernyms,
+                "hyponyms": kg.fetch_terms_hyponyms,
+            }
+            for lookup_name, lookup in lookups.items():
+                print(
+                    f"{str(nb_terms or 'dump'):>9} | {build_time:>9.1f} | "
+                    f"{snapshot_size:>9.0f} | {lookup_name:>10} | "
+                    f"{time_lookup(lookup, single_batches):>11.1f} | "
+                    f"{time_lookup(lookup, batches):>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of the corpus loaders parsing throughput.
+
+The script generates a synthetic text corpus (one document per line), loads it with a
+TextCorpusLoader for each requested number of processes and batch size and reports the
+number of documents parsed per second. A blank pipeline can be used with
+--spacy-model blank:en.
+
+Usage: python -m benchmarks.corpus_loader_benchmark --nb-docs 20000 --n-process 1 2 4
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import spacy
+
+from olaf.repository.corpus_loader import TextCorpusLoader
+
+WORDS = [
+    "pizza",
+    "cheese",
+    "tomato",
+    "sauce",
+    "oven",
+    "baked",
+    "crust",
+    "the",
+    "is",
+    "with",
+    "a",
+    "delicious",
+    "topping",
+    "italian",
+    "recipe",
+    "dough",
+]
+
+
+def generate_corpus_file(dir_path: str, nb_docs: int, doc_len: int) -> str:
+    """Write a synthetic corpus with one document per line."""
+    rand = random.Random(42)
+    file_path = os.path.join(dir_path, "benchmark_corpus.txt")
+    with open(file_path, "w", encoding="utf-8") as corpus_file:
+        for _ in range(nb_docs):
+            corpus_file.write(" ".join(rand.choices(WORDS, k=doc_len)) + ".\n")
+    return file_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--spacy-model", default="en_core_web_sm")
+    parser.add_argument("--nb-docs", type=int, default=10000)
+    parser.add_argument("--doc-len", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[256])
+    parser.add_argument("--n-process", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--disable", nargs="*", default=[])
+    args = parser.parse_args()
+
+    spacy_model = spacy.load(args.spacy_model)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_path = generate_corpus_file(tmp_dir, args.nb_docs, args.doc_len)
+
+        print(
+            f"{'n_process':>10} | {'batch_size':>10} | {'seconds':>8} | "
+            f"{'docs/sec':>9} | speedup"
+        )
+        reference_time = None
+        for n_process in args.n_process:
+            for batch_size in args.batch_size:
+                corpus_loader = TextCorpusLoader(
+                    corpus_path,
+                    n_process=n_process,
+                    batch_size=batch_size,
+                    disable=args.disable,
+                )
+                start = time.perf_counter()
+                corpus = corpus_loader(spacy_model)
+                elapsed = time.perf_counter() - start
+
+                reference_time = reference_time or elapsed
+                print(
+                    f"{n_process:>10} | {batch_size:>10} | {elapsed:>8.2f} | "
+                    f"{len(corpus) / elapsed:>9.1f} | x{reference_time / elapsed:.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark of the candidate term grouping on synonyms.
+
+The script generates enriched candidate terms whose synonyms are drawn from a shared
+vocabulary, groups them with group_cts_on_synonyms and, for the smaller sizes, with the
+former pairwise group comparison. It checks that both give the same groups and reports
+their run times.
+
+Usage: python -m benchmarks.group_cts_on_synonyms_benchmark --nb-cts 1000 10000 50000
+"""
+import argparse
+import random
+import time
+from typing import List, Set
+
+from olaf.commons.candidate_term_tools import (
+    check_ct_belongs_to_group,
+    group_cts_on_synonyms,
+)
+from olaf.data_container.candidate_term_schema import CandidateTerm
+from olaf.data_container.enrichment_schema import Enrichment
+
+
+def generate_candidate_terms(
+    nb_cts: int, nb_synonyms: int, vocabulary_size: int
+) -> Set[CandidateTerm]:
+    """Generate candidate terms enriched with random synonyms."""
+    rng = random.Random(42)
+    return {
+        CandidateTerm(
+            label=f"term{i}",
+            corpus_occurrences=set(),
+            enrichment=Enrichment(
+                {f"synonym{rng.randrange(vocabulary_size)}" for _ in range(nb_synonyms)}
+            ),
+        )
+        for i in range(nb_cts)
+    }
+
+
+def pairwise_group_cts_on_synonyms(
+    candidate_terms: Set[CandidateTerm],
+) -> List[Set[CandidateTerm]]:
+    """Former grouping, comparing each candidate term with every existing group."""
+    ct_labels = {}
+    for ct in candidate_terms:
+        ct_labels[ct] = {ct.label}
+        if ct.enrichment is not None:
+            ct_labels[ct].update(ct.enrichment.synonyms)
+
+    cts_groups = {}
+    for ct in candidate_terms:
+        match_cts = []
+        match_labels = set()
+        for ct_g, labels in cts_groups.items():
+            if check_ct_belongs_to_group(ct, ct_labels[ct], ct_g, labels):
+                match_cts.append(ct_g)
+                match_labels.update(labels)
+        if len(match_cts) == 0:
+            cts_groups[tuple([ct])] = ct_labels[ct]
+        else:
+            new_key = []
+            for key in match_cts:
+                del cts_groups[key]
+                keys = list(key)
+                keys.append(ct)
+                new_key.extend(keys)
+            match_labels.update(ct_labels[ct])
+            cts_groups[tuple(new_key)] = match_labels
+    return [set(cts_group) for cts_group in cts_groups.keys()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nb-cts", type=int, nargs="+", default=[1000, 5000, 50000])
+    parser.add_argument("--nb-synonyms", type=int, default=3)
+    parser.add_argument(
+        "--vocabulary-ratio",
+        type=float,
+        default=2.0,
+        help="Synonym vocabulary size relative to the number of candidate terms.",
+    )
+    parser.add_argument(
+        "--max-pairwise-cts",
+        type=int,
+        default=5000,
+        help="Largest number of candidate terms grouped with the former pairwise grouping.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'nb cts':>8} | {'nb groups':>9} | {'pairwise (s)':>12} | {'indexed (s)':>11}")
+    for nb_cts in args.nb_cts:
+        candidate_terms = generate_candidate_terms(
+            nb_cts, args.nb_synonyms, int(nb_cts * args.vocabulary_ratio)
+        )
+
+        start = time.perf_counter()
+        groups = group_cts_on_synonyms(candidate_terms)
+        indexed_time = time.perf_counter() - start
+
+        pairwise_time = float("nan")
+        if nb_cts <= args.max_pairwise_cts:
+            start = time.perf_counter()
+            pairwise_groups = pairwise_group_cts_on_synonyms(candidate_terms)
+            pairwise_time = time.perf_counter() - start
+            assert set(map(frozenset, groups)) == set(
+                map(frozenset, pairwise_groups)
+            ), "The candidate term groupings differ."
+
+        print(
+            f"{nb_cts:>8} | {len(groups):>9} | {pairwise_time:>12.2f} | {indexed_time:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of the corpus loaders peak memory, with and without streaming.
+
+For growing synthetic corpora, the script reports the Python heap peak (tracemalloc) of
+reading all the texts at once versus streaming them, and of parsing the corpus with
+CorpusLoader.iter_docs when documents are consumed one by one.
+
+Usage: python -m benchmarks.streaming_corpus_loader_benchmark --nb-docs 10000 50000 100000
+"""
+import argparse
+import tempfile
+import tracemalloc
+from typing import Callable
+
+import spacy
+
+from benchmarks.corpus_loader_benchmark import generate_corpus_file
+from olaf.repository.corpus_loader import TextCorpusLoader
+
+
+def peak_memory_mb(funct: Callable[[], None]) -> float:
+    """Run a function and return the Python heap peak in MB."""
+    tracemalloc.start()
+    funct()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def consume(iterable) -> None:
+    """Iterate over all the elements without keeping them."""
+    for _ in iterable:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--spacy-model", default="en_core_web_sm")
+    parser.add_argument("--nb-docs", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--doc-len", type=int, default=50)
+    args = parser.parse_args()
+
+    spacy_model = spacy.load(args.spacy_model)
+
+    print(
+        f"{'nb docs':>8} | {'read (MB)':>9} | {'stream (MB)':>11} | {'iter_docs (MB)':>14}"
+    )
+    for nb_docs in args.nb_docs:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            corpus_path = generate_corpus_file(tmp_dir, nb_docs, args.doc_len)
+            corpus_loader = TextCorpusLoader(corpus_path, streaming=True)
+
+            read_peak = peak_memory_mb(corpus_loader._read_corpus)
+            stream_peak = peak_memory_mb(lambda: consume(corpus_loader._iter_corpus()))
+            docs_peak = peak_memory_mb(
+                lambda: consume(corpus_loader.iter_docs(spacy_model))
+            )
+
+        print(
+            f"{nb_docs:>8} | {read_peak:>9.2f} | {stream_peak:>11.2f} | {docs_peak:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark of the TF-IDF term extraction peak memory.
+
+For growing vocabulary sizes, the script fits the TFIDFTermExtraction vectorizer on synthetic
+token sequences and reports the Python heap peak (tracemalloc) of aggregating the TF-IDF
+values on the densified matrix, as done before, versus directly on the sparse matrix.
+It also reports the peak of the whole candidate term extraction with the TF-IDF vectorizer
+versus in streaming mode.
+
+Usage: python -m benchmarks.tfidf_memory_benchmark --vocabulary-size 10000 50000 100000
+"""
+import argparse
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.c_value_benchmark import generate_token_sequences
+from olaf.pipeline.pipeline_component.term_extraction.tfidf_term_extraction import (
+    TFIDFTermExtraction,
+)
+
+
+def peak_memory_mb(funct: Callable[[], None]) -> float:
+    """Run a function and return the Python heap peak in MB."""
+    tracemalloc.start()
+    funct()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def dense_aggregation(tfidf_matrix, tfidf_agg_type: str) -> np.ndarray:
+    """Aggregate the TF-IDF values on the densified matrix."""
+    dense_tfidf_matrix = tfidf_matrix.toarray()
+    if tfidf_agg_type == "MEAN":
+        return dense_tfidf_matrix.sum(axis=0) / np.count_nonzero(
+            dense_tfidf_matrix, axis=0
+        )
+    return dense_tfidf_matrix.max(axis=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--vocabulary-size", type=int, nargs="+", default=[5000, 20000, 50000]
+    )
+    parser.add_argument("--nb-sequences", type=int, default=5000)
+    parser.add_argument("--max-sequence-length", type=int, default=12)
+    parser.add_argument("--max-term-token-length", type=int, default=3)
+    parser.add_argument("--tfidf-agg-type", choices=["MEAN", "MAX"], default="MEAN")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{'vocabulary':>10} | {'nb terms':>9} | {'dense (MB)':>10} | {'sparse (MB)':>11} | "
+        f"{'extraction (MB)':>15} | {'streaming (MB)':>14}"
+    )
+    for vocabulary_size in args.vocabulary_size:
+        token_sequences = generate_token_sequences(
+            args.nb_sequences, vocabulary_size, args.max_sequence_length
+        )
+        term_extraction = TFIDFTermExtraction(
+            max_term_token_length=args.max_term_token_length,
+            tfidf_agg_type=args.tfidf_agg_type,
+        )
+        tfidf_matrix = term_extraction.tfidf_vectorizer.fit_transform(token_sequences)
+
+        dense_peak = peak_memory_mb(
+            lambda: dense_aggregation(tfidf_matrix, args.tfidf_agg_type)
+        )
+        sparse_peak = peak_memory_mb(
+            lambda: term_extraction._aggregate_tfidf_values(tfidf_matrix)
+        )
+
+        extraction_peak = peak_memory_mb(
+            lambda: term_extraction._extract_candidate_terms(token_sequences)
+        )
+        streaming_term_extraction = TFIDFTermExtraction(
+            max_term_token_length=args.max_term_token_length,
+            tfidf_agg_type=args.tfidf_agg_type,
+            streaming=True,
+            batch_size=args.batch_size,
+        )
+        streaming_peak = peak_memory_mb(
+            lambda: streaming_term_extraction._extract_candidate_terms(token_sequences)
+        )
+
+        print(
+            f"{vocabulary_size:>10} | {tfidf_matrix.shape[1]:>9} | "
+            f"{dense_peak:>10.2f} | {sparse_peak:>11.2f} | "
+            f"{extraction_peak:>15.2f} | {streaming_peak:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -66,6 +66,16 @@ def show_pipeline(args):
     getattr(module, "PipelineRunner")().describe()
 
 
+def build_conceptnet_snapshot(args):
+    from olaf.repository.knowledge_source import conceptnet_snapshot_kg
+
+    print(f"\nBuilding ConceptNet snapshot {args.snapshot} from {args.dump}")
+    nb_edges = conceptnet_snapshot_kg.build_conceptnet_snapshot(
+        args.dump, args.snapshot, langs=set(args.lang) if args.lang else None
+    )
+    print(f"{nb_edges} edges stored.")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Shortcuts for pipeline demonstration."
@@ -85,6 +95,21 @@ def main():
     show_parser = subparsers.add_parser("show", help="Describe a pipeline.")
     show_parser.add_argument("pipeline", help="The pipeline to show.")
 
+    # Subparser for the "build-conceptnet-snapshot" command
+    snapshot_parser = subparsers.add_parser(
+        "build-conceptnet-snapshot",
+        help="Build an offline ConceptNet snapshot from a ConceptNet dump.",
+    )
+    snapshot_parser.add_argument(
+        "dump", help="The ConceptNet assertions dump or edge list, gzipped or not."
+    )
+    snapshot_parser.add_argument("snapshot", help="The snapshot file to create.")
+    snapshot_parser.add_argument(
+        "--lang",
+        nargs="+",
+        help="Languages of the edges to keep, all languages by default.",
+    )
+
     # Parse the arguments
     args = parser.parse_args()
 
@@ -106,6 +131,8 @@ def main():
                 show_pipeline(pipeline)
         else:
             show_pipeline(args)
+    elif args.command == "build-conceptnet-snapshot":
+        build_conceptnet_snapshot(args)
 
 
 if __name__ == "__main__":
@@ -1,2 +1,3 @@
 from .agglomerative_clustering import AgglomerativeClustering
 from .c_value import Cvalue
+from .vectorised_c_value import VectorisedCvalue
@@ -1,10 +1,34 @@
 from typing import Any, List, Optional
 
-from sklearn import cluster
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components, minimum_spanning_tree
+from sklearn import base, cluster, config_context
+from sklearn.metrics import pairwise_distances
+from sklearn.metrics.pairwise import paired_distances
+from sklearn.neighbors import kneighbors_graph
+from sklearn.preprocessing import normalize
+
+CLUSTERING_ENGINES = {"exact", "knn_graph", "two_stage"}
+# Memory in MB of the pairwise distances chunks of the nearest neighbours search.
+KNN_WORKING_MEMORY = 128
+# Number of graph edges whose distances are computed at once.
+EDGE_BATCH_SIZE = 100000
 
 
 class AgglomerativeClustering:
-    """Implementation of agglomerative clustering algorithm."""
+    """Implementation of agglomerative clustering algorithm.
+
+    Three engines are available:
+
+    - "exact" runs the agglomerative clustering on all the instances. It needs the full
+      pairwise distance matrix, i.e., quadratic memory.
+    - "knn_graph" constrains the merges to the k nearest neighbours graph of the instances.
+      The linkage only keeps the graph edges, i.e., linear memory in the number of instances.
+    - "two_stage" summarises the instances with mini-batch k-means centroids and runs the
+      exact agglomerative clustering on the centroids. Each instance gets the cluster of its
+      centroid. The distance threshold applies to the distances between centroids.
+    """
 
     def __init__(
         self,
@@ -13,6 +37,10 @@ class AgglomerativeClustering:
         metric: Optional[str] = "cosine",
         linkage: Optional[str] = "average",
         distance_threshold: Optional[float] = None,
+        engine: Optional[str] = "exact",
+        nb_neighbours: Optional[int] = 15,
+        nb_centroids: Optional[int] = 1000,
+        random_state: Optional[int] = 0,
     ) -> None:
         """Initialise agglomerative clustering instance.
 
@@ -28,6 +56,14 @@ class AgglomerativeClustering:
             Type of linkage used for the algorithm, by default "average".
         distance_threshold: float, optional
             Distance threshold to stop the clustering, by default None.
+        engine: str, optional
+            Clustering engine, "exact", "knn_graph" or "two_stage", by default "exact".
+        nb_neighbours: int, optional
+            Number of neighbours of each instance in the "knn_graph" engine graph, by default 15.
+        nb_centroids: int, optional
+            Number of k-means centroids of the "two_stage" engine, by default 1000.
+        random_state: int, optional
+            Seed of the "two_stage" engine k-means, by default 0.
 
         Raises
         ------
@@ -39,12 +75,31 @@ class AgglomerativeClustering:
         self.metric = metric
         self.linkage = linkage
         self.distance_threshold = distance_threshold
+        self.engine = engine
+        self.nb_neighbours = nb_neighbours
+        self.nb_centroids = nb_centroids
+        self.random_state = random_state
+        self._clustering_labels = None
 
         if not (self.nb_clusters) and not (distance_threshold):
             raise AttributeError(
                 "Attributes nb_clusters and distance_threshold cannot be both set to None."
             )
 
+        if self.engine not in CLUSTERING_ENGINES:
+            raise AttributeError(
+                f"Attribute engine should be one of {sorted(CLUSTERING_ENGINES)}."
+            )
+
+        if (
+            self.engine == "two_stage"
+            and self.nb_clusters
+            and self.nb_clusters > self.nb_centroids
+        ):
+            raise AttributeError(
+                "Attribute nb_clusters cannot be greater than nb_centroids."
+            )
+
         self.clustering = cluster.AgglomerativeClustering(
             n_clusters=self.nb_clusters,
             metric=self.metric,
@@ -54,7 +109,186 @@ class AgglomerativeClustering:
 
     def compute_agglomerative_clustering(self) -> None:
         """Method used to compute the agglomerative clustering on the training instances."""
-        self.clustering.fit(self.training_instances)
+        if self.engine == "knn_graph":
+            self._compute_knn_graph_clustering()
+        elif self.engine == "two_stage":
+            self._compute_two_stage_clustering()
+        else:
+            self.clustering.fit(self.training_instances)
+            self._clustering_labels = self.clustering.labels_
+
+    def _compute_knn_graph_clustering(self) -> None:
+        """Compute the agglomerative clustering with merges constrained to the symmetric
+        k nearest neighbours graph of the training instances."""
+        instances = np.asarray(self.training_instances)
+        # The neighbours are searched by chunks of pairwise distances bounded in memory.
+        with config_context(working_memory=KNN_WORKING_MEMORY):
+            connectivity = kneighbors_graph(
+                instances,
+                n_neighbors=min(self.nb_neighbours, len(instances) - 1),
+                metric=self.metric,
+                include_self=False,
+            )
+        connectivity = connectivity.maximum(connectivity.T)
+
+        nb_components, component_labels = connected_components(
+            connectivity, directed=False
+        )
+        if nb_components > 1:
+            connectivity = connectivity + self._connect_components(
+                instances, nb_components, component_labels
+            )
+
+        if self.distance_threshold is not None and self.linkage != "ward":
+            self._clustering_labels = self._fit_threshold_components(
+                instances, connectivity
+            )
+        else:
+            self.clustering.set_params(connectivity=connectivity)
+            self.clustering.fit(instances)
+            self._clustering_labels = self.clustering.labels_
+
+    def _fit_threshold_components(
+        self, instances: np.ndarray, connectivity: sparse.csr_matrix
+    ) -> np.ndarray:
+        """Cluster separately the connected components of the graph edges shorter than the
+        distance threshold.
+
+        With a connectivity graph, the distance between two clusters is an average, a
+        minimum or a maximum of the graph edges distances between them. Two clusters closer
+        than the distance threshold are thus linked by an edge shorter than the threshold,
+        and clusters never span several components. Clustering the components separately
+        gives the same clusters while bounding the linkage memory by the largest component.
+
+        Parameters
+        ----------
+        instances : np.ndarray
+            The training instances.
+        connectivity : sparse.csr_matrix
+            The connectivity graph of the training instances.
+
+        Returns
+        -------
+        np.ndarray
+            The cluster label of each training instance.
+        """
+        nb_instances = len(instances)
+        edges = sparse.triu(connectivity, k=1).tocoo()
+        edge_distances = np.concatenate(
+            [
+                paired_distances(
+                    instances[edges.row[batch_start : batch_start + EDGE_BATCH_SIZE]],
+                    instances[edges.col[batch_start : batch_start + EDGE_BATCH_SIZE]],
+                    metric=self.metric,
+                )
+                for batch_start in range(0, max(edges.nnz, 1), EDGE_BATCH_SIZE)
+            ]
+        )
+        close_edges = edge_distances < self.distance_threshold
+        nb_components, component_labels = connected_components(
+            sparse.coo_matrix(
+                (
+                    np.ones(close_edges.sum()),
+                    (edges.row[close_edges], edges.col[close_edges]),
+                ),
+                shape=(nb_instances, nb_instances),
+            ),
+            directed=False,
+        )
+
+        # Instances alone in their component are clusters on their own.
+        component_sizes = np.bincount(component_labels, minlength=nb_components)
+        component_offsets = np.concatenate(([0], np.cumsum(component_sizes)))
+        instance_order = np.argsort(component_labels, kind="stable")
+        clustering_labels = component_labels.copy()
+        next_label = nb_components
+        for component in np.flatnonzero(component_sizes > 1):
+            component_instances = instance_order[
+                component_offsets[component] : component_offsets[component + 1]
+            ]
+            component_clustering = base.clone(self.clustering).set_params(
+                connectivity=connectivity[component_instances][:, component_instances]
+            )
+            component_clustering.fit(instances[component_instances])
+            clustering_labels[component_instances] = (
+                component_clustering.labels_ + next_label
+            )
+            next_label += component_clustering.labels_.max() + 1
+
+        return np.unique(clustering_labels, return_inverse=True)[1]
+
+    def _connect_components(
+        self, instances: np.ndarray, nb_components: int, component_labels: np.ndarray
+    ) -> sparse.csr_matrix:
+        """Link the connected components of the k nearest neighbours graph.
+
+        Each component is represented by its instance closest to the component mean and the
+        representatives are linked along their minimum spanning tree. The linkage would
+        otherwise link the components by computing the distances between all their
+        instances.
+
+        Parameters
+        ----------
+        instances : np.ndarray
+            The training instances.
+        nb_components : int
+            Number of connected components of the graph.
+        component_labels : np.ndarray
+            The connected component of each instance.
+
+        Returns
+        -------
+        sparse.csr_matrix
+            The adjacency matrix of the edges linking the components.
+        """
+        component_sizes = np.bincount(component_labels, minlength=nb_components)
+        component_means = np.zeros((nb_components, instances.shape[1]))
+        np.add.at(component_means, component_labels, instances)
+        component_means /= component_sizes[:, np.newaxis]
+
+        mean_distances = paired_distances(
+            instances, component_means[component_labels], metric=self.metric
+        )
+        instance_order = np.lexsort((mean_distances, component_labels))
+        representatives = instance_order[
+            np.concatenate(([0], np.cumsum(component_sizes)[:-1]))
+        ]
+
+        spanning_tree = minimum_spanning_tree(
+            pairwise_distances(instances[representatives], metric=self.metric)
+        ).tocoo()
+        nb_instances = len(instances)
+        links = sparse.coo_matrix(
+            (
+                np.ones(spanning_tree.nnz),
+                (
+                    representatives[spanning_tree.row],
+                    representatives[spanning_tree.col],
+                ),
+            ),
+            shape=(nb_instances, nb_instances),
+        )
+        return (links + links.T).tocsr()
+
+    def _compute_two_stage_clustering(self) -> None:
+        """Compute the agglomerative clustering of the mini-batch k-means centroids of the
+        training instances and assign each instance the cluster of its centroid."""
+        instances = np.asarray(self.training_instances, dtype=np.float64)
+        if self.metric == "cosine":
+            instances = normalize(instances)
+
+        kmeans = cluster.MiniBatchKMeans(
+            n_clusters=min(self.nb_centroids, len(instances)),
+            random_state=self.random_state,
+            n_init=3,
+        )
+        centroid_assignments = kmeans.fit_predict(instances)
+
+        self.clustering.fit(kmeans.cluster_centers_)
+        # Centroids without instances may leave gaps in the cluster labels.
+        self._clustering_labels = np.unique(
+            self.clustering.labels_[centroid_assignments], return_inverse=True
+        )[1]
 
     @property
     def clustering_labels(self) -> List[int]:
@@ -65,4 +299,4 @@ class AgglomerativeClustering:
         List[int]
             List of cluster labels found for each training instance.
         """
-        return self.clustering.labels_
+        return self._clustering_labels
@@ -1,12 +1,85 @@
 from collections import Counter, defaultdict
-from typing import List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, Optional, Set, Tuple
 import math
+import os
 
 from nltk.util import ngrams as nltk_ngrams
 
 from ..commons.logging_config import logger
 
 
+def count_terms_string_tokens(
+    corpus_terms: Iterable[str],
+    max_term_token_length: Optional[int] = None,
+    stop_list: Optional[Set[str]] = set(),
+) -> Counter:
+    """Extract terms string tokens from space-tokenised strings and count their occurrences.
+    The counters of consecutive shards of strings can be merged with merge_terms_counters into
+    the counter of the whole strings.
+
+    Parameters
+    ----------
+    corpus_terms : Iterable[str]
+        The strings to extract the terms from.
+    max_term_token_length : int, optional
+        The maximum number of tokens a term can have, by default None.
+    stop_list : Set[str], optional
+        A set of stop words that should not appear in a term, by default set().
+
+    Returns
+    -------
+    Counter
+        The mapping of terms string tokens to their occurrences, in order of first appearance.
+    """
+    all_terms_string_tokens = []
+
+    # provide a maximum token length in case none have been given.
+    # arbitrary value to act as if there were no maximum token length limit.
+    max_term_token_length = max_term_token_length if max_term_token_length else 100
+
+    for term in corpus_terms:
+        term_tokens = term.split()
+        if len(term_tokens) > 1:
+
+            # avoid adding terms longer than the max token length
+            if len(term_tokens) <= max_term_token_length:
+                all_terms_string_tokens.append(tuple(term_tokens))
+
+            for i in range(2, min(max_term_token_length, len(term_tokens))):
+                i_length_token_seqs = nltk_ngrams(term_tokens, i)
+                terms_tokens = [
+                    tuple(tokens)
+                    for tokens in i_length_token_seqs
+                    if not set(tokens).intersection(stop_list)
+                ]
+                all_terms_string_tokens.extend(terms_tokens)
+
+    return Counter(all_terms_string_tokens)
+
+
+def merge_terms_counters(terms_counters: Iterable[Counter]) -> Counter:
+    """Merge the terms counters of consecutive shards of strings.
+    Counters must be given in the order of the shards so that the terms keep their order of
+    first appearance.
+
+    Parameters
+    ----------
+    terms_counters : Iterable[Counter]
+        The terms counters of the shards, in the shards order.
+
+    Returns
+    -------
+    Counter
+        The terms counter of the whole strings.
+    """
+    merged_terms_counter = Counter()
+    for terms_counter in terms_counters:
+        merged_terms_counter.update(terms_counter)
+    return merged_terms_counter
+
+
 class Cvalue:
     """A class to extract terms form a list of strings and compute the C-values of those.
        The C-values are computed based on <https://doi.org/10.1007/s007999900023>.
@@ -24,6 +97,10 @@ class Cvalue:
         Tuple of terms string tokens to compute the C-values with.
     c_value_threshold: float
         A threshold to decide wether or not a term should be added to the candidate terms.
+    n_process: int
+        Number of processes used to count the terms, -1 to use all the cores.
+    shard_size: int
+        Number of strings counted by a process at a time.
     candidate_terms: Tuple[str]
         The tuple of selected candidate terms.
     _terms_counter: Counter
@@ -41,6 +118,8 @@ class Cvalue:
         stop_list: Optional[Set[str]] = set(),
         # value to act as if there was no threshold
         c_value_threshold: Optional[float] = 0.0,
+        n_process: Optional[int] = 1,
+        shard_size: Optional[int] = None,
     ) -> None:
         """Initialise Cvalue instance.
 
@@ -57,6 +136,12 @@ class Cvalue:
         c_value_threshold : float, optional
             A threshold to decide wether or not a term should be added to the candidate terms, by default 0.0.
             The default value is set to 0.0 if there is no threshold.
+        n_process : int, optional
+            Number of processes used to count the terms, -1 to use all the cores, by default 1.
+            The strings are split in shards counted separately and the counts are merged.
+        shard_size : int, optional
+            Number of strings counted by a process at a time, by default None which splits the
+            strings in 4 shards per process.
         """
         self.corpus_terms = corpus_terms
 
@@ -67,6 +152,8 @@ class Cvalue:
 
         self.stop_list = stop_list
         self.c_value_threshold = c_value_threshold
+        self.n_process = os.cpu_count() if n_process == -1 else n_process
+        self.shard_size = shard_size
 
         self._candidate_terms = None
         self._c_values = None
@@ -145,37 +232,35 @@ class Cvalue:
 
     def _extract_and_count_terms_string_tokens(self) -> None:
         """Extract terms string tokens from the strings provided as input and count their occurrences.
+        If several processes are used, shards of strings are counted in parallel and
+        the shards counts are merged.
 
         The method sets the following attributes:
         - self._terms_counter
         - self._terms_string_tokens
         """
-        all_terms_string_tokens = []
-
-        # provide a maximum token length in case none have been given.
-        # arbitrary value to act as if there were no maximum token length limit.
-        max_term_token_length = (
-            self._max_term_token_length if self._max_term_token_length else 100
-        )
-
-        for term in self.corpus_terms:
-            term_tokens = term.split()
-            if len(term_tokens) > 1:
-
-                # avoid adding terms longer than the max token length
-                if len(term_tokens) <= max_term_token_length:
-                    all_terms_string_tokens.append(tuple(term_tokens))
-
-                for i in range(2, min(max_term_token_length, len(term_tokens))):
-                    i_length_token_seqs = nltk_ngrams(term_tokens, i)
-                    terms_tokens = [
-                        tuple(tokens)
-                        for tokens in i_length_token_seqs
-                        if not set(tokens).intersection(self.stop_list)
-                    ]
-                    all_terms_string_tokens.extend(terms_tokens)
+        if self.n_process > 1 and len(self.corpus_terms) > 1:
+            shard_size = self.shard_size or math.ceil(
+                len(self.corpus_terms) / (4 * self.n_process)
+            )
+            shards = [
+                self.corpus_terms[i : i + shard_size]
+                for i in range(0, len(self.corpus_terms), shard_size)
+            ]
+            with ProcessPoolExecutor(max_workers=self.n_process) as executor:
+                self._terms_counter = merge_terms_counters(
+                    executor.map(
+                        count_terms_string_tokens,
+                        shards,
+                        repeat(self._max_term_token_length),
+                        repeat(self.stop_list),
+                    )
+                )
+        else:
+            self._terms_counter = count_terms_string_tokens(
+                self.corpus_terms, self._max_term_token_length, self.stop_list
+            )
 
-        self._terms_counter = Counter(all_terms_string_tokens)
         self._terms_string_tokens = list(self._terms_counter.keys())
 
     def _order_terms_string_tokens(self) -> None:
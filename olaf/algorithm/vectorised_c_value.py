@@ -0,0 +1,445 @@
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+import math
+
+import numpy as np
+
+from .c_value import Cvalue
+
+
+class VectorisedCvalue(Cvalue):
+    """A C-value engine working on integer token ids that produces the same C-values as Cvalue.
+
+    Tokens are interned to integer ids and identical corpus strings are processed once.
+    The n-grams are indexed in a trie over the token ids: each n-gram occurrence gets the id of
+    its trie node, computed for all the corpus positions at once with numpy. The n-grams are
+    counted with these ids and the substrings of a term are found by reading the trie nodes of
+    its occurrence, so that the term stat triples are built without generating substrings.
+    Terms of a given token length only depend on the longer terms, hence the C-values are
+    computed one token length at a time with array operations.
+
+    Term strings are only decoded for the extracted candidate terms. The term stat triples
+    are kept in arrays and _term_stat_triples is not filled.
+
+    Attributes
+    ----------
+    corpus_terms: List[str]
+        The list of strings extracted from the corpus to extract the terms from.
+        The strings should be space-tokenised.
+    max_term_token_length: int
+        The maximum number of tokens a term can have.
+    stop_list: Set[str]
+        A set of stop words that should not appear in a term.
+    c_value_threshold: float
+        A threshold to decide wether or not a term should be added to the candidate terms.
+    candidate_terms: Tuple[str]
+        The tuple of selected candidate terms.
+    c_values: Tuple[Tuple[float, str]]
+        An ordered tuple of candidate terms with their C-values.
+    _vocabulary: np.ndarray
+        The token strings indexed by their ids.
+    _token_ids: np.ndarray
+        The token ids of the distinct corpus strings, concatenated.
+    _trie_nodes: Dict[int, np.ndarray]
+        For each token length n, the trie node id of the n-gram starting at each position of
+        _token_ids, -1 if the n-gram overlaps two strings.
+    _ngram_blocks: Dict[int, Tuple[int, np.ndarray, np.ndarray, np.ndarray]]
+        For each token length, the processing index of its first term, the terms occurrence
+        position, occurrence count and processing index by trie node, in processing order.
+    """
+
+    def __init__(
+        self,
+        corpus_terms: List[str],
+        max_term_token_length: Optional[int] = None,
+        stop_list: Optional[Set[str]] = set(),
+        c_value_threshold: Optional[float] = 0.0,
+    ) -> None:
+        """Initialise VectorisedCvalue instance.
+
+        Parameters
+        ----------
+        corpus_terms: List[str]
+            The list of strings extracted from the corpus to extract the terms from.
+            The strings should be space-tokenised.
+        max_term_token_length : int, optional
+            The maximum number of tokens a term can have, by default None.
+            If not provided, the default value will be set to the maximum token length of candidate terms.
+        stop_list : Set[str], optional
+            A set of stop words that should not appear in a term, by default set().
+        c_value_threshold : float, optional
+            A threshold to decide wether or not a term should be added to the candidate terms, by default 0.0.
+        """
+        self._vocabulary = np.array([], dtype=object)
+        self._token_ids = np.array([], dtype=np.int64)
+        self._trie_nodes = dict()
+        self._ngram_tables = dict()
+        self._ngram_blocks = dict()
+        self._decoded_terms_counter = None
+        self._decoded_terms_string_tokens = None
+
+        super().__init__(
+            corpus_terms=corpus_terms,
+            max_term_token_length=max_term_token_length,
+            stop_list=stop_list,
+            c_value_threshold=c_value_threshold,
+        )
+
+    @property
+    def _terms_counter(self) -> Counter:
+        """Mapping of terms string tokens to their occurrences in the corpus.
+        It is decoded from the token ids on first access.
+
+        Returns
+        -------
+        Counter
+            The terms counter.
+        """
+        if self._decoded_terms_counter is None:
+            terms_counter = Counter()
+            for gram_size, (_, positions, counts, _) in self._ngram_tables.items():
+                terms_counter.update(
+                    dict(
+                        zip(
+                            self._decode_terms(positions, gram_size),
+                            counts.tolist(),
+                        )
+                    )
+                )
+            self._decoded_terms_counter = terms_counter
+        return self._decoded_terms_counter
+
+    @_terms_counter.setter
+    def _terms_counter(self, value: Optional[Counter]) -> None:
+        self._decoded_terms_counter = value
+
+    @property
+    def _terms_string_tokens(self) -> Tuple[Tuple[str]]:
+        """Terms string tokens in the order they are processed by the C-value computation.
+        It is decoded from the token ids on first access.
+
+        Returns
+        -------
+        Tuple[Tuple[str]]
+            The ordered terms string tokens.
+        """
+        if self._decoded_terms_string_tokens is None:
+            terms_string_tokens = []
+            for gram_size, (_, positions, _, _) in self._ngram_blocks.items():
+                terms_string_tokens.extend(self._decode_terms(positions, gram_size))
+            self._decoded_terms_string_tokens = tuple(terms_string_tokens)
+        return self._decoded_terms_string_tokens
+
+    @_terms_string_tokens.setter
+    def _terms_string_tokens(self, value: Optional[Tuple[Tuple[str]]]) -> None:
+        self._decoded_terms_string_tokens = value
+
+    def _decode_terms(self, positions: np.ndarray, gram_size: int) -> List[Tuple[str]]:
+        """Convert n-grams occurrences to their string tokens.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions of the n-grams in the token ids array.
+        gram_size : int
+            The n-grams token length.
+
+        Returns
+        -------
+        List[Tuple[str]]
+            The n-grams string tokens.
+        """
+        rows = self._token_ids[positions[:, None] + np.arange(gram_size)]
+        return [tuple(row) for row in self._vocabulary[rows].tolist()]
+
+    def _intern_corpus_terms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert the distinct corpus strings of more than one token into token ids.
+
+        The method sets the following attributes:
+        - self._vocabulary
+        - self._token_ids
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The strings token lengths and the number of times each string appears in the corpus.
+        """
+        vocabulary_index = dict()
+        token_ids = []
+        seq_lengths = []
+        seq_weights = []
+
+        # Counter keeps the order of first appearance, which drives the ties ordering.
+        for term, term_count in Counter(self.corpus_terms).items():
+            term_tokens = term.split()
+            if len(term_tokens) > 1:
+                token_ids.extend(
+                    vocabulary_index.setdefault(token, len(vocabulary_index))
+                    for token in term_tokens
+                )
+                seq_lengths.append(len(term_tokens))
+                seq_weights.append(term_count)
+
+        self._vocabulary = np.array(list(vocabulary_index), dtype=object)
+        self._token_ids = np.array(token_ids, dtype=np.int64)
+
+        return (
+            np.array(seq_lengths, dtype=np.int64),
+            np.array(seq_weights, dtype=np.int64),
+        )
+
+    def _extract_and_count_terms_string_tokens(self) -> None:
+        """Extract and count the terms n-grams of each token length.
+
+        As in Cvalue, a string is counted as a whole if it is not longer than the maximum
+        token length and its n-grams from 2 tokens to the maximum token length (excluded)
+        are counted if they do not contain stop words.
+
+        The method sets the following attributes:
+        - self._trie_nodes
+        - self._ngram_tables, mapping each token length to the counted trie nodes, one of
+          their occurrence positions, their occurrence counts and their first appearance rank.
+        """
+        seq_lengths, seq_weights = self._intern_corpus_terms()
+        token_ids = self._token_ids
+
+        # arbitrary value to act as if there were no maximum token length limit.
+        max_term_token_length = (
+            self._max_term_token_length if self._max_term_token_length else 100
+        )
+
+        is_stop_token = np.array(
+            [token in self.stop_list for token in self._vocabulary], dtype=bool
+        )
+        seq_starts = np.cumsum(seq_lengths) - seq_lengths
+        token_seq = np.repeat(np.arange(len(seq_lengths)), seq_lengths)
+        token_offsets = np.arange(len(token_ids)) - np.repeat(seq_starts, seq_lengths)
+        token_seq_lengths = np.repeat(seq_lengths, seq_lengths)
+        longest_seq = int(seq_lengths.max()) if len(seq_lengths) else 0
+
+        self._trie_nodes = {1: token_ids}
+        self._ngram_tables = dict()
+        # whether the n-gram starting at each position contains a stop token.
+        has_stop_token = is_stop_token[token_ids]
+
+        for gram_size in range(2, min(max_term_token_length, longest_seq) + 1):
+            # trie nodes of the n-grams, identified by their prefix node and last token.
+            positions = np.flatnonzero(token_offsets <= token_seq_lengths - gram_size)
+            last_tokens = token_ids[positions + gram_size - 1]
+            _, nodes = np.unique(
+                self._trie_nodes[gram_size - 1][positions] * len(self._vocabulary)
+                + last_tokens,
+                return_inverse=True,
+            )
+            trie_nodes = np.full(len(token_ids), -1, dtype=np.int64)
+            trie_nodes[positions] = nodes.ravel()
+            self._trie_nodes[gram_size] = trie_nodes
+            has_stop_token[positions] |= is_stop_token[last_tokens]
+
+            # whole strings of gram_size tokens are counted first, then the n-grams of
+            # the longer strings, as in Cvalue.
+            full_seqs = np.flatnonzero(seq_lengths == gram_size)
+            occ_positions = [seq_starts[full_seqs]]
+            occ_phases = [np.zeros(len(full_seqs), dtype=np.int64)]
+
+            if gram_size < max_term_token_length:
+                ngram_positions = positions[
+                    (token_seq_lengths[positions] > gram_size)
+                    & ~has_stop_token[positions]
+                ]
+                occ_positions.append(ngram_positions)
+                occ_phases.append(np.ones(len(ngram_positions), dtype=np.int64))
+
+            occ_positions = np.concatenate(occ_positions)
+            if not len(occ_positions):
+                continue
+            appearance_order = np.lexsort(
+                (
+                    token_offsets[occ_positions],
+                    np.concatenate(occ_phases),
+                    token_seq[occ_positions],
+                )
+            )
+            occ_positions = occ_positions[appearance_order]
+
+            counted_nodes, first_index, inverse = np.unique(
+                trie_nodes[occ_positions], return_index=True, return_inverse=True
+            )
+            counts = np.bincount(
+                inverse.ravel(),
+                weights=seq_weights[token_seq[occ_positions]],
+                minlength=len(counted_nodes),
+            )
+
+            self._ngram_tables[gram_size] = (
+                counted_nodes,
+                occ_positions[first_index],
+                np.rint(counts).astype(np.int64),
+                first_index,
+            )
+
+    def _order_terms_string_tokens(self) -> None:
+        """Order the n-grams by descending token length, then by descending occurrence count
+        and by first appearance, as Cvalue does.
+
+        The method sets the following attributes:
+        - self._ngram_blocks
+        - self._max_term_token_length
+        """
+        if not self._max_term_token_length:
+            self._max_term_token_length = max(self._ngram_tables.keys())
+
+        self._ngram_blocks = dict()
+        block_start = 0
+
+        for gram_size in sorted(self._ngram_tables, reverse=True):
+            counted_nodes, positions, counts, first_index = self._ngram_tables[
+                gram_size
+            ]
+            order = np.lexsort((first_index, -counts))
+
+            processing_index = np.full(counted_nodes.max() + 1, -1, dtype=np.int64)
+            processing_index[counted_nodes[order]] = block_start + np.arange(len(order))
+
+            self._ngram_blocks[gram_size] = (
+                block_start,
+                positions[order],
+                counts[order],
+                processing_index,
+            )
+            block_start += len(order)
+
+    def _nested_terms_indices(self, gram_size: int, positions: np.ndarray) -> np.ndarray:
+        """Find the processing indices of the substrings of 2 to gram_size - 1 tokens of terms,
+        ordered by descending token length then position, i.e., the order in which Cvalue
+        visits them.
+
+        Parameters
+        ----------
+        gram_size : int
+            The terms token length.
+        positions : np.ndarray
+            An occurrence position of each term.
+
+        Returns
+        -------
+        np.ndarray
+            The 2D array of the substrings processing indices, one row per term.
+            Substrings that are not counted, e.g., containing stop words, are indexed -1.
+        """
+        substring_columns = []
+        for sub_size in range(gram_size - 1, 1, -1):
+            for offset in range(gram_size - sub_size + 1):
+                if sub_size in self._ngram_blocks:
+                    processing_index = self._ngram_blocks[sub_size][3]
+                    sub_nodes = self._trie_nodes[sub_size][positions + offset]
+                    column = np.full(len(positions), -1, dtype=np.int64)
+                    indexed = sub_nodes < len(processing_index)
+                    column[indexed] = processing_index[sub_nodes[indexed]]
+                else:
+                    column = np.full(len(positions), -1, dtype=np.int64)
+                substring_columns.append(column)
+
+        return np.stack(substring_columns, axis=1)
+
+    def compute_c_values(self) -> None:
+        """Compute the C-value scores.
+
+        The method sets the following attributes:
+        - self._c_values
+        - self._candidate_terms
+        """
+        nb_terms = sum(len(block[1]) for block in self._ngram_blocks.values())
+
+        # t(b) and c(b) of the term stat triples, indexed by processing index.
+        nested_occurrences = np.zeros(nb_terms, dtype=np.int64)
+        nested_terms = np.zeros(nb_terms, dtype=np.int64)
+
+        c_values_blocks = []
+        for gram_size, (block_start, positions, counts, _) in self._ngram_blocks.items():
+            block_indices = block_start + np.arange(len(counts))
+            terms_nested_occurrences = nested_occurrences[block_indices]
+            terms_nested_terms = nested_terms[block_indices]
+
+            c_values = counts.astype(np.float64)
+            if gram_size != self._max_term_token_length:
+                nested = terms_nested_terms > 0
+                c_values[nested] = counts[nested] - (
+                    terms_nested_occurrences[nested] / terms_nested_terms[nested]
+                )
+            # the Python float keeps the computation identical to Cvalue.
+            c_values = math.log2(gram_size) * c_values
+
+            accepted = c_values >= self.c_value_threshold
+            c_values_blocks.append((block_indices[accepted], c_values[accepted]))
+
+            if gram_size < 3 or not accepted.any():
+                continue
+
+            substrings = self._nested_terms_indices(gram_size, positions[accepted])
+            contributions = np.repeat(
+                counts[accepted] - terms_nested_terms[accepted], substrings.shape[1]
+            )
+            first_contributions = np.repeat(
+                terms_nested_terms[accepted], substrings.shape[1]
+            )
+            substrings = substrings.ravel()
+            counted = substrings >= 0
+            substrings = substrings[counted]
+
+            # the first time a substring is nested, the nested count of the longer term is
+            # not subtracted.
+            new_substrings, first_index = np.unique(substrings, return_index=True)
+            new = nested_terms[new_substrings] == 0
+            nested_occurrences[new_substrings[new]] += first_contributions[counted][
+                first_index[new]
+            ]
+
+            np.add.at(nested_occurrences, substrings, contributions[counted])
+            np.add.at(nested_terms, substrings, 1)
+
+        if not c_values_blocks:
+            self._c_values = tuple()
+            self._candidate_terms = tuple()
+            return
+
+        terms_indices = np.concatenate([block[0] for block in c_values_blocks])
+        c_values = np.concatenate([block[1] for block in c_values_blocks])
+        order = np.argsort(-c_values, kind="stable")
+
+        self._c_values = tuple(
+            zip(
+                c_values[order].tolist(),
+                self._decode_candidate_terms(terms_indices[order]),
+            )
+        )
+        self._candidate_terms = tuple(
+            [c_val_tuple[1] for c_val_tuple in self._c_values]
+        )
+
+    def _decode_candidate_terms(self, terms_indices: np.ndarray) -> List[str]:
+        """Convert terms processing indices to the space-tokenised term strings.
+
+        Parameters
+        ----------
+        terms_indices : np.ndarray
+            The terms processing indices.
+
+        Returns
+        -------
+        List[str]
+            The term strings, in the order of the indices.
+        """
+        candidate_terms = np.empty(len(terms_indices), dtype=object)
+        for gram_size, (block_start, positions, _, _) in self._ngram_blocks.items():
+            in_block = (terms_indices >= block_start) & (
+                terms_indices < block_start + len(positions)
+            )
+            rows = self._token_ids[
+                positions[terms_indices[in_block] - block_start, None]
+                + np.arange(gram_size)
+            ]
+            candidate_terms[in_block] = [
+                " ".join(term_tokens) for term_tokens in self._vocabulary[rows].tolist()
+            ]
+        return candidate_terms.tolist()
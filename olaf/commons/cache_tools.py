@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """In memory cache of computed values, evicting the least recently used values when it
+    exceeds its maximum size.
+
+    Attributes
+    ----------
+    max_size : int, optional
+        Maximum number of values kept in the cache. If None, the cache is unbounded.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        """Initialise LRU cache instance.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of values kept in the cache, by default None which never evicts
+            values.
+        """
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value of a key, computing and caching it if it is missing.
+
+        Parameters
+        ----------
+        key : Hashable
+            The value key.
+        compute : Callable[[], Any]
+            The function computing the value.
+
+        Returns
+        -------
+        Any
+            The value of the key.
+        """
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+
+        value = compute()
+
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The value key.
+        default : Any, optional
+            The value returned if the key is missing, by default None.
+
+        Returns
+        -------
+        Any
+            The value of the key, or the default value if it is not cached.
+        """
+        with self._lock:
+            if key not in self._values:
+                return default
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache the value of a key, replacing its previous value.
+
+        Parameters
+        ----------
+        key : Hashable
+            The value key.
+        value : Any
+            The value to cache.
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -1,9 +1,10 @@
+from collections import defaultdict
 from typing import List, Set, Tuple
 
 import spacy
-from spacy.matcher import PhraseMatcher
 
 from ..commons.logging_config import logger
+from ..commons.spacy_processing_tools import build_phrase_matcher
 from ..data_container.candidate_term_schema import CandidateRelation, CandidateTerm
 from ..data_container.concept_schema import Concept
 from ..data_container.linguistic_realisation_schema import ConceptLR
@@ -13,6 +14,12 @@ def group_cts_on_synonyms(
     candidate_terms: Set[CandidateTerm],
 ) -> List[Set[CandidateTerm]]:
     """Group candidate terms with commons labels or synonyms.
+    Candidate relations are only grouped if they have the same source and destination
+    concepts as well.
+
+    Groups are the connected components of candidate terms sharing a label or a synonym.
+    They are computed with a union-find over an inverted index of the labels and synonyms,
+    in near-linear time in the number of labels.
 
     Parameters
     ----------
@@ -24,32 +31,36 @@ def group_cts_on_synonyms(
     List[Set[CandidateTerm]]
         Candidate terms grouped.
     """
-    ct_labels = {}
-    for ct in candidate_terms:
-        ct_labels[ct] = {ct.label}
+    cts = list(candidate_terms)
+    parents = list(range(len(cts)))
+
+    def find_root(ct_index: int) -> int:
+        while parents[ct_index] != ct_index:
+            parents[ct_index] = parents[parents[ct_index]]
+            ct_index = parents[ct_index]
+        return ct_index
+
+    label_index = {}
+    for ct_index, ct in enumerate(cts):
+        if isinstance(ct, CandidateRelation):
+            group_key = (ct.source_concept, ct.destination_concept)
+        else:
+            group_key = None
+
+        ct_labels = {ct.label}
         if ct.enrichment is not None:
-            ct_labels[ct].update(ct.enrichment.synonyms)
+            ct_labels.update(ct.enrichment.synonyms)
 
-    cts_groups = {}
-    for ct in candidate_terms:
-        match_cts = []
-        match_labels = set()
-        for ct_g, labels in cts_groups.items():
-            if check_ct_belongs_to_group(ct, ct_labels[ct], ct_g, labels):
-                match_cts.append(ct_g)
-                match_labels.update(labels)
-        if len(match_cts) == 0:
-            cts_groups[tuple([ct])] = ct_labels[ct]
-        else:
-            new_key = []
-            for key in match_cts:
-                del cts_groups[key]
-                keys = list(key)
-                keys.append(ct)
-                new_key.extend(keys)
-            match_labels.update(ct_labels[ct])
-            cts_groups[tuple(new_key)] = match_labels
-    return [set(cts_group) for cts_group in cts_groups.keys()]
+        for label in ct_labels:
+            label_ct_index = label_index.setdefault((group_key, label), ct_index)
+            if label_ct_index != ct_index:
+                parents[find_root(label_ct_index)] = find_root(ct_index)
+
+    cts_groups = defaultdict(set)
+    for ct_index, ct in enumerate(cts):
+        cts_groups[find_root(ct_index)].add(ct)
+
+    return list(cts_groups.values())
 
 
 def check_ct_belongs_to_group(
@@ -149,6 +160,68 @@ def cts_to_concept(concept_candidates: Set[CandidateTerm]) -> Concept:
     return new_concept
 
 
+def add_cts_to_concepts(
+    candidate_terms: Set[CandidateTerm], concepts: Set[Concept]
+) -> Set[CandidateTerm]:
+    """Add the candidate terms whose label is the label of a linguistic realisation of a
+    concept to this concept. Their corpus occurrences are added to the matching linguistic
+    realisation.
+
+    Parameters
+    ----------
+    candidate_terms : Set[CandidateTerm]
+        The candidate terms to add to the concepts.
+    concepts : Set[Concept]
+        The existing concepts.
+
+    Returns
+    -------
+    Set[CandidateTerm]
+        The candidate terms not matching any concept.
+    """
+    concepts_lr_index = {}
+    for concept in concepts:
+        for lr in concept.linguistic_realisations:
+            concepts_lr_index.setdefault(lr.label, concept)
+
+    unmatched_cts = set()
+    for ct in candidate_terms:
+        concept = concepts_lr_index.get(ct.label)
+        if concept is None:
+            unmatched_cts.add(ct)
+        else:
+            concept.add_linguistic_realisation(
+                ConceptLR(label=ct.label, corpus_occurrences=ct.corpus_occurrences)
+            )
+
+    return unmatched_cts
+
+
+def merge_concepts(concepts: Set[Concept], new_concepts: Set[Concept]) -> None:
+    """Add new concepts to a set of concepts. A new concept with the label of an existing
+    concept is merged into it, i.e., its linguistic realisations and external UIDs are
+    added to the existing concept.
+
+    Parameters
+    ----------
+    concepts : Set[Concept]
+        The existing concepts, updated in place.
+    new_concepts : Set[Concept]
+        The concepts to add.
+    """
+    concepts_index = {concept.label: concept for concept in concepts}
+
+    for new_concept in new_concepts:
+        concept = concepts_index.get(new_concept.label)
+        if concept is None:
+            concepts.add(new_concept)
+            concepts_index[new_concept.label] = new_concept
+        else:
+            for lr in new_concept.linguistic_realisations:
+                concept.add_linguistic_realisation(lr)
+            concept.external_uids.update(new_concept.external_uids)
+
+
 def filter_cts_on_token_in_term(
     candidate_terms: Set[CandidateTerm], filtering_tokens: Set[str]
 ) -> Set[CandidateTerm]:
@@ -279,10 +352,9 @@ def build_cts_from_strings(
     Set[CandidateTerm]
         The set of created candidate terms.
     """
-    phrase_matcher = PhraseMatcher(spacy_model.vocab, attr="LOWER")
-
-    for label in ct_label_strings:
-        phrase_matcher.add(label, [spacy_model(label)])
+    phrase_matcher = build_phrase_matcher(
+        spacy_model, {label: [label] for label in ct_label_strings}
+    )
 
     candidate_terms_index = {}
 
@@ -1,8 +1,265 @@
-from typing import Any, List
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
-def sbert_embeddings(model_name: str, words: List[str]) -> Any : 
-    model = SentenceTransformer(model_name)
-    embeddings = model.encode(words)
-    return embeddings
\ No newline at end of file
+# Maximum number of texts per SQL query, below the SQLite bound variables limit.
+SQL_QUERY_BATCH_SIZE = 500
+
+# Maximum number of embeddings of the default process-wide cache, about 30 MB of 768
+# dimension embeddings.
+DEFAULT_EMBEDDING_CACHE_SIZE = 10000
+
+_sbert_models: Dict[str, SentenceTransformer] = {}
+_sbert_models_lock = threading.Lock()
+
+
+def get_sbert_model(model_name: str) -> SentenceTransformer:
+    """Return the sentence transformer model of the process-wide model registry.
+    The model is loaded on first use and shared by all the callers afterwards.
+
+    Parameters
+    ----------
+    model_name : str
+        Name of the sentence transformer model.
+
+    Returns
+    -------
+    SentenceTransformer
+        The sentence transformer model.
+    """
+    with _sbert_models_lock:
+        model = _sbert_models.get(model_name)
+        if model is None:
+            model = SentenceTransformer(model_name)
+            _sbert_models[model_name] = model
+    return model
+
+
+def register_sbert_model(model_name: str, model: SentenceTransformer) -> None:
+    """Add an already loaded sentence transformer model to the process-wide model registry,
+    e.g., a model loaded on a specific device.
+
+    Parameters
+    ----------
+    model_name : str
+        Name under which the model is registered.
+    model : SentenceTransformer
+        The sentence transformer model.
+    """
+    with _sbert_models_lock:
+        _sbert_models[model_name] = model
+
+
+class EmbeddingCache:
+    """Cache of text embeddings keyed by (model name, text), stored in a SQLite database.
+    The least recently used embeddings are evicted when the cache exceeds its maximum size.
+
+    Attributes
+    ----------
+    cache_path : str, optional
+        Path to the SQLite database file. If None, the cache only lives in memory.
+    max_size : int
+        Maximum number of embeddings kept in the cache.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_size: int = 100000) -> None:
+        """Initialise embedding cache instance.
+
+        Parameters
+        ----------
+        cache_path : str, optional
+            Path to the SQLite database file, by default None which keeps the cache in memory.
+            The embeddings stored in the file are reused across runs.
+        max_size : int, optional
+            Maximum number of embeddings kept in the cache, by default 100000.
+        """
+        self.cache_path = cache_path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            cache_path if cache_path is not None else ":memory:",
+            check_same_thread=False,
+        )
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (model, text)
+                )"""
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+        self._clock = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM embeddings"
+        ).fetchone()[0]
+
+    def get(self, model_name: str, texts: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Fetch the cached embeddings of texts.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of the model the embeddings are computed with.
+        texts : Iterable[str]
+            The texts to fetch the embeddings of.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The embeddings of the cached texts, by text.
+        """
+        texts = list(dict.fromkeys(texts))
+        embeddings = {}
+        with self._lock, self._connection:
+            self._clock += 1
+            for batch_start in range(0, len(texts), SQL_QUERY_BATCH_SIZE):
+                batch = texts[batch_start : batch_start + SQL_QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT text, embedding FROM embeddings "
+                    f"WHERE model = ? AND text IN ({placeholders})",
+                    [model_name, *batch],
+                ).fetchall()
+                for text, embedding in rows:
+                    embeddings[text] = np.frombuffer(embedding, dtype=np.float32)
+                self._connection.execute(
+                    f"UPDATE embeddings SET last_used = ? "
+                    f"WHERE model = ? AND text IN ({placeholders})",
+                    [self._clock, model_name, *batch],
+                )
+        return embeddings
+
+    def put(self, model_name: str, embeddings: Dict[str, np.ndarray]) -> None:
+        """Store text embeddings, evicting the least recently used ones if needed.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of the model the embeddings are computed with.
+        embeddings : Dict[str, np.ndarray]
+            The embeddings to store, by text.
+        """
+        with self._lock, self._connection:
+            self._clock += 1
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        model_name,
+                        text,
+                        np.asarray(embedding, dtype=np.float32).tobytes(),
+                        self._clock,
+                    )
+                    for text, embedding in embeddings.items()
+                ),
+            )
+            nb_evicted = (
+                self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                - self.max_size
+            )
+            if nb_evicted > 0:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (nb_evicted,),
+                )
+
+    def clear(self) -> None:
+        """Remove all the cached embeddings."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM embeddings")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()[0]
+
+
+_embedding_cache = EmbeddingCache(max_size=DEFAULT_EMBEDDING_CACHE_SIZE)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache shared by the pipeline components.
+    By default, it lives in memory and keeps the DEFAULT_EMBEDDING_CACHE_SIZE most recently
+    used embeddings. Components can be given their own, e.g., persistent, cache instead.
+
+    Returns
+    -------
+    EmbeddingCache
+        The process-wide embedding cache.
+    """
+    return _embedding_cache
+
+
+def set_embedding_cache(embedding_cache: EmbeddingCache) -> None:
+    """Replace the process-wide embedding cache, e.g., by a persistent one.
+
+    Parameters
+    ----------
+    embedding_cache : EmbeddingCache
+        The embedding cache to share between the pipeline components.
+    """
+    global _embedding_cache
+    _embedding_cache = embedding_cache
+
+
+def sbert_embeddings(
+    model_name: str,
+    words: List[str],
+    batch_size: int = 32,
+    normalise: bool = False,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> np.ndarray:
+    """Compute the sentence transformer embeddings of texts.
+    The model is taken from the process-wide model registry and only the texts missing from
+    the embedding cache are encoded.
+
+    Parameters
+    ----------
+    model_name : str
+        Name of the sentence transformer model.
+    words : List[str]
+        The texts to embed.
+    batch_size : int, optional
+        Number of texts encoded at once by the model, by default 32.
+    normalise : bool, optional
+        Whether to scale the embeddings to unit length, by default False.
+    embedding_cache : EmbeddingCache, optional
+        The embedding cache to use, by default None which uses the process-wide cache.
+
+    Returns
+    -------
+    np.ndarray
+        The embeddings, one row per text.
+    """
+    if embedding_cache is None:
+        embedding_cache = get_embedding_cache()
+
+    text_embeddings = embedding_cache.get(model_name, words)
+    missing_texts = [
+        text for text in dict.fromkeys(words) if text not in text_embeddings
+    ]
+    if missing_texts:
+        new_embeddings = get_sbert_model(model_name).encode(
+            missing_texts, batch_size=batch_size, convert_to_numpy=True
+        )
+        new_text_embeddings = dict(zip(missing_texts, new_embeddings))
+        embedding_cache.put(model_name, new_text_embeddings)
+        text_embeddings.update(new_text_embeddings)
+
+    if not words:
+        return np.empty((0, 0), dtype=np.float32)
+
+    embeddings = np.stack([text_embeddings[text] for text in words]).astype(np.float32)
+    if normalise:
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.where(norms > 0, norms, 1)
+    return embeddings
@@ -0,0 +1,178 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_http_session(pool_size: int = 10, max_retries: int = 3) -> requests.Session:
+    """Build a requests session whose connections are pooled and reused across requests.
+    Failed connections and rate limited or server error responses are retried with an
+    exponential backoff.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Maximum number of connections kept open per host, by default 10.
+        It should be at least the number of threads sharing the session.
+    max_retries : int, optional
+        Maximum number of retries of a request, by default 3.
+
+    Returns
+    -------
+    requests.Session
+        The HTTP session.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ResponseCache:
+    """Cache of JSON responses keyed by request URL, stored in a SQLite database.
+    Responses older than the time to live are ignored and fetched again.
+    Expired responses are deleted, and the oldest responses beyond the maximum size are
+    evicted, when the cache is opened and then every PURGE_INTERVAL stored responses.
+
+    Attributes
+    ----------
+    cache_path : str, optional
+        Path to the SQLite database file. If None, the cache only lives in memory.
+    ttl : float, optional
+        Time to live of the cached responses in seconds. If None, responses never expire.
+    max_size : int, optional
+        Maximum number of cached responses kept after a purge. If None, the number of
+        responses is not bounded.
+    """
+
+    PURGE_INTERVAL = 100
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = 10000,
+    ) -> None:
+        """Initialise response cache instance.
+
+        Parameters
+        ----------
+        cache_path : str, optional
+            Path to the SQLite database file, by default None which keeps the cache in memory.
+            The responses stored in the file are reused across runs.
+        ttl : float, optional
+            Time to live of the cached responses in seconds, by default None which keeps the
+            responses forever.
+        max_size : int, optional
+            Maximum number of cached responses, by default 10000. The oldest responses are
+            evicted first. If None, the number of responses is not bounded.
+            The cache can exceed it by at most PURGE_INTERVAL responses between purges.
+        """
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._nb_puts = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            cache_path if cache_path is not None else ":memory:",
+            check_same_thread=False,
+        )
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created REAL NOT NULL
+                )"""
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created ON responses (created)"
+            )
+        self.purge()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch the cached response of a request URL.
+
+        Parameters
+        ----------
+        url : str
+            The request URL.
+
+        Returns
+        -------
+        Dict[str, Any], optional
+            The cached response, None if it is missing or expired.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        response, created = row
+        if self.ttl is not None and time.time() - created > self.ttl:
+            return None
+        return json.loads(response)
+
+    def put(self, url: str, response: Dict[str, Any]) -> None:
+        """Store the response of a request URL.
+
+        Parameters
+        ----------
+        url : str
+            The request URL.
+        response : Dict[str, Any]
+            The JSON response.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (url, json.dumps(response), time.time()),
+            )
+            self._nb_puts += 1
+            purge = self._nb_puts % self.PURGE_INTERVAL == 0
+        if purge:
+            self.purge()
+
+    def purge(self) -> None:
+        """Delete the expired responses, then the oldest responses beyond the maximum
+        size of the cache."""
+        with self._lock, self._connection:
+            if self.ttl is not None:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)
+                )
+            if self.max_size is not None:
+                self._connection.execute(
+                    """DELETE FROM responses WHERE url IN (
+                        SELECT url FROM responses ORDER BY created DESC
+                        LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_size,),
+                )
+
+    def clear(self) -> None:
+        """Remove all the cached responses."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
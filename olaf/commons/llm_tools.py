@@ -1,6 +1,20 @@
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import openai
 import requests
@@ -15,8 +29,24 @@ from ..commons.errors import MissingEnvironmentVariable
 from ..commons.logging_config import logger
 
 
+T = TypeVar("T")
+
+# Rate limiters shared by all the generators of a provider, by provider and rate.
+_PROVIDER_RATE_LIMITERS = {}
+_PROVIDER_RATE_LIMITERS_LOCK = threading.Lock()
+
+
 class LLMGenerator(ABC):
-    """Text generator based on LLM."""
+    """Text generator based on LLM.
+
+    Attributes
+    ----------
+    max_requests_per_minute: float, optional
+        Maximum number of requests per minute to the LLM provider when the generator is used
+        by a LLMRequestExecutor. If None, the requests are not rate limited.
+    """
+
+    max_requests_per_minute: Optional[float] = None
 
     def __init__(self) -> None:
         """Initialise LLM generator."""
@@ -117,6 +147,9 @@ class OpenAIGenerator(LLMGenerator):
 class MistralAIGenerator(LLMGenerator):
     """Text generator based on MiastralAI models."""
 
+    # MistralAI API default rate limit is one request per second.
+    max_requests_per_minute = 60
+
     def __init__(self, model_name: Optional[str] = "mistral-tiny") -> None:
         self.model_name = model_name 
         self.api_url = "https://api.mistral.ai/v1/chat/completions"
@@ -169,3 +202,184 @@ class MistralAIGenerator(LLMGenerator):
             )
 
         return llm_output
+
+
+class RateLimiter:
+    """Thread-safe rate limiter spacing out requests evenly.
+
+    Attributes
+    ----------
+    max_requests_per_minute: float
+        Maximum number of requests per minute.
+    """
+
+    def __init__(self, max_requests_per_minute: float) -> None:
+        """Initialise rate limiter instance.
+
+        Parameters
+        ----------
+        max_requests_per_minute: float
+            Maximum number of requests per minute.
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self._interval = 60 / max_requests_per_minute
+        self._next_request_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent without exceeding the rate limit."""
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + self._interval
+        time.sleep(request_time - now)
+
+
+def get_provider_rate_limiter(
+    provider: str, max_requests_per_minute: float
+) -> RateLimiter:
+    """Get the rate limiter shared by all the requests to a LLM provider.
+
+    Parameters
+    ----------
+    provider: str
+        The LLM provider name, e.g., the generator class name.
+    max_requests_per_minute: float
+        Maximum number of requests per minute to the provider.
+
+    Returns
+    -------
+    RateLimiter
+        The provider rate limiter.
+    """
+    with _PROVIDER_RATE_LIMITERS_LOCK:
+        rate_limiter = _PROVIDER_RATE_LIMITERS.get((provider, max_requests_per_minute))
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(max_requests_per_minute)
+            _PROVIDER_RATE_LIMITERS[(provider, max_requests_per_minute)] = rate_limiter
+    return rate_limiter
+
+
+class LLMRequestExecutor:
+    """Executor sending the requests of a LLM generator concurrently.
+
+    At most max_workers requests are sent at once and the requests to a same provider are
+    rate limited across executors. The generated texts are returned in the order of the
+    requests and a failed request does not stop the others.
+
+    Attributes
+    ----------
+    llm_generator: LLMGenerator
+        The LLM generator used to generate the texts.
+    max_workers: int, optional
+        Maximum number of concurrent requests, by default 4.
+    max_requests_per_minute: float, optional
+        Maximum number of requests per minute to the LLM provider, by default the
+        generator max_requests_per_minute.
+    """
+
+    def __init__(
+        self,
+        llm_generator: LLMGenerator,
+        max_workers: Optional[int] = 4,
+        max_requests_per_minute: Optional[float] = None,
+    ) -> None:
+        """Initialise LLM request executor instance.
+
+        Parameters
+        ----------
+        llm_generator: LLMGenerator
+            The LLM generator used to generate the texts.
+        max_workers: int, optional
+            Maximum number of concurrent requests, by default 4.
+        max_requests_per_minute: float, optional
+            Maximum number of requests per minute to the LLM provider, by default None
+            which uses the generator max_requests_per_minute.
+        """
+        self.llm_generator = llm_generator
+        self.max_workers = max_workers
+        self.max_requests_per_minute = (
+            max_requests_per_minute
+            if max_requests_per_minute is not None
+            else llm_generator.max_requests_per_minute
+        )
+        self._check_parameters()
+
+        self._rate_limiter = None
+        if self.max_requests_per_minute is not None:
+            self._rate_limiter = get_provider_rate_limiter(
+                type(llm_generator).__name__, self.max_requests_per_minute
+            )
+
+    def _check_parameters(self) -> None:
+        """Check wether required parameters are given and correct. If this is not the case,
+        suitable default ones are set.
+        """
+        if not isinstance(self.max_workers, int) or self.max_workers < 1:
+            logger.warning(
+                "Incorrect value given for max_workers parameter, default will be set to 4."
+            )
+            self.max_workers = 4
+
+        if self.max_requests_per_minute is not None and not (
+            isinstance(self.max_requests_per_minute, (int, float))
+            and self.max_requests_per_minute > 0
+        ):
+            logger.warning(
+                "Incorrect value given for max_requests_per_minute parameter, requests will not be rate limited."
+            )
+            self.max_requests_per_minute = None
+
+    def _generate_text(self, prompt: Any) -> str:
+        """Generate a text once the rate limit allows it.
+
+        Parameters
+        ----------
+        prompt: Any
+            The prompt given to the LLM generator.
+
+        Returns
+        -------
+        str
+            The generated text, an empty string if the generation failed.
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        try:
+            return self.llm_generator.generate_text(prompt)
+        except Exception as e:
+            logger.error("LLM text generation failed with exception %s.", e)
+            return ""
+
+    def generate_texts(
+        self, items: Iterable[T], build_prompt: Callable[[T], Any]
+    ) -> Iterator[Tuple[T, str]]:
+        """Generate the texts of the prompts of items concurrently.
+        The items are consumed lazily, at most twice max_workers items being pending at
+        once, so that large or streamed collections are not loaded in memory.
+
+        Parameters
+        ----------
+        items: Iterable[T]
+            The items to generate texts for, e.g., documents or candidate terms.
+        build_prompt: Callable[[T], Any]
+            The function building the prompt of an item.
+
+        Yields
+        ------
+        Tuple[T, str]
+            Each item and its generated text, in the order of the items.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for item in items:
+                pending.append(
+                    (item, executor.submit(self._generate_text, build_prompt(item)))
+                )
+                if len(pending) >= 2 * self.max_workers:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
@@ -3,8 +3,8 @@ from itertools import product
 from typing import Dict, List, Set
 
 import spacy
-from spacy.matcher import PhraseMatcher
 
+from ..commons.spacy_processing_tools import build_phrase_matcher
 from ..data_container.candidate_term_schema import CandidateRelation, CandidateTerm
 from ..data_container.concept_schema import Concept
 from ..data_container.linguistic_realisation_schema import RelationLR
@@ -65,6 +65,47 @@ def crs_to_relation(candidate_relations: Set[CandidateRelation]) -> Relation:
     return new_relation
 
 
+def merge_relations(relations: Set[Relation], new_relations: Set[Relation]) -> None:
+    """Add new relations to a set of relations. A new relation with the label, source and
+    destination concepts of an existing relation is merged into it, i.e., its linguistic
+    realisations and external UIDs are added to the existing relation.
+
+    Parameters
+    ----------
+    relations : Set[Relation]
+        The existing relations, updated in place.
+    new_relations : Set[Relation]
+        The relations to add.
+    """
+    relations_index = {
+        (relation.label, relation.source_concept, relation.destination_concept): relation
+        for relation in relations
+    }
+
+    for new_relation in new_relations:
+        relation_key = (
+            new_relation.label,
+            new_relation.source_concept,
+            new_relation.destination_concept,
+        )
+        relation = relations_index.get(relation_key)
+        if relation is None:
+            relations.add(new_relation)
+            relations_index[relation_key] = new_relation
+            continue
+
+        relation_lrs_index = {lr.label: lr for lr in relation.linguistic_realisations}
+        for lr in new_relation.linguistic_realisations:
+            if lr.label in relation_lrs_index:
+                relation_lrs_index[lr.label].add_corpus_occurrences(
+                    lr.corpus_occurrences
+                )
+            else:
+                relation.add_linguistic_realisation(lr)
+                relation_lrs_index[lr.label] = lr
+        relation.external_uids.update(new_relation.external_uids)
+
+
 def cts_to_crs(
     candidate_terms: Set[CandidateTerm],
     concepts_labels_map: Dict[str, Concept],
@@ -97,12 +138,13 @@ def cts_to_crs(
         Set of candidate relations found from the candidate terms.
     """
 
-    matcher = PhraseMatcher(spacy_model.vocab, attr="LOWER")
-    for concept in concepts_labels_map.values():
-        matcher.add(
-            concept.label,
-            [spacy_model(lr.label) for lr in concept.linguistic_realisations],
-        )
+    matcher = build_phrase_matcher(
+        spacy_model,
+        {
+            concept.label: [lr.label for lr in concept.linguistic_realisations]
+            for concept in concepts_labels_map.values()
+        },
+    )
 
     candidate_relations = set()
     for ct in candidate_terms:
@@ -1,11 +1,22 @@
-from typing import List
+from collections import defaultdict
+from typing import FrozenSet, Iterable, List, Mapping, Tuple
 
+import spacy.language
 import spacy.matcher
 import spacy.tokens
 from nltk.util import ngrams as nltk_ngrams
 
+from .cache_tools import LRUCache
 from .logging_config import logger
 
+# Token attributes set by the tokenizer alone, patterns matched on them do not need the
+# whole spaCy pipeline.
+TOKENIZER_MATCH_ATTRS = {"ORTH", "TEXT", "LOWER"}
+
+# Phrase matchers by vocabulary id, attribute and label strings. A cached matcher holds a
+# reference to its vocabulary so the vocabulary id cannot be reused while it is cached.
+_phrase_matcher_cache = LRUCache(max_size=16)
+
 
 def spacy_span_ngrams(
     span: spacy.tokens.Span, gram_size: int
@@ -44,6 +55,38 @@ def spacy_span_ngrams(
     return gram_spans
 
 
+def token_texts(span: spacy.tokens.Span) -> List[str]:
+    """Return the texts of the tokens of a spaCy Span.
+
+    Parameters
+    ----------
+    span : spacy.tokens.Span
+        The span to get the token texts of.
+
+    Returns
+    -------
+    List[str]
+        The token texts.
+    """
+    return [token.text for token in span]
+
+
+def lower_token_texts(span: spacy.tokens.Span) -> List[str]:
+    """Return the lower case texts of the tokens of a spaCy Span, stripped of whitespaces.
+
+    Parameters
+    ----------
+    span : spacy.tokens.Span
+        The span to get the token texts of.
+
+    Returns
+    -------
+    List[str]
+        The lower case token texts.
+    """
+    return [token.lower_.strip() for token in span]
+
+
 def is_not_stopword(token: spacy.tokens.Token) -> bool:
     """Return True if the Spacy Token is NOT a stopword.
 
@@ -161,3 +204,85 @@ def spans_overlap(span1: spacy.tokens.Span, span2: spacy.tokens.Span) -> bool:
         spans_are_overlapping = any(overlap_conditions)
 
     return spans_are_overlapping
+
+
+def build_phrase_matcher(
+    spacy_model: spacy.language.Language,
+    label_strings_map: Mapping[str, Iterable[str]],
+    attr: str = "LOWER",
+    batch_size: int = 1000,
+    cache: bool = True,
+) -> spacy.matcher.PhraseMatcher:
+    """Build a spaCy phrase matcher matching strings under their label.
+
+    Pattern strings are processed by batches. When the matching attribute is set by the
+    tokenizer, e.g. "LOWER", they are only tokenised instead of going through the whole
+    spaCy pipeline.
+    Unless cache is False, matchers are cached per spaCy vocabulary, attribute and label
+    strings so that the same matcher is not built twice. The cache keeps the 16 most
+    recently used matchers and is emptied by clear_phrase_matcher_cache. A cached matcher
+    is shared and should not be modified.
+
+    Parameters
+    ----------
+    spacy_model : spacy.language.Language
+        The spaCy model used to process the pattern strings.
+    label_strings_map : Mapping[str, Iterable[str]]
+        The mapping between the match labels and the strings to match under each label.
+    attr : str, optional
+        The token attribute to match on, by default "LOWER", i.e., case insensitive matching.
+    batch_size : int, optional
+        The number of pattern strings processed at once, by default 1000.
+    cache : bool, optional
+        Wether to reuse and cache the matcher, by default True. Single-use matchers should
+        not be cached.
+
+    Returns
+    -------
+    spacy.matcher.PhraseMatcher
+        The phrase matcher.
+    """
+    label_strings = frozenset(
+        (label, frozenset(strings)) for label, strings in label_strings_map.items()
+    )
+    if not cache:
+        return _build_phrase_matcher(spacy_model, label_strings, attr, batch_size)
+
+    return _phrase_matcher_cache.get_or_compute(
+        (id(spacy_model.vocab), attr.upper(), label_strings),
+        lambda: _build_phrase_matcher(spacy_model, label_strings, attr, batch_size),
+    )
+
+
+def clear_phrase_matcher_cache() -> None:
+    """Remove all the cached phrase matchers."""
+    _phrase_matcher_cache.clear()
+
+
+def _build_phrase_matcher(
+    spacy_model: spacy.language.Language,
+    label_strings: FrozenSet[Tuple[str, FrozenSet[str]]],
+    attr: str,
+    batch_size: int,
+) -> spacy.matcher.PhraseMatcher:
+    """Build a phrase matcher from hashable label strings, see build_phrase_matcher."""
+    labels, pattern_strings = [], []
+    for label, strings in label_strings:
+        for string in strings:
+            labels.append(label)
+            pattern_strings.append(string)
+
+    if attr.upper() in TOKENIZER_MATCH_ATTRS:
+        pattern_docs = spacy_model.tokenizer.pipe(pattern_strings, batch_size=batch_size)
+    else:
+        pattern_docs = spacy_model.pipe(pattern_strings, batch_size=batch_size)
+
+    label_patterns = defaultdict(list)
+    for label, pattern_doc in zip(labels, pattern_docs):
+        label_patterns[label].append(pattern_doc)
+
+    matcher = spacy.matcher.PhraseMatcher(spacy_model.vocab, attr=attr)
+    for label, patterns in label_patterns.items():
+        matcher.add(label, patterns)
+
+    return matcher
@@ -0,0 +1,389 @@
+from array import array
+from collections.abc import Mapping
+from typing import (
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import spacy.tokens
+
+from ..data_container.span_set_schema import DocRegistry
+
+
+def default_gram_sizes(sequence_length: int) -> Iterable[int]:
+    """Return all the gram sizes of a token sequence, from unigrams to the full sequence."""
+    return range(1, sequence_length + 1)
+
+
+def normalised_term_string(tokens: Sequence[str]) -> str:
+    """Build the term string of token strings as whitespace tokenisers split it, i.e.,
+    with single spaces between the non whitespace characters."""
+    return " ".join(" ".join(tokens).split())
+
+
+def _join_normalised_tokens(tokens: Sequence[str]) -> str:
+    """Build the term string of token strings already normalised one by one, see
+    normalised_term_string. Whitespace tokens are empty strings."""
+    return " ".join([token for token in tokens if token])
+
+
+class SpanNgramIndex(Mapping):
+    """Index of the corpus occurrences of the ngrams of token sequences, by term string.
+
+    Occurrences are stored as (document index, start, end) integer triples in compact arrays
+    instead of spaCy spans. Spans are only materialised when the occurrences of a term are
+    retrieved, so that they are created for the selected terms only.
+    The index is a read-only mapping between term strings and their lists of spaCy spans.
+
+    Attributes
+    ----------
+    gram_sizes : Callable[[int], Iterable[int]]
+        The function returning the gram sizes to index for a token sequence length.
+    term_string : Callable[[Sequence[str]], str]
+        The function building the term string of an ngram from its token strings.
+    doc_registry : DocRegistry
+        The registry of the documents the occurrences belong to.
+    """
+
+    def __init__(
+        self,
+        gram_sizes: Optional[Callable[[int], Iterable[int]]] = None,
+        term_string: Optional[Callable[[Sequence[str]], str]] = None,
+        doc_registry: Optional[DocRegistry] = None,
+    ) -> None:
+        """Initialise an empty span ngram index.
+
+        Parameters
+        ----------
+        gram_sizes : Callable[[int], Iterable[int]], optional
+            The function returning the gram sizes to index for a token sequence length,
+            by default None which indexes all the ngrams, from unigrams to the full sequence.
+        term_string : Callable[[Sequence[str]], str], optional
+            The function building the term string of an ngram from its token strings,
+            by default None which joins the token strings with spaces.
+        doc_registry : DocRegistry, optional
+            The registry of the documents the occurrences belong to, by default None which
+            creates a new registry.
+        """
+        self.gram_sizes = gram_sizes if gram_sizes is not None else default_gram_sizes
+        self.term_string = term_string if term_string is not None else " ".join
+        self.doc_registry = doc_registry if doc_registry is not None else DocRegistry()
+        self._term_ids = {}
+        self._occ_term_ids = array("i")
+        self._occ_doc_indices = array("i")
+        self._occ_starts = array("i")
+        self._occ_ends = array("i")
+        self._term_order = None
+        self._term_offsets = None
+
+    def add(self, term: str, doc: spacy.tokens.Doc, start: int, end: int) -> None:
+        """Add a corpus occurrence of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term string.
+        doc : spacy.tokens.Doc
+            The document the occurrence belongs to.
+        start : int
+            The index of the first token of the occurrence.
+        end : int
+            The index after the last token of the occurrence.
+        """
+        term_id = self._term_ids.setdefault(term, len(self._term_ids))
+        self._occ_term_ids.append(term_id)
+        self._occ_doc_indices.append(self.doc_registry.register(doc))
+        self._occ_starts.append(start)
+        self._occ_ends.append(end)
+        self._term_order = None
+
+    def add_token_sequence(
+        self,
+        span: spacy.tokens.Span,
+        tokens: Optional[Sequence[str]] = None,
+        terms: Optional[Container[str]] = None,
+    ) -> None:
+        """Index the ngrams of a token sequence.
+
+        Parameters
+        ----------
+        span : spacy.tokens.Span
+            The token sequence.
+        tokens : Sequence[str], optional
+            The token strings of the sequence, aligned with its tokens, by default None
+            which uses the token texts.
+        terms : Container[str], optional
+            The terms to index the occurrences of, by default None which indexes all the
+            ngrams.
+        """
+        if tokens is None:
+            tokens = [token.text for token in span]
+
+        doc_index = self.doc_registry.register(span.doc)
+        sequence_length = len(span)
+        for gram_size in self.gram_sizes(sequence_length):
+            for gram_start in range(sequence_length - gram_size + 1):
+                term = self.term_string(tokens[gram_start : gram_start + gram_size])
+                if terms is not None and term not in terms:
+                    continue
+                term_id = self._term_ids.setdefault(term, len(self._term_ids))
+                self._occ_term_ids.append(term_id)
+                self._occ_doc_indices.append(doc_index)
+                self._occ_starts.append(span.start + gram_start)
+                self._occ_ends.append(span.start + gram_start + gram_size)
+
+        self._term_order = None
+
+    def extend(self, other: "SpanNgramIndex") -> None:
+        """Add all the occurrences of another index.
+
+        Parameters
+        ----------
+        other : SpanNgramIndex
+            The index to add the occurrences from.
+        """
+        doc_indices = np.array(
+            [self.doc_registry.register(doc) for doc in other.doc_registry.docs],
+            dtype=np.int32,
+        )
+        term_ids = np.array(
+            [
+                self._term_ids.setdefault(term, len(self._term_ids))
+                for term in other._term_ids
+            ],
+            dtype=np.int32,
+        )
+        if len(other._occ_term_ids):
+            self._occ_term_ids.extend(
+                term_ids[np.frombuffer(other._occ_term_ids, dtype=np.int32)].tolist()
+            )
+            self._occ_doc_indices.extend(
+                doc_indices[
+                    np.frombuffer(other._occ_doc_indices, dtype=np.int32)
+                ].tolist()
+            )
+        self._occ_starts.extend(other._occ_starts)
+        self._occ_ends.extend(other._occ_ends)
+        self._term_order = None
+
+    def view(
+        self,
+        max_gram_size: Optional[int] = None,
+        map_term: Optional[Callable[[str], str]] = None,
+    ) -> "SpanNgramIndex":
+        """Return a new index of the occurrences of this index, restricted to the ngrams of
+        at most max_gram_size tokens and with their term strings mapped by map_term.
+        The terms mapped to the same string are merged.
+
+        The occurrences are remapped as integer arrays without going through the token
+        sequences again: only the term strings are mapped, once per term.
+
+        Parameters
+        ----------
+        max_gram_size : int, optional
+            The maximum number of tokens of the occurrences kept, by default None which
+            keeps all the occurrences.
+        map_term : Callable[[str], str], optional
+            The function mapping the term strings to the term strings of the new index,
+            e.g., str.lower, by default None which keeps the term strings.
+
+        Returns
+        -------
+        SpanNgramIndex
+            The new index. It shares the document registry of this index.
+        """
+        gram_sizes = self.gram_sizes
+        if max_gram_size is not None:
+            gram_sizes = lambda sequence_length: [
+                gram_size
+                for gram_size in self.gram_sizes(sequence_length)
+                if gram_size <= max_gram_size
+            ]
+        term_string = self.term_string
+        if map_term is not None:
+            term_string = lambda tokens: map_term(self.term_string(tokens))
+        index = SpanNgramIndex(
+            gram_sizes=gram_sizes, term_string=term_string, doc_registry=self.doc_registry
+        )
+
+        occ_term_ids = np.frombuffer(self._occ_term_ids, dtype=np.int32)
+        occ_doc_indices = np.frombuffer(self._occ_doc_indices, dtype=np.int32)
+        occ_starts = np.frombuffer(self._occ_starts, dtype=np.int32)
+        occ_ends = np.frombuffer(self._occ_ends, dtype=np.int32)
+        if max_gram_size is not None:
+            kept_occurrences = occ_ends - occ_starts <= max_gram_size
+            occ_term_ids = occ_term_ids[kept_occurrences]
+            occ_doc_indices = occ_doc_indices[kept_occurrences]
+            occ_starts = occ_starts[kept_occurrences]
+            occ_ends = occ_ends[kept_occurrences]
+
+        kept_terms = np.bincount(occ_term_ids, minlength=len(self._term_ids)) > 0
+        term_ids_map = np.full(len(self._term_ids), -1, dtype=np.int32)
+        for term, term_id in self._term_ids.items():
+            if kept_terms[term_id]:
+                if map_term is not None:
+                    term = map_term(term)
+                term_ids_map[term_id] = index._term_ids.setdefault(
+                    term, len(index._term_ids)
+                )
+
+        index._occ_term_ids.frombytes(term_ids_map[occ_term_ids].tobytes())
+        index._occ_doc_indices.frombytes(occ_doc_indices.tobytes())
+        index._occ_starts.frombytes(occ_starts.tobytes())
+        index._occ_ends.frombytes(occ_ends.tobytes())
+        return index
+
+    def _group_occurrences(self) -> None:
+        """Sort the occurrences by term, keeping their insertion order within a term."""
+        occ_term_ids = np.frombuffer(self._occ_term_ids, dtype=np.int32)
+        self._term_order = np.argsort(occ_term_ids, kind="stable")
+        self._term_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(occ_term_ids, minlength=len(self._term_ids))))
+        )
+
+    def get_occurrence_triples(self, term: str) -> List[Tuple[int, int, int]]:
+        """Return the (document index, start, end) triples of the occurrences of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term string.
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            The occurrence triples, in insertion order. Empty if the term is not indexed.
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            return []
+
+        if self._term_order is None:
+            self._group_occurrences()
+
+        occ_indices = self._term_order[
+            self._term_offsets[term_id] : self._term_offsets[term_id + 1]
+        ]
+        return [
+            (
+                self._occ_doc_indices[occ_index],
+                self._occ_starts[occ_index],
+                self._occ_ends[occ_index],
+            )
+            for occ_index in occ_indices.tolist()
+        ]
+
+    def __getitem__(self, term: str) -> List[spacy.tokens.Span]:
+        if term not in self._term_ids:
+            raise KeyError(term)
+        return [
+            self.doc_registry[doc_index][start:end]
+            for doc_index, start, end in self.get_occurrence_triples(term)
+        ]
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._term_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._term_ids)
+
+    def __len__(self) -> int:
+        return len(self._term_ids)
+
+
+def iter_token_sequences(
+    corpus: Iterable[spacy.tokens.Doc], token_sequences_doc_attribute: Optional[str] = None
+) -> Iterator[spacy.tokens.Span]:
+    """Yield the token sequences of the corpus documents.
+
+    Parameters
+    ----------
+    corpus : Iterable[spacy.tokens.Doc]
+        The corpus documents.
+    token_sequences_doc_attribute : str, optional
+        The name of the spaCy doc custom attribute containing the token sequences of the
+        documents, by default None which yields each document as a single span.
+
+    Yields
+    ------
+    spacy.tokens.Span
+        The token sequences, document by document.
+    """
+    for doc in corpus:
+        if token_sequences_doc_attribute:
+            yield from doc._.get(token_sequences_doc_attribute)
+        else:
+            yield doc[:]
+
+
+def build_span_ngram_index(
+    token_sequences: Iterable[spacy.tokens.Span],
+    max_gram_size: int,
+    token_strings: Callable[[spacy.tokens.Span], Sequence[str]],
+    doc_registry: Optional[DocRegistry] = None,
+    sequences_token_strings: Optional[Iterable[Sequence[str]]] = None,
+    terms: Optional[Container[str]] = None,
+) -> SpanNgramIndex:
+    """Index the corpus occurrences of the ngrams of 1 to max_gram_size tokens of token
+    sequences by term string, see normalised_term_string.
+
+    The ngram term strings are sliced from the token strings of their sequence when
+    token_strings returns one string per token. Otherwise, each ngram span goes through
+    token_strings on its own.
+
+    Parameters
+    ----------
+    token_sequences : Iterable[spacy.tokens.Span]
+        The token sequences to index the ngrams of.
+    max_gram_size : int
+        The maximum number of tokens of the indexed ngrams.
+    token_strings : Callable[[spacy.tokens.Span], Sequence[str]]
+        The function returning the token strings of a span the term strings are built from.
+    doc_registry : DocRegistry, optional
+        The registry of the documents the occurrences belong to, by default None which
+        creates a new registry.
+    sequences_token_strings : Iterable[Sequence[str]], optional
+        The token strings of the token sequences if already computed, by default None.
+    terms : Container[str], optional
+        The terms to index the occurrences of, by default None which indexes all the
+        ngrams.
+
+    Returns
+    -------
+    SpanNgramIndex
+        The index of the ngrams corpus occurrences.
+    """
+    index = SpanNgramIndex(
+        gram_sizes=lambda sequence_length: range(
+            1, min(max_gram_size, sequence_length) + 1
+        ),
+        term_string=_join_normalised_tokens,
+        doc_registry=doc_registry,
+    )
+    if sequences_token_strings is None:
+        spans_tokens = ((span, token_strings(span)) for span in token_sequences)
+    else:
+        spans_tokens = zip(token_sequences, sequences_token_strings)
+
+    for span, tokens in spans_tokens:
+        if len(tokens) == len(span):
+            index.add_token_sequence(
+                span, [" ".join(token.split()) for token in tokens], terms
+            )
+            continue
+
+        for gram_size in index.gram_sizes(len(span)):
+            for gram_start in range(span.start, span.end - gram_size + 1):
+                gram_span = span.doc[gram_start : gram_start + gram_size]
+                term = normalised_term_string(token_strings(gram_span))
+                if terms is None or term in terms:
+                    index.add(term, span.doc, gram_span.start, gram_span.end)
+
+    return index
@@ -1,6 +1,11 @@
+import json
 import os
-from typing import Dict, Optional, Set
+import shutil
+import tempfile
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
 from nltk.corpus.reader.wordnet import ADJ as WN_ADJ
 from nltk.corpus.reader.wordnet import ADV as WN_ADV
 from nltk.corpus.reader.wordnet import NOUN as WN_NOUN
@@ -47,6 +52,351 @@ def load_wordnet_domains(wordnet_domains_path: str) -> Dict[str, Set[str]]:
     return domains_map
 
 
+class WordNetDomainIndex(Mapping):
+    """Compiled index of the WordNet Synsets domains.
+
+    Synsets are keyed by an integer built from their offset and part of speech, and the
+    keys are sorted along with the bitsets of the synsets domains, one bit per domain.
+    Looking up a synset is a binary search and filtering synsets on domains is a bitset AND.
+    The index can be saved in a directory and loaded memory-mapped, so that the processes
+    using it share the same memory pages.
+    The index is a read-only mapping between WordNet synsets ids, e.g., `04154152-n`, and
+    their sets of domains.
+
+    Attributes
+    ----------
+    domains : List[str]
+        The domains, in the bitsets bit order.
+    """
+
+    # Part of speech codes of the synset keys, 's' being the adjective satellites.
+    POS_CODES = {"n": 0, "v": 1, "a": 2, "s": 3, "r": 4}
+    POS_CODE_SIZE = 8
+    INDEX_DTYPE = "<u8"
+
+    def __init__(
+        self, domains: List[str], synset_keys: np.ndarray, domain_bitsets: np.ndarray
+    ) -> None:
+        """Initialise WordNet domain index instance.
+
+        Parameters
+        ----------
+        domains : List[str]
+            The domains, in the bitsets bit order.
+        synset_keys : np.ndarray
+            The sorted synset keys.
+        domain_bitsets : np.ndarray
+            The domains bitsets of the synsets, one row of 64 bits words per synset key.
+        """
+        self.domains = domains
+        self._domain_ids = {
+            domain: domain_id for domain_id, domain in enumerate(domains)
+        }
+        self._synset_keys = synset_keys
+        self._domain_bitsets = domain_bitsets
+
+    @classmethod
+    def from_domains_map(
+        cls, domains_map: Mapping[str, Iterable[str]]
+    ) -> "WordNetDomainIndex":
+        """Build the index of a mapping of WordNet Synsets ids to domains.
+
+        Parameters
+        ----------
+        domains_map : Mapping[str, Iterable[str]]
+            The mapping of WordNet Synsets ids, e.g., `04154152-n`, to domains.
+
+        Returns
+        -------
+        WordNetDomainIndex
+            The WordNet domain index.
+        """
+        domain_ids = {}
+        synsets_domain_ids = {}
+        for ssid, synset_domains in domains_map.items():
+            synset_key = cls._parse_ssid(ssid)
+            if synset_key is None:
+                logger.warning("Unknown WordNet synset id %s ignored.", ssid)
+                continue
+            synsets_domain_ids.setdefault(synset_key, set()).update(
+                domain_ids.setdefault(domain, len(domain_ids))
+                for domain in synset_domains
+            )
+
+        synset_keys = np.array(sorted(synsets_domain_ids), dtype=cls.INDEX_DTYPE)
+        domain_bitsets = np.zeros(
+            (len(synset_keys), max(1, -(-len(domain_ids) // 64))),
+            dtype=cls.INDEX_DTYPE,
+        )
+        for synset_index, synset_key in enumerate(synset_keys.tolist()):
+            for domain_id in synsets_domain_ids[synset_key]:
+                domain_bitsets[synset_index, domain_id // 64] |= np.uint64(
+                    1 << (domain_id % 64)
+                )
+
+        return cls(list(domain_ids), synset_keys, domain_bitsets)
+
+    @classmethod
+    def _parse_ssid(cls, ssid: str) -> Optional[int]:
+        """Return the key of a WordNet synset id, e.g., `04154152-n`, or None if it is
+        malformed."""
+        offset, _, pos = ssid.partition("-")
+        pos_code = cls.POS_CODES.get(pos)
+        if pos_code is None or not offset.isdigit():
+            return None
+        return int(offset) * cls.POS_CODE_SIZE + pos_code
+
+    @classmethod
+    def get_synset_key(cls, offset: int, pos: str) -> int:
+        """Return the index key of a WordNet synset.
+
+        Parameters
+        ----------
+        offset : int
+            The synset offset.
+        pos : str
+            The synset part of speech.
+
+        Returns
+        -------
+        int
+            The synset key.
+        """
+        pos_code = cls.POS_CODES.get(pos, cls.POS_CODE_SIZE - 1)
+        return offset * cls.POS_CODE_SIZE + pos_code
+
+    def save(self, index_path: str) -> None:
+        """Save the index in a directory.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the index directory.
+        """
+        os.makedirs(index_path, exist_ok=True)
+        np.save(os.path.join(index_path, "synset_keys.npy"), self._synset_keys)
+        np.save(os.path.join(index_path, "domain_bitsets.npy"), self._domain_bitsets)
+        domains_path = os.path.join(index_path, "domains.json")
+        with open(domains_path, "w", encoding="utf8") as file:
+            json.dump(self.domains, file)
+
+    @classmethod
+    def load(cls, index_path: str) -> "WordNetDomainIndex":
+        """Load a saved index, memory-mapping its arrays.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the index directory.
+
+        Returns
+        -------
+        WordNetDomainIndex
+            The WordNet domain index.
+        """
+        domains_path = os.path.join(index_path, "domains.json")
+        with open(domains_path, "r", encoding="utf8") as file:
+            domains = json.load(file)
+        synset_keys = np.load(
+            os.path.join(index_path, "synset_keys.npy"), mmap_mode="r"
+        )
+        domain_bitsets = np.load(
+            os.path.join(index_path, "domain_bitsets.npy"), mmap_mode="r"
+        )
+        return cls(domains, synset_keys, domain_bitsets)
+
+    def get_domains_bitset(self, domains: Iterable[str]) -> np.ndarray:
+        """Return the bitset of a set of domains. Unknown domains are ignored.
+
+        Parameters
+        ----------
+        domains : Iterable[str]
+            The domains.
+
+        Returns
+        -------
+        np.ndarray
+            The domains bitset.
+        """
+        domains_bitset = np.zeros(self._domain_bitsets.shape[1], dtype=self.INDEX_DTYPE)
+        for domain in domains:
+            domain_id = self._domain_ids.get(domain)
+            if domain_id is not None:
+                domains_bitset[domain_id // 64] |= np.uint64(1 << (domain_id % 64))
+        return domains_bitset
+
+    def _lookup(self, synset_keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the positions of synset keys in the index and whether they are found."""
+        positions = np.searchsorted(self._synset_keys, synset_keys)
+        positions = np.minimum(positions, max(len(self._synset_keys) - 1, 0))
+        if len(self._synset_keys) == 0:
+            return positions, np.zeros(len(synset_keys), dtype=bool)
+        return positions, self._synset_keys[positions] == synset_keys
+
+    def _get_bitset_domains(self, domains_bitset: np.ndarray) -> Set[str]:
+        """Return the domains of a bitset."""
+        domain_bits = np.unpackbits(
+            np.ascontiguousarray(domains_bitset).view(np.uint8), bitorder="little"
+        )
+        return {self.domains[domain_id] for domain_id in np.flatnonzero(domain_bits)}
+
+    def get_synset_domains(self, offset: int, pos: str) -> Set[str]:
+        """Return the domains of a WordNet synset.
+
+        Parameters
+        ----------
+        offset : int
+            The synset offset.
+        pos : str
+            The synset part of speech.
+
+        Returns
+        -------
+        Set[str]
+            The synset domains, empty if the synset is not indexed.
+        """
+        positions, found = self._lookup(
+            np.array([self.get_synset_key(offset, pos)], dtype=self.INDEX_DTYPE)
+        )
+        if not found[0]:
+            return set()
+        return self._get_bitset_domains(self._domain_bitsets[positions[0]])
+
+    def match_synsets_domains(
+        self, synsets_offsets_pos: List[Tuple[int, str]], domains_bitset: np.ndarray
+    ) -> np.ndarray:
+        """Test which WordNet synsets have at least one domain of a domains bitset.
+
+        Parameters
+        ----------
+        synsets_offsets_pos : List[Tuple[int, str]]
+            The (offset, part of speech) pairs of the synsets.
+        domains_bitset : np.ndarray
+            The bitset of the domains to match.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each synset has one of the domains.
+        """
+        synset_keys = np.array(
+            [self.get_synset_key(offset, pos) for offset, pos in synsets_offsets_pos],
+            dtype=self.INDEX_DTYPE,
+        )
+        positions, found = self._lookup(synset_keys)
+        if not len(synset_keys):
+            return found
+        return found & (self._domain_bitsets[positions] & domains_bitset).any(axis=1)
+
+    def __getitem__(self, ssid: str) -> Set[str]:
+        synset_key = self._parse_ssid(ssid)
+        if synset_key is None:
+            raise KeyError(ssid)
+        positions, found = self._lookup(
+            np.array([synset_key], dtype=self.INDEX_DTYPE)
+        )
+        if not found[0]:
+            raise KeyError(ssid)
+        return self._get_bitset_domains(self._domain_bitsets[positions[0]])
+
+    def __iter__(self) -> Iterator[str]:
+        key_pos = {pos_code: pos for pos, pos_code in self.POS_CODES.items()}
+        for synset_key in self._synset_keys.tolist():
+            offset, pos_code = divmod(synset_key, self.POS_CODE_SIZE)
+            ssid_num = str(offset).zfill(WORDNET_DOMAINS_SSID_NUM_SIZE)
+            yield f"{ssid_num}-{key_pos[pos_code]}"
+
+    def __len__(self) -> int:
+        return len(self._synset_keys)
+
+
+def load_wordnet_domain_index(
+    wordnet_domains_path: str, index_path: Optional[str] = None
+) -> WordNetDomainIndex:
+    """Load the compiled index of the WordNet Synsets domains of a domains file.
+    The index is compiled from the file on first use and saved next to it, then loaded
+    memory-mapped by the following calls, in any process. It is compiled again when the file
+    changes.
+
+    Parameters
+    ----------
+    wordnet_domains_path : str
+        The full or relative path to wordnet domains synsets mapping file.
+        See `load_wordnet_domains` for the file structure.
+    index_path : str, optional
+        Path to the index directory, by default None which uses the file path followed by
+        `.index`.
+
+    Returns
+    -------
+    WordNetDomainIndex
+        The WordNet domain index, empty if the file could not be loaded.
+    """
+    domain_file_path = str(wordnet_domains_path)
+
+    if not os.path.isabs(domain_file_path):
+        domain_file_path = os.path.join(os.getenv("DATA_PATH"), domain_file_path)
+
+    if index_path is None:
+        index_path = f"{domain_file_path}.index"
+
+    try:
+        domain_file_stat = os.stat(domain_file_path)
+    except OSError as e:
+        logger.error(
+            "Could not load wordnet domains from file %s. Trace : %s",
+            domain_file_path,
+            e,
+        )
+        return WordNetDomainIndex.from_domains_map({})
+    index_source = {
+        "size": domain_file_stat.st_size,
+        "mtime_ns": domain_file_stat.st_mtime_ns,
+    }
+
+    index_source_path = os.path.join(index_path, "source.json")
+    try:
+        with open(index_source_path, "r", encoding="utf8") as file:
+            if json.load(file) == index_source:
+                return WordNetDomainIndex.load(index_path)
+    except (OSError, ValueError):
+        pass
+
+    domain_index = WordNetDomainIndex.from_domains_map(
+        load_wordnet_domains(domain_file_path)
+    )
+    if not len(domain_index):
+        return domain_index
+
+    # The index is written in a temporary directory and moved in place so that processes
+    # compiling the same index concurrently never read a partial one.
+    tmp_index_path = None
+    try:
+        tmp_index_path = tempfile.mkdtemp(
+            prefix=".tmp_", dir=os.path.dirname(os.path.abspath(index_path))
+        )
+        domain_index.save(tmp_index_path)
+        with open(
+            os.path.join(tmp_index_path, "source.json"), "w", encoding="utf8"
+        ) as file:
+            json.dump(index_source, file)
+        shutil.rmtree(index_path, ignore_errors=True)
+        os.replace(tmp_index_path, index_path)
+    except OSError as e:
+        logger.warning(
+            "Could not save the wordnet domains index in %s, it will be compiled again next time. Trace : %s",
+            index_path,
+            e,
+        )
+        if tmp_index_path is not None:
+            shutil.rmtree(tmp_index_path, ignore_errors=True)
+    else:
+        logger.info("Wordnet domains index compiled in %s.", index_path)
+        domain_index = WordNetDomainIndex.load(index_path)
+
+    return domain_index
+
+
 def load_enrichment_wordnet_domains_from_file(enrichment_domains_path: str) -> Set[str]:
     """Load a set of domains (strings) from a file.
         The file is expected to contain one domain string per line.
@@ -6,3 +6,4 @@ from .knowledge_representation_schema import KnowledgeRepresentation
 from .linguistic_realisation_schema import LinguisticRealisation, MetaRelationLR, RelationLR, ConceptLR
 from .metarelation_schema import Metarelation
 from .relation_schema import Relation
+from .span_set_schema import DocRegistry, SpanSet
@@ -0,0 +1,395 @@
+from collections.abc import MutableSet
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import spacy.tokens
+
+# Bits used to pack a (doc id, start, end) span reference into a single integer.
+OFFSET_BITS = 21
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+MAX_DOC_ID = (1 << (63 - 2 * OFFSET_BITS)) - 1
+
+CorpusOccurrence = Union[spacy.tokens.Span, Tuple[spacy.tokens.Span, ...]]
+
+
+class DocRegistry:
+    """Registry of the corpus documents, assigning each document an integer id.
+    The ids are used to refer to the corpus occurrences without keeping spaCy spans.
+
+    Attributes
+    ----------
+    docs : List[spacy.tokens.Doc]
+        The registered documents, indexed by their id.
+    """
+
+    def __init__(self, docs: Optional[Iterable[spacy.tokens.Doc]] = None) -> None:
+        """Initialise document registry instance.
+
+        Parameters
+        ----------
+        docs : Iterable[spacy.tokens.Doc], optional
+            Documents to register, by default None.
+        """
+        self.docs = []
+        self._doc_ids = {}
+        if docs is not None:
+            self.register_docs(docs)
+
+    def register(self, doc: spacy.tokens.Doc) -> int:
+        """Return the id of a document, registering it if needed.
+
+        Parameters
+        ----------
+        doc : spacy.tokens.Doc
+            The document to register.
+
+        Returns
+        -------
+        int
+            The document id.
+        """
+        doc_id = self._doc_ids.get(id(doc))
+        if doc_id is None:
+            doc_id = len(self.docs)
+            self._doc_ids[id(doc)] = doc_id
+            self.docs.append(doc)
+        return doc_id
+
+    def register_docs(self, docs: Iterable[spacy.tokens.Doc]) -> None:
+        """Register documents.
+
+        Parameters
+        ----------
+        docs : Iterable[spacy.tokens.Doc]
+            The documents to register.
+        """
+        for doc in docs:
+            self.register(doc)
+
+    def get_doc_id(self, doc: spacy.tokens.Doc) -> Optional[int]:
+        """Return the id of a document, or None if it is not registered.
+
+        Parameters
+        ----------
+        doc : spacy.tokens.Doc
+            The document to look for.
+
+        Returns
+        -------
+        Optional[int]
+            The document id.
+        """
+        return self._doc_ids.get(id(doc))
+
+    def __getitem__(self, doc_id: int) -> spacy.tokens.Doc:
+        return self.docs[doc_id]
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+
+class SpanSet(MutableSet):
+    """Compact set of corpus occurrences, i.e., spaCy spans or tuples of spaCy spans.
+
+    Each span is stored as a (doc id, start, end) reference packed in a 64-bit integer,
+    the doc ids being given by a document registry. References are kept in a sorted numpy
+    array, so that union, intersection and difference of span sets sharing the same registry
+    are computed on arrays. Spans are only created when the set is iterated over.
+    The span set behaves as a set of spans. Span attributes other than their document and
+    boundaries, e.g. their label, are not kept.
+
+    Attributes
+    ----------
+    doc_registry : DocRegistry
+        The registry of the documents the occurrences belong to.
+    arity : int
+        The number of spans per occurrence, 1 for spans, None while the set has never
+        contained any occurrence.
+    """
+
+    def __init__(
+        self,
+        corpus_occurrences: Optional[Iterable[CorpusOccurrence]] = None,
+        doc_registry: Optional[DocRegistry] = None,
+    ) -> None:
+        """Initialise span set instance.
+
+        Parameters
+        ----------
+        corpus_occurrences : Iterable[CorpusOccurrence], optional
+            The initial corpus occurrences, by default None.
+        doc_registry : DocRegistry, optional
+            The registry of the documents the occurrences belong to, by default None which
+            creates a new registry.
+        """
+        self.doc_registry = doc_registry if doc_registry is not None else DocRegistry()
+        self.arity = None
+        self._refs = None
+        self._pending_refs = []
+        if corpus_occurrences is not None:
+            self.update(corpus_occurrences)
+
+    def _from_iterable(self, corpus_occurrences: Iterable[CorpusOccurrence]) -> "SpanSet":
+        return SpanSet(corpus_occurrences, self.doc_registry)
+
+    def _dtype(self) -> np.dtype:
+        """Return the numpy type of the occurrence references."""
+        if self.arity in (None, 1):
+            return np.dtype(np.int64)
+        return np.dtype([(f"span_{i}", np.int64) for i in range(self.arity)])
+
+    def _span_ref(self, span: spacy.tokens.Span, register: bool = True) -> Optional[int]:
+        """Pack a span into a (doc id, start, end) reference."""
+        if register:
+            doc_id = self.doc_registry.register(span.doc)
+        else:
+            doc_id = self.doc_registry.get_doc_id(span.doc)
+            if doc_id is None:
+                return None
+        if doc_id > MAX_DOC_ID or span.end > OFFSET_MASK:
+            raise ValueError(
+                f"Span {span} can not be referenced in a span set, the corpus or the document is too large."
+            )
+        return (doc_id << (2 * OFFSET_BITS)) | (span.start << OFFSET_BITS) | span.end
+
+    def _occurrence_ref(
+        self, corpus_occurrence: CorpusOccurrence, register: bool = True
+    ) -> Any:
+        """Convert a corpus occurrence into its reference, None if the occurrence can not
+        belong to the set."""
+        if isinstance(corpus_occurrence, spacy.tokens.Span):
+            arity = 1
+            ref = self._span_ref(corpus_occurrence, register)
+        elif isinstance(corpus_occurrence, tuple) and all(
+            isinstance(span, spacy.tokens.Span) for span in corpus_occurrence
+        ):
+            arity = len(corpus_occurrence)
+            ref = tuple(self._span_ref(span, register) for span in corpus_occurrence)
+            if None in ref:
+                ref = None
+        else:
+            raise TypeError(
+                f"Span sets only contain spans or tuples of spans, not {type(corpus_occurrence)}."
+            )
+
+        if self.arity is None and register:
+            self.arity = arity
+        elif arity != self.arity:
+            if register:
+                raise TypeError(
+                    f"Span set of occurrences of {self.arity} span(s) can not contain occurrences of {arity} span(s)."
+                )
+            return None
+
+        return ref
+
+    def _resolve_span(self, span_ref: int) -> spacy.tokens.Span:
+        """Unpack a (doc id, start, end) reference into a spaCy span."""
+        doc = self.doc_registry[span_ref >> (2 * OFFSET_BITS)]
+        return doc[(span_ref >> OFFSET_BITS) & OFFSET_MASK : span_ref & OFFSET_MASK]
+
+    def _resolve(self, ref: Any) -> CorpusOccurrence:
+        """Convert a reference into its corpus occurrence."""
+        if self.arity == 1:
+            return self._resolve_span(ref)
+        return tuple(self._resolve_span(span_ref) for span_ref in ref)
+
+    def _get_refs(self) -> np.ndarray:
+        """Return the sorted array of unique references, merging the pending ones."""
+        if self._refs is None or self._refs.dtype != self._dtype():
+            # The references of a set never filled are retyped once its arity is known.
+            self._refs = np.empty(0, dtype=self._dtype())
+        if self._pending_refs:
+            pending_refs = np.array(self._pending_refs, dtype=self._dtype())
+            self._refs = np.union1d(self._refs, pending_refs)
+            self._pending_refs = []
+        return self._refs
+
+    def _with_refs(self, refs: np.ndarray, arity: Optional[int]) -> "SpanSet":
+        """Create a span set sharing the registry from an array of sorted unique references."""
+        span_set = SpanSet(doc_registry=self.doc_registry)
+        span_set.arity = arity
+        span_set._refs = refs
+        return span_set
+
+    def _is_compatible(self, other: Any) -> bool:
+        """Whether set operations with another set can be computed on the references."""
+        return (
+            isinstance(other, SpanSet)
+            and other.doc_registry is self.doc_registry
+            and (self.arity is None or other.arity is None or self.arity == other.arity)
+        )
+
+    def get_doc_ids(self) -> np.ndarray:
+        """Return the ids of the documents the occurrences belong to.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted unique document ids.
+        """
+        refs = self._get_refs()
+        if self.arity not in (None, 1):
+            refs = refs["span_0"]
+        return np.unique(refs >> (2 * OFFSET_BITS))
+
+    def add(self, corpus_occurrence: CorpusOccurrence) -> None:
+        self._pending_refs.append(self._occurrence_ref(corpus_occurrence))
+
+    def discard(self, corpus_occurrence: CorpusOccurrence) -> None:
+        ref = self._occurrence_ref(corpus_occurrence, register=False)
+        if ref is not None:
+            refs = self._get_refs()
+            self._refs = refs[refs != np.array(ref, dtype=self._dtype())]
+
+    def update(self, *corpus_occurrences_sets: Iterable[CorpusOccurrence]) -> None:
+        """Add the corpus occurrences of iterables to the set.
+
+        Parameters
+        ----------
+        *corpus_occurrences_sets : Iterable[CorpusOccurrence]
+            The corpus occurrences to add.
+        """
+        for corpus_occurrences in corpus_occurrences_sets:
+            if self._is_compatible(corpus_occurrences):
+                if corpus_occurrences.arity is not None:
+                    self.arity = corpus_occurrences.arity
+                    self._refs = np.union1d(
+                        self._get_refs(), corpus_occurrences._get_refs()
+                    )
+            else:
+                self._pending_refs.extend(
+                    self._occurrence_ref(corpus_occurrence)
+                    for corpus_occurrence in corpus_occurrences
+                )
+
+    def copy(self) -> "SpanSet":
+        return self._with_refs(self._get_refs().copy(), self.arity)
+
+    def union(self, *others: Iterable[CorpusOccurrence]) -> "SpanSet":
+        span_set = self.copy()
+        span_set.update(*others)
+        return span_set
+
+    def intersection(self, other: Iterable[CorpusOccurrence]) -> "SpanSet":
+        if self._is_compatible(other):
+            if self.arity is None or other.arity is None:
+                return SpanSet(doc_registry=self.doc_registry)
+            return self._with_refs(
+                np.intersect1d(self._get_refs(), other._get_refs(), assume_unique=True),
+                self.arity if self.arity is not None else other.arity,
+            )
+        return self._from_iterable(
+            corpus_occurrence for corpus_occurrence in other if corpus_occurrence in self
+        )
+
+    def difference(self, other: Iterable[CorpusOccurrence]) -> "SpanSet":
+        if self._is_compatible(other):
+            if self.arity is None or other.arity is None:
+                return self.copy()
+            return self._with_refs(
+                np.setdiff1d(self._get_refs(), other._get_refs(), assume_unique=True),
+                self.arity,
+            )
+        return super().__sub__(other)
+
+    def __or__(self, other: Any) -> "SpanSet":
+        if self._is_compatible(other):
+            return self.union(other)
+        return super().__or__(other)
+
+    __ror__ = __or__
+
+    def __and__(self, other: Any) -> "SpanSet":
+        if self._is_compatible(other):
+            return self.intersection(other)
+        return super().__and__(other)
+
+    __rand__ = __and__
+
+    def __sub__(self, other: Any) -> "SpanSet":
+        if self._is_compatible(other):
+            return self.difference(other)
+        return super().__sub__(other)
+
+    def __eq__(self, other: Any) -> bool:
+        if self._is_compatible(other) and self.arity == other.arity:
+            return np.array_equal(self._get_refs(), other._get_refs())
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __contains__(self, corpus_occurrence: Any) -> bool:
+        try:
+            ref = self._occurrence_ref(corpus_occurrence, register=False)
+        except TypeError:
+            return False
+        if ref is None:
+            return False
+        refs = self._get_refs()
+        ref = np.array(ref, dtype=self._dtype())
+        position = np.searchsorted(refs, ref)
+        return bool(position < len(refs) and refs[position] == ref)
+
+    def __iter__(self) -> Iterator[CorpusOccurrence]:
+        for ref in self._get_refs().tolist():
+            yield self._resolve(ref)
+
+    def __len__(self) -> int:
+        return len(self._get_refs())
+
+    def __repr__(self) -> str:
+        return f"SpanSet({set(self)})"
+
+
+def compact_corpus_occurrences(
+    corpus_occurrences: Iterable[CorpusOccurrence], doc_registry: DocRegistry
+) -> Union[SpanSet, Iterable[CorpusOccurrence]]:
+    """Convert corpus occurrences into a span set using a document registry.
+    Occurrences that can not be stored in a span set, e.g. mixing spans and tuples of spans
+    or containing None values, are returned unchanged.
+
+    Parameters
+    ----------
+    corpus_occurrences : Iterable[CorpusOccurrence]
+        The corpus occurrences to convert.
+    doc_registry : DocRegistry
+        The registry of the documents the occurrences belong to.
+
+    Returns
+    -------
+    Union[SpanSet, Iterable[CorpusOccurrence]]
+        The span set of the corpus occurrences, or the corpus occurrences unchanged.
+    """
+    if isinstance(corpus_occurrences, SpanSet) and (
+        corpus_occurrences.doc_registry is doc_registry
+    ):
+        return corpus_occurrences
+    try:
+        return SpanSet(corpus_occurrences, doc_registry)
+    except (TypeError, ValueError):
+        return corpus_occurrences
+
+
+def compact_corpus_occurrences_in_place(
+    containers: Iterable[Any], doc_registry: DocRegistry
+) -> None:
+    """Replace the corpus occurrences of data containers, i.e., candidate terms and
+    linguistic realisations, by span sets.
+
+    Parameters
+    ----------
+    containers : Iterable[Any]
+        The data containers with a corpus_occurrences attribute.
+    doc_registry : DocRegistry
+        The registry of the documents the occurrences belong to.
+    """
+    # Containers sharing the same corpus occurrences keep sharing them once compacted.
+    compacted_occurrences = {}
+    for container in containers:
+        occurrences_id = id(container.corpus_occurrences)
+        if occurrences_id not in compacted_occurrences:
+            compacted_occurrences[occurrences_id] = compact_corpus_occurrences(
+                container.corpus_occurrences, doc_registry
+            )
+        container.corpus_occurrences = compacted_occurrences[occurrences_id]
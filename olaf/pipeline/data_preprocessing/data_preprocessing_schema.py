@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from typing import Any, List, TYPE_CHECKING
+
+import spacy
 
 if TYPE_CHECKING:
     from ..pipeline_schema import Pipeline
@@ -25,3 +27,20 @@ class DataPreprocessing(ABC):
             Type Any is used instead of Pipeline to avoid circular import.
         """
         ...
+
+    def run_incremental(
+        self, pipeline: 'Pipeline', new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Method that is responsible for the execution of the component on documents added
+        to the pipeline corpus.
+
+        By default, the component is run again on the whole pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The running pipeline. Its corpus already contains the new documents.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        self.run(pipeline)
@@ -98,7 +98,33 @@ class TokenSelectorDataPreprocessing(DataPreprocessing):
         """
 
         self.corpus = pipeline.corpus
-        for doc in self.corpus:
+        self._preprocess_docs(self.corpus)
+
+    def run_incremental(
+        self, pipeline: 'Pipeline', new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Method that is responsible for the execution of the component to preprocess only
+        the documents added to the pipeline corpus.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        self.corpus = pipeline.corpus
+        self._preprocess_docs(new_corpus)
+
+    def _preprocess_docs(self, docs: List[spacy.tokens.Doc]) -> None:
+        """Select the tokens of each document and store them in the token sequence doc attribute.
+
+        Parameters
+        ----------
+        docs : List[spacy.tokens.Doc]
+            The documents to preprocess.
+        """
+        for doc in docs:
             selected_tokens = doc._.get(self._token_sequence_doc_attribute)
 
             if not (selected_tokens):
@@ -1,9 +1,14 @@
-from typing import Any, Dict, Set, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import spacy
 
 from ...pipeline_schema import Pipeline
 from ....commons.logging_config import logger
 from ....data_container.enrichment_schema import Enrichment
-from ....repository.knowledge_source.knowledge_source_schema import KnowledgeSource
+from ....repository.knowledge_source.knowledge_source_schema import (
+    ENRICHMENT_KINDS,
+    KnowledgeSource,
+)
 from ..pipeline_component_schema import PipelineComponent
 
 
@@ -85,9 +90,7 @@ class KnowledgeBasedCTermEnrichment(PipelineComponent):
             The pipeline running.
         """
 
-        unknown_enrichment_kinds = self.enrichment_kinds.difference(
-            {"synonyms", "hypernyms", "hyponyms", "antonyms"}
-        )
+        unknown_enrichment_kinds = self.enrichment_kinds.difference(ENRICHMENT_KINDS)
 
         if len(unknown_enrichment_kinds) > 0:
             logger.warning(
@@ -98,30 +101,47 @@ class KnowledgeBasedCTermEnrichment(PipelineComponent):
             for enrichment_kind in unknown_enrichment_kinds:
                 logger.warning("%s", enrichment_kind)
 
-        for c_term in pipeline.candidate_terms:
+        c_terms = list(pipeline.candidate_terms)
+        c_terms_to_use = {}
+        for c_term_index, c_term in enumerate(c_terms):
             if not c_term.enrichment:
                 c_term.enrichment = Enrichment()
 
             terms_to_use = {c_term.label}
             if self.use_synonyms:
                 terms_to_use.update(c_term.enrichment.synonyms)
+            c_terms_to_use[c_term_index] = terms_to_use
+
+        c_terms_enrichment = self.knowledge_source.fetch_terms_groups_enrichment(
+            terms_groups=c_terms_to_use, enrichment_kinds=self.enrichment_kinds
+        )
+
+        for c_term_index, c_term in enumerate(c_terms):
+            terms_enrichment = c_terms_enrichment[c_term_index]
+
+            if "synonyms" in terms_enrichment:
+                c_term.enrichment.add_synonyms(terms_enrichment["synonyms"])
+
+            if "hypernyms" in terms_enrichment:
+                c_term.enrichment.add_hypernyms(terms_enrichment["hypernyms"])
+
+            if "hyponyms" in terms_enrichment:
+                c_term.enrichment.add_hyponyms(terms_enrichment["hyponyms"])
 
-            if "synonyms" in self.enrichment_kinds:
-                c_term.enrichment.add_synonyms(
-                    self.knowledge_source.fetch_terms_synonyms(terms=terms_to_use)
-                )
-
-            if "hypernyms" in self.enrichment_kinds:
-                c_term.enrichment.add_hypernyms(
-                    self.knowledge_source.fetch_terms_hypernyms(terms=terms_to_use)
-                )
-
-            if "hyponyms" in self.enrichment_kinds:
-                c_term.enrichment.add_hyponyms(
-                    self.knowledge_source.fetch_terms_hyponyms(terms=terms_to_use)
-                )
-
-            if "antonyms" in self.enrichment_kinds:
-                c_term.enrichment.add_antonyms(
-                    self.knowledge_source.fetch_terms_antonyms(terms=terms_to_use)
-                )
+            if "antonyms" in terms_enrichment:
+                c_term.enrichment.add_antonyms(terms_enrichment["antonyms"])
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the enrichment on the candidate terms extracted from the documents
+        added to the corpus, i.e., the current pipeline candidate terms.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        self.run(pipeline)
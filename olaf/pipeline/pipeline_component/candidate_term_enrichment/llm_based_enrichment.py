@@ -1,8 +1,14 @@
 import ast
 from typing import Any, Callable, Dict, List, Optional, Set
 
+import spacy
+
 from ...pipeline_schema import Pipeline
-from ....commons.llm_tools import HuggingFaceGenerator, LLMGenerator
+from ....commons.llm_tools import (
+    HuggingFaceGenerator,
+    LLMGenerator,
+    LLMRequestExecutor,
+)
 from ....commons.logging_config import logger
 from ....commons.prompts import hf_prompt_term_enrichment
 from ....data_container import CandidateTerm, Enrichment
@@ -19,12 +25,15 @@ class LLMBasedTermEnrichment(PipelineComponent):
     llm_generator: LLMGenerator
         The LLM model used to enrich the candidate terms.
         By default, the zephyr-7b-beta HuggingFace model is used.
+    llm_executor: LLMRequestExecutor
+        The executor sending the LLM generator requests of the candidate terms concurrently.
     """
 
     def __init__(
         self,
         prompt_template: Optional[Callable[[str], List[Dict[str, str]]]] = None,
         llm_generator: Optional[LLMGenerator] = None,
+        max_concurrent_requests: Optional[int] = 4,
     ) -> None:
         """Initialise LLM term enrichment pipeline component instance.
 
@@ -36,6 +45,10 @@ class LLMBasedTermEnrichment(PipelineComponent):
         llm_generator: LLMGenerator, optional
             The LLM model used to generate the enrichment.
             By default, the zephyr-7b-beta HuggingFace model is used.
+        max_concurrent_requests: int, optional
+            Maximum number of candidate terms sent concurrently to the LLM generator, by
+            default 4. The requests are also limited by the generator
+            max_requests_per_minute.
         """
 
         self.prompt_template = (
@@ -46,6 +59,9 @@ class LLMBasedTermEnrichment(PipelineComponent):
         self.llm_generator = (
             llm_generator if llm_generator is not None else HuggingFaceGenerator()
         )
+        self.llm_executor = LLMRequestExecutor(
+            self.llm_generator, max_workers=max_concurrent_requests
+        )
         self.check_resources()
 
     def optimise(
@@ -86,6 +102,18 @@ class LLMBasedTermEnrichment(PipelineComponent):
         """
         cterm_prompt = self.prompt_template(cterm.label)
         llm_output = self.llm_generator.generate_text(cterm_prompt)
+        self._add_llm_enrichment(cterm, llm_output)
+
+    def _add_llm_enrichment(self, cterm: CandidateTerm, llm_output: str) -> None:
+        """Add to a candidate term the enrichment generated by a LLM.
+
+        Parameters
+        ----------
+        cterm: CandidateTerm
+            The candidate term to enrich.
+        llm_output: str
+            The LLM generator output, expected to be a dictionary of enrichments.
+        """
         try:
             enrichment = ast.literal_eval(llm_output)
             if isinstance(enrichment, Dict):
@@ -121,5 +149,22 @@ class LLMBasedTermEnrichment(PipelineComponent):
             The pipeline running.
         """
 
-        for cterm in pipeline.candidate_terms:
-            self._enrich_cterm(cterm)
+        for cterm, llm_output in self.llm_executor.generate_texts(
+            pipeline.candidate_terms, lambda cterm: self.prompt_template(cterm.label)
+        ):
+            self._add_llm_enrichment(cterm, llm_output)
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the enrichment on the candidate terms extracted from the documents
+        added to the corpus, i.e., the current pipeline candidate terms.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        self.run(pipeline)
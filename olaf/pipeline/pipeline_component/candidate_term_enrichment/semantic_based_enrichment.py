@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
+import spacy
 from spacy.language import Language
 
 from ...pipeline_schema import Pipeline
@@ -126,3 +127,18 @@ class SemanticBasedEnrichment(PipelineComponent):
         else:
             for c_term in pipeline.candidate_terms:
                 self.enrich_term(c_term, pipeline.spacy_model)
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the enrichment on the candidate terms extracted from the documents
+        added to the corpus, i.e., the current pipeline candidate terms.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        self.run(pipeline)
@@ -1,11 +1,19 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
+import spacy
 
 from ...pipeline_schema import Pipeline
-from ....algorithm.agglomerative_clustering import AgglomerativeClustering
-from ....commons.candidate_term_tools import cts_to_concept
-from ....commons.embedding_tools import sbert_embeddings
+from ....algorithm.agglomerative_clustering import (
+    CLUSTERING_ENGINES,
+    AgglomerativeClustering,
+)
+from ....commons.candidate_term_tools import (
+    add_cts_to_concepts,
+    cts_to_concept,
+    merge_concepts,
+)
+from ....commons.embedding_tools import EmbeddingCache, sbert_embeddings
 from ....commons.errors import ParameterError
 from ....commons.logging_config import logger
 from ....data_container.knowledge_representation_schema import KnowledgeRepresentation
@@ -35,6 +43,20 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
         Name of the embedding model to use.
         The list of available models can be found here : https://www.sbert.net/docs/pretrained_models.html,
         by default None.
+    embedding_batch_size: int, optional
+        Number of candidate labels encoded at once by the embedding model, by default 32.
+    normalise_embeddings: bool, optional
+        Whether to scale the embeddings to unit length, by default False.
+    clustering_engine: str, optional
+        Clustering engine, "exact", "knn_graph" for large sets of candidates or "two_stage"
+        for very large ones, by default "exact".
+        See AgglomerativeClustering for the engines description.
+    nb_neighbours: int, optional
+        Number of neighbours of each candidate in the "knn_graph" engine graph, by default 15.
+    nb_centroids: int, optional
+        Number of k-means centroids of the "two_stage" engine, by default 1000.
+    embedding_cache: EmbeddingCache, optional
+        Cache of the candidate labels embeddings, None for the process-wide cache.
     """
 
     def __init__(
@@ -44,6 +66,12 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
         linkage: Optional[str] = "average",
         distance_threshold: Optional[float] = None,
         embedding_model: Optional[str] = None,
+        embedding_batch_size: Optional[int] = 32,
+        normalise_embeddings: Optional[bool] = False,
+        clustering_engine: Optional[str] = "exact",
+        nb_neighbours: Optional[int] = 15,
+        nb_centroids: Optional[int] = 1000,
+        embedding_cache: Optional[Union[EmbeddingCache, str]] = None,
     ) -> None:
         """Initialise agglomerative clustering-based concept extraction instance.
 
@@ -65,6 +93,22 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
             Name of the embedding model to use.
             The list of available models can be found here : https://www.sbert.net/docs/pretrained_models.html,
             by default all-mpnet-base-v2.
+        embedding_batch_size: int, optional
+            Number of candidate labels encoded at once by the embedding model, by default 32.
+        normalise_embeddings: bool, optional
+            Whether to scale the embeddings to unit length, by default False.
+        clustering_engine: str, optional
+            Clustering engine, "exact", "knn_graph" for large sets of candidates or "two_stage"
+            for very large ones, by default "exact".
+            See AgglomerativeClustering for the engines description.
+        nb_neighbours: int, optional
+            Number of neighbours of each candidate in the "knn_graph" engine graph, by default 15.
+        nb_centroids: int, optional
+            Number of k-means centroids of the "two_stage" engine, by default 1000.
+        embedding_cache: EmbeddingCache or str, optional
+            Cache of the candidate labels embeddings, or path to the SQLite file of a
+            persistent embedding cache reused across runs, by default None which uses the
+            process-wide in memory cache, see embedding_tools.get_embedding_cache.
         """
         self.candidate_terms = None
         self._nb_clusters = nb_clusters
@@ -72,6 +116,12 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
         self._linkage = linkage
         self._distance_threshold = distance_threshold
         self._embedding_model = embedding_model
+        self._embedding_batch_size = embedding_batch_size
+        self._normalise_embeddings = normalise_embeddings
+        self._clustering_engine = clustering_engine
+        self._nb_neighbours = nb_neighbours
+        self._nb_centroids = nb_centroids
+        self._embedding_cache = embedding_cache
         self._check_parameters()
 
     def _check_parameters(self) -> None:
@@ -97,6 +147,50 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
             )
             self._embedding_model = "all-mpnet-base-v2"
 
+        if not (
+            isinstance(self._embedding_batch_size, int)
+            and self._embedding_batch_size > 0
+        ):
+            logger.warning(
+                "Wrong value for embedding_batch_size parameter, default will be set to 32."
+            )
+            self._embedding_batch_size = 32
+
+        if not isinstance(self._normalise_embeddings, bool):
+            logger.warning(
+                "Wrong value for normalise_embeddings parameter, default will be set to False."
+            )
+            self._normalise_embeddings = False
+
+        if self._clustering_engine not in CLUSTERING_ENGINES:
+            logger.warning(
+                "Wrong value for clustering_engine parameter, default will be set to exact."
+            )
+            self._clustering_engine = "exact"
+
+        if not (isinstance(self._nb_neighbours, int) and self._nb_neighbours > 0):
+            logger.warning(
+                "Wrong value for nb_neighbours parameter, default will be set to 15."
+            )
+            self._nb_neighbours = 15
+
+        if not (isinstance(self._nb_centroids, int) and self._nb_centroids > 0):
+            logger.warning(
+                "Wrong value for nb_centroids parameter, default will be set to 1000."
+            )
+            self._nb_centroids = 1000
+
+        if isinstance(self._embedding_cache, str):
+            self._embedding_cache = EmbeddingCache(cache_path=self._embedding_cache)
+        elif not (
+            self._embedding_cache is None
+            or isinstance(self._embedding_cache, EmbeddingCache)
+        ):
+            logger.warning(
+                "Wrong value for embedding_cache parameter, the process-wide cache will be used."
+            )
+            self._embedding_cache = None
+
         if not self._nb_clusters:
             if not self._distance_threshold:
                 logger.warning(
@@ -184,6 +278,9 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
             embeddings = sbert_embeddings(
                 self._embedding_model,
                 [candidate.label for candidate in self.candidate_terms],
+                batch_size=self._embedding_batch_size,
+                normalise=self._normalise_embeddings,
+                embedding_cache=self._embedding_cache,
             )
             agglo_clustering = AgglomerativeClustering(
                 embeddings,
@@ -191,9 +288,39 @@ class AgglomerativeClusteringConceptExtraction(PipelineComponent):
                 self._metric,
                 self._linkage,
                 self._distance_threshold,
+                engine=self._clustering_engine,
+                nb_neighbours=self._nb_neighbours,
+                nb_centroids=self._nb_centroids,
             )
             agglo_clustering.compute_agglomerative_clustering()
 
             self._create_concepts(agglo_clustering.clustering_labels, pipeline.kr)
 
             pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the concept extraction on the candidate terms extracted from the
+        documents added to the corpus. Candidate terms matching a linguistic realisation of
+        an existing concept are added to this concept. Concepts are extracted from the other
+        candidate terms and merged into the existing concepts with the same label.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_concepts = set(pipeline.kr.concepts)
+        pipeline.candidate_terms = add_cts_to_concepts(
+            pipeline.candidate_terms, existing_concepts
+        )
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_concepts = pipeline.kr.concepts - existing_concepts
+        pipeline.kr.concepts -= new_concepts
+        merge_concepts(pipeline.kr.concepts, new_concepts)
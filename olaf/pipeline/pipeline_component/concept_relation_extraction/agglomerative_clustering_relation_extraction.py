@@ -1,13 +1,22 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
+import spacy
 
 from ...pipeline_schema import Pipeline
-from ....algorithm.agglomerative_clustering import AgglomerativeClustering
-from ....commons.embedding_tools import sbert_embeddings
+from ....algorithm.agglomerative_clustering import (
+    CLUSTERING_ENGINES,
+    AgglomerativeClustering,
+)
+from ....commons.embedding_tools import EmbeddingCache, sbert_embeddings
 from ....commons.errors import ParameterError
 from ....commons.logging_config import logger
-from ....commons.relation_tools import crs_to_relation, cts_to_crs, group_cr_by_concepts
+from ....commons.relation_tools import (
+    crs_to_relation,
+    cts_to_crs,
+    group_cr_by_concepts,
+    merge_relations,
+)
 from ....data_container.knowledge_representation_schema import KnowledgeRepresentation
 from ...pipeline_schema import Pipeline
 from ..pipeline_component_schema import PipelineComponent
@@ -36,11 +45,25 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
         Name of the embedding model to use.
         The list of available models can be found here : https://www.sbert.net/docs/pretrained_models.html,
         by default None.
+    embedding_batch_size: int, optional
+        Number of candidate labels encoded at once by the embedding model, by default 32.
+    normalise_embeddings: bool, optional
+        Whether to scale the embeddings to unit length, by default False.
+    clustering_engine: str, optional
+        Clustering engine, "exact", "knn_graph" for large sets of candidates or "two_stage"
+        for very large ones, by default "exact".
+        See AgglomerativeClustering for the engines description.
+    nb_neighbours: int, optional
+        Number of neighbours of each candidate in the "knn_graph" engine graph, by default 15.
+    nb_centroids: int, optional
+        Number of k-means centroids of the "two_stage" engine, by default 1000.
     concept_max_distance: int, optional
         The maximum distance between the candidate term and the concept sought, by defautl 5.
     scope: str, optional
         Scope used to search concepts. Can be "doc" for the entire document or "sent" for the
         candidate term "sentence", by default "doc".
+    embedding_cache: EmbeddingCache, optional
+        Cache of the candidate labels embeddings, None for the process-wide cache.
     """
 
     def __init__(
@@ -50,8 +73,14 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
         linkage: Optional[str] = "average",
         distance_threshold: Optional[float] = None,
         embedding_model: Optional[str] = None,
+        embedding_batch_size: Optional[int] = 32,
+        normalise_embeddings: Optional[bool] = False,
+        clustering_engine: Optional[str] = "exact",
+        nb_neighbours: Optional[int] = 15,
+        nb_centroids: Optional[int] = 1000,
         concept_max_distance: Optional[int] = None,
         scope: Optional[str] = "doc",
+        embedding_cache: Optional[Union[EmbeddingCache, str]] = None,
     ) -> None:
         """Initialise agglomerative clustering-based relation extraction instance.
 
@@ -75,11 +104,27 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
             Name of the embedding model to use.
             The list of available models can be found here : https://www.sbert.net/docs/pretrained_models.html,
             by default all-mpnet-base-v2.
+        embedding_batch_size: int, optional
+            Number of candidate labels encoded at once by the embedding model, by default 32.
+        normalise_embeddings: bool, optional
+            Whether to scale the embeddings to unit length, by default False.
+        clustering_engine: str, optional
+            Clustering engine, "exact", "knn_graph" for large sets of candidates or "two_stage"
+            for very large ones, by default "exact".
+            See AgglomerativeClustering for the engines description.
+        nb_neighbours: int, optional
+            Number of neighbours of each candidate in the "knn_graph" engine graph, by default 15.
+        nb_centroids: int, optional
+            Number of k-means centroids of the "two_stage" engine, by default 1000.
         concept_max_distance: int, optional
             The maximum distance between the candidate term and the concept sought, by defautl 5.
         scope: str, optional
             Scope used to search concepts. Can be "doc" for the entire document or "sent" for the
             candidate term "sentence", by default "sentence".
+        embedding_cache: EmbeddingCache or str, optional
+            Cache of the candidate labels embeddings, or path to the SQLite file of a
+            persistent embedding cache reused across runs, by default None which uses the
+            process-wide in memory cache, see embedding_tools.get_embedding_cache.
         """
         self.candidate_relations = None
         self._nb_clusters = nb_clusters
@@ -87,8 +132,14 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
         self._linkage = linkage
         self._distance_threshold = distance_threshold
         self._embedding_model = embedding_model
+        self._embedding_batch_size = embedding_batch_size
+        self._normalise_embeddings = normalise_embeddings
+        self._clustering_engine = clustering_engine
+        self._nb_neighbours = nb_neighbours
+        self._nb_centroids = nb_centroids
         self.concept_max_distance = concept_max_distance
         self.scope = scope
+        self._embedding_cache = embedding_cache
         self._check_parameters()
 
     def _check_parameters(self) -> None:
@@ -113,6 +164,50 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
             )
             self._embedding_model = "all-mpnet-base-v2"
 
+        if not (
+            isinstance(self._embedding_batch_size, int)
+            and self._embedding_batch_size > 0
+        ):
+            logger.warning(
+                "Wrong value for embedding_batch_size parameter, default will be set to 32."
+            )
+            self._embedding_batch_size = 32
+
+        if not isinstance(self._normalise_embeddings, bool):
+            logger.warning(
+                "Wrong value for normalise_embeddings parameter, default will be set to False."
+            )
+            self._normalise_embeddings = False
+
+        if self._clustering_engine not in CLUSTERING_ENGINES:
+            logger.warning(
+                "Wrong value for clustering_engine parameter, default will be set to exact."
+            )
+            self._clustering_engine = "exact"
+
+        if not (isinstance(self._nb_neighbours, int) and self._nb_neighbours > 0):
+            logger.warning(
+                "Wrong value for nb_neighbours parameter, default will be set to 15."
+            )
+            self._nb_neighbours = 15
+
+        if not (isinstance(self._nb_centroids, int) and self._nb_centroids > 0):
+            logger.warning(
+                "Wrong value for nb_centroids parameter, default will be set to 1000."
+            )
+            self._nb_centroids = 1000
+
+        if isinstance(self._embedding_cache, str):
+            self._embedding_cache = EmbeddingCache(cache_path=self._embedding_cache)
+        elif not (
+            self._embedding_cache is None
+            or isinstance(self._embedding_cache, EmbeddingCache)
+        ):
+            logger.warning(
+                "Wrong value for embedding_cache parameter, the process-wide cache will be used."
+            )
+            self._embedding_cache = None
+
         if not self._nb_clusters:
             if not self._distance_threshold:
                 logger.warning(
@@ -233,6 +328,9 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
             embeddings = sbert_embeddings(
                 self._embedding_model,
                 [candidate.label for candidate in self.candidate_relations],
+                batch_size=self._embedding_batch_size,
+                normalise=self._normalise_embeddings,
+                embedding_cache=self._embedding_cache,
             )
 
             agglo_clustering = AgglomerativeClustering(
@@ -241,9 +339,35 @@ class AgglomerativeClusteringRelationExtraction(PipelineComponent):
                 self._metric,
                 self._linkage,
                 self._distance_threshold,
+                engine=self._clustering_engine,
+                nb_neighbours=self._nb_neighbours,
+                nb_centroids=self._nb_centroids,
             )
             agglo_clustering.compute_agglomerative_clustering()
 
             self._create_relations(agglo_clustering.clustering_labels, pipeline.kr)
 
             pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the relation extraction on the candidate terms extracted from the
+        documents added to the corpus. The extracted relations are merged into the existing
+        relations with the same label, source and destination concepts.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_relations = set(pipeline.kr.relations)
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_relations = pipeline.kr.relations - existing_relations
+        pipeline.kr.relations -= new_relations
+        merge_relations(pipeline.kr.relations, new_relations)
@@ -1,8 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import spacy
 
 from ...pipeline_schema import Pipeline
 from ....commons.candidate_term_tools import cts_to_concept
 from ....commons.logging_config import logger
+from ....data_container.linguistic_realisation_schema import ConceptLR
 from ..pipeline_component_schema import PipelineComponent
 
 
@@ -52,3 +55,32 @@ class CTsToConceptExtraction(PipelineComponent):
             pipeline.kr.concepts.add(cts_to_concept({ct}))
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the concept extraction on the candidate terms extracted from the
+        documents added to the corpus. The corpus occurrences of candidate terms matching an
+        existing concept label are added to the concept while the other candidate terms become
+        new concepts. The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        concepts_index = {concept.label: concept for concept in pipeline.kr.concepts}
+
+        for ct in pipeline.candidate_terms:
+            if ct.label in concepts_index:
+                concepts_index[ct.label].add_linguistic_realisation(
+                    ConceptLR(label=ct.label, corpus_occurrences=ct.corpus_occurrences)
+                )
+            else:
+                concept = cts_to_concept({ct})
+                concepts_index[concept.label] = concept
+                pipeline.kr.concepts.add(concept)
+
+        pipeline.candidate_terms = set()
@@ -1,11 +1,13 @@
-from itertools import combinations
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
 import spacy
+from scipy import sparse
+
 from ...pipeline_schema import Pipeline
 from ....commons.logging_config import logger
-from ....commons.spacy_processing_tools import spacy_span_ngrams, spans_overlap
 from ....data_container.concept_schema import Concept
+from ....data_container.span_set_schema import DocRegistry
 from ....data_container.metarelation_schema import Metarelation
 from ..pipeline_component_schema import PipelineComponent
 
@@ -128,46 +130,88 @@ class ConceptCoocMetarelationExtraction(PipelineComponent):
         """
         raise NotImplementedError
 
-    def _fetch_concept_occurrences_fragments(
-        self, concept: Concept
-    ) -> Set[spacy.tokens.Span]:
-        """Fetch the concept occurrences corpus fragments.
+    def _fetch_concept_occurrences_fragment_keys(
+        self, concept: Concept, doc_registry: DocRegistry
+    ) -> Set[Tuple[int, int, int]]:
+        """Fetch the concept occurrences corpus fragments as (document id, start, end) keys.
         The corpus fragments depends on the self.scope and self.window_size attributes.
         Only the corpus fragments containing the concepts are returned.
+        With a window size, the fragments are the windows of the scope overlapping the
+        occurrence, or the whole scope if it is shorter than the window.
 
         Parameters
         ----------
         concept : Concept
             The concept to find the corpus fragments from.
+        doc_registry : DocRegistry
+            The registry giving the document ids of the keys.
 
         Returns
         -------
-        Set[spacy.tokens.Span]
-            The set of corpus fragments containing the concept.
+        Set[Tuple[int, int, int]]
+            The set of keys of the corpus fragments containing the concept.
         """
-        concept_occ_fragments = set()
+        concept_occ_fragment_keys = set()
 
         for c_lr in concept.linguistic_realisations:
             for c_corpus_occ in c_lr.corpus_occurrences:
+                doc_id = doc_registry.register(c_corpus_occ.doc)
                 if self.scope == "sent":
-                    c_occ_fragment = c_corpus_occ.sent
+                    c_occ_sent = c_corpus_occ.sent
+                    fragment_start, fragment_end = c_occ_sent.start, c_occ_sent.end
                 else:
-                    c_occ_fragment = c_corpus_occ.doc
-
-                if self.window_size:
-                    concept_occ_fragments.update(
-                        {
-                            span
-                            for span in spacy_span_ngrams(
-                                c_occ_fragment, self.window_size
-                            )
-                            if spans_overlap(c_corpus_occ, span)
-                        }
+                    fragment_start, fragment_end = 0, len(c_corpus_occ.doc)
+
+                if (
+                    self.window_size
+                    and fragment_end - fragment_start >= self.window_size
+                ):
+                    concept_occ_fragment_keys.update(
+                        (doc_id, window_start, window_start + self.window_size)
+                        for window_start in range(
+                            max(
+                                fragment_start,
+                                c_corpus_occ.start - self.window_size + 1,
+                            ),
+                            min(
+                                c_corpus_occ.end, fragment_end - self.window_size + 1
+                            ),
+                        )
                     )
                 else:
-                    concept_occ_fragments.add(c_occ_fragment)
+                    concept_occ_fragment_keys.add(
+                        (doc_id, fragment_start, fragment_end)
+                    )
+
+        return concept_occ_fragment_keys
+
+    def _fetch_concept_occurrences_fragments(
+        self, concept: Concept
+    ) -> Set[spacy.tokens.Span]:
+        """Fetch the concept occurrences corpus fragments.
+        The corpus fragments depends on the self.scope and self.window_size attributes.
+        Only the corpus fragments containing the concepts are returned.
+
+        Parameters
+        ----------
+        concept : Concept
+            The concept to find the corpus fragments from.
 
-        return concept_occ_fragments
+        Returns
+        -------
+        Set[spacy.tokens.Span]
+            The set of corpus fragments containing the concept.
+        """
+        doc_registry = DocRegistry()
+        fragment_keys = self._fetch_concept_occurrences_fragment_keys(
+            concept, doc_registry
+        )
+
+        if self.scope == "doc" and not self.window_size:
+            return {doc_registry[doc_id] for doc_id, _, _ in fragment_keys}
+        return {
+            doc_registry[doc_id][start:end] for doc_id, start, end in fragment_keys
+        }
 
     def _count_concept_cooccurrence(self, concept1: Concept, concept2: Concept) -> int:
         """Count the concepts co-occurrence in the corpus.
@@ -187,38 +231,159 @@ class ConceptCoocMetarelationExtraction(PipelineComponent):
         int
             The concepts co-occurrence count.
         """
-        concept1_fragments = self._fetch_concept_occurrences_fragments(concept1)
-        concept2_fragments = self._fetch_concept_occurrences_fragments(concept2)
+        doc_registry = DocRegistry()
+        concept1_fragments = self._fetch_concept_occurrences_fragment_keys(
+            concept1, doc_registry
+        )
+        concept2_fragments = self._fetch_concept_occurrences_fragment_keys(
+            concept2, doc_registry
+        )
 
         concept_cooc_count = len(concept1_fragments & concept2_fragments)
 
         return concept_cooc_count
 
+    def _count_concepts_cooccurrences(
+        self, concepts: List[Concept]
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Count the co-occurrences of all the concept pairs at once.
+        The fragments of each concept are computed once and indexed in a binary
+        concept x fragment matrix. Its product with its transpose gives the number of
+        fragments shared by each concept pair, for the co-occurring pairs only.
+
+        Parameters
+        ----------
+        concepts : List[Concept]
+            The concepts to count the co-occurrences of.
+
+        Returns
+        -------
+        Iterator[Tuple[int, int, int]]
+            The (first concept index, second concept index, co-occurrence count) triples of
+            the co-occurring concept pairs, with the first index lower than the second one.
+        """
+        doc_registry = DocRegistry()
+        fragment_ids = {}
+        concept_indices = []
+        fragment_indices = []
+        for concept_index, concept in enumerate(concepts):
+            for fragment_key in self._fetch_concept_occurrences_fragment_keys(
+                concept, doc_registry
+            ):
+                concept_indices.append(concept_index)
+                fragment_indices.append(
+                    fragment_ids.setdefault(fragment_key, len(fragment_ids))
+                )
+
+        concept_fragments = sparse.csr_matrix(
+            (
+                np.ones(len(concept_indices), dtype=np.int32),
+                (concept_indices, fragment_indices),
+            ),
+            shape=(len(concepts), len(fragment_ids)),
+        )
+        cooc_counts = sparse.triu(concept_fragments @ concept_fragments.T, k=1).tocoo()
+
+        return zip(
+            cooc_counts.row.tolist(), cooc_counts.col.tolist(), cooc_counts.data.tolist()
+        )
+
+    def _add_metarelations(
+        self, pipeline: Pipeline, concept1: Concept, concept2: Concept
+    ) -> None:
+        """Add the metarelation between two concepts, and its symmetric one if required, to
+        the pipeline knowledge representation.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        concept1 : Concept
+            The metarelation source concept.
+        concept2 : Concept
+            The metarelation destination concept.
+        """
+        pipeline.kr.metarelations.add(
+            Metarelation(
+                source_concept=concept1,
+                destination_concept=concept2,
+                label=self.metarelation_label,
+            )
+        )
+        if self.create_symmetric_metarelation:
+            pipeline.kr.metarelations.add(
+                Metarelation(
+                    source_concept=concept2,
+                    destination_concept=concept1,
+                    label=self.metarelation_label,
+                )
+            )
+
     def run(self, pipeline: Pipeline) -> None:
         """Execution of the metarelation extraction based on concept co-occurrence.
         Metarelations are created and added to the pipeline knowledge representation.
+        Only the concept pairs co-occurring at least once are considered.
 
         Parameters
         ----------
         pipeline : Pipeline
             The pipeline running.
         """
-        for concept1, concept2 in combinations(pipeline.kr.concepts, 2):
-            concept_cooc_count = self._count_concept_cooccurrence(concept1, concept2)
-
+        concepts = list(pipeline.kr.concepts)
+        for concept1_index, concept2_index, concept_cooc_count in (
+            self._count_concepts_cooccurrences(concepts)
+        ):
             if self.metarelation_creation_metric(concept_cooc_count):
-                pipeline.kr.metarelations.add(
-                    Metarelation(
-                        source_concept=concept1,
-                        destination_concept=concept2,
-                        label=self.metarelation_label,
-                    )
+                self._add_metarelations(
+                    pipeline, concepts[concept1_index], concepts[concept2_index]
                 )
-                if self.create_symmetric_metarelation:
-                    pipeline.kr.metarelations.add(
-                        Metarelation(
-                            source_concept=concept2,
-                            destination_concept=concept1,
-                            label=self.metarelation_label,
-                        )
-                    )
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the metarelation extraction on the documents added to the corpus.
+        Corpus fragments belong to a single document so only the co-occurrence counts of the
+        concepts occurring in the new documents can change. The co-occurrences of these
+        concepts are counted again and the missing metarelations are added to the pipeline
+        knowledge representation. Existing metarelations are never removed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        new_docs = set(new_corpus)
+        updated_concepts = {
+            concept
+            for concept in pipeline.kr.concepts
+            if any(
+                lr.get_docs() & new_docs for lr in concept.linguistic_realisations
+            )
+        }
+        if not updated_concepts:
+            return
+
+        existing_metarelations = {
+            (metarelation.source_concept, metarelation.destination_concept)
+            for metarelation in pipeline.kr.metarelations
+            if metarelation.label == self.metarelation_label
+        }
+
+        concepts = list(pipeline.kr.concepts)
+        for concept1_index, concept2_index, concept_cooc_count in (
+            self._count_concepts_cooccurrences(concepts)
+        ):
+            concept1 = concepts[concept1_index]
+            concept2 = concepts[concept2_index]
+            if not (concept1 in updated_concepts or concept2 in updated_concepts):
+                continue
+            if (concept1, concept2) in existing_metarelations or (
+                concept2,
+                concept1,
+            ) in existing_metarelations:
+                continue
+
+            if self.metarelation_creation_metric(concept_cooc_count):
+                self._add_metarelations(pipeline, concept1, concept2)
@@ -1,7 +1,14 @@
-from typing import Any, Dict, Set, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import spacy
 
 from ...pipeline_schema import Pipeline
-from ....commons.candidate_term_tools import cts_to_concept, group_cts_on_synonyms
+from ....commons.candidate_term_tools import (
+    add_cts_to_concepts,
+    cts_to_concept,
+    group_cts_on_synonyms,
+    merge_concepts,
+)
 from ....data_container.candidate_term_schema import CandidateTerm
 from ..pipeline_component_schema import PipelineComponent
 from ....repository.knowledge_source.knowledge_source_schema import KnowledgeSource
@@ -105,12 +112,18 @@ class KnowledgeBasedConceptExtraction(PipelineComponent):
         else:
             cts_groups = [{ct} for ct in pipeline.candidate_terms]
 
-        for ct_group in cts_groups:
-            ct_group_texts = self.c_terms_texts_to_match(ct_group)
-
-            concept_uids = self.knowledge_source.match_external_concepts(
-                matching_terms=ct_group_texts
+        cts_groups = list(cts_groups)
+        groups_concept_uids = (
+            self.knowledge_source.match_terms_groups_external_concepts(
+                {
+                    group_index: self.c_terms_texts_to_match(ct_group)
+                    for group_index, ct_group in enumerate(cts_groups)
+                }
             )
+        )
+
+        for group_index, ct_group in enumerate(cts_groups):
+            concept_uids = groups_concept_uids[group_index]
 
             if len(concept_uids) > 0:
                 c_term_concept = cts_to_concept(ct_group)
@@ -118,3 +131,30 @@ class KnowledgeBasedConceptExtraction(PipelineComponent):
                 pipeline.kr.concepts.add(c_term_concept)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the concept extraction on the candidate terms extracted from the
+        documents added to the corpus. Candidate terms matching a linguistic realisation of
+        an existing concept are added to this concept. Concepts are extracted from the other
+        candidate terms and merged into the existing concepts with the same label.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_concepts = set(pipeline.kr.concepts)
+        pipeline.candidate_terms = add_cts_to_concepts(
+            pipeline.candidate_terms, existing_concepts
+        )
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_concepts = pipeline.kr.concepts - existing_concepts
+        pipeline.kr.concepts -= new_concepts
+        merge_concepts(pipeline.kr.concepts, new_concepts)
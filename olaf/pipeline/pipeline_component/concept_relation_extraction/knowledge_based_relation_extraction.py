@@ -1,9 +1,11 @@
-from typing import Any, Dict, Set, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import spacy
 
 from ...pipeline_schema import Pipeline
 from ....commons.candidate_term_tools import group_cts_on_synonyms
 from ....commons.logging_config import logger
-from ....commons.relation_tools import crs_to_relation, cts_to_crs
+from ....commons.relation_tools import crs_to_relation, cts_to_crs, merge_relations
 from ....data_container.candidate_term_schema import CandidateRelation
 from ..pipeline_component_schema import PipelineComponent
 from ....repository.knowledge_source.knowledge_source_schema import KnowledgeSource
@@ -160,12 +162,18 @@ class KnowledgeBasedRelationExtraction(PipelineComponent):
         else:
             crs_groups = [{cr} for cr in candidate_relations]
 
-        for cr_group in crs_groups:
-            cr_group_texts = self.c_terms_texts_to_match(cr_group)
-
-            relation_uids = self.knowledge_source.match_external_concepts(
-                matching_terms=cr_group_texts
+        crs_groups = list(crs_groups)
+        groups_relation_uids = (
+            self.knowledge_source.match_terms_groups_external_concepts(
+                {
+                    group_index: self.c_terms_texts_to_match(cr_group)
+                    for group_index, cr_group in enumerate(crs_groups)
+                }
             )
+        )
+
+        for group_index, cr_group in enumerate(crs_groups):
+            relation_uids = groups_relation_uids[group_index]
 
             if len(relation_uids) > 0:
                 c_term_relation = crs_to_relation(cr_group)
@@ -173,3 +181,26 @@ class KnowledgeBasedRelationExtraction(PipelineComponent):
                 pipeline.kr.relations.add(c_term_relation)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the relation extraction on the candidate terms extracted from the
+        documents added to the corpus. The extracted relations are merged into the existing
+        relations with the same label, source and destination concepts.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_relations = set(pipeline.kr.relations)
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_relations = pipeline.kr.relations - existing_relations
+        pipeline.kr.relations -= new_relations
+        merge_relations(pipeline.kr.relations, new_relations)
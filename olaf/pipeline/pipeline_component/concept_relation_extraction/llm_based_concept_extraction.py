@@ -4,7 +4,11 @@ from typing import Any, Callable, Dict, List, Optional, Set
 from spacy.tokens import Doc
 
 from ...pipeline_schema import Pipeline
-from ....commons.candidate_term_tools import cts_to_concept
+from ....commons.candidate_term_tools import (
+    add_cts_to_concepts,
+    cts_to_concept,
+    merge_concepts,
+)
 from ....commons.llm_tools import HuggingFaceGenerator, LLMGenerator
 from ....commons.logging_config import logger
 from ....commons.prompts import hf_prompt_concept_extraction
@@ -155,7 +159,8 @@ class LLMBasedConceptExtraction(PipelineComponent):
                     for cc_label in cc_group
                     if cc_label in cterm_index
                 }
-                concept_candidates.append(cc_set)
+                if cc_set:
+                    concept_candidates.append(cc_set)
         except (SyntaxError, ValueError):
             logger.error(
                 """LLM generator output is not in the expected format. 
@@ -183,3 +188,30 @@ class LLMBasedConceptExtraction(PipelineComponent):
             pipeline.kr.concepts.add(new_concept)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[Doc]
+    ) -> None:
+        """Execution of the concept extraction on the candidate terms extracted from the
+        documents added to the corpus. Candidate terms matching a linguistic realisation of
+        an existing concept are added to this concept. Concepts are extracted from the other
+        candidate terms and merged into the existing concepts with the same label.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_concepts = set(pipeline.kr.concepts)
+        pipeline.candidate_terms = add_cts_to_concepts(
+            pipeline.candidate_terms, existing_concepts
+        )
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_concepts = pipeline.kr.concepts - existing_concepts
+        pipeline.kr.concepts -= new_concepts
+        merge_concepts(pipeline.kr.concepts, new_concepts)
@@ -7,7 +7,12 @@ from ...pipeline_schema import Pipeline
 from ....commons.llm_tools import HuggingFaceGenerator, LLMGenerator
 from ....commons.logging_config import logger
 from ....commons.prompts import hf_prompt_relation_extraction
-from ....commons.relation_tools import crs_to_relation, cts_to_crs, group_cr_by_concepts
+from ....commons.relation_tools import (
+    crs_to_relation,
+    cts_to_crs,
+    group_cr_by_concepts,
+    merge_relations,
+)
 from ....data_container.candidate_term_schema import CandidateTerm
 from ..pipeline_component_schema import PipelineComponent
 
@@ -239,3 +244,26 @@ class LLMBasedRelationExtraction(PipelineComponent):
                 pipeline.kr.relations.add(new_relation)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[Doc]
+    ) -> None:
+        """Execution of the relation extraction on the candidate terms extracted from the
+        documents added to the corpus. The extracted relations are merged into the existing
+        relations with the same label, source and destination concepts.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_relations = set(pipeline.kr.relations)
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_relations = pipeline.kr.relations - existing_relations
+        pipeline.kr.relations -= new_relations
+        merge_relations(pipeline.kr.relations, new_relations)
@@ -1,7 +1,14 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import spacy
 
 from ...pipeline_schema import Pipeline
-from ....commons.candidate_term_tools import cts_to_concept, group_cts_on_synonyms
+from ....commons.candidate_term_tools import (
+    add_cts_to_concepts,
+    cts_to_concept,
+    group_cts_on_synonyms,
+    merge_concepts,
+)
 from ....commons.logging_config import logger
 from ..pipeline_component_schema import PipelineComponent
 
@@ -57,3 +64,30 @@ class SynonymConceptExtraction(PipelineComponent):
             pipeline.kr.concepts.add(new_concept)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the concept extraction on the candidate terms extracted from the
+        documents added to the corpus. Candidate terms matching a linguistic realisation of
+        an existing concept are added to this concept. Concepts are extracted from the other
+        candidate terms and merged into the existing concepts with the same label.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_concepts = set(pipeline.kr.concepts)
+        pipeline.candidate_terms = add_cts_to_concepts(
+            pipeline.candidate_terms, existing_concepts
+        )
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_concepts = pipeline.kr.concepts - existing_concepts
+        pipeline.kr.concepts -= new_concepts
+        merge_concepts(pipeline.kr.concepts, new_concepts)
@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import spacy
 
 from ...pipeline_schema import Pipeline
 from ....commons.candidate_term_tools import group_cts_on_synonyms
 from ....commons.logging_config import logger
-from ....commons.relation_tools import crs_to_relation, cts_to_crs
+from ....commons.relation_tools import crs_to_relation, cts_to_crs, merge_relations
 from ..pipeline_component_schema import PipelineComponent
 
 
@@ -119,3 +121,26 @@ class SynonymRelationExtraction(PipelineComponent):
             pipeline.kr.relations.add(new_relation)
 
         pipeline.candidate_terms = set()
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the relation extraction on the candidate terms extracted from the
+        documents added to the corpus. The extracted relations are merged into the existing
+        relations with the same label, source and destination concepts.
+        The pipeline candidate terms are consumed.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        existing_relations = set(pipeline.kr.relations)
+        if pipeline.candidate_terms:
+            self.run(pipeline)
+
+        new_relations = pipeline.kr.relations - existing_relations
+        pipeline.kr.relations -= new_relations
+        merge_relations(pipeline.kr.relations, new_relations)
@@ -1,11 +1,12 @@
-from itertools import combinations
-from typing import Any, Dict, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple
 
-from tqdm import tqdm
+import numpy as np
+from scipy import sparse
 
 from ...pipeline_schema import Pipeline
 from ....commons.logging_config import logger
 from ....data_container.concept_schema import Concept
+from ....data_container.span_set_schema import DocRegistry
 from ....data_container.metarelation_schema import Metarelation
 from ..pipeline_component_schema import PipelineComponent
 
@@ -173,6 +174,99 @@ class SubsumptionHierarchisation(PipelineComponent):
             sub_hierarchy = True
         return sub_hierarchy
 
+    def _build_concept_sentence_matrix(
+        self, concepts: List[Concept]
+    ) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Build the binary concept x sentence incidence matrix of the concepts corpus
+        occurrences, along with the number of corpus occurrences of each concept.
+
+        Parameters
+        ----------
+        concepts : List[Concept]
+            The concepts, in the matrix rows order.
+
+        Returns
+        -------
+        Tuple[sparse.csr_matrix, np.ndarray]
+            The incidence matrix and the concepts corpus occurrences counts.
+        """
+        doc_registry = DocRegistry()
+        sentence_ids = {}
+        concept_indices = []
+        sentence_indices = []
+        concept_occurrences = np.zeros(len(concepts), dtype=np.int64)
+        for concept_index, concept in enumerate(concepts):
+            concept_sentences = set()
+            for lr in concept.linguistic_realisations:
+                concept_occurrences[concept_index] += len(lr.corpus_occurrences)
+                for co in lr.corpus_occurrences:
+                    concept_sentences.add(
+                        (doc_registry.register(co.doc), co.sent.start)
+                    )
+            for sentence in concept_sentences:
+                concept_indices.append(concept_index)
+                sentence_indices.append(
+                    sentence_ids.setdefault(sentence, len(sentence_ids))
+                )
+
+        concept_sentence_matrix = sparse.csr_matrix(
+            (
+                np.ones(len(concept_indices), dtype=np.int32),
+                (concept_indices, sentence_indices),
+            ),
+            shape=(len(concepts), len(sentence_ids)),
+        )
+        return concept_sentence_matrix, concept_occurrences
+
+    def _find_generalisation_pairs(
+        self, concepts: List[Concept]
+    ) -> List[Tuple[int, int]]:
+        """Find the generalisation metarelations between concepts.
+        The cooccurrence counts of all the concept pairs come from the product of the
+        concept x sentence incidence matrix with its transpose, which only holds the
+        cooccurring pairs. Pairs that never cooccur have null subsumption scores and are
+        never generalisations. The subsumption scores and thresholds are computed on all
+        the cooccurring pairs at once.
+
+        Parameters
+        ----------
+        concepts : List[Concept]
+            The concepts to find the generalisations of.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The (source concept index, destination concept index) pairs of the
+            generalisation metarelations.
+        """
+        concept_sentence_matrix, concept_occurrences = (
+            self._build_concept_sentence_matrix(concepts)
+        )
+        concepts_cooc = sparse.triu(
+            concept_sentence_matrix @ concept_sentence_matrix.T, k=1
+        ).tocoo()
+
+        # Cooccurring concepts have at least one corpus occurrence.
+        sub_scores = concepts_cooc.data / concept_occurrences[concepts_cooc.row]
+        inv_sub_scores = concepts_cooc.data / concept_occurrences[concepts_cooc.col]
+
+        sub_hierarchies = (sub_scores > self.threshold) & (sub_scores > inv_sub_scores)
+        inv_sub_hierarchies = (inv_sub_scores > self.threshold) & (
+            inv_sub_scores > sub_scores
+        )
+
+        return list(
+            zip(
+                concepts_cooc.row[sub_hierarchies].tolist(),
+                concepts_cooc.col[sub_hierarchies].tolist(),
+            )
+        ) + list(
+            zip(
+                concepts_cooc.col[inv_sub_hierarchies].tolist(),
+                concepts_cooc.row[inv_sub_hierarchies].tolist(),
+            )
+        )
+
     def run(self, pipeline: Pipeline) -> None:
         """Execution of the subsumption hierarchisation process on pipeline concepts.
         Generalisation metarelations are created.
@@ -182,24 +276,13 @@ class SubsumptionHierarchisation(PipelineComponent):
         pipeline : Pipeline
             The pipeline running.
         """
-        concept_pairs = list(combinations(pipeline.kr.concepts, 2))
-        for concept_1, concept_2 in tqdm(concept_pairs):
-            concept_1_occ = self._concept_occurrence_count(concept_1)
-            concept_2_occ = self._concept_occurrence_count(concept_2)
-            concepts_cooc = self._concepts_cooccurrence_count(concept_1, concept_2)
-            sub_score = self._compute_subsumption(concepts_cooc, concept_1_occ)
-            inv_sub_score = self._compute_subsumption(concepts_cooc, concept_2_occ)
-            if self._is_sub_hierarchy(sub_score, inv_sub_score):
-                metarelation = Metarelation(
-                    source_concept=concept_1,
-                    destination_concept=concept_2,
-                    label="is_generalised_by",
-                )
-                pipeline.kr.metarelations.add(metarelation)
-            elif self._is_sub_hierarchy(inv_sub_score, sub_score):
-                metarelation = Metarelation(
-                    source_concept=concept_2,
-                    destination_concept=concept_1,
-                    label="is_generalised_by",
-                )
-                pipeline.kr.metarelations.add(metarelation)
+        concepts = list(pipeline.kr.concepts)
+        for source_index, destination_index in self._find_generalisation_pairs(
+            concepts
+        ):
+            metarelation = Metarelation(
+                source_concept=concepts[source_index],
+                destination_concept=concepts[destination_index],
+                label="is_generalised_by",
+            )
+            pipeline.kr.metarelations.add(metarelation)
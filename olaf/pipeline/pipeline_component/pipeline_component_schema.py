@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, List, TYPE_CHECKING
+
+import spacy
+
+from ...commons.logging_config import logger
 
 if TYPE_CHECKING:
     from ..pipeline_schema import Pipeline
@@ -46,3 +50,28 @@ class PipelineComponent(ABC):
         pipeline : Pipeline
             The pipeline running
         """
+
+    def run_incremental(
+        self, pipeline: 'Pipeline', new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Method that is responsible for the execution of the component on documents added
+        to the pipeline corpus. Components supporting incremental ingestion only process the
+        new documents and update the pipeline candidate terms and knowledge representation
+        in place.
+
+        By default, the component does not support incremental ingestion and it is skipped
+        with an error: running it again on the whole pipeline would create again the
+        knowledge representation elements it already created.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running. Its corpus already contains the new documents.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        logger.error(
+            "%s does not support incremental ingestion, it is skipped. "
+            "Run the pipeline again to process the added documents with it.",
+            self.__class__.__name__,
+        )
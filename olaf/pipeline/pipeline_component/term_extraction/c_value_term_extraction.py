@@ -1,16 +1,25 @@
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import spacy.tokens.span
 
 from ...pipeline_schema import Pipeline
 from ....algorithm.c_value import Cvalue
+from ....algorithm.vectorised_c_value import VectorisedCvalue
 from ....commons.errors import OptionError
 from ....commons.logging_config import logger
-from ....commons.spacy_processing_tools import spacy_span_ngrams
+from ....commons.span_ngram_index import (
+    SpanNgramIndex,
+    build_span_ngram_index,
+    iter_token_sequences,
+)
+from ....commons.spacy_processing_tools import spacy_span_ngrams, token_texts
+from ....data_container.span_set_schema import DocRegistry
 from ....data_container.candidate_term_schema import CandidateTerm
 from .term_extraction_schema import TermExtractionPipelineComponent
 
+# C-value engines by name, they compute the same C-values.
+C_VALUE_ENGINES = {"default": Cvalue, "vectorised": VectorisedCvalue}
+
 
 class CvalueTermExtraction(TermExtractionPipelineComponent):
     """Extract candidate terms using C-value scores computed based on the corpus.
@@ -29,6 +38,11 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         The threshold used during the c-value scores computation process, by defaut 0.0.
     _max_term_token_length : int, optional
         The maximum number of tokens a term can have, by defaut 5.
+    n_process : int, optional
+        Number of processes used to count the terms for the c-value computation, -1 to use all
+        the cores, by default 1.
+    c_value_engine : str, optional
+        The C-value engine, "default" or "vectorised" for large corpora, by default "default".
     """
 
     def __init__(
@@ -41,6 +55,8 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
             List[Callable[[Set[CandidateTerm]], Set[CandidateTerm]]]
         ] = None,
         stop_token_list: Set[str] = None,
+        n_process: Optional[int] = 1,
+        c_value_engine: Optional[str] = "default",
     ) -> None:
         """Initialise C-value term extraction pipeline component instance.
 
@@ -62,6 +78,13 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         stop_token_list: Set[str], optional
             A set of stop words that should not appear in a term.
             _terms_string_tokens: Tuple[Tuple[str]], by default None.
+        n_process : int, optional
+            Number of processes used to count the terms for the c-value computation, -1 to use
+            all the cores, by default 1. The results are the same whatever the number of processes.
+        c_value_engine : str, optional
+            The C-value engine, "default" or "vectorised", by default "default".
+            The "vectorised" engine, see VectorisedCvalue, computes the same C-values
+            faster on large corpora. It runs in a single process and ignores n_process.
         """
 
         super().__init__(cts_post_processing_functions)
@@ -73,6 +96,8 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         self._stop_token_list = (
             stop_token_list if stop_token_list is not None else set()
         )
+        self.n_process = n_process
+        self.c_value_engine = c_value_engine
         self._check_parameters()
 
     def _check_parameters(self) -> None:
@@ -113,6 +138,24 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
             )
             self._c_value_threshold = self._candidate_term_threshold
 
+        if not isinstance(self.n_process, int) or (
+            self.n_process < 1 and self.n_process != -1
+        ):
+            logger.warning(
+                "Incorrect value given for n_process parameter, default will be set to 1."
+            )
+            self.n_process = 1
+
+        if self.c_value_engine not in C_VALUE_ENGINES:
+            logger.warning(
+                "Incorrect value given for c_value_engine parameter, default will be set to 'default'."
+            )
+            self.c_value_engine = "default"
+        elif self.c_value_engine == "vectorised" and self.n_process != 1:
+            logger.warning(
+                "The vectorised C-value engine runs in a single process, n_process is ignored."
+            )
+
     def optimise(
         self, validation_terms: Set[str], option_values_map: Set[float]
     ) -> None:
@@ -151,13 +194,13 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         raise NotImplementedError
 
     def _create_max_length_spans(
-        self, token_sequences: List[spacy.tokens.Span]
+        self, token_sequences: Iterable[spacy.tokens.Span]
     ) -> List[spacy.tokens.Span]:
         """Extract spans of size limited to the self._max_term_token_length.
 
         Parameters
         ----------
-        token_sequences : List[spacy.tokens.Span]
+        token_sequences : Iterable[spacy.tokens.Span]
             The spans to extract the max length spans from.
 
         Returns
@@ -188,56 +231,47 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         Tuple[spacy.tokens.Span]
             The list of extracted sequences.
         """
-        token_sequences = []
-
-        if self._token_sequences_doc_attribute:
-            for doc in corpus:
-                doc_token_sequences = doc._.get(self._token_sequences_doc_attribute)
-                max_length_spans = self._create_max_length_spans(doc_token_sequences)
-                token_sequences.extend(max_length_spans)
-        else:
-            for doc in corpus:
-                # Extract the document tokens in a span instance for consistency.
-                doc_span = doc[:]
-                max_length_spans = self._create_max_length_spans([doc_span])
-                token_sequences.extend(max_length_spans)
+        token_sequences = self._create_max_length_spans(
+            iter_token_sequences(corpus, self._token_sequences_doc_attribute)
+        )
 
         return tuple(token_sequences)
 
     def _spaced_term_corpus_occ_map(
-        self, token_seqs_spans: Tuple[spacy.tokens.Span]
-    ) -> Dict[str, List[spacy.tokens.Span]]:
+        self,
+        token_seqs_spans: Iterable[spacy.tokens.Span],
+        doc_registry: Optional[DocRegistry] = None,
+    ) -> SpanNgramIndex:
         """Build a mapping between term string processed by the c-value algorithm
         and the spaCy spans they were extracted from.
 
-        We extract all the substring in each token sequence because the C-value
-        algorithm will create them and return scores for each. Hence, some candidate
-        terms might be substrings of the initial token sequences. We pre-generate all
-        of them to make sure to have the mapping with a spaCy span to construct the
-        Candidate Term instance.
+        We extract all the substring of 1 to self._max_term_token_length tokens in each
+        token sequence because the C-value algorithm will create them and return scores for
+        each. Hence, some candidate terms might be substrings of the initial token
+        sequences. We index all of them to make sure to have the mapping with a spaCy span
+        to construct the Candidate Term instance. The spans are only created for the terms
+        retrieved. The mapping is the pipeline ngram index of the token texts, see
+        Pipeline.get_span_ngram_index.
 
         Parameters
         ----------
-        token_seqs_spans : Tuple[spacy.tokens.Span]
+        token_seqs_spans : Iterable[spacy.tokens.Span]
             The spaCy spans of the token sequences to extract the candidate terms from.
+        doc_registry : DocRegistry, optional
+            The registry of the documents of the token sequences, by default None.
 
         Returns
         -------
-        Dict[str, List[spacy.tokens.Span]]
+        SpanNgramIndex
             The mapping between term string processed by the c-value algorithm and the
             spaCy spans they were extracted from.
         """
-        term_corpus_occ_mapping = defaultdict(list)
-
-        for token_seqs_span in token_seqs_spans:
-            for i in range(2, len(token_seqs_span)):
-                spans = spacy_span_ngrams(token_seqs_span, i)
-
-                for term_span in spans:
-                    spaced_term = " ".join([token.text for token in term_span])
-                    term_corpus_occ_mapping[spaced_term].append(term_span)
-
-        return term_corpus_occ_mapping
+        return build_span_ngram_index(
+            token_seqs_spans,
+            self._max_term_token_length,
+            token_texts,
+            doc_registry=doc_registry,
+        )
 
     def _extract_terms(self, terms: List[str]) -> Tuple[str]:
         """Compute the C-value score for each term and filter out the ones with a
@@ -253,12 +287,15 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         Tuple[str]
             The list the selected terms.
         """
-        c_value = Cvalue(
-            corpus_terms=terms,
-            max_term_token_length=self._max_term_token_length,
-            stop_list=self._stop_token_list,
-            c_value_threshold=self._c_value_threshold,
-        )
+        c_value_params = {
+            "corpus_terms": terms,
+            "max_term_token_length": self._max_term_token_length,
+            "stop_list": self._stop_token_list,
+            "c_value_threshold": self._c_value_threshold,
+        }
+        if self.c_value_engine == "default":
+            c_value_params["n_process"] = self.n_process
+        c_value = C_VALUE_ENGINES[self.c_value_engine](**c_value_params)
 
         c_value.compute_c_values()
 
@@ -273,7 +310,7 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         return candidate_terms
 
     def _get_corpus_occurrences(
-        self, term: str, term_corpus_occ_mapping: Dict[str, List[spacy.tokens.Span]]
+        self, term: str, term_corpus_occ_mapping: SpanNgramIndex
     ) -> List[spacy.tokens.Span]:
         """Retrieve spaCy spans corresponding to term.
 
@@ -281,7 +318,7 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
         ----------
         term : str
             The term to retrieve the corpus occurrences from.
-        term_corpus_occ_mapping : Dict[str, List[spacy.tokens.Span]]
+        term_corpus_occ_mapping : SpanNgramIndex
             The mapping of term to corpus occurrences.
 
         Returns
@@ -304,7 +341,17 @@ class CvalueTermExtraction(TermExtractionPipelineComponent):
 
         token_sequences = self._extract_token_sequences(corpus=pipeline.corpus)
 
-        spaced_term_corpus_occ_map = self._spaced_term_corpus_occ_map(token_sequences)
+        spaced_term_corpus_occ_map = pipeline.get_span_ngram_index(
+            self._token_sequences_doc_attribute,
+            self._max_term_token_length,
+            token_texts,
+            build_index=lambda: self._spaced_term_corpus_occ_map(
+                iter_token_sequences(
+                    pipeline.corpus, self._token_sequences_doc_attribute
+                ),
+                pipeline.doc_registry,
+            ),
+        )
 
         corpus_spaced_token_sequences = [
             " ".join([token.text for token in token_sequence])
@@ -5,7 +5,11 @@ from typing import Any, Callable, Dict, List, Optional, Set
 from spacy.tokens import Doc
 
 from ...pipeline_schema import Pipeline
-from ....commons.llm_tools import HuggingFaceGenerator, LLMGenerator
+from ....commons.llm_tools import (
+    HuggingFaceGenerator,
+    LLMGenerator,
+    LLMRequestExecutor,
+)
 from ....commons.logging_config import logger
 from ....commons.prompts import hf_prompt_concept_term_extraction
 from ....data_container.candidate_term_schema import CandidateTerm
@@ -24,6 +28,8 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
     cts_post_processing_functions: List[Callable[[Set[CandidateTerm]], Set[CandidateTerm]]], optional
         A list of candidate term post processing functions to run after candidate term extraction
         and before assigning the extracted candidate terms to the pipeline. Default to None.
+    llm_executor: LLMRequestExecutor
+        The executor sending the LLM generator requests of the documents concurrently.
     """
 
     def __init__(
@@ -33,6 +39,7 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
         cts_post_processing_functions: Optional[
             List[Callable[[Set[CandidateTerm]], Set[CandidateTerm]]]
         ] = None,
+        max_concurrent_requests: Optional[int] = 4,
     ) -> None:
         """Initialise LLM term extraction pipeline component instance.
 
@@ -47,6 +54,9 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
         llm_generator: LLMGenerator
             The LLM model used to generate the candidate terms.
             By default, the zephyr-7b-beta HuggingFace model is used.
+        max_concurrent_requests: int, optional
+            Maximum number of documents sent concurrently to the LLM generator, by default 4.
+            The requests are also limited by the generator max_requests_per_minute.
         """
         super().__init__(cts_post_processing_functions)
         self.prompt_template = (
@@ -57,6 +67,9 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
         self.llm_generator = (
             llm_generator if llm_generator is not None else HuggingFaceGenerator()
         )
+        self.llm_executor = LLMRequestExecutor(
+            self.llm_generator, max_workers=max_concurrent_requests
+        )
         self.check_resources()
 
     def optimise(
@@ -102,6 +115,24 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
         """
         doc_prompt = self.prompt_template(doc.text)
         llm_output = self.llm_generator.generate_text(doc_prompt)
+        ct_labels = self._parse_candidate_terms(doc, llm_output)
+        return ct_labels
+
+    def _parse_candidate_terms(self, doc: Doc, llm_output: str) -> Set[str]:
+        """Parse the candidate term labels generated by a LLM from a document content.
+
+        Parameters
+        ----------
+        doc: Doc
+            The spaCy doc the candidate terms are generated from.
+        llm_output: str
+            The LLM generator output, expected to be a list of labels.
+
+        Returns
+        -------
+        Set[str]
+            The set of candidate term labels generated.
+        """
         try:
             ct_labels = ast.literal_eval(llm_output)
             if isinstance(ct_labels, List):
@@ -161,8 +192,10 @@ class LLMTermExtraction(TermExtractionPipelineComponent):
         for ct in pipeline.candidate_terms:
             ct_index[ct.label] = ct
 
-        for doc in pipeline.corpus:
-            ct_labels = self._generate_candidate_terms(doc)
+        for doc, llm_output in self.llm_executor.generate_texts(
+            pipeline.corpus, lambda doc: self.prompt_template(doc.text)
+        ):
+            ct_labels = self._parse_candidate_terms(doc, llm_output)
             self._update_candidate_terms(doc, ct_labels, ct_index)
 
         new_cts = set(ct_index.values())
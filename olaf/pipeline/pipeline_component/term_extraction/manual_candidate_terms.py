@@ -1,11 +1,13 @@
 from typing import Any, Callable, Dict, List, Optional, Set
 
 import spacy.language
+import spacy.tokens
 from spacy.matcher import PhraseMatcher
 
 from ...pipeline_schema import Pipeline
 from ....commons.errors import ParameterError
 from ....commons.logging_config import logger
+from ....commons.spacy_processing_tools import build_phrase_matcher
 from ....data_container.candidate_term_schema import CandidateTerm
 from .term_extraction_schema import TermExtractionPipelineComponent
 
@@ -111,34 +113,39 @@ class ManualCandidateTermExtraction(TermExtractionPipelineComponent):
         PhraseMatcher
             The constructed phrase matcher.
         """
-        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-
-        for label, match_strings in self.ct_label_strings_map.items():
-            matcher.add(label, [nlp(string) for string in match_strings])
+        matcher = build_phrase_matcher(nlp, self.ct_label_strings_map)
 
         return matcher
 
-    def run(self, pipeline: Pipeline) -> None:
-        """Execution of the candidate term extraction based manually provided strings.
+    def _build_candidate_terms(
+        self, corpus: List[spacy.tokens.Doc], nlp: spacy.language.Language
+    ) -> Set[CandidateTerm]:
+        """Match the candidate terms in a corpus and apply the post processing functions.
 
         Parameters
         ----------
-        pipeline : Pipeline
-            The pipeline running.
-        """
+        corpus : List[spacy.tokens.Doc]
+            The corpus to match the candidate terms in.
+        nlp : spacy.language.Language
+            The spaCy language model used to build the corpus.
 
+        Returns
+        -------
+        Set[CandidateTerm]
+            The matched candidate terms.
+        """
         if self.phrase_matcher is None:
-            self.phrase_matcher = self._build_matcher(pipeline.spacy_model)
+            self.phrase_matcher = self._build_matcher(nlp)
 
         candidate_terms_index = {}
 
-        for doc in pipeline.corpus:
+        for doc in corpus:
             matches = self.phrase_matcher(doc, as_spans=True)
 
             for match in matches:
                 if match.label not in candidate_terms_index:
                     candidate_terms_index[match.label] = CandidateTerm(
-                        label=pipeline.spacy_model.vocab.strings[match.label],
+                        label=nlp.vocab.strings[match.label],
                         corpus_occurrences={match},
                     )
                 else:
@@ -148,4 +155,35 @@ class ManualCandidateTermExtraction(TermExtractionPipelineComponent):
 
         candidate_terms = self.apply_post_processing(candidate_terms)
 
+        return candidate_terms
+
+    def run(self, pipeline: Pipeline) -> None:
+        """Execution of the candidate term extraction based manually provided strings.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        """
+
+        candidate_terms = self._build_candidate_terms(
+            pipeline.corpus, pipeline.spacy_model
+        )
+
         pipeline.candidate_terms.update(candidate_terms)
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the candidate term extraction on the documents added to the corpus.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        candidate_terms = self._build_candidate_terms(new_corpus, pipeline.spacy_model)
+
+        self.update_pipeline_candidate_terms(pipeline, candidate_terms)
@@ -197,16 +197,22 @@ class POSTermExtraction(TermExtractionPipelineComponent):
 
         return term_corpus_occ_mapping
 
-    def run(self, pipeline: Pipeline) -> None:
-        """Execution of the POS term extraction on the corpus. Pipeline candidate terms are updated.
+    def _build_candidate_terms(
+        self, corpus: List[spacy.tokens.Doc]
+    ) -> Set[CandidateTerm]:
+        """Extract the candidate terms of a corpus and apply the post processing functions.
 
         Parameters
         ----------
-        pipeline : Pipeline
-            The pipeline running.
-        """
+        corpus : List[spacy.tokens.Doc]
+            The corpus to extract the candidate terms from.
 
-        token_sequences = self._extract_token_sequences(corpus=pipeline.corpus)
+        Returns
+        -------
+        Set[CandidateTerm]
+            The extracted candidate terms.
+        """
+        token_sequences = self._extract_token_sequences(corpus=corpus)
         candidate_spans = self._extract_candidate_tokens(token_sequences)
         term_corpus_occ_map = self._build_term_corpus_occ_map(candidate_spans)
 
@@ -220,4 +226,34 @@ class POSTermExtraction(TermExtractionPipelineComponent):
 
         candidate_terms = self.apply_post_processing(candidate_terms)
 
+        return candidate_terms
+
+    def run(self, pipeline: Pipeline) -> None:
+        """Execution of the POS term extraction on the corpus. Pipeline candidate terms are updated.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        """
+
+        candidate_terms = self._build_candidate_terms(pipeline.corpus)
+
         pipeline.candidate_terms.update(candidate_terms)
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the POS term extraction on the documents added to the corpus.
+        Pipeline candidate terms are updated.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        candidate_terms = self._build_candidate_terms(new_corpus)
+
+        self.update_pipeline_candidate_terms(pipeline, candidate_terms)
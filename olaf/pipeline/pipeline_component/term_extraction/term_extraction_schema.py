@@ -1,8 +1,11 @@
 from abc import abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Set
 
+import spacy
+
 from ...pipeline_schema import Pipeline
 from ....commons.errors import NotCallableError
+from ....commons.logging_config import logger
 from ....data_container.candidate_term_schema import CandidateTerm
 from ..pipeline_component_schema import PipelineComponent
 
@@ -87,6 +90,30 @@ class TermExtractionPipelineComponent(PipelineComponent):
                 candidate_terms = post_processing_func(candidate_terms)
         return candidate_terms
 
+    def update_pipeline_candidate_terms(
+        self, pipeline: Pipeline, candidate_terms: Set[CandidateTerm]
+    ) -> None:
+        """Add candidate terms extracted from new documents to the pipeline candidate terms.
+        The corpus occurrences of a candidate term whose label is already in the pipeline
+        candidate terms are added to the existing candidate term.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running.
+        candidate_terms : Set[CandidateTerm]
+            The candidate terms extracted from the new documents.
+        """
+        pipeline_cts_index = {ct.label: ct for ct in pipeline.candidate_terms}
+
+        for candidate_term in candidate_terms:
+            if candidate_term.label in pipeline_cts_index:
+                pipeline_cts_index[candidate_term.label].add_corpus_occurrences(
+                    candidate_term.corpus_occurrences
+                )
+            else:
+                pipeline.candidate_terms.add(candidate_term)
+
     @abstractmethod
     def run(self, pipeline: Pipeline) -> None:
         """Method that is responsible for the execution of the component.
@@ -96,3 +123,32 @@ class TermExtractionPipelineComponent(PipelineComponent):
         pipeline : Pipeline
             The pipeline running
         """
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the component on the documents added to the pipeline corpus.
+
+        By default, the candidate terms are extracted again from the whole corpus and
+        merged by label into the pipeline candidate terms. Term extraction components
+        should override it to only process the new documents.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline running. Its corpus already contains the new documents.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        logger.warning(
+            "%s does not support incremental ingestion, candidate terms are extracted "
+            "again from the whole corpus.",
+            self.__class__.__name__,
+        )
+        pipeline_candidate_terms = pipeline.candidate_terms
+        pipeline.candidate_terms = set()
+        self.run(pipeline)
+
+        candidate_terms = pipeline.candidate_terms
+        pipeline.candidate_terms = pipeline_candidate_terms
+        self.update_pipeline_candidate_terms(pipeline, candidate_terms)
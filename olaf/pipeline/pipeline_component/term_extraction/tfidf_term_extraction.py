@@ -1,16 +1,24 @@
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import spacy.tokens.doc
 import spacy.tokens.span
-from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
 
 from ...pipeline_schema import Pipeline
 from ....commons.errors import OptionError
 from ....commons.logging_config import logger
-from ....commons.spacy_processing_tools import spacy_span_ngrams
+from ....commons.span_ngram_index import (
+    SpanNgramIndex,
+    build_span_ngram_index,
+    iter_token_sequences,
+)
+from ....commons.spacy_processing_tools import lower_token_texts
 from ....data_container.candidate_term_schema import CandidateTerm
+from ....data_container.span_set_schema import DocRegistry
 from .term_extraction_schema import TermExtractionPipelineComponent
 
 
@@ -40,6 +48,30 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         Tokenizer for the TF-IDF vectorizer.
     tfidf_vectorizer : sklearn.feature_extraction.text.TfidfVectorizer, optional
         The TF-IDF vectorizer to compute TF-IDF scores.
+    streaming : bool
+        Whether the TF-IDF scores are computed out-of-core, by batches of token sequences
+        with a hashing vectorizer, instead of with the TF-IDF vectorizer, by default False.
+    batch_size : int
+        The number of token sequences vectorised at once in streaming mode, by default 1000.
+    n_features : int
+        The number of hashed features in streaming mode, by default 2**20.
+    hashing_vectorizer : sklearn.feature_extraction.text.HashingVectorizer
+        The vectorizer counting the hashed terms of the token sequences in streaming mode.
+    _document_frequencies : np.ndarray
+        The number of token sequences containing each hashed feature, in streaming mode.
+    _nb_documents : int
+        The number of token sequences the document frequencies are fitted on, in streaming mode.
+    _term_feature_map : Dict[str, int]
+        The mapping between the terms selected in streaming mode and their hashed feature.
+    _corpus_spaced_token_sequences : List[str]
+        The preprocessed token sequences of the corpus processed so far, used to update the
+        TF-IDF scores when documents are added. It is not kept in streaming mode.
+    _term_corpus_occ_maps : List[SpanNgramIndex]
+        The mappings between terms and their corpus occurrences in the corpus processed so
+        far, one for the corpus of the last run and one per incremental run. It is not kept
+        in streaming mode.
+    _extracted_terms : Set[str]
+        The terms already extracted as candidate terms.
     """
 
     def __init__(
@@ -55,6 +87,9 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         tfidf_agg_type: Optional[str] = "MEAN",
         candidate_term_threshold: Optional[float] = None,
         tfidf_vectorizer: Optional[TfidfVectorizer] = None,
+        streaming: Optional[bool] = False,
+        batch_size: Optional[int] = 1000,
+        n_features: Optional[int] = 2**20,
     ) -> None:
         """Initialise TF-IDF term extraction pipeline component instance.
 
@@ -63,6 +98,13 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         - take the maximum TF IDF score for a term in the corpus: `tfidf_agg_type = "MAX"`
         - or compute the mean of the non zero TF IDF scores: `tfidf_agg_type = "MEAN"` (default)
 
+        In streaming mode, the document frequencies are fitted incrementally over batches of
+        token sequences with a hashing vectorizer so that neither the vectorizer vocabulary
+        nor the TF-IDF matrix is held in memory. The scores are the ones of the default
+        TF-IDF vectorizer, up to the hashed feature collisions. The token sequences are
+        read from the corpus again in each pass instead of being stored, and only the
+        occurrences of the selected terms are indexed.
+
         Parameters
         ----------
         token_sequence_preprocessing: Callable[[spacy.tokens.span.Span],Tuple[str]], optional
@@ -82,7 +124,15 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         candidate_term_threshold : float, optional
             The TF-IDF score threshold below which terms will be ignored, by default 0.0.
         tfidf_vectorizer : sklearn.feature_extraction.text.TfidfVectorizer, optional
-            The TF-IDF vectorizer to compute TF-IDF scores.
+            The TF-IDF vectorizer to compute TF-IDF scores. It is not used in streaming mode.
+        streaming : bool, optional
+            Whether the TF-IDF scores are computed out-of-core, by batches of token sequences
+            with a hashing vectorizer, by default False.
+        batch_size : int, optional
+            The number of token sequences vectorised at once in streaming mode, by default 1000.
+        n_features : int, optional
+            The number of hashed features in streaming mode, by default 2**20.
+            The higher, the less collisions between terms.
         """
 
         super().__init__(cts_post_processing_functions)
@@ -92,6 +142,9 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         self._max_term_token_length = max_term_token_length
         self.tfidf_agg_type = tfidf_agg_type
         self.candidate_term_threshold = candidate_term_threshold
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.n_features = n_features
 
         self._check_parameters()
 
@@ -106,6 +159,26 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
             )
         )
 
+        self.hashing_vectorizer = HashingVectorizer(
+            tokenizer=self._custom_tokenizer,
+            ngram_range=self._ngram_range,
+            n_features=self.n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+        # Hashes single terms the same way as the token sequences ngrams.
+        self._term_hasher = HashingVectorizer(
+            analyzer=lambda term: [term],
+            n_features=self.n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+
+        self._corpus_spaced_token_sequences = []
+        self._term_corpus_occ_maps = []
+        self._extracted_terms = set()
+        self._reset_streaming_statistics()
+
     def _check_parameters(self) -> None:
         """Check wether required parameters are given and correct. If this is not the case,
         suitable default ones are set.
@@ -136,9 +209,7 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
             logger.debug(
                 "No preprocessing function provided for the token sequences. Using the default one."
             )
-            self.token_sequence_preprocessing = lambda span: [
-                token.lower_.strip() for token in span
-            ]
+            self.token_sequence_preprocessing = lower_token_texts
 
         if self._max_term_token_length is None:
             logger.debug(
@@ -165,6 +236,24 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
                 error_type="Wrong value type",
             )
 
+        if not isinstance(self.streaming, bool):
+            logger.warning(
+                "Incorrect value given for streaming parameter, default will be set to False."
+            )
+            self.streaming = False
+
+        if not isinstance(self.batch_size, int) or self.batch_size < 1:
+            logger.warning(
+                "Incorrect value given for batch_size parameter, default will be set to 1000."
+            )
+            self.batch_size = 1000
+
+        if not isinstance(self.n_features, int) or self.n_features < 1:
+            logger.warning(
+                "Incorrect value given for n_features parameter, default will be set to 2**20."
+            )
+            self.n_features = 2**20
+
     def optimise(
         self, validation_terms: Set[str], option_values_map: Set[float]
     ) -> None:
@@ -203,39 +292,50 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         raise NotImplementedError
 
     def _spaced_term_corpus_occ_map(
-        self, token_seqs_spans: Set[spacy.tokens.Span]
-    ) -> Dict[str, Set[spacy.tokens.Span]]:
+        self,
+        token_seqs_spans: Tuple[spacy.tokens.Span],
+        token_seqs_tokens: Optional[List[List[str]]] = None,
+        doc_registry: Optional[DocRegistry] = None,
+    ) -> SpanNgramIndex:
         """Build a mapping between term string to be processed and the spaCy spans
         they were extracted from.
 
         We extract all the substring from 1 token to self._max_term_token_length in
         each token sequence. Hence, some candidate  terms might be substrings of the
-        initial token sequences. We pre-generate all of them to make sure to have the
-        mapping with a spaCy span to construct the Candidate Term instance.
+        initial token sequences. We index all of them in a single pass to make sure to
+        have the mapping with a spaCy span to construct the Candidate Term instance.
+        The spans are only created for the terms retrieved.
+
+        The ngram strings are sliced from the preprocessed token sequence when the
+        preprocessing returns one string per token. Otherwise, each ngram span is
+        preprocessed on its own. The term strings are split on whitespaces as the
+        TF-IDF vectorizer tokenizer does, to make sure the terms it generates are indexed.
 
         Parameters
         ----------
         token_seqs_spans : Tuple[spacy.tokens.Span]
             The spaCy spans of the token sequences to extract the candidate terms from.
+        token_seqs_tokens : List[List[str]], optional
+            The preprocessed token sequences, by default None which preprocesses them.
+        doc_registry : DocRegistry, optional
+            The registry of the documents of the token sequences, by default None.
 
         Returns
         -------
-        Dict[str, Set[spacy.tokens.Span]]
+        SpanNgramIndex
             The mapping between term string to be processed spaCy spans they were
             extracted from.
         """
-        term_corpus_occ_mapping = defaultdict(set)
-
-        for span in token_seqs_spans:
-            preprocessed_span_string = " ".join(self.token_sequence_preprocessing(span))
-            # to make sure terms generated by the TF-IDF process are indexed.
-            spaced_term = " ".join(self._custom_tokenizer(preprocessed_span_string))
-            term_corpus_occ_mapping[spaced_term].add(span)
-
-        return term_corpus_occ_mapping
+        return build_span_ngram_index(
+            token_seqs_spans,
+            self._max_term_token_length,
+            self.token_sequence_preprocessing,
+            doc_registry=doc_registry,
+            sequences_token_strings=token_seqs_tokens,
+        )
 
     def _get_corpus_occurrences(
-        self, term: str, term_corpus_occ_mapping: Dict[str, Set[spacy.tokens.Span]]
+        self, term: str, term_corpus_occ_mappings: Sequence[SpanNgramIndex]
     ) -> Set[spacy.tokens.Span]:
         """Retrieve spaCy spans corresponding to term.
 
@@ -243,73 +343,258 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         ----------
         term : str
             The term to retrieve the corpus occurrences from.
-        term_corpus_occ_mapping : Dict[str, Set[spacy.tokens.Span]]
-            The mapping of term to corpus occurrences.
+        term_corpus_occ_mappings : Sequence[SpanNgramIndex]
+            The mappings of term to corpus occurrences.
 
         Returns
         -------
         Set[spacy.tokens.Span]
             The set of corpus occurrences.
         """
-        term_corpus_occurrences = term_corpus_occ_mapping.get(term, set())
+        term_corpus_occurrences = set()
+        for term_corpus_occ_mapping in term_corpus_occ_mappings:
+            term_corpus_occurrences.update(term_corpus_occ_mapping.get(term, ()))
 
         if len(term_corpus_occurrences) == 0:
             logger.warning("No corpus occurrence found for candidate term %s", term)
 
         return term_corpus_occurrences
 
-    def _create_ngram_spans(
-        self, token_sequences: List[spacy.tokens.Span]
-    ) -> List[spacy.tokens.Span]:
-        """Extract spans ngrams of size from 1 to self._max_term_token_length.
+    def _extract_token_sequences(
+        self, corpus: List[spacy.tokens.Doc]
+    ) -> Tuple[spacy.tokens.Span]:
+        """Extract token sequences to constitute the corpus.
 
         Parameters
         ----------
-        token_sequences : List[spacy.tokens.Span]
-            The spans to extract the ngram spans from.
+        corpus: List[spacy.tokens.doc.Doc]
+            The corpus to extract the candidate terms from.
 
         Returns
         -------
-        List[spacy.tokens.Span]
-            The ngram spans
+        Tuple[spacy.tokens.Span]
+            The list of extracted sequences.
         """
-        ngram_spans = []
+        token_sequences = iter_token_sequences(
+            corpus, self._token_sequences_doc_attribute
+        )
 
-        for span in token_sequences:
-            for gram_size in range(1, min(self._max_term_token_length, len(span)) + 1):
-                span_ngrams = spacy_span_ngrams(span=span, gram_size=gram_size)
-                ngram_spans.extend(span_ngrams)
+        return tuple(token_sequences)
 
-        return ngram_spans
+    def _aggregate_tfidf_values(self, tfidf_matrix: sparse.spmatrix) -> np.ndarray:
+        """Aggregate the TF-IDF values of each term over the corpus documents.
 
-    def _extract_token_sequences(
+        The aggregation is computed on the sparse TF-IDF matrix, without densifying it, so
+        that the memory used only depends on the number of non zero TF-IDF values.
+
+        Parameters
+        ----------
+        tfidf_matrix : scipy.sparse.spmatrix
+            The documents x terms TF-IDF matrix.
+
+        Returns
+        -------
+        np.ndarray
+            The aggregated TF-IDF value of each term, indexed as the matrix columns.
+        """
+        tfidf_matrix = sparse.csr_matrix(tfidf_matrix)
+        tfidf_matrix.eliminate_zeros()
+        nb_terms = tfidf_matrix.shape[1]
+
+        if self.tfidf_agg_type == "MEAN":
+            # Values are accumulated in row order, as the dense column sums are.
+            tfidf_sums = np.bincount(
+                tfidf_matrix.indices, weights=tfidf_matrix.data, minlength=nb_terms
+            )
+            tfidf_counts = np.bincount(tfidf_matrix.indices, minlength=nb_terms)
+            tfidf_values = tfidf_sums / tfidf_counts
+
+        else:
+            tfidf_values = tfidf_matrix.max(axis=0).toarray().ravel()
+
+        return tfidf_values
+
+    def _reset_streaming_statistics(self) -> None:
+        """Reset the document frequencies and the term feature map of the streaming mode."""
+        self._document_frequencies = np.zeros(self.n_features, dtype=np.int64)
+        self._nb_documents = 0
+        self._term_feature_map = {}
+
+    def _spaced_token_sequences(
+        self, token_seqs_tokens: List[Sequence[str]]
+    ) -> List[str]:
+        """Join the preprocessed token sequences into the strings the vectorizers take."""
+        return [" ".join([t.strip() for t in tokens]) for tokens in token_seqs_tokens]
+
+    def _iter_token_sequence_batches(
         self, corpus: List[spacy.tokens.Doc]
-    ) -> Tuple[spacy.tokens.Span]:
-        """Extract token sequences to constitute the corpus.
+    ) -> Iterator[Tuple[List[spacy.tokens.Span], List[Sequence[str]]]]:
+        """Yield the token sequences of a corpus with their preprocessed token strings, by
+        batches of self.batch_size, so that only one batch is preprocessed at once.
 
         Parameters
         ----------
         corpus: List[spacy.tokens.doc.Doc]
-            The corpus to extract the candidate terms from.
+            The corpus to read the token sequences from.
+
+        Yields
+        ------
+        Tuple[List[spacy.tokens.Span], List[Sequence[str]]]
+            The token sequences of a batch and their preprocessed token strings.
+        """
+        token_sequences = iter_token_sequences(
+            corpus, self._token_sequences_doc_attribute
+        )
+        while True:
+            batch = list(islice(token_sequences, self.batch_size))
+            if not batch:
+                return
+            yield batch, [self.token_sequence_preprocessing(span) for span in batch]
+
+    def _partial_fit(self, corpus: List[spacy.tokens.Doc]) -> None:
+        """Update the document frequencies of the hashed features with the token sequences
+        of new documents, batch by batch.
+
+        Parameters
+        ----------
+        corpus: List[spacy.tokens.doc.Doc]
+            The documents to fit.
+        """
+        for _, token_seqs_tokens in self._iter_token_sequence_batches(corpus):
+            counts_matrix = self.hashing_vectorizer.transform(
+                self._spaced_token_sequences(token_seqs_tokens)
+            )
+            self._document_frequencies += np.bincount(
+                counts_matrix.indices, minlength=self.n_features
+            )
+            self._nb_documents += counts_matrix.shape[0]
+
+    def _streaming_tfidf_values(self, corpus: List[spacy.tokens.Doc]) -> np.ndarray:
+        """Compute the aggregated TF-IDF values of the hashed features, batch by batch,
+        with the fitted document frequencies.
+
+        The TF-IDF values are computed as the default TF-IDF vectorizer does, i.e., with a
+        smoothed IDF and l2 normalised document vectors.
+
+        Parameters
+        ----------
+        corpus: List[spacy.tokens.doc.Doc]
+            The corpus to compute the TF-IDF values on.
 
         Returns
         -------
-        Tuple[spacy.tokens.Span]
-            The list of extracted sequences.
+        np.ndarray
+            The aggregated TF-IDF value of each hashed feature.
         """
-        token_sequences = []
+        idf = (
+            np.log((1 + self._nb_documents) / (1 + self._document_frequencies)) + 1
+        )
 
-        if self._token_sequences_doc_attribute:
-            for doc in corpus:
-                doc_token_sequences = doc._.get(self._token_sequences_doc_attribute)
-                token_sequences.extend(doc_token_sequences)
+        if self.tfidf_agg_type == "MEAN":
+            tfidf_sums = np.zeros(self.n_features)
+            tfidf_counts = np.zeros(self.n_features, dtype=np.int64)
         else:
-            for doc in corpus:
-                # Extract the document tokens in a span instance for type consistency.
-                doc_span = doc[:]
-                token_sequences.append(doc_span)
+            tfidf_max = np.zeros(self.n_features)
 
-        return tuple(token_sequences)
+        for _, token_seqs_tokens in self._iter_token_sequence_batches(corpus):
+            tfidf_matrix = self.hashing_vectorizer.transform(
+                self._spaced_token_sequences(token_seqs_tokens)
+            )
+            tfidf_matrix.data *= idf[tfidf_matrix.indices]
+            tfidf_matrix = normalize(tfidf_matrix, copy=False)
+            tfidf_matrix.eliminate_zeros()
+
+            if self.tfidf_agg_type == "MEAN":
+                tfidf_sums += np.bincount(
+                    tfidf_matrix.indices,
+                    weights=tfidf_matrix.data,
+                    minlength=self.n_features,
+                )
+                tfidf_counts += np.bincount(
+                    tfidf_matrix.indices, minlength=self.n_features
+                )
+            else:
+                np.maximum.at(tfidf_max, tfidf_matrix.indices, tfidf_matrix.data)
+
+        if self.tfidf_agg_type == "MEAN":
+            return np.divide(
+                tfidf_sums,
+                tfidf_counts,
+                out=np.zeros(self.n_features),
+                where=tfidf_counts > 0,
+            )
+
+        return tfidf_max
+
+    def _select_streaming_terms(
+        self,
+        corpus: List[spacy.tokens.Doc],
+        tfidf_values: np.ndarray,
+        doc_registry: DocRegistry,
+        is_candidate: Optional[Callable[[str], bool]] = None,
+    ) -> SpanNgramIndex:
+        """Select the terms of a corpus whose hashed feature has a TF-IDF value above the
+        threshold and index their corpus occurrences, batch by batch.
+
+        The selected terms are added to the term feature map. The terms below the
+        threshold are not kept, so they are hashed again in each batch they appear in.
+
+        Parameters
+        ----------
+        corpus: List[spacy.tokens.doc.Doc]
+            The corpus to select the terms from.
+        tfidf_values : np.ndarray
+            The aggregated TF-IDF value of each hashed feature.
+        doc_registry : DocRegistry
+            The registry of the corpus documents.
+        is_candidate : Callable[[str], bool], optional
+            The function telling whether a term can be selected, by default None which
+            considers all the terms.
+
+        Returns
+        -------
+        SpanNgramIndex
+            The mapping between the selected terms and their corpus occurrences.
+        """
+        analyzer = self.hashing_vectorizer.build_analyzer()
+        term_corpus_occ_map = SpanNgramIndex(doc_registry=doc_registry)
+
+        for token_sequences, token_seqs_tokens in self._iter_token_sequence_batches(
+            corpus
+        ):
+            batch_terms = dict.fromkeys(
+                term
+                for token_sequence in self._spaced_token_sequences(token_seqs_tokens)
+                for term in analyzer(token_sequence)
+                if is_candidate is None or is_candidate(term)
+            )
+            new_terms = [
+                term for term in batch_terms if term not in self._term_feature_map
+            ]
+            if new_terms:
+                term_features = self._term_hasher.transform(new_terms).indices.tolist()
+                self._term_feature_map.update(
+                    (term, feature)
+                    for term, feature in zip(new_terms, term_features)
+                    if tfidf_values[feature] > self.candidate_term_threshold
+                )
+
+            selected_terms = {
+                term for term in batch_terms if term in self._term_feature_map
+            }
+            if selected_terms:
+                term_corpus_occ_map.extend(
+                    build_span_ngram_index(
+                        token_sequences,
+                        self._max_term_token_length,
+                        self.token_sequence_preprocessing,
+                        doc_registry=doc_registry,
+                        sequences_token_strings=token_seqs_tokens,
+                        terms=selected_terms,
+                    )
+                )
+
+        return term_corpus_occ_map
 
     def _extract_candidate_terms(self, terms: List[str]) -> Tuple[str]:
         """Compute the TF-IDF score for each term and filter out the ones with a score
@@ -325,18 +610,8 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         Tuple[str]
             The list the selected terms.
         """
-
-        tfidf_values = []
-
-        tfidf_matrix = self.tfidf_vectorizer.fit_transform(terms).toarray()
-
-        if self.tfidf_agg_type == "MEAN":
-            tfidf_values = tfidf_matrix.sum(axis=0) / np.count_nonzero(
-                tfidf_matrix, axis=0
-            )
-
-        elif self.tfidf_agg_type == "MAX":
-            tfidf_values = tfidf_matrix.max(axis=0)
+        tfidf_matrix = self.tfidf_vectorizer.fit_transform(terms)
+        tfidf_values = self._aggregate_tfidf_values(tfidf_matrix)
 
         candidate_terms_scores = []
         for term, idx in self.tfidf_vectorizer.vocabulary_.items():
@@ -349,35 +624,78 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
 
         return candidate_terms
 
-    def run(self, pipeline: Pipeline) -> None:
-        """Method that is responsible for the execution of the component.
+    def _process_token_sequences(
+        self, corpus: List[spacy.tokens.Doc]
+    ) -> Tuple[Tuple[spacy.tokens.Span], List[Sequence[str]]]:
+        """Extract and preprocess the token sequences of a corpus and store their
+        preprocessed strings.
 
         Parameters
         ----------
-        pipeline: Pipeline
-            The pipeline to run the component with.
+        corpus: List[spacy.tokens.doc.Doc]
+            The corpus to process.
+
+        Returns
+        -------
+        Tuple[Tuple[spacy.tokens.Span], List[Sequence[str]]]
+            The token sequences and their preprocessed token strings.
         """
+        token_sequences = self._extract_token_sequences(corpus=corpus)
+        token_seqs_tokens = [
+            self.token_sequence_preprocessing(span) for span in token_sequences
+        ]
 
-        token_sequences = self._extract_token_sequences(corpus=pipeline.corpus)
+        self._corpus_spaced_token_sequences.extend(
+            self._spaced_token_sequences(token_seqs_tokens)
+        )
 
-        vocabulary_spans = self._create_ngram_spans(token_sequences)
+        return token_sequences, token_seqs_tokens
 
-        spaced_term_corpus_occ_map = self._spaced_term_corpus_occ_map(vocabulary_spans)
+    def run(self, pipeline: Pipeline) -> None:
+        """Method that is responsible for the execution of the component.
 
-        corpus_spaced_token_sequences = [
-            " ".join([t.strip() for t in self.token_sequence_preprocessing(span)])
-            for span in token_sequences
-        ]
+        Parameters
+        ----------
+        pipeline: Pipeline
+            The pipeline to run the component with.
+        """
+        self._corpus_spaced_token_sequences = []
+        self._term_corpus_occ_maps = []
+        self._reset_streaming_statistics()
+
+        if self.streaming:
+            self._partial_fit(pipeline.corpus)
+            tfidf_values = self._streaming_tfidf_values(pipeline.corpus)
+            spaced_term_corpus_occ_map = self._select_streaming_terms(
+                pipeline.corpus, tfidf_values, pipeline.doc_registry
+            )
+            extracted_terms = list(self._term_feature_map)
+        else:
+            token_sequences, token_seqs_tokens = self._process_token_sequences(
+                pipeline.corpus
+            )
+            # The index is shared with the components indexing the corpus the same way,
+            # the default lower case index is derived from the token texts index.
+            spaced_term_corpus_occ_map = pipeline.get_span_ngram_index(
+                self._token_sequences_doc_attribute,
+                self._max_term_token_length,
+                self.token_sequence_preprocessing,
+                build_index=lambda: self._spaced_term_corpus_occ_map(
+                    token_sequences, token_seqs_tokens, pipeline.doc_registry
+                ),
+            )
+            self._term_corpus_occ_maps = [spaced_term_corpus_occ_map]
 
-        extracted_terms = self._extract_candidate_terms(
-            terms=corpus_spaced_token_sequences
-        )
+            extracted_terms = self._extract_candidate_terms(
+                terms=self._corpus_spaced_token_sequences
+            )
+        self._extracted_terms = set(extracted_terms)
 
         candidate_terms = set()
         for extracted_term in extracted_terms:
             term_corpus_occurrences = self._get_corpus_occurrences(
                 term=extracted_term,
-                term_corpus_occ_mapping=spaced_term_corpus_occ_map,
+                term_corpus_occ_mappings=[spaced_term_corpus_occ_map],
             )
             candidate_term = CandidateTerm(
                 label=extracted_term, corpus_occurrences=term_corpus_occurrences
@@ -388,3 +706,82 @@ class TFIDFTermExtraction(TermExtractionPipelineComponent):
         candidate_terms = self.apply_post_processing(candidate_terms)
 
         pipeline.candidate_terms.update(candidate_terms)
+
+    def run_incremental(
+        self, pipeline: Pipeline, new_corpus: List[spacy.tokens.Doc]
+    ) -> None:
+        """Execution of the component on the documents added to the pipeline corpus.
+
+        Only the new documents are processed with spaCy. As TF-IDF scores depend on the whole
+        corpus, they are computed again on the stored preprocessed token sequences. In
+        streaming mode, the document frequencies are only updated with the new documents
+        and the scores are computed again by reading the whole corpus.
+        Candidate terms already extracted are updated with their new corpus occurrences only
+        while newly selected terms get all their corpus occurrences.
+        Candidate terms already extracted are never removed.
+
+        Parameters
+        ----------
+        pipeline: Pipeline
+            The pipeline to run the component with.
+        new_corpus : List[spacy.tokens.Doc]
+            The documents added to the pipeline corpus.
+        """
+        if self.streaming:
+            self._partial_fit(new_corpus)
+            tfidf_values = self._streaming_tfidf_values(pipeline.corpus)
+            self._term_feature_map = {}
+            # Terms already extracted only get their occurrences in the new documents.
+            new_spaced_term_corpus_occ_map = self._select_streaming_terms(
+                new_corpus,
+                tfidf_values,
+                pipeline.doc_registry,
+                is_candidate=self._extracted_terms.__contains__,
+            )
+            term_corpus_occ_maps = [
+                self._select_streaming_terms(
+                    pipeline.corpus,
+                    tfidf_values,
+                    pipeline.doc_registry,
+                    is_candidate=lambda term: term not in self._extracted_terms,
+                )
+            ]
+            extracted_terms = list(self._term_feature_map)
+        else:
+            new_token_sequences, new_token_seqs_tokens = self._process_token_sequences(
+                new_corpus
+            )
+            new_spaced_term_corpus_occ_map = self._spaced_term_corpus_occ_map(
+                new_token_sequences, new_token_seqs_tokens, pipeline.doc_registry
+            )
+            self._term_corpus_occ_maps.append(new_spaced_term_corpus_occ_map)
+            term_corpus_occ_maps = self._term_corpus_occ_maps
+
+            extracted_terms = self._extract_candidate_terms(
+                terms=self._corpus_spaced_token_sequences
+            )
+
+        candidate_terms = set()
+        for extracted_term in extracted_terms:
+            if extracted_term in self._extracted_terms:
+                term_corpus_occurrences = set(
+                    new_spaced_term_corpus_occ_map.get(extracted_term, ())
+                )
+                if not term_corpus_occurrences:
+                    continue
+            else:
+                term_corpus_occurrences = self._get_corpus_occurrences(
+                    term=extracted_term,
+                    term_corpus_occ_mappings=term_corpus_occ_maps,
+                )
+            candidate_term = CandidateTerm(
+                label=extracted_term, corpus_occurrences=term_corpus_occurrences
+            )
+
+            candidate_terms.add(candidate_term)
+
+        self._extracted_terms.update(extracted_terms)
+
+        candidate_terms = self.apply_post_processing(candidate_terms)
+
+        self.update_pipeline_candidate_terms(pipeline, candidate_terms)
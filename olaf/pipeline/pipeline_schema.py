@@ -1,13 +1,28 @@
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import spacy
 
+from ..commons.cache_tools import LRUCache
 from ..commons.errors import PipelineCorpusInitialisationError
+from ..commons.spacy_processing_tools import lower_token_texts, token_texts
+from ..commons.span_ngram_index import (
+    SpanNgramIndex,
+    build_span_ngram_index,
+    iter_token_sequences,
+)
 from ..data_container.knowledge_representation_schema import KnowledgeRepresentation
+from ..data_container.span_set_schema import (
+    DocRegistry,
+    compact_corpus_occurrences_in_place,
+)
 from .data_preprocessing.data_preprocessing_schema import DataPreprocessing
 from .pipeline_component.pipeline_component_schema import PipelineComponent
 from ..repository.corpus_loader.corpus_loader_schema import CorpusLoader
 
+# Token strings functions whose ngram index is derived from the ngram index of other token
+# strings by mapping its term strings, e.g., the lower case index from the token texts one.
+DERIVED_TOKEN_STRINGS = {lower_token_texts: (token_texts, str.lower)}
+
 
 class Pipeline:
     """A Pipeline is the library main class. It orchestrates the pipeline starting
@@ -32,6 +47,14 @@ class Pipeline:
         The knowledge extracted from the corpus.
     candidate_terms: Set[CandidateTerms]
         The candidate terms extracted and processed to create concept and relations.
+    compact_corpus_occurrences: bool
+        Whether the corpus occurrences of the candidate terms and of the linguistic
+        realisations are stored as compact span sets after each pipeline component run.
+    doc_registry: DocRegistry
+        The registry of the corpus documents the compact span sets refer to.
+    span_ngram_indices: LRUCache
+        The ngram occurrence indices of the corpus shared by the pipeline components, see
+        get_span_ngram_index.
     """
 
     def __init__(
@@ -42,6 +65,7 @@ class Pipeline:
         corpus_loader: Optional[CorpusLoader] = None,
         corpus: Optional[List[spacy.tokens.doc.Doc]] = None,
         seed_kr: Optional[KnowledgeRepresentation] = None,
+        compact_corpus_occurrences: Optional[bool] = False,
     ) -> None:
         """Initialise Pipeline instance.
 
@@ -59,6 +83,11 @@ class Pipeline:
             The preprocessed corpus the knowledge representation is built from, by default None.
         seed_kr: KnowledgeRepresentation, optional
             An initial knowledge representation to work with, by default None.
+        compact_corpus_occurrences: bool, optional
+            Whether the corpus occurrences of the candidate terms and of the linguistic
+            realisations are stored as compact span sets after each pipeline component run,
+            by default False. Span sets use less memory than sets of spaCy spans on large
+            corpora but do not keep span labels.
         """
         self.pipeline_components = pipeline_components
         self.preprocessing_components = preprocessing_components
@@ -67,6 +96,7 @@ class Pipeline:
         self.corpus = corpus
         self.kr = seed_kr
         self.candidate_terms = set()
+        self.compact_corpus_occurrences = compact_corpus_occurrences
 
         if self.preprocessing_components is None:
             self.preprocessing_components = []
@@ -83,6 +113,9 @@ class Pipeline:
         if self.kr is None:
             self.kr = KnowledgeRepresentation()
 
+        self.doc_registry = DocRegistry(self.corpus)
+        self.span_ngram_indices = LRUCache(max_size=2)
+
     def build(self) -> None:
         """Effectively build the pipeline, making the instance runnable.
         This method check each components and the constrained order.
@@ -139,9 +172,174 @@ class Pipeline:
     def run(self) -> None:
         """Run the pipeline. The method hence run each pipeline components in
         the determined order filling the Knowledge Representation.
+        If the corpus has been loaded with a cached corpus loader, the preprocessed corpus is
+        cached so that the next pipelines skip the corpus parsing. It is only written when the
+        preprocessing changed the cached documents.
         """
         for component in self.preprocessing_components:
             component.run(self)
 
+        if self.preprocessing_components and self.corpus_loader is not None:
+            self.corpus_loader.cache_corpus(self.corpus)
+
+        self.span_ngram_indices.clear()
         for component in self.pipeline_components:
             component.run(self)
+            self._compact_corpus_occurrences()
+        self.span_ngram_indices.clear()
+
+    def get_span_ngram_index(
+        self,
+        token_sequences_doc_attribute: Optional[str],
+        max_gram_size: int,
+        token_strings: Callable[[spacy.tokens.Span], Sequence[str]],
+        build_index: Optional[Callable[[], SpanNgramIndex]] = None,
+    ) -> SpanNgramIndex:
+        """Return the index of the corpus occurrences of the ngrams of 1 to max_gram_size
+        tokens of the corpus token sequences, building it on first use.
+
+        The indices are cached by token sequences and token strings function, so that the
+        components indexing the corpus the same way share one index. A cached index of
+        larger ngrams answers the lookups of smaller ngrams through a filtered view. The
+        index of the token strings of DERIVED_TOKEN_STRINGS is a view of the index of their
+        base token strings, e.g., the lower case index of the TF-IDF term extraction is
+        derived from the token texts index of the C-value term extraction, so that they
+        share one pass over the corpus. The two most recently used indices are kept until
+        the end of the pipeline run.
+
+        Parameters
+        ----------
+        token_sequences_doc_attribute : str, optional
+            The name of the spaCy doc custom attribute containing the token sequences,
+            None for the whole documents.
+        max_gram_size : int
+            The maximum number of tokens of the indexed ngrams.
+        token_strings : Callable[[spacy.tokens.Span], Sequence[str]]
+            The function returning the token strings the term strings are built from.
+        build_index : Callable[[], SpanNgramIndex], optional
+            The function building the index of ngrams of 1 to max_gram_size tokens if it is
+            neither cached nor derived, by default None which builds it with
+            build_span_ngram_index. It should index the corpus the same way.
+
+        Returns
+        -------
+        SpanNgramIndex
+            The index of the ngrams corpus occurrences, by term string. It is shared and
+            should not be modified.
+        """
+        index_max_gram_size, index = self._cached_span_ngram_index(
+            token_sequences_doc_attribute, max_gram_size, token_strings, build_index
+        )
+        if index_max_gram_size > max_gram_size:
+            return index.view(max_gram_size=max_gram_size)
+        return index
+
+    def _cached_span_ngram_index(
+        self,
+        token_sequences_doc_attribute: Optional[str],
+        max_gram_size: int,
+        token_strings: Callable[[spacy.tokens.Span], Sequence[str]],
+        build_index: Optional[Callable[[], SpanNgramIndex]] = None,
+    ) -> Tuple[int, SpanNgramIndex]:
+        """Return the cached ngram index of the corpus token sequences if its ngrams are
+        large enough, otherwise build or derive it and cache it, see get_span_ngram_index.
+
+        Parameters
+        ----------
+        token_sequences_doc_attribute : str, optional
+            The name of the spaCy doc custom attribute containing the token sequences,
+            None for the whole documents.
+        max_gram_size : int
+            The minimum maximum number of tokens of the index ngrams.
+        token_strings : Callable[[spacy.tokens.Span], Sequence[str]]
+            The function returning the token strings the term strings are built from.
+        build_index : Callable[[], SpanNgramIndex], optional
+            The function building the index if it is neither cached nor derived, by default
+            None.
+
+        Returns
+        -------
+        Tuple[int, SpanNgramIndex]
+            The maximum number of tokens of the index ngrams, at least max_gram_size, and
+            the index.
+        """
+        # The corpus size is part of the key as documents can be added to the corpus.
+        cache_key = (token_sequences_doc_attribute, token_strings, len(self.corpus))
+        cached_index = self.span_ngram_indices.get(cache_key)
+        if cached_index is not None and cached_index[0] >= max_gram_size:
+            return cached_index
+
+        if token_strings in DERIVED_TOKEN_STRINGS:
+            base_token_strings, map_term = DERIVED_TOKEN_STRINGS[token_strings]
+            base_max_gram_size, base_index = self._cached_span_ngram_index(
+                token_sequences_doc_attribute, max_gram_size, base_token_strings
+            )
+            index = base_index.view(
+                max_gram_size=(
+                    max_gram_size if base_max_gram_size > max_gram_size else None
+                ),
+                map_term=map_term,
+            )
+        elif build_index is None:
+            index = build_span_ngram_index(
+                iter_token_sequences(self.corpus, token_sequences_doc_attribute),
+                max_gram_size,
+                token_strings,
+                doc_registry=self.doc_registry,
+            )
+        else:
+            index = build_index()
+
+        cached_index = (max_gram_size, index)
+        self.span_ngram_indices.put(cache_key, cached_index)
+        return cached_index
+
+    def _compact_corpus_occurrences(self) -> None:
+        """Store the corpus occurrences of the candidate terms and of the knowledge
+        representation linguistic realisations as span sets, if the pipeline is set to.
+        """
+        if not self.compact_corpus_occurrences:
+            return
+
+        containers = list(self.candidate_terms)
+        for kr_elements in (self.kr.concepts, self.kr.relations, self.kr.metarelations):
+            for kr_element in kr_elements:
+                containers.extend(kr_element.linguistic_realisations)
+
+        compact_corpus_occurrences_in_place(containers, self.doc_registry)
+
+    def add_documents(
+        self, new_corpus: Iterable[Union[str, spacy.tokens.doc.Doc]]
+    ) -> None:
+        """Add documents to the corpus of a pipeline that has already been run, without running
+        the pipeline again on the whole corpus.
+        The new documents are preprocessed and each pipeline component is run incrementally,
+        i.e., the components supporting it only process the new documents and update the
+        candidate terms and the knowledge representation in place. The components not
+        supporting it are skipped with an error, the pipeline has to be run again to process
+        the new documents with them.
+
+        Parameters
+        ----------
+        new_corpus : Iterable[Union[str, spacy.tokens.doc.Doc]]
+            The documents to add, either texts or documents parsed with the pipeline spacy model.
+            Texts are parsed with the pipeline spacy model.
+        """
+        new_corpus = [
+            self.spacy_model(document) if isinstance(document, str) else document
+            for document in new_corpus
+        ]
+        if not new_corpus:
+            return
+
+        self.corpus.extend(new_corpus)
+        self.doc_registry.register_docs(new_corpus)
+
+        for component in self.preprocessing_components:
+            component.run_incremental(self, new_corpus)
+
+        self.span_ngram_indices.clear()
+        for component in self.pipeline_components:
+            component.run_incremental(self, new_corpus)
+            self._compact_corpus_occurrences()
+        self.span_ngram_indices.clear()
@@ -1,3 +1,4 @@
+from .corpus_cache import CorpusCache
 from .corpus_loader_schema import CorpusLoader
 from .csv_corpus_loader import CsvCorpusLoader
 from .json_corpus_loader import JsonCorpusLoader
@@ -0,0 +1,253 @@
+import hashlib
+import os
+from typing import Any, Iterable, List, Optional
+
+import spacy
+from spacy.tokens import DocBin
+
+from ...commons.logging_config import logger
+
+CORPUS_CACHE_FORMAT_VERSION = "1"
+SPAN_MARKER = "__olaf_span__"
+
+
+class CorpusCache:
+    """On-disk cache of parsed corpora.
+
+    Parsed corpora are stored as spaCy DocBin files named after a key computed from the raw
+    texts, the spaCy model name, version and enabled pipes. The custom spaCy doc attributes,
+    e.g., the selected tokens set by the TokenSelectorDataPreprocessing component, are stored
+    along with the documents. Spans are stored as (start, end) token offsets and
+    restored as spans on load.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Path of the folder in which the parsed corpora are stored.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialise CorpusCache instance.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Path of the folder in which the parsed corpora are stored.
+            The folder is created if it does not exist.
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def compute_key(
+        self,
+        texts: Iterable[str],
+        spacy_model: spacy.language.Language,
+        disable: Optional[Iterable[str]] = None,
+    ) -> str:
+        """Compute the cache key of a corpus.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The raw texts of the corpus.
+        spacy_model : spacy.language.Language
+            The spacy model used to parse the texts.
+        disable : Iterable[str], optional
+            Names of the spaCy pipes disabled while parsing the texts, by default None.
+
+        Returns
+        -------
+        str
+            The corpus cache key.
+        """
+        disabled_pipes = set(disable) if disable else set()
+        enabled_pipes = [
+            pipe_name
+            for pipe_name in spacy_model.pipe_names
+            if pipe_name not in disabled_pipes
+        ]
+        model_signature = "|".join(
+            [
+                CORPUS_CACHE_FORMAT_VERSION,
+                spacy_model.lang,
+                spacy_model.meta.get("name", ""),
+                spacy_model.meta.get("version", ""),
+                spacy.__version__,
+                ",".join(enabled_pipes),
+            ]
+        )
+
+        hasher = hashlib.sha256(model_signature.encode("utf-8"))
+        for text in texts:
+            text_bytes = text.encode("utf-8")
+            # prefix each text with its length to avoid collisions on concatenation
+            hasher.update(len(text_bytes).to_bytes(8, "little"))
+            hasher.update(text_bytes)
+
+        return hasher.hexdigest()
+
+    def compute_user_data_fingerprint(self, docs: Iterable[spacy.tokens.Doc]) -> str:
+        """Compute a fingerprint of the custom attributes stored in the documents user data,
+        e.g., to check whether preprocessing components changed a cached corpus.
+
+        Parameters
+        ----------
+        docs : Iterable[spacy.tokens.Doc]
+            The parsed corpus.
+
+        Returns
+        -------
+        str
+            The user data fingerprint.
+        """
+        hasher = hashlib.sha256()
+        for doc in docs:
+            doc_user_data = sorted(
+                repr((data_key, self._encode_value(data_value)))
+                for data_key, data_value in doc.user_data.items()
+            )
+            hasher.update(repr(doc_user_data).encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _cache_file_path(self, key: str) -> str:
+        """Path of the DocBin file corresponding to a cache key.
+
+        Parameters
+        ----------
+        key : str
+            The corpus cache key.
+
+        Returns
+        -------
+        str
+            The cache file path.
+        """
+        return os.path.join(self.cache_dir, f"{key}.spacy")
+
+    def contains(self, key: str) -> bool:
+        """Check whether a parsed corpus is stored for the key.
+
+        Parameters
+        ----------
+        key : str
+            The corpus cache key.
+
+        Returns
+        -------
+        bool
+            True if the corpus is cached, False otherwise.
+        """
+        return os.path.isfile(self._cache_file_path(key))
+
+    def _encode_value(self, value: Any) -> Any:
+        """Convert spans contained in a custom attribute value to token offsets.
+
+        Parameters
+        ----------
+        value : Any
+            The custom attribute value.
+
+        Returns
+        -------
+        Any
+            The value with spans replaced by their token offsets.
+        """
+        if isinstance(value, spacy.tokens.Span):
+            return {SPAN_MARKER: [value.start, value.end]}
+        if isinstance(value, (list, tuple)):
+            return [self._encode_value(item) for item in value]
+        return value
+
+    def _decode_value(self, value: Any, doc: spacy.tokens.Doc) -> Any:
+        """Convert token offsets stored in a custom attribute value back to spans.
+
+        Parameters
+        ----------
+        value : Any
+            The stored custom attribute value.
+        doc : spacy.tokens.Doc
+            The document the spans belong to.
+
+        Returns
+        -------
+        Any
+            The value with token offsets replaced by spans.
+        """
+        if isinstance(value, dict) and SPAN_MARKER in value:
+            start, end = value[SPAN_MARKER]
+            return doc[start:end]
+        if isinstance(value, (list, tuple)):
+            return [self._decode_value(item, doc) for item in value]
+        return value
+
+    def save(self, key: str, docs: List[spacy.tokens.Doc]) -> None:
+        """Store a parsed corpus.
+
+        Parameters
+        ----------
+        key : str
+            The corpus cache key.
+        docs : List[spacy.tokens.Doc]
+            The parsed corpus.
+        """
+        doc_bin = DocBin(store_user_data=True)
+        for doc in docs:
+            user_data = doc.user_data
+            doc.user_data = {
+                data_key: self._encode_value(data_value)
+                for data_key, data_value in user_data.items()
+            }
+            try:
+                doc_bin.add(doc)
+            finally:
+                doc.user_data = user_data
+
+        # write to a temporary file first so that an interrupted write never leaves
+        # a corrupted cache entry behind.
+        file_path = self._cache_file_path(key)
+        tmp_file_path = f"{file_path}.tmp"
+        doc_bin.to_disk(tmp_file_path)
+        os.replace(tmp_file_path, file_path)
+
+        logger.info("Parsed corpus of %i documents cached in %s.", len(docs), file_path)
+
+    def load(
+        self, key: str, spacy_model: spacy.language.Language
+    ) -> Optional[List[spacy.tokens.Doc]]:
+        """Restore a parsed corpus.
+
+        Parameters
+        ----------
+        key : str
+            The corpus cache key.
+        spacy_model : spacy.language.Language
+            The spacy model whose vocabulary is used to restore the documents.
+
+        Returns
+        -------
+        List[spacy.tokens.Doc], optional
+            The parsed corpus or None if the corpus is not cached.
+        """
+        file_path = self._cache_file_path(key)
+        if not os.path.isfile(file_path):
+            return None
+
+        try:
+            doc_bin = DocBin(store_user_data=True).from_disk(file_path)
+            docs = list(doc_bin.get_docs(spacy_model.vocab))
+        except Exception as _e:
+            logger.warning(
+                "Could not restore cached corpus %s, it will be parsed again. Trace : %s.",
+                file_path,
+                _e,
+            )
+            return None
+
+        for doc in docs:
+            for data_key, data_value in doc.user_data.items():
+                doc.user_data[data_key] = self._decode_value(data_value, doc)
+
+        logger.info("Parsed corpus of %i documents restored from %s.", len(docs), file_path)
+
+        return docs
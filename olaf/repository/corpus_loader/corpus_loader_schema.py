@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional
 
 import spacy
 
 from ...commons.errors import EmptyCorpusError
 from ...commons.logging_config import logger
+from .corpus_cache import CorpusCache
 
 
 class CorpusLoader(ABC):
@@ -13,20 +15,96 @@ class CorpusLoader(ABC):
     ----------
     corpus_path : str
         Path of the text corpus to use.
+    n_process : int
+        Number of processes used by spaCy to parse the documents, -1 to use all the cores.
+    batch_size : int, optional
+        Number of texts to buffer per process, by default None which defaults to the
+        spaCy model batch size.
+    disable : List[str]
+        Names of the spaCy pipes to disable while parsing the documents.
+    corpus_cache : CorpusCache, optional
+        The on-disk cache of parsed corpora. If set, a corpus already parsed with the same
+        spaCy model is restored instead of being parsed again.
+    streaming : bool
+        Whether texts are read lazily and fed one by one to the spaCy model instead of being
+        loaded all at once in memory. Only the raw texts are streamed: calling the loader,
+        as the pipeline does, still keeps the full list of parsed documents in memory.
+        Use iter_docs to process the documents one by one.
     """
 
-    def __init__(self, corpus_path: str) -> None:
+    def __init__(
+        self,
+        corpus_path: str,
+        n_process: Optional[int] = 1,
+        batch_size: Optional[int] = None,
+        disable: Optional[List[str]] = None,
+        corpus_cache: Optional[CorpusCache] = None,
+        streaming: Optional[bool] = False,
+    ) -> None:
         """Initialise CorpusLoader instance.
 
         Parameters
         ----------
         corpus_path : str
             Path of the text corpus to use.
+        n_process : int, optional
+            Number of processes used by spaCy to parse the documents, -1 to use all the cores,
+            by default 1.
+        batch_size : int, optional
+            Number of texts to buffer per process, by default None which defaults to the
+            spaCy model batch size.
+        disable : List[str], optional
+            Names of the spaCy pipes to disable while parsing the documents, by default None.
+        corpus_cache : CorpusCache, optional
+            The on-disk cache of parsed corpora, by default None.
+        streaming : bool, optional
+            Whether texts are read lazily and fed one by one to the spaCy model instead of being
+            loaded all at once in memory, by default False. Only the raw texts are streamed:
+            calling the loader, as the pipeline does, still keeps the full list of parsed
+            documents in memory. Use iter_docs to process the documents one by one.
         """
         self.corpus_path = corpus_path
+        self.n_process = n_process
+        self.batch_size = batch_size
+        self.disable = disable
+        self.corpus_cache = corpus_cache
+        self.streaming = streaming
+        self._corpus_cache_key = None
+        self._corpus_cache_fingerprint = None
+
+        self._check_parameters()
+
+    def _check_parameters(self) -> None:
+        """Check whether the parsing parameters are given and correct.
+        If this is not the case, suitable default ones are set.
+        """
+        if not isinstance(self.n_process, int) or (
+            self.n_process < 1 and self.n_process != -1
+        ):
+            logger.warning(
+                "Incorrect value given for n_process parameter, default will be set to 1."
+            )
+            self.n_process = 1
+
+        if self.batch_size is not None and (
+            not isinstance(self.batch_size, int) or self.batch_size < 1
+        ):
+            logger.warning(
+                "Incorrect value given for batch_size parameter, default spaCy model batch size will be used."
+            )
+            self.batch_size = None
+
+        if self.disable is None:
+            self.disable = []
 
     def __call__(self, spacy_model: spacy.language.Language) -> list[spacy.tokens.Doc]:
         """Convert a list of text to a list of spacy documents.
+        Documents are returned in the same order as the texts are read, whatever the number
+        of processes used.
+        In streaming mode, the texts are not kept in memory but all the parsed documents
+        are, as the pipeline needs the whole corpus.
+        If a corpus cache is set and the corpus has already been parsed with the same spaCy model,
+        the cached documents are returned and no parsing is done.
 
         Parameters
         ----------
@@ -43,28 +121,99 @@ class CorpusLoader(ABC):
         EmptyCorpusError
             An error raised when the loaded corpus is empty signifying an issue in the loading process.
         """
-        text_corpus = self._read_corpus()
-        spacy_corpus = []
-        for i, spacy_document in enumerate(spacy_model.pipe(text_corpus)):
-            try:
-                spacy_corpus.append(spacy_document)
-            except Exception as _e:
-                logger.error(
-                    "Could not load content as spacy document. \nTrace : %s.\nDocument : %s.",
-                    _e,
-                    text_corpus[i]
-                    )
-            else:
-                logger.info(
-                    "File content %i converted to spacy document.",
-                    i
+        text_corpus = self._iter_corpus() if self.streaming else self._read_corpus()
+
+        if self.corpus_cache is not None:
+            # In streaming mode, the texts are read twice, once for the key and once for
+            # the parsing, rather than being kept in memory.
+            self._corpus_cache_key = self.corpus_cache.compute_key(
+                self._iter_corpus() if self.streaming else text_corpus,
+                spacy_model,
+                self.disable,
+            )
+            cached_corpus = self.corpus_cache.load(self._corpus_cache_key, spacy_model)
+            if cached_corpus:
+                self._corpus_cache_fingerprint = (
+                    self.corpus_cache.compute_user_data_fingerprint(cached_corpus)
                 )
+                return cached_corpus
+
+        spacy_corpus = list(self.iter_docs(spacy_model, text_corpus))
 
         if not spacy_corpus:
             raise EmptyCorpusError
 
+        self.cache_corpus(spacy_corpus)
+
         return spacy_corpus
 
+    def iter_docs(
+        self,
+        spacy_model: spacy.language.Language,
+        text_corpus: Optional[Iterable[str]] = None,
+    ) -> Iterator[spacy.tokens.Doc]:
+        """Parse the corpus texts and yield the spacy documents one by one.
+        By default the texts are read lazily so that neither the texts nor the documents are
+        kept in memory.
+
+        Parameters
+        ----------
+        spacy_model: spacy.language.Language
+            The spacy model used to represent text corpus.
+        text_corpus: Iterable[str], optional
+            The texts to parse, by default None which reads the corpus texts lazily.
+
+        Yields
+        ------
+        spacy.tokens.doc.Doc
+            The corpus documents, in the order the texts are read.
+        """
+        for i, spacy_document in enumerate(
+            spacy_model.pipe(
+                text_corpus if text_corpus is not None else self._iter_corpus(),
+                n_process=self.n_process,
+                batch_size=self.batch_size,
+                disable=self.disable,
+            )
+        ):
+            logger.info("File content %i converted to spacy document.", i)
+            yield spacy_document
+
+    def cache_corpus(self, spacy_corpus: List[spacy.tokens.Doc]) -> None:
+        """Store the corpus in the corpus cache, if any, under the key of the loaded texts.
+        It is used to update the cached documents, e.g., with the custom attributes set by
+        the preprocessing components. The corpus is not written again if its custom
+        attributes are the same as the cached ones, e.g., when re-running the preprocessing
+        components on a corpus restored from the cache.
+
+        Parameters
+        ----------
+        spacy_corpus : List[spacy.tokens.Doc]
+            The corpus loaded with this corpus loader.
+        """
+        if self.corpus_cache is None or self._corpus_cache_key is None:
+            return
+
+        fingerprint = self.corpus_cache.compute_user_data_fingerprint(spacy_corpus)
+        if fingerprint == self._corpus_cache_fingerprint:
+            logger.info("Cached corpus is up to date, it is not written again.")
+            return
+
+        self.corpus_cache.save(self._corpus_cache_key, spacy_corpus)
+        self._corpus_cache_fingerprint = fingerprint
+
+    def _iter_corpus(self) -> Iterator[str]:
+        """Load documents and yield their texts one by one.
+        By default, it relies on the full list of texts. Corpus loaders should override it to
+        read the texts lazily.
+
+        Yields
+        ------
+        str
+            The corpus texts.
+        """
+        yield from self._read_corpus()
+
     @abstractmethod
     def _read_corpus(self) -> list[str]:
         """Load documents and convert them as a list of texts.
@@ -1,10 +1,11 @@
 import os
-from typing import List
+from typing import Iterator, List, Optional
 
 import pandas as pd
 
 from ...commons.errors import FileOrDirectoryNotFoundError
 from ...commons.logging_config import logger
+from .corpus_cache import CorpusCache
 from .corpus_loader_schema import CorpusLoader
 
 
@@ -17,9 +18,32 @@ class CsvCorpusLoader(CorpusLoader):
         Path of the text corpus to use.
     column_name : str
         Name of the column to use in the csv file.
+    n_process : int
+        Number of processes used by spaCy to parse the documents, -1 to use all the cores.
+    batch_size : int, optional
+        Number of texts to buffer per process.
+    disable : List[str]
+        Names of the spaCy pipes to disable while parsing the documents.
+    corpus_cache : CorpusCache, optional
+        The on-disk cache of parsed corpora.
+    streaming : bool
+        Whether texts are read lazily instead of being loaded all at once in memory.
+        Only the raw texts are streamed, the parsed documents are still returned as a list.
+    chunksize : int
+        Number of csv rows read at once.
     """
 
-    def __init__(self, corpus_path: str, column_name: str) -> None:
+    def __init__(
+        self,
+        corpus_path: str,
+        column_name: str,
+        n_process: Optional[int] = 1,
+        batch_size: Optional[int] = None,
+        disable: Optional[List[str]] = None,
+        corpus_cache: Optional[CorpusCache] = None,
+        streaming: Optional[bool] = False,
+        chunksize: Optional[int] = 10000,
+    ) -> None:
         """Initialise csv corpus loader.
 
         Parameters
@@ -28,31 +52,56 @@ class CsvCorpusLoader(CorpusLoader):
             Path of the text corpus to use.
         column_name : str
             Name of the column to use in the csv file.
+        n_process : int, optional
+            Number of processes used by spaCy to parse the documents, -1 to use all the cores,
+            by default 1.
+        batch_size : int, optional
+            Number of texts to buffer per process, by default None which defaults to the
+            spaCy model batch size.
+        disable : List[str], optional
+            Names of the spaCy pipes to disable while parsing the documents, by default None.
+        corpus_cache : CorpusCache, optional
+            The on-disk cache of parsed corpora, by default None.
+        streaming : bool, optional
+            Whether texts are read lazily instead of being loaded all at once in memory,
+            by default False. Only the raw texts are streamed, the parsed documents are
+            still returned as a list.
+        chunksize : int, optional
+            Number of csv rows read at once, by default 10000.
         """
-        super().__init__(corpus_path)
+        super().__init__(
+            corpus_path, n_process, batch_size, disable, corpus_cache, streaming
+        )
         self.column_name = column_name
+        self.chunksize = chunksize
 
-    def _extract_column_from_dataframe(self, dataframe: pd.DataFrame) -> List[str]:
-        """Extract content from a specific column and convert it into list.
+        if not isinstance(self.chunksize, int) or self.chunksize < 1:
+            logger.warning(
+                "Incorrect value given for chunksize parameter, default will be set to 10000."
+            )
+            self.chunksize = 10000
+
+    def _iter_csv_file_texts(self, file_path: str) -> Iterator[str]:
+        """Read a csv file by chunks and yield the content of the column to use.
 
         Parameters
         ----------
-        dataframe : pd.DataFrame
-            Dataframe representing the corpus.
+        file_path : str
+            Path of the csv file to read.
 
-        Returns
-        -------
-        List[str]
-            List of data to add in the corpus.
+        Yields
+        ------
+        str
+            The texts contained in the column to use.
         """
-        file_content = []
-        if self.column_name in dataframe:
-            file_content += dataframe[self.column_name].to_list()
-        else:
-            logger.warning(
-                f"File {self.corpus_path} do not have column {self.column_name}."
-            )
-        return file_content
+        with pd.read_csv(file_path, chunksize=self.chunksize) as chunks:
+            for chunk in chunks:
+                if self.column_name not in chunk:
+                    logger.warning(
+                        f"File {file_path} do not have column {self.column_name}."
+                    )
+                    break
+                yield from chunk[self.column_name].to_list()
 
     def _read_corpus(self) -> List[str]:
         """Load csv file(s) contained in a file or a folder and convert it/them as a list of texts.
@@ -62,20 +111,26 @@ class CsvCorpusLoader(CorpusLoader):
         List[str]
             Corpus represented as a list of texts.
         """
-        corpus = []
+        return list(self._iter_corpus())
 
+    def _iter_corpus(self) -> Iterator[str]:
+        """Load csv file(s) contained in a file or a folder and yield the texts one by one.
+        Files are read one at a time, by chunks of rows.
+
+        Yields
+        ------
+        str
+            The corpus texts.
+        """
         if os.path.isdir(self.corpus_path):
-            for filename in os.listdir(self.corpus_path):
+            for filename in sorted(os.listdir(self.corpus_path)):
                 file_path = os.path.join(self.corpus_path, filename)
                 if os.path.isfile(file_path):
-                    df = pd.read_csv(file_path)
-                    corpus += self._extract_column_from_dataframe(df)
+                    yield from self._iter_csv_file_texts(file_path)
 
         elif os.path.isfile(self.corpus_path):
-            df = pd.read_csv(self.corpus_path)
-            corpus += self._extract_column_from_dataframe(df)
+            yield from self._iter_csv_file_texts(self.corpus_path)
 
         else:
             logger.error(f"File path {self.corpus_path} is invalid.")
             raise FileOrDirectoryNotFoundError(self.corpus_path)
-        return corpus
@@ -1,24 +1,53 @@
 import json
 import os
-from typing import List
+import re
+from typing import Any, Iterator, List, Optional, TextIO
 
 from ...commons.errors import FileOrDirectoryNotFoundError
 from ...commons.logging_config import logger
+from .corpus_cache import CorpusCache
 from .corpus_loader_schema import CorpusLoader
 
 
+JSON_READ_SIZE = 1 << 16
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
 class JsonCorpusLoader(CorpusLoader):
     """Corpus loader for json files in a same folder.
 
+    Json files can contain a list of json objects or a single json object.
+    Files with the '.jsonl' extension are read as JSON Lines, i.e., one json object per line.
+
     Parameters
     ----------
     corpus_path : str
         Path of the text corpus to use.
     json_field : str
         Name of the field to use in json files.
+    n_process : int
+        Number of processes used by spaCy to parse the documents, -1 to use all the cores.
+    batch_size : int, optional
+        Number of texts to buffer per process.
+    disable : List[str]
+        Names of the spaCy pipes to disable while parsing the documents.
+    corpus_cache : CorpusCache, optional
+        The on-disk cache of parsed corpora.
+    streaming : bool
+        Whether texts are read lazily instead of being loaded all at once in memory.
+        Only the raw texts are streamed, the parsed documents are still returned as a list.
     """
 
-    def __init__(self, corpus_path: str, json_field: str) -> None:
+    def __init__(
+        self,
+        corpus_path: str,
+        json_field: str,
+        n_process: Optional[int] = 1,
+        batch_size: Optional[int] = None,
+        disable: Optional[List[str]] = None,
+        corpus_cache: Optional[CorpusCache] = None,
+        streaming: Optional[bool] = False,
+    ) -> None:
         """Initialise json corpus loader.
 
         Parameters
@@ -27,8 +56,24 @@ class JsonCorpusLoader(CorpusLoader):
             Path of the text corpus to use.
         json_field : str
             Name of the field to use in json files.
+        n_process : int, optional
+            Number of processes used by spaCy to parse the documents, -1 to use all the cores,
+            by default 1.
+        batch_size : int, optional
+            Number of texts to buffer per process, by default None which defaults to the
+            spaCy model batch size.
+        disable : List[str], optional
+            Names of the spaCy pipes to disable while parsing the documents, by default None.
+        corpus_cache : CorpusCache, optional
+            The on-disk cache of parsed corpora, by default None.
+        streaming : bool, optional
+            Whether texts are read lazily instead of being loaded all at once in memory,
+            by default False. Only the raw texts are streamed, the parsed documents are
+            still returned as a list.
         """
-        super().__init__(corpus_path)
+        super().__init__(
+            corpus_path, n_process, batch_size, disable, corpus_cache, streaming
+        )
         self.json_field = json_field
 
     def _read_corpus(self) -> List[str]:
@@ -40,39 +85,215 @@ class JsonCorpusLoader(CorpusLoader):
             Corpus represented as a list of texts.
         """
         text_corpus = []
+        for file_path in self._iter_file_paths():
+            text_corpus.extend(self._iter_json_file_texts(file_path, incremental=False))
+
+        return text_corpus
+
+    def _iter_corpus(self) -> Iterator[str]:
+        """Load json contents and yield the texts one by one.
+        Files are read one at a time and the json objects are parsed incrementally.
+
+        Yields
+        ------
+        str
+            The corpus texts.
+        """
+        for file_path in self._iter_file_paths():
+            yield from self._iter_json_file_texts(file_path, incremental=True)
 
+    def _iter_file_paths(self) -> Iterator[str]:
+        """Yield the paths of the json files of the corpus.
+
+        Yields
+        ------
+        str
+            The json file paths.
+
+        Raises
+        ------
+        FileOrDirectoryNotFoundError
+            An error raised when the corpus path is neither a file nor a directory.
+        """
         if os.path.isdir(self.corpus_path):
-            for filename in os.listdir(self.corpus_path):
+            for filename in sorted(os.listdir(self.corpus_path)):
                 file_path = os.path.join(self.corpus_path, filename)
                 if os.path.isfile(file_path):
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        file_content = json.load(file)
-                        if isinstance(file_content, list):
-                            try:
-                                text_corpus += [content[self.json_field] for content in file_content]
-                            except Exception as _e:
-                                logger.error(f"Invalid json field {self.json_field} for file {filename}.")
-                                raise _e
-                        elif isinstance(file_content, dict):
-                            try:
-                                text_corpus += [file_content[self.json_field]]
-                            except Exception as _e:
-                                logger.error(f"Invalid json field {self.json_field} for file {filename}.")
-                                raise _e
+                    yield file_path
         elif os.path.isfile(self.corpus_path):
-            with open(self.corpus_path, "r", encoding="utf-8") as file:
+            yield self.corpus_path
+        else:
+            logger.error(f"Corpus path {self.corpus_path} is invalid.")
+            raise FileOrDirectoryNotFoundError(self.corpus_path)
+
+    def _iter_json_file_texts(self, file_path: str, incremental: bool) -> Iterator[str]:
+        """Yield the json field content of each json object of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the json file to read.
+        incremental : bool
+            Whether the json list of the file is parsed incrementally instead of being
+            loaded all at once.
+
+        Yields
+        ------
+        str
+            The texts contained in the json field to use.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            if os.path.splitext(file_path)[1] == ".jsonl":
+                json_objects = (json.loads(line) for line in file if line.strip())
+            elif incremental:
+                json_objects = iter_json_list_items(file)
+            else:
                 file_content = json.load(file)
+                json_objects = (
+                    file_content if isinstance(file_content, list) else [file_content]
+                )
+
+            for json_object in json_objects:
                 try:
-                    text_corpus += [
-                        content[self.json_field] for content in file_content
-                    ]
+                    text = json_object[self.json_field]
                 except Exception as _e:
                     logger.error(
-                        f"Invalid json field {self.json_field} for file {self.corpus_path}."
+                        f"Invalid json field {self.json_field} for file {file_path}."
                     )
                     raise _e
-        else:
-            logger.error(f"Corpus path {self.corpus_path} is invalid.")
-            raise FileOrDirectoryNotFoundError(self.corpus_path)
+                yield text
 
-        return text_corpus
+
+class _JsonStreamBuffer:
+    """Buffer of the content of a json file being parsed incrementally.
+    The consumed content is dropped when reading more content, and the reads grow with the
+    pending content so that large json values are decoded in linear time.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.end_of_file = False
+        self._decoder = json.JSONDecoder()
+
+    def read_more(self) -> bool:
+        """Read more content from the file.
+
+        Returns
+        -------
+        bool
+            False if the end of the file is reached, True otherwise.
+        """
+        if self.end_of_file:
+            return False
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+        content = self.file.read(max(JSON_READ_SIZE, len(self.buffer)))
+        if not content:
+            self.end_of_file = True
+            return False
+        self.buffer += content
+        return True
+
+    def next_char(self) -> str:
+        """Skip whitespaces and return the next character.
+
+        Returns
+        -------
+        str
+            The next non whitespace character, an empty string at the end of the file.
+        """
+        while True:
+            self.pos = JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    def decode_value(self) -> Any:
+        """Decode the json value starting at the current position.
+
+        Returns
+        -------
+        Any
+            The decoded json value.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            An error raised when the value is not valid json.
+        """
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+                # a value ending the buffer might be truncated, e.g., a number.
+                if end < len(self.buffer) or self.end_of_file:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.end_of_file:
+                    raise
+            self.read_more()
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """Build a decoding error at the current position.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+
+        Returns
+        -------
+        json.JSONDecodeError
+            The decoding error.
+        """
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_json_list_items(file: TextIO) -> Iterator[Any]:
+    """Parse incrementally the items of a json file containing a json list.
+    If the file does not contain a list, its whole content is yielded as one item.
+
+    Parameters
+    ----------
+    file : TextIO
+        The json file to parse.
+
+    Yields
+    ------
+    Any
+        The json items of the file.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        An error raised when the file is not valid json, e.g., with missing or extra
+        separators between the list items.
+    """
+    stream = _JsonStreamBuffer(file)
+
+    if stream.next_char() != "[":
+        yield json.loads(stream.buffer[stream.pos :] + file.read())
+        return
+
+    stream.pos += 1
+    char = stream.next_char()
+    while char != "]":
+        if char == "":
+            raise stream.error("Expecting value")
+        yield stream.decode_value()
+
+        char = stream.next_char()
+        if char == ",":
+            stream.pos += 1
+            char = stream.next_char()
+            if char in ("]", ","):
+                raise stream.error("Expecting value")
+        elif char != "]":
+            raise stream.error("Expecting ',' delimiter")
+
+    stream.pos += 1
+    if stream.next_char() != "":
+        raise stream.error("Extra data")
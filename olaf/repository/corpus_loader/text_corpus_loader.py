@@ -1,7 +1,9 @@
 import os
+from typing import Iterator, List, Optional
 
 from ...commons.errors import FileOrDirectoryNotFoundError
 from ...commons.logging_config import logger
+from .corpus_cache import CorpusCache
 from .corpus_loader_schema import CorpusLoader
 
 
@@ -16,17 +18,52 @@ class TextCorpusLoader(CorpusLoader):
     corpus_path : str
         Path of the text corpus to use.
         It can be a folder or a file.
+    n_process : int
+        Number of processes used by spaCy to parse the documents, -1 to use all the cores.
+    batch_size : int, optional
+        Number of texts to buffer per process.
+    disable : List[str]
+        Names of the spaCy pipes to disable while parsing the documents.
+    corpus_cache : CorpusCache, optional
+        The on-disk cache of parsed corpora.
+    streaming : bool
+        Whether texts are read lazily instead of being loaded all at once in memory.
+        Only the raw texts are streamed, the parsed documents are still returned as a list.
     """
 
-    def __init__(self, corpus_path: str) -> None:
+    def __init__(
+        self,
+        corpus_path: str,
+        n_process: Optional[int] = 1,
+        batch_size: Optional[int] = None,
+        disable: Optional[List[str]] = None,
+        corpus_cache: Optional[CorpusCache] = None,
+        streaming: Optional[bool] = False,
+    ) -> None:
         """Initialise text corpus loader.
 
         Parameters
         ----------
         corpus_path : str
             Path of the text corpus to use.
+        n_process : int, optional
+            Number of processes used by spaCy to parse the documents, -1 to use all the cores,
+            by default 1.
+        batch_size : int, optional
+            Number of texts to buffer per process, by default None which defaults to the
+            spaCy model batch size.
+        disable : List[str], optional
+            Names of the spaCy pipes to disable while parsing the documents, by default None.
+        corpus_cache : CorpusCache, optional
+            The on-disk cache of parsed corpora, by default None.
+        streaming : bool, optional
+            Whether texts are read lazily instead of being loaded all at once in memory,
+            by default False. Only the raw texts are streamed, the parsed documents are
+            still returned as a list.
         """
-        super().__init__(corpus_path)
+        super().__init__(
+            corpus_path, n_process, batch_size, disable, corpus_cache, streaming
+        )
 
     def _read_corpus(self) -> list[str]:
         """Load text contents and convert them as a list of texts.
@@ -36,28 +73,35 @@ class TextCorpusLoader(CorpusLoader):
         List[str]
             Corpus represented as a list of texts.
         """
-        text_corpus = []
+        return list(self._iter_corpus())
 
+    def _iter_corpus(self) -> Iterator[str]:
+        """Load text contents and yield the texts one by one.
+        Files are read one at a time and, for a one document per line file, line by line.
+
+        Yields
+        ------
+        str
+            The corpus texts.
+        """
         if os.path.isdir(self.corpus_path):
-            for filename in os.listdir(self.corpus_path):
+            for filename in sorted(os.listdir(self.corpus_path)):
                 file_path = os.path.join(self.corpus_path, filename)
                 file_extension = filename.split(".")[-1]
                 if file_extension == "txt":
                     with open(file_path, "r", encoding="utf-8") as file:
-                        text_corpus.append(file.read())
+                        yield file.read()
 
         elif os.path.isfile(self.corpus_path) and (
             self.corpus_path.split(".")[-1] == "txt"
         ):
             with open(self.corpus_path, "r", encoding="utf-8") as file:
-                for line in file.readlines():
+                for line in file:
                     if len(line.strip()):
-                        text_corpus.append(line)
+                        yield line
         else:
             logger.error(
                 "Corpus path %s is invalid, or the file extension is not '.txt'.",
                 self.corpus_path,
             )
             raise FileOrDirectoryNotFoundError(self.corpus_path)
-
-        return text_corpus
@@ -1,3 +1,7 @@
 from .conceptnet_kg import ConceptNetKnowledgeResource
+from .conceptnet_snapshot_kg import (
+    ConceptNetSnapshotKnowledgeResource,
+    build_conceptnet_snapshot,
+)
 from .knowledge_source_schema import KnowledgeSource
 from .wordnet_kg import WordNetKnowledgeResource
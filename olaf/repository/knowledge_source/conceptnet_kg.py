@@ -1,7 +1,9 @@
-from typing import Any, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Set
 
 import requests
 
+from ...commons.http_tools import ResponseCache, build_http_session
 from ...commons.logging_config import logger
 from ...commons.string_tools import space_to_underscore_str, underscore_to_space_str
 from .knowledge_source_schema import KnowledgeSource
@@ -20,6 +22,14 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
         Wether or not to filter the concepts based on provided sources, default False.
     validation_sources: Set[str], optional
         The sources to use to filter the concepts, default set().
+    api_url: str, optional
+        Base URL of the ConceptNet API, by default "http://api.conceptnet.io".
+    max_workers: int, optional
+        Maximum number of terms fetched concurrently, by default 8.
+    timeout: float, optional
+        Timeout in seconds of the ConceptNet API requests, by default 60.
+    response_cache: ResponseCache, optional
+        The cache of the ConceptNet API responses, None if the responses are not cached.
     """
 
     def __init__(
@@ -28,6 +38,12 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
         api_resp_batch_size: Optional[int] = 1000,
         check_sources: Optional[bool] = False,
         validation_sources: Optional[Set[str]] = set(),
+        api_url: Optional[str] = "http://api.conceptnet.io",
+        max_workers: Optional[int] = 8,
+        timeout: Optional[float] = 60,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = 30 * 24 * 3600,
+        cache_max_size: Optional[int] = 10000,
     ) -> None:
         """Initialise ConceptNet knowledge resource instance.
 
@@ -41,14 +57,40 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
             Wether or not to filter the concepts based on provided sources, default False.
         validation_sources: Set[str], optional
             The sources to use to filter the concepts, default set().
+        api_url: str, optional
+            Base URL of the ConceptNet API, by default "http://api.conceptnet.io".
+            It can point to a local ConceptNet server.
+        max_workers: int, optional
+            Maximum number of terms fetched concurrently, by default 8.
+        timeout: float, optional
+            Timeout in seconds of the ConceptNet API requests, by default 60.
+        cache_path: str, optional
+            Path to the SQLite file caching the ConceptNet API responses across runs,
+            by default None which does not cache them.
+        cache_ttl: float, optional
+            Time to live in seconds of the cached responses, by default 30 days.
+            If None, the cached responses never expire.
+        cache_max_size: int, optional
+            Maximum number of cached responses, by default 10000, the oldest ones being
+            evicted first. If None, the number of cached responses is not bounded.
         """
 
         self.lang = lang
         self.api_resp_batch_size = api_resp_batch_size
         self.check_sources = check_sources
         self.validation_sources = validation_sources
+        self.api_url = api_url
+        self.max_workers = max_workers
+        self.timeout = timeout
         self._check_parameters()
 
+        self.response_cache = None
+        if cache_path is not None:
+            self.response_cache = ResponseCache(
+                cache_path=cache_path, ttl=cache_ttl, max_size=cache_max_size
+            )
+        self._session = build_http_session(pool_size=self.max_workers)
+
     def _check_parameters(self) -> None:
         """Check wether required parameters are given and correct. If this is not the case,
         suitable default ones are set.
@@ -67,12 +109,33 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
             )
             self.check_sources = False
 
+        if not self.api_url:
+            logger.warning(
+                "No value given for api_url parameter, default will be set to 'http://api.conceptnet.io'"
+            )
+            self.api_url = "http://api.conceptnet.io"
+        self.api_url = self.api_url.rstrip("/")
+
+        if not self.max_workers or self.max_workers < 1:
+            logger.warning(
+                "Wrong value given for max_workers parameter, default will be set to 8"
+            )
+            self.max_workers = 8
+
+        if not self.timeout or self.timeout <= 0:
+            logger.warning(
+                "Wrong value given for timeout parameter, default will be set to 60"
+            )
+            self.timeout = 60
+
     def check_resources(self) -> None:
         # TODO
         """Method to check that the component has access to all its required resources."""
 
     def match_external_concepts(self, matching_terms: Set[str]) -> Set[str]:
         """Method to fetch external concepts matching the set of terms.
+        The terms are fetched concurrently, by at most self.max_workers threads sharing the
+        HTTP connections and the response cache.
 
         Parameters
         ----------
@@ -87,13 +150,85 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
 
         term_conceptnet_uris = set()
 
-        for term in matching_terms:
-            term_conceptnet_uris.update(
-                self._get_term_conceptnet_external_uris(space_to_underscore_str(term))
-            )
+        for term_uris in self._fetch_terms_external_uris(matching_terms).values():
+            term_conceptnet_uris.update(term_uris)
 
         return term_conceptnet_uris
 
+    def match_terms_groups_external_concepts(
+        self, terms_groups: Mapping[Hashable, Set[str]]
+    ) -> Dict[Hashable, Set[str]]:
+        """Method to fetch the external concepts matching many groups of terms at once.
+        The terms of all the groups are fetched once and concurrently, by at most
+        self.max_workers threads.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The term texts to use for matching concepts, by group key.
+
+        Returns
+        -------
+        Dict[Hashable, Set[str]]
+            The UIDs of the external concepts found matching the term texts, by group key.
+        """
+        all_terms = set().union(*terms_groups.values())
+        terms_uris = self._fetch_terms_external_uris(all_terms)
+
+        groups_concept_uids = {}
+        for group_key, group_terms in terms_groups.items():
+            group_uris = set()
+            for term in group_terms:
+                group_uris.update(terms_uris[term])
+            groups_concept_uids[group_key] = group_uris
+
+        return groups_concept_uids
+
+    def _fetch_terms_external_uris(self, terms: Set[str]) -> Dict[str, Set[str]]:
+        """Fetch concurrently the external URIs of terms, by at most self.max_workers threads
+        sharing the HTTP connections and the response cache.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The term texts.
+
+        Returns
+        -------
+        Dict[str, Set[str]]
+            The ConceptNet term related external uris, by term text.
+            Terms whose fetch failed have no external URIs.
+        """
+        terms = list(terms)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            terms_uris = dict(
+                zip(terms, executor.map(self._safe_get_term_external_uris, terms))
+            )
+
+        return terms_uris
+
+    def _safe_get_term_external_uris(self, term: str) -> Set[str]:
+        """Fetch the external URIs of a term, logging and skipping the term if the
+        ConceptNet API request fails so that it does not abort the other terms.
+
+        Parameters
+        ----------
+        term : str
+            The term text.
+
+        Returns
+        -------
+        Set[str]
+            The ConceptNet term related external uris, empty if the fetch failed.
+        """
+        try:
+            return self._get_term_conceptnet_external_uris(space_to_underscore_str(term))
+        except (requests.RequestException, ValueError) as error:
+            logger.warning(
+                "Failed to fetch term %s from ConceptNet, it is skipped: %s", term, error
+            )
+            return set()
+
     def _get_term_conceptnet_external_uris(self, term_conceptnet_text: str) -> Set[str]:
         """Fetch term related data from ConceptNet api and extract the term related external URIs.
 
@@ -216,12 +351,12 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
             page_count += 1
 
             next_page_url = (
-                "http://api.conceptnet.io"
+                self.api_url
                 + conceptnet_view_res.get("nextPage").split("?")[0]
                 + f"?offset={page_count*batch_size}&limit={batch_size}"
             )
 
-            conceptnet_res = requests.get(next_page_url, timeout=1000).json()
+            conceptnet_res = self._fetch_json(next_page_url)
 
             paginated_edges.extend(conceptnet_res.get("edges", []))
 
@@ -248,11 +383,52 @@ class ConceptNetKnowledgeResource(KnowledgeSource):
         Dict[str, Any]
             The ConceptNet API result.
         """
-        term_conceptnet_url = f"http://api.conceptnet.io/c/{lang}/{term_conceptnet_text}?limit={batch_size}"
-        conceptnet_term_res = requests.get(term_conceptnet_url, timeout=1000).json()
+        term_conceptnet_url = (
+            f"{self.api_url}/c/{lang}/{term_conceptnet_text}?limit={batch_size}"
+        )
+        conceptnet_term_res = self._fetch_json(term_conceptnet_url)
 
         return conceptnet_term_res
 
+    def _fetch_json(self, url: str) -> Dict[str, Any]:
+        """Fetch the JSON response of a ConceptNet API URL, from the response cache if it
+        holds a valid response, else from the API through the pooled HTTP session.
+        Only successful responses, and the not found responses of unknown terms, are
+        cached.
+
+        Parameters
+        ----------
+        url : str
+            The ConceptNet API URL.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The ConceptNet API result.
+
+        Raises
+        ------
+        requests.RequestException
+            If the request fails or the API answers with an error status.
+        ValueError
+            If the response is not valid JSON.
+        """
+        if self.response_cache is not None:
+            response = self.response_cache.get(url)
+            if response is not None:
+                return response
+
+        http_response = self._session.get(url, timeout=self.timeout)
+        # Unknown terms are answered with a JSON error and a not found status.
+        if http_response.status_code != 404:
+            http_response.raise_for_status()
+        response = http_response.json()
+
+        if self.response_cache is not None:
+            self.response_cache.put(url, response)
+
+        return response
+
     def fetch_terms_synonyms(self, terms: Set[str]) -> Set[str]:
         """Method to fetch synonyms of a set of terms according to the knowledge source.
 
@@ -0,0 +1,551 @@
+import gzip
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+from ...commons.errors import ResourcesCheckFailError
+from ...commons.logging_config import logger
+from ...commons.string_tools import space_to_underscore_str, underscore_to_space_str
+from .knowledge_source_schema import ENRICHMENT_KINDS, KnowledgeSource
+
+# ConceptNet relations kept in the snapshots by default, the ones used by the lookups.
+SNAPSHOT_RELATIONS = {"/r/ExternalURL", "/r/Synonym", "/r/Antonym", "/r/IsA"}
+# Maximum number of terms per SQL query, below the SQLite bound variables limit.
+SQL_QUERY_BATCH_SIZE = 500
+# ConceptNet relation and directions (forward, backward) followed by each enrichment kind.
+ENRICHMENT_RELATIONS = {
+    "synonyms": ("/r/Synonym", True, True),
+    "antonyms": ("/r/Antonym", True, True),
+    "hypernyms": ("/r/IsA", True, False),
+    "hyponyms": ("/r/IsA", False, True),
+}
+SNAPSHOT_INSERT_BATCH_SIZE = 10000
+
+
+def parse_conceptnet_node(node_uri: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return the language and the text of a ConceptNet node URI, e.g., ("en", "air_pump")
+    for `/c/en/air_pump/n`. External URIs have no language nor text.
+
+    Parameters
+    ----------
+    node_uri : str
+        The ConceptNet node URI.
+
+    Returns
+    -------
+    Tuple[Optional[str], Optional[str]]
+        The node language and text, (None, None) for external URIs.
+    """
+    if not node_uri.startswith("/c/"):
+        return None, None
+
+    node_parts = node_uri.split("/")
+    if len(node_parts) < 4:
+        return None, None
+    return node_parts[2], node_parts[3]
+
+
+def read_edge_list(dump_path: str) -> Iterator[Tuple[str, str, str]]:
+    """Read the (start, relation, end) edges of a ConceptNet assertions dump, i.e., tab
+    separated assertion URI, relation, start, end and metadata columns, or of a tab separated
+    edge list with start, relation and end columns. Gzipped files are read on the fly.
+
+    Parameters
+    ----------
+    dump_path : str
+        Path to the dump file.
+
+    Yields
+    ------
+    Tuple[str, str, str]
+        The start node, relation and end node URIs of each edge.
+    """
+    open_dump = gzip.open if str(dump_path).endswith(".gz") else open
+    with open_dump(dump_path, "rt", encoding="utf8") as dump_file:
+        for line in dump_file:
+            columns = line.rstrip("\n").split("\t")
+            if len(columns) >= 4:
+                yield columns[2], columns[1], columns[3]
+            elif len(columns) == 3:
+                yield columns[0], columns[1], columns[2]
+
+
+def build_conceptnet_snapshot(
+    dump_path: str,
+    snapshot_path: str,
+    langs: Optional[Set[str]] = None,
+    relations: Optional[Set[str]] = None,
+) -> int:
+    """Ingest a ConceptNet dump or an edge list into an indexed SQLite snapshot, to be used
+    by ConceptNetSnapshotKnowledgeResource.
+    Node URIs are stored as language and text, without their part of speech and sense
+    suffixes, so that a term matches all its senses as with the ConceptNet API.
+
+    Parameters
+    ----------
+    dump_path : str
+        Path to the ConceptNet assertions dump or to the edge list, see `read_edge_list`.
+    snapshot_path : str
+        Path to the SQLite snapshot file to create. An existing file is replaced.
+    langs : Set[str], optional
+        Languages of the edges to keep, an edge being kept if one of its nodes is in one of
+        the languages, by default None which keeps all the languages.
+    relations : Set[str], optional
+        Relations of the edges to keep, by default None which keeps SNAPSHOT_RELATIONS.
+
+    Returns
+    -------
+    int
+        The number of edges in the snapshot.
+    """
+    if relations is None:
+        relations = SNAPSHOT_RELATIONS
+
+    tmp_snapshot_path = f"{snapshot_path}.tmp"
+    if os.path.exists(tmp_snapshot_path):
+        os.remove(tmp_snapshot_path)
+
+    connection = sqlite3.connect(tmp_snapshot_path)
+    try:
+        connection.execute(
+            """CREATE TABLE edges (
+                start_lang TEXT,
+                start_text TEXT,
+                rel TEXT NOT NULL,
+                end_lang TEXT,
+                end_text TEXT,
+                end_uri TEXT NOT NULL,
+                site TEXT
+            )"""
+        )
+
+        nb_edges = 0
+        edge_rows = []
+        for start_uri, rel, end_uri in read_edge_list(dump_path):
+            if rel not in relations:
+                continue
+            start_lang, start_text = parse_conceptnet_node(start_uri)
+            end_lang, end_text = parse_conceptnet_node(end_uri)
+            if langs is not None and not (start_lang in langs or end_lang in langs):
+                continue
+
+            site = urlparse(end_uri).netloc if end_lang is None else None
+            edge_rows.append(
+                (start_lang, start_text, rel, end_lang, end_text, end_uri, site)
+            )
+            if len(edge_rows) == SNAPSHOT_INSERT_BATCH_SIZE:
+                connection.executemany(
+                    "INSERT INTO edges VALUES (?, ?, ?, ?, ?, ?, ?)", edge_rows
+                )
+                nb_edges += len(edge_rows)
+                edge_rows = []
+
+        connection.executemany(
+            "INSERT INTO edges VALUES (?, ?, ?, ?, ?, ?, ?)", edge_rows
+        )
+        nb_edges += len(edge_rows)
+
+        # Indexes are created once the edges are inserted, which is faster than updating them.
+        connection.execute(
+            "CREATE INDEX edges_start ON edges (start_lang, start_text, rel)"
+        )
+        connection.execute("CREATE INDEX edges_end ON edges (end_lang, end_text, rel)")
+        # The indexes statistics make the query planner pick the text index of the queries.
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+
+    os.replace(tmp_snapshot_path, snapshot_path)
+    logger.info(
+        "ConceptNet snapshot with %i edges built in %s.", nb_edges, snapshot_path
+    )
+
+    return nb_edges
+
+
+class ConceptNetSnapshotKnowledgeResource(KnowledgeSource):
+    """Adapter for a local snapshot of the ConceptNet KG, built from a ConceptNet dump with
+    `build_conceptnet_snapshot` or the `olaf build-conceptnet-snapshot` command.
+    It answers the lookups without any network access.
+
+    Attributes
+    ----------
+    snapshot_path: str
+        Path to the SQLite snapshot file.
+    lang: str, optional
+        Language ISO code for the terms to find concepts and terms for, by default 'en'.
+    check_sources: bool, optional
+        Wether or not to filter the concepts based on provided sources, default False.
+    validation_sources: Set[str], optional
+        The sources to use to filter the concepts, default set().
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        lang: Optional[str] = None,
+        check_sources: Optional[bool] = False,
+        validation_sources: Optional[Set[str]] = set(),
+    ) -> None:
+        """Initialise ConceptNet snapshot knowledge resource instance.
+
+        Parameters
+        ----------
+        snapshot_path: str
+            Path to the SQLite snapshot file.
+        lang: str, optional
+            Language ISO code for the terms to find concepts and terms for, by default 'en'.
+        check_sources: bool, optional
+            Wether or not to filter the concepts based on provided sources, default False.
+        validation_sources: Set[str], optional
+            The sources to use to filter the concepts, default set().
+        """
+        self.snapshot_path = snapshot_path
+        self.lang = lang
+        self.check_sources = check_sources
+        self.validation_sources = validation_sources
+        self._check_parameters()
+        self.check_resources()
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            f"file:{os.path.abspath(self.snapshot_path)}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+
+    def _check_parameters(self) -> None:
+        """Check wether required parameters are given and correct. If this is not the case,
+        suitable default ones are set.
+        """
+        if not self.lang:
+            logger.warning(
+                "No value given for lang parameter, default will be set to 'en'"
+            )
+            self.lang = "en"
+
+        if self.check_sources and len(self.validation_sources) == 0:
+            logger.warning(
+                """Using sources checking (check_sources = True) but no source tags provided in parameter `validation_sources`.
+                Defaulting to not checking sources.
+                """
+            )
+            self.check_sources = False
+
+    def check_resources(self) -> None:
+        """Method to check that the component has access to all its required resources.
+
+        Raises
+        ------
+        ResourcesCheckFailError
+            Exception raised when the snapshot file does not exist.
+        """
+        if not os.path.isfile(self.snapshot_path):
+            logger.error(
+                "ConceptNet snapshot %s not found. It can be built with the command `olaf build-conceptnet-snapshot`.",
+                self.snapshot_path,
+            )
+            raise ResourcesCheckFailError()
+
+    def _query_terms(
+        self, query: str, terms: Iterable[str], query_params: Tuple = ()
+    ) -> List[Tuple]:
+        """Run a query on batches of ConceptNet formatted terms.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query, with a `{terms}` placeholder for the terms parameters list,
+            followed by the other parameters.
+        terms : Iterable[str]
+            The ConceptNet formatted terms.
+        query_params : Tuple, optional
+            The query parameters following the terms, by default ().
+
+        Returns
+        -------
+        List[Tuple]
+            The rows returned by the query.
+        """
+        terms = list(terms)
+        rows = []
+        with self._lock:
+            for batch_start in range(0, len(terms), SQL_QUERY_BATCH_SIZE):
+                batch = terms[batch_start : batch_start + SQL_QUERY_BATCH_SIZE]
+                rows.extend(
+                    self._connection.execute(
+                        query.format(terms=",".join("?" * len(batch))),
+                        [*batch, *query_params],
+                    ).fetchall()
+                )
+        return rows
+
+    def match_external_concepts(self, matching_terms: Set[str]) -> Set[str]:
+        """Method to fetch external concepts matching the set of terms.
+
+        Parameters
+        ----------
+        matching_terms : Set[str]
+            The term texts to use for matching concepts.
+
+        Returns
+        -------
+        Set[str]
+            The UIDs of the external concepts found matching the term texts.
+        """
+        concept_uris = set()
+        for term_uris in self._fetch_terms_external_uris(matching_terms).values():
+            concept_uris.update(term_uris)
+
+        return concept_uris
+
+    def match_terms_groups_external_concepts(
+        self, terms_groups: Mapping[Hashable, Set[str]]
+    ) -> Dict[Hashable, Set[str]]:
+        """Method to fetch the external concepts matching many groups of terms at once.
+        The terms of all the groups are looked up once, in batched queries.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The term texts to use for matching concepts, by group key.
+
+        Returns
+        -------
+        Dict[Hashable, Set[str]]
+            The UIDs of the external concepts found matching the term texts, by group key.
+        """
+        terms_uris = self._fetch_terms_external_uris(
+            set().union(*terms_groups.values())
+        )
+
+        groups_concept_uids = {
+            group_key: set().union(*(terms_uris[term] for term in group_terms))
+            for group_key, group_terms in terms_groups.items()
+        }
+
+        return groups_concept_uids
+
+    def _fetch_terms_external_uris(self, terms: Set[str]) -> Dict[str, Set[str]]:
+        """Fetch the external URIs of terms.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The term texts.
+
+        Returns
+        -------
+        Dict[str, Set[str]]
+            The external URIs, by term text.
+        """
+        terms_texts = {term: space_to_underscore_str(term) for term in terms}
+        rows = self._query_terms(
+            "SELECT start_text, end_uri, site FROM edges "
+            "WHERE start_text IN ({terms}) AND start_lang = ? "
+            "AND rel = '/r/ExternalURL'",
+            set(terms_texts.values()),
+            (self.lang,),
+        )
+
+        texts_uris = defaultdict(set)
+        for start_text, end_uri, site in rows:
+            if not self.check_sources or site in self.validation_sources:
+                texts_uris[start_text].add(end_uri)
+
+        terms_uris = {term: texts_uris[text] for term, text in terms_texts.items()}
+
+        return terms_uris
+
+    def fetch_terms_groups_enrichment(
+        self, terms_groups: Mapping[Hashable, Set[str]], enrichment_kinds: Set[str]
+    ) -> Dict[Hashable, Dict[str, Set[str]]]:
+        """Method to fetch several kinds of enrichments of many groups of terms at once.
+        The terms of all the groups are looked up once per enrichment kind, in batched
+        queries.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The sets of terms to enrich, by group key.
+        enrichment_kinds : Set[str]
+            The kinds of enrichments to fetch, among 'synonyms', 'antonyms', 'hypernyms' and
+            'hyponyms'. Other values are ignored.
+
+        Returns
+        -------
+        Dict[Hashable, Dict[str, Set[str]]]
+            The set of terms enrichments by enrichment kind, by group key.
+        """
+        all_terms = set().union(*terms_groups.values())
+        kinds_terms_related = {
+            enrichment_kind: self._fetch_terms_related_terms(
+                all_terms, *ENRICHMENT_RELATIONS[enrichment_kind]
+            )
+            for enrichment_kind in enrichment_kinds & ENRICHMENT_KINDS
+        }
+
+        groups_enrichment = {
+            group_key: {
+                enrichment_kind: set().union(
+                    *(terms_related[term] for term in group_terms)
+                )
+                for enrichment_kind, terms_related in kinds_terms_related.items()
+            }
+            for group_key, group_terms in terms_groups.items()
+        }
+
+        return groups_enrichment
+
+    def _fetch_related_terms(
+        self, terms: Set[str], rel: str, forward: bool = True, backward: bool = False
+    ) -> Set[str]:
+        """Fetch the terms related to a set of terms in the knowledge resource language.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find related terms of.
+        rel : str
+            The ConceptNet relation.
+        forward : bool, optional
+            Whether to follow the relation from the terms, by default True.
+        backward : bool, optional
+            Whether to follow the relation towards the terms, by default False.
+
+        Returns
+        -------
+        Set[str]
+            The set of related terms.
+        """
+        related_terms = set()
+        for term_related_terms in self._fetch_terms_related_terms(
+            terms, rel, forward, backward
+        ).values():
+            related_terms.update(term_related_terms)
+
+        return related_terms
+
+    def _fetch_terms_related_terms(
+        self, terms: Set[str], rel: str, forward: bool = True, backward: bool = False
+    ) -> Dict[str, Set[str]]:
+        """Fetch the terms related to each term in the knowledge resource language.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find related terms of.
+        rel : str
+            The ConceptNet relation.
+        forward : bool, optional
+            Whether to follow the relation from the terms, by default True.
+        backward : bool, optional
+            Whether to follow the relation towards the terms, by default False.
+
+        Returns
+        -------
+        Dict[str, Set[str]]
+            The set of related terms, by term.
+        """
+        terms_texts = {term: space_to_underscore_str(term) for term in terms}
+        conceptnet_texts = set(terms_texts.values())
+        texts_related = defaultdict(set)
+
+        if forward:
+            for start_text, end_text in self._query_terms(
+                "SELECT start_text, end_text FROM edges "
+                "WHERE start_text IN ({terms}) AND start_lang = ? AND rel = ? "
+                "AND end_lang = ?",
+                conceptnet_texts,
+                (self.lang, rel, self.lang),
+            ):
+                texts_related[start_text].add(underscore_to_space_str(end_text))
+        if backward:
+            for end_text, start_text in self._query_terms(
+                "SELECT end_text, start_text FROM edges "
+                "WHERE end_text IN ({terms}) AND end_lang = ? AND rel = ? "
+                "AND start_lang = ?",
+                conceptnet_texts,
+                (self.lang, rel, self.lang),
+            ):
+                texts_related[end_text].add(underscore_to_space_str(start_text))
+
+        terms_related = {
+            term: texts_related[text] for term, text in terms_texts.items()
+        }
+
+        return terms_related
+
+    def fetch_terms_synonyms(self, terms: Set[str]) -> Set[str]:
+        """Method to fetch synonyms of a set of terms from the ConceptNet snapshot.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find synonyms of.
+
+        Returns
+        -------
+        Set[str]
+            The set of terms synonyms.
+        """
+        return self._fetch_related_terms(terms, *ENRICHMENT_RELATIONS["synonyms"])
+
+    def fetch_terms_antonyms(self, terms: Set[str]) -> Set[str]:
+        """Method to fetch antonyms of a set of terms from the ConceptNet snapshot.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find antonyms of.
+
+        Returns
+        -------
+        Set[str]
+            The set of terms antonyms.
+        """
+        return self._fetch_related_terms(terms, *ENRICHMENT_RELATIONS["antonyms"])
+
+    def fetch_terms_hypernyms(self, terms: Set[str]) -> Set[str]:
+        """Method to fetch hypernyms of a set of terms from the ConceptNet snapshot.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find hypernyms of.
+
+        Returns
+        -------
+        Set[str]
+            The set of terms hypernyms.
+        """
+        return self._fetch_related_terms(terms, *ENRICHMENT_RELATIONS["hypernyms"])
+
+    def fetch_terms_hyponyms(self, terms: Set[str]) -> Set[str]:
+        """Method to fetch hyponyms of a set of terms from the ConceptNet snapshot.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to find hyponyms of.
+
+        Returns
+        -------
+        Set[str]
+            The set of terms hyponyms.
+        """
+        return self._fetch_related_terms(terms, *ENRICHMENT_RELATIONS["hyponyms"])
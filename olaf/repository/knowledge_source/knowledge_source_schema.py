@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import Dict, Hashable, Mapping, Set
+
+ENRICHMENT_KINDS = {"synonyms", "antonyms", "hypernyms", "hyponyms"}
 
 
 class KnowledgeSource(ABC):
@@ -92,3 +94,89 @@ class KnowledgeSource(ABC):
         Set[str]
             The set of terms hyponyms.
         """
+
+    def fetch_terms_enrichment(
+        self, terms: Set[str], enrichment_kinds: Set[str]
+    ) -> Dict[str, Set[str]]:
+        """Method to fetch several kinds of enrichments of a set of terms at once.
+        By default, the method of each enrichment kind is called. Knowledge sources can
+        override it to share the term lookups between the enrichment kinds.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to enrich.
+        enrichment_kinds : Set[str]
+            The kinds of enrichments to fetch, among 'synonyms', 'antonyms', 'hypernyms' and
+            'hyponyms'. Other values are ignored.
+
+        Returns
+        -------
+        Dict[str, Set[str]]
+            The set of terms enrichments, by enrichment kind.
+        """
+        kind_fetchers = {
+            "synonyms": self.fetch_terms_synonyms,
+            "antonyms": self.fetch_terms_antonyms,
+            "hypernyms": self.fetch_terms_hypernyms,
+            "hyponyms": self.fetch_terms_hyponyms,
+        }
+        terms_enrichment = {
+            enrichment_kind: kind_fetchers[enrichment_kind](terms)
+            for enrichment_kind in enrichment_kinds & ENRICHMENT_KINDS
+        }
+
+        return terms_enrichment
+
+    def match_terms_groups_external_concepts(
+        self, terms_groups: Mapping[Hashable, Set[str]]
+    ) -> Dict[Hashable, Set[str]]:
+        """Method to fetch the external concepts matching many groups of terms at once.
+        By default, `match_external_concepts` is called for each group. Knowledge sources
+        can override it to look up the terms shared by several groups only once and in
+        batches.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The term texts to use for matching concepts, by group key.
+
+        Returns
+        -------
+        Dict[Hashable, Set[str]]
+            The UIDs of the external concepts found matching the term texts, by group key.
+        """
+        groups_concept_uids = {
+            group_key: self.match_external_concepts(group_terms)
+            for group_key, group_terms in terms_groups.items()
+        }
+
+        return groups_concept_uids
+
+    def fetch_terms_groups_enrichment(
+        self, terms_groups: Mapping[Hashable, Set[str]], enrichment_kinds: Set[str]
+    ) -> Dict[Hashable, Dict[str, Set[str]]]:
+        """Method to fetch several kinds of enrichments of many groups of terms at once.
+        By default, `fetch_terms_enrichment` is called for each group. Knowledge sources
+        can override it to look up the terms shared by several groups only once and in
+        batches.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The sets of terms to enrich, by group key.
+        enrichment_kinds : Set[str]
+            The kinds of enrichments to fetch, among 'synonyms', 'antonyms', 'hypernyms' and
+            'hyponyms'. Other values are ignored.
+
+        Returns
+        -------
+        Dict[Hashable, Dict[str, Set[str]]]
+            The set of terms enrichments by enrichment kind, by group key.
+        """
+        groups_enrichment = {
+            group_key: self.fetch_terms_enrichment(group_terms, enrichment_kinds)
+            for group_key, group_terms in terms_groups.items()
+        }
+
+        return groups_enrichment
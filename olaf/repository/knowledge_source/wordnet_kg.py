@@ -1,18 +1,19 @@
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, Hashable, Mapping, Optional, Set
 
 from nltk.corpus import wordnet as wn
 from nltk.corpus.reader.wordnet import Lemma, Synset
 
+from ...commons.cache_tools import LRUCache
 from ...commons.logging_config import logger
 from ...commons.string_tools import space_to_underscore_str, underscore_to_space_str
 from ...commons.wordnet_tools import (
-    WORDNET_DOMAINS_SSID_NUM_SIZE,
+    WordNetDomainIndex,
     fetch_wordnet_lang,
     load_enrichment_wordnet_domains_from_file,
-    load_wordnet_domains,
+    load_wordnet_domain_index,
     spacy2wordnet_pos,
 )
-from .knowledge_source_schema import KnowledgeSource
+from .knowledge_source_schema import ENRICHMENT_KINDS, KnowledgeSource
 
 
 class WordNetKnowledgeResource(KnowledgeSource):
@@ -30,12 +31,16 @@ class WordNetKnowledgeResource(KnowledgeSource):
         The mapping between WordNet synsets ids and domains ids, by default None.
         The expected file can be found at
         <https://github.com/argilla-io/spacy-wordnet/blob/master/spacy_wordnet/data/wordnet_domains.txt>
+        When loaded from file, it is a compiled WordNetDomainIndex.
     enrichment_domains: Set[str], optional
         The set of enrichment domains strings to use for matching.
         Mandatory when use_domains is True, by default to None.
     wordnet_pos: Set[str], optional
         The set of part of speech tags to use for matching.
         Mandatory when use_pos is True, by default to None.
+    cache_size: int, optional
+        Maximum number of WordNet lookups kept in the cache, by default 100000.
+        If None, the cache is unbounded.
     """
 
     def __init__(
@@ -48,6 +53,8 @@ class WordNetKnowledgeResource(KnowledgeSource):
         enrichment_domains: Optional[Set[str]] = None,
         enrichment_domains_path: Optional[str] = None,
         wordnet_pos: Optional[Set[str]] = None,
+        cache_size: Optional[int] = 100000,
+        preload: Optional[bool] = False,
     ) -> None:
         """Initialise WordNet knowledge resource instance.
 
@@ -76,6 +83,12 @@ class WordNetKnowledgeResource(KnowledgeSource):
         wordnet_pos: Set[str], optional
             The set of part of speech tags to use for matching.
             Mandatory when use_pos is True, by default to None.
+        cache_size: int, optional
+            Maximum number of WordNet lookups (term synsets, lemmas texts, related synsets)
+            kept in the cache, by default 100000. If None, the cache is unbounded.
+        preload: bool, optional
+            Whether to load the WordNet data when initialising the instance instead of on
+            first lookup, by default False.
         """
 
         self.lang = lang
@@ -86,10 +99,15 @@ class WordNetKnowledgeResource(KnowledgeSource):
         self.enrichment_domains = enrichment_domains
         self.enrichment_domains_path = enrichment_domains_path
         self.wordnet_pos = wordnet_pos
+        self.cache_size = cache_size
 
         self._check_parameters()
         self.wordnet_lang = fetch_wordnet_lang(self.lang)
 
+        self._cache = LRUCache(max_size=self.cache_size)
+        if preload:
+            self.preload()
+
     def _check_parameters(self) -> None:
         """Check wether required parameters are given and correct. If this is not the case,
         suitable default ones are set.
@@ -133,7 +151,7 @@ class WordNetKnowledgeResource(KnowledgeSource):
                 )
                 self.use_domains = False
             else:
-                self.wordnet_domains_map = load_wordnet_domains(
+                self.wordnet_domains_map = load_wordnet_domain_index(
                     self.wordnet_domains_path
                 )
             if not self.wordnet_domains_map:
@@ -169,6 +187,12 @@ class WordNetKnowledgeResource(KnowledgeSource):
                 )
                 self.use_pos = False
 
+        if self.cache_size is not None and self.cache_size < 1:
+            logger.warning(
+                "Wrong value given for cache_size parameter, default will be set to 100000."
+            )
+            self.cache_size = 100000
+
     # TODO Rename this here and in `_check_parameters`
     def _extracted_from__check_parameters_35(self, arg0):
         logger.warning(arg0)
@@ -179,6 +203,27 @@ class WordNetKnowledgeResource(KnowledgeSource):
         # TODO
         """Method to check that the component has access to all its required resources."""
 
+    def preload(self, terms: Optional[Set[str]] = None) -> None:
+        """Load the WordNet data of the knowledge resource language and optionally warm up
+        the lookups cache with all the enrichment kinds of a set of terms.
+
+        Parameters
+        ----------
+        terms : Set[str], optional
+            The terms whose lookups to cache, by default None.
+        """
+        wn.ensure_loaded()
+        if self.wordnet_lang != "eng":
+            # Open Multilingual Wordnet data is loaded on first use of the language.
+            wn.all_lemma_names(lang=self.wordnet_lang)
+
+        if terms:
+            self.fetch_terms_enrichment(terms, ENRICHMENT_KINDS)
+
+    def clear_cache(self) -> None:
+        """Remove all the cached WordNet lookups, e.g., after changing the matching options."""
+        self._cache.clear()
+
     def _check_enrichment_domains_exist(self) -> bool:
         """Private method to test wether all the WordNet domains provided for enrichment
             exist in the mapping of WordNet Synsets to domains.
@@ -188,9 +233,7 @@ class WordNetKnowledgeResource(KnowledgeSource):
         bool
             Wether or not all the WordNet domains provided for enrichment exist.
         """
-        all_wordnet_domains = set()
-        for synset_domains in self.wordnet_domains_map.values():
-            all_wordnet_domains.update(synset_domains)
+        all_wordnet_domains = self._get_wordnet_domain_index().domains
 
         domains_exist = self.enrichment_domains.issubset(all_wordnet_domains)
 
@@ -226,12 +269,30 @@ class WordNetKnowledgeResource(KnowledgeSource):
         """
         texts = set()
         for synset in synsets:
-            synset_lemmas = synset.lemmas(lang=self.wordnet_lang)
-            synset_lemmas_texts = self._get_lemmas_texts(synset_lemmas)
-            texts.update(synset_lemmas_texts)
+            texts.update(self._get_synset_lemmas_texts(synset))
 
         return texts
 
+    def _get_synset_lemmas_texts(self, synset: Synset) -> FrozenSet[str]:
+        """Get the texts of a synset's lemmas, from the lookups cache if possible.
+
+        Parameters
+        ----------
+        synset : Synset
+            The synset to extract the text lemmas from.
+
+        Returns
+        -------
+        FrozenSet[str]
+            The synset's lemmas texts.
+        """
+        return self._cache.get_or_compute(
+            ("synset_lemmas_texts", synset.name(), self.wordnet_lang),
+            lambda: frozenset(
+                self._get_lemmas_texts(synset.lemmas(lang=self.wordnet_lang))
+            ),
+        )
+
     def fetch_terms_synonyms(self, terms: Set[str]) -> Set[str]:
         """Method to fetch synonyms of a set of terms from WordNet.
 
@@ -266,20 +327,7 @@ class WordNetKnowledgeResource(KnowledgeSource):
         """
         terms_synsets = self._fetch_terms_synsets(terms)
 
-        term_antonyms_lemmas = set()
-        for synset in terms_synsets:
-            # antonyms are linked with Lemmas in WordNet
-            # extract synsets lemmas
-            synset_lemmas = synset.lemmas(lang=self.wordnet_lang)
-            synset_antonyms = set()
-
-            # Extract lemmas antonyms
-            for lemma in synset_lemmas:
-                synset_antonyms.update(set(lemma.antonyms()))
-
-            term_antonyms_lemmas.update(synset_antonyms)
-
-        terms_antonyms = self._get_lemmas_texts(term_antonyms_lemmas)
+        terms_antonyms = self._fetch_synsets_antonyms_texts(terms_synsets)
 
         return terms_antonyms
 
@@ -298,13 +346,7 @@ class WordNetKnowledgeResource(KnowledgeSource):
         """
         terms_synsets = self._fetch_terms_synsets(terms)
 
-        terms_hypernyms_synsets = set()
-        for synset in terms_synsets:
-            synset_hypernyms = self._get_synset_hypernyms(synset)
-            terms_hypernyms_synsets.update(synset_hypernyms)
-
-        # extract lemmas texts from hypernyms Synsets
-        terms_hypernyms = self._fetch_synsets_lemmas_texts(terms_hypernyms_synsets)
+        terms_hypernyms = self._fetch_synsets_hypernyms_texts(terms_synsets)
 
         return terms_hypernyms
 
@@ -323,16 +365,181 @@ class WordNetKnowledgeResource(KnowledgeSource):
         """
         terms_synsets = self._fetch_terms_synsets(terms)
 
-        # extract hyponyms Synsets
-        terms_hyponyms_synsets = set()
-        for synset in terms_synsets:
-            synset_hyponyms = self._get_synset_hyponyms(synset)
-            terms_hyponyms_synsets.update(synset_hyponyms)
+        terms_hyponyms = self._fetch_synsets_hyponyms_texts(terms_synsets)
+
+        return terms_hyponyms
+
+    def fetch_terms_enrichment(
+        self, terms: Set[str], enrichment_kinds: Set[str]
+    ) -> Dict[str, Set[str]]:
+        """Method to fetch several kinds of enrichments of a set of terms from WordNet.
+        The terms synsets are resolved once for all the enrichment kinds.
+
+        Parameters
+        ----------
+        terms : Set[str]
+            The set of terms to enrich.
+        enrichment_kinds : Set[str]
+            The kinds of enrichments to fetch, among 'synonyms', 'antonyms', 'hypernyms' and
+            'hyponyms'. Other values are ignored.
+
+        Returns
+        -------
+        Dict[str, Set[str]]
+            The set of terms enrichments, by enrichment kind.
+        """
+        terms_synsets = self._fetch_terms_synsets(terms)
+
+        kind_fetchers = {
+            "synonyms": self._fetch_synsets_lemmas_texts,
+            "antonyms": self._fetch_synsets_antonyms_texts,
+            "hypernyms": self._fetch_synsets_hypernyms_texts,
+            "hyponyms": self._fetch_synsets_hyponyms_texts,
+        }
+        terms_enrichment = {
+            enrichment_kind: kind_fetchers[enrichment_kind](terms_synsets)
+            for enrichment_kind in enrichment_kinds & ENRICHMENT_KINDS
+        }
+
+        return terms_enrichment
+
+    def fetch_terms_groups_enrichment(
+        self, terms_groups: Mapping[Hashable, Set[str]], enrichment_kinds: Set[str]
+    ) -> Dict[Hashable, Dict[str, Set[str]]]:
+        """Method to fetch several kinds of enrichments of many groups of terms at once from
+        WordNet. The synsets of the terms shared by several groups are resolved once, as
+        are the enrichments of the synsets shared by several groups.
+
+        Parameters
+        ----------
+        terms_groups : Mapping[Hashable, Set[str]]
+            The sets of terms to enrich, by group key.
+        enrichment_kinds : Set[str]
+            The kinds of enrichments to fetch, among 'synonyms', 'antonyms', 'hypernyms' and
+            'hyponyms'. Other values are ignored.
+
+        Returns
+        -------
+        Dict[Hashable, Dict[str, Set[str]]]
+            The set of terms enrichments by enrichment kind, by group key.
+        """
+        enrichment_kinds = enrichment_kinds & ENRICHMENT_KINDS
+        terms_synsets = {
+            term: self._fetch_terms_synsets({term})
+            for term in set().union(*terms_groups.values())
+        }
+
+        kind_fetchers = {
+            "synonyms": self._fetch_synsets_lemmas_texts,
+            "antonyms": self._fetch_synsets_antonyms_texts,
+            "hypernyms": self._fetch_synsets_hypernyms_texts,
+            "hyponyms": self._fetch_synsets_hyponyms_texts,
+        }
+        synsets_enrichment = {
+            synset: {
+                enrichment_kind: kind_fetchers[enrichment_kind]({synset})
+                for enrichment_kind in enrichment_kinds
+            }
+            for synset in set().union(*terms_synsets.values())
+        }
+
+        groups_enrichment = {}
+        for group_key, group_terms in terms_groups.items():
+            group_enrichment = {
+                enrichment_kind: set() for enrichment_kind in enrichment_kinds
+            }
+            group_synsets = set().union(*(terms_synsets[term] for term in group_terms))
+            for synset in group_synsets:
+                for enrichment_kind, texts in synsets_enrichment[synset].items():
+                    group_enrichment[enrichment_kind].update(texts)
+            groups_enrichment[group_key] = group_enrichment
+
+        return groups_enrichment
+
+    def _fetch_synsets_antonyms_texts(self, synsets: Set[Synset]) -> Set[str]:
+        """Fetch the texts of the antonyms of synsets' lemmas.
+
+        Parameters
+        ----------
+        synsets : Set[Synset]
+            The synsets to extract the antonyms from.
+
+        Returns
+        -------
+        Set[str]
+            The synsets' antonyms texts.
+        """
+        antonyms_lemmas = set()
+        for synset in synsets:
+            # antonyms are linked with Lemmas in WordNet
+            antonyms_lemmas.update(
+                self._cache.get_or_compute(
+                    ("synset_antonyms", synset.name(), self.wordnet_lang),
+                    lambda: frozenset(
+                        antonym
+                        for lemma in synset.lemmas(lang=self.wordnet_lang)
+                        for antonym in lemma.antonyms()
+                    ),
+                )
+            )
+
+        antonyms_texts = self._get_lemmas_texts(antonyms_lemmas)
+
+        return antonyms_texts
+
+    def _fetch_synsets_hypernyms_texts(self, synsets: Set[Synset]) -> Set[str]:
+        """Fetch the lemmas texts of synsets' hypernyms.
+
+        Parameters
+        ----------
+        synsets : Set[Synset]
+            The synsets to extract the hypernyms from.
+
+        Returns
+        -------
+        Set[str]
+            The synsets' hypernyms lemmas texts.
+        """
+        hypernyms_synsets = set()
+        for synset in synsets:
+            hypernyms_synsets.update(
+                self._cache.get_or_compute(
+                    ("synset_hypernyms", synset.name()),
+                    lambda: frozenset(self._get_synset_hypernyms(synset)),
+                )
+            )
+
+        # extract lemmas texts from hypernyms Synsets
+        hypernyms_texts = self._fetch_synsets_lemmas_texts(hypernyms_synsets)
+
+        return hypernyms_texts
+
+    def _fetch_synsets_hyponyms_texts(self, synsets: Set[Synset]) -> Set[str]:
+        """Fetch the lemmas texts of synsets' hyponyms.
+
+        Parameters
+        ----------
+        synsets : Set[Synset]
+            The synsets to extract the hyponyms from.
+
+        Returns
+        -------
+        Set[str]
+            The synsets' hyponyms lemmas texts.
+        """
+        hyponyms_synsets = set()
+        for synset in synsets:
+            hyponyms_synsets.update(
+                self._cache.get_or_compute(
+                    ("synset_hyponyms", synset.name()),
+                    lambda: frozenset(self._get_synset_hyponyms(synset)),
+                )
+            )
 
         # extract lemmas texts from hyponyms Synsets
-        terms_hyponyms = self._fetch_synsets_lemmas_texts(terms_hyponyms_synsets)
+        hyponyms_texts = self._fetch_synsets_lemmas_texts(hyponyms_synsets)
 
-        return terms_hyponyms
+        return hyponyms_texts
 
     def _fetch_terms_synsets(self, terms: Set[str]) -> Set[Synset]:
         """Fetch terms corresponding WordNet synsets.
@@ -351,7 +558,14 @@ class WordNetKnowledgeResource(KnowledgeSource):
 
         terms_synsets = set()
         for term_wordnet_text in terms_wordnet_texts:
-            terms_synsets.update(self._get_term_wordnet_synsets(term_wordnet_text))
+            terms_synsets.update(
+                self._cache.get_or_compute(
+                    ("term_synsets", term_wordnet_text, self.wordnet_lang),
+                    lambda: frozenset(
+                        self._get_term_wordnet_synsets(term_wordnet_text)
+                    ),
+                )
+            )
 
         return terms_synsets
 
@@ -369,11 +583,28 @@ class WordNetKnowledgeResource(KnowledgeSource):
         Set[str]
             The set of domains associated with the synset.
         """
-        ssid = f"{str(synset.offset()).zfill(WORDNET_DOMAINS_SSID_NUM_SIZE)}-{synset.pos()}"
-        synset_domains = self.wordnet_domains_map.get(ssid, set())
+        synset_domains = self._get_wordnet_domain_index().get_synset_domains(
+            synset.offset(), synset.pos()
+        )
 
         return synset_domains
 
+    def _get_wordnet_domain_index(self) -> WordNetDomainIndex:
+        """Private method to get the compiled index of the WordNet domains mapping.
+        A mapping given as a dictionary is compiled on first use.
+
+        Returns
+        -------
+        WordNetDomainIndex
+            The WordNet domains index.
+        """
+        if not isinstance(self.wordnet_domains_map, WordNetDomainIndex):
+            self.wordnet_domains_map = WordNetDomainIndex.from_domains_map(
+                self.wordnet_domains_map
+            )
+
+        return self.wordnet_domains_map
+
     def _filter_synsets_on_domains(self, synsets: Set[Synset]) -> Set[Synset]:
         """Private method to filter out synsets not associated with the WordNet domains
             to use for term enrichment.
@@ -388,12 +619,16 @@ class WordNetKnowledgeResource(KnowledgeSource):
         Set[Synset]
             The filtered set of synsets.
         """
-        kept_synsets = set()
+        domain_index = self._get_wordnet_domain_index()
+        synsets = list(synsets)
 
-        for synset in synsets:
-            synset_domains = self._get_domains_for_synset(synset)
-            if len(self.enrichment_domains & synset_domains) > 0:
-                kept_synsets.add(synset)
+        synsets_matches = domain_index.match_synsets_domains(
+            [(synset.offset(), synset.pos()) for synset in synsets],
+            domain_index.get_domains_bitset(self.enrichment_domains),
+        )
+        kept_synsets = {
+            synset for synset, match in zip(synsets, synsets_matches) if match
+        }
 
         return kept_synsets
 
@@ -438,17 +673,39 @@ class WordNetKnowledgeResource(KnowledgeSource):
         Set[str]
             The set of extracted strings.
         """
-        lemmas_names = set()
+        lemmas_texts = set()
 
         for lemma in lemmas:
-            lemmas_names.add(lemma.name())
+            lemmas_texts.update(self._get_lemma_texts(lemma))
 
-            for derived_lemma in lemma.derivationally_related_forms():
-                lemmas_names.add(derived_lemma.name())
+        return lemmas_texts
 
-        lemmas_texts = {underscore_to_space_str(name) for name in lemmas_names}
+    def _get_lemma_texts(self, lemma: Lemma) -> FrozenSet[str]:
+        """Private method to get the strings of a WordNet Lemma and its derivationally
+        related forms, from the lookups cache if possible.
+        Lemmas are compared on their name only so the cache key includes their synset.
 
-        return lemmas_texts
+        Parameters
+        ----------
+        lemma : Lemma
+            The Lemma to extract the strings from.
+
+        Returns
+        -------
+        FrozenSet[str]
+            The set of extracted strings.
+        """
+
+        def compute_lemma_texts() -> FrozenSet[str]:
+            lemma_names = {lemma.name()}
+            for derived_lemma in lemma.derivationally_related_forms():
+                lemma_names.add(derived_lemma.name())
+            return frozenset(underscore_to_space_str(name) for name in lemma_names)
+
+        return self._cache.get_or_compute(
+            ("lemma_texts", lemma.synset().name(), lemma.name(), lemma.lang()),
+            compute_lemma_texts,
+        )
 
     def _get_synset_hypernyms(self, synset: Synset) -> Set[Synset]:
         """Private method to get WordNet hypernyms Synsets associated with a Synset.
@@ -1,4 +1,8 @@
-from .kr_serialisers import KRJSONSerialiser
+from .kr_serialisers import (
+    KRJSONLinesSerialiser,
+    KRJSONSerialiser,
+    KRMsgpackSerialiser,
+)
 from .rdf_owl_serialisers.base_owl_serialiser import BaseOWLSerialiser
 from .rdf_owl_serialisers.base_rdf_serialiser import BaseRDFserialiser
 from .rdf_owl_serialisers.domain_range_owl_serialiser import \
@@ -1,13 +1,21 @@
+import hashlib
 import json
+from collections import defaultdict
+from itertools import chain
 from collections.abc import Iterable
 from os import PathLike
+from pathlib import Path
+from typing import Any, Optional
 
 import spacy
+import srsly
 from rdflib import Graph
-from spacy.matcher import PhraseMatcher
 
+from ...commons.logging_config import logger
+from ...commons.spacy_processing_tools import build_phrase_matcher
 from ...data_container import (
     Concept,
+    DocRegistry,
     KnowledgeRepresentation,
     LinguisticRealisation,
     Metarelation,
@@ -15,9 +23,20 @@ from ...data_container import (
 )
 from ...pipeline.pipeline_schema import Pipeline
 
+# Version of the KR serialisation format.
+# Version 1 only records the corpus occurrence texts of the linguistic realisations.
+# Version 2 also records their (doc index, start, end) offsets and the corpus fingerprint.
+KR_FORMAT_VERSION = 2
+
 
 class KRJSONSerialiser:
-    """JSON serialiser for KR objects."""
+    """JSON serialiser for KR objects.
+
+    Corpus occurrences are serialised as (doc index, start, end) offsets along with a
+    fingerprint of the documents they belong to. When the KR is loaded with the same corpus,
+    the corpus occurrences are restored by slicing the documents. Otherwise, or for
+    serialisations without offsets, they are retrieved by matching their texts in the corpus.
+    """
 
     def __init__(self) -> None: ...
 
@@ -31,17 +50,64 @@ class KRJSONSerialiser:
         file_path : PathLike
             The path to the file to save the serialised KR object.
         """
+        self._write_kr_json(self.get_kr_json(kr=kr), file_path)
+
+    def _write_kr_json(self, kr_json: dict[str, Any], file_path: PathLike) -> None:
+        """Write the KR JSON serialisation into a file.
+
+        Parameters
+        ----------
+        kr_json : dict[str, Any]
+            The KR JSON serialisation.
+        file_path : PathLike
+            The path to the file to save the serialised KR object.
+        """
+        with open(file_path, "w", encoding="utf8") as json_file:
+            json.dump(kr_json, json_file)
+
+    def _read_kr_json(self, file_path: PathLike) -> dict[str, Any]:
+        """Read the KR JSON serialisation from a file.
+
+        Parameters
+        ----------
+        file_path : PathLike
+            The path to the file containing the serialised KR object.
+
+        Returns
+        -------
+        dict[str, Any]
+            The KR JSON serialisation.
+        """
+        with open(file_path, "r", encoding="utf8") as json_file:
+            return json.load(json_file)
+
+    def get_kr_json(self, kr: KnowledgeRepresentation) -> dict[str, Any]:
+        """Construct the JSON serialisation of a KR object.
+
+        Parameters
+        ----------
+        kr : KnowledgeRepresentation
+            The KR object to serialise.
+
+        Returns
+        -------
+        dict[str, Any]
+            The serialised KR JSON-like object.
+        """
+        doc_registry = DocRegistry()
         kr_json = {
-            "concepts": self.get_concepts_json(kr=kr),
-            "relations": self.get_relations_json(kr=kr),
-            "metarelations": self.get_metarelations_json(kr=kr),
+            "format_version": KR_FORMAT_VERSION,
+            "concepts": self.get_concepts_json(kr=kr, doc_registry=doc_registry),
+            "relations": self.get_relations_json(kr=kr, doc_registry=doc_registry),
+            "metarelations": self.get_metarelations_json(
+                kr=kr, doc_registry=doc_registry
+            ),
             "rdf_graph": (
                 kr.rdf_graph.serialize(format="ttl") if len(kr.rdf_graph) else None
             ),
         }
-
-        with open(file_path, "w", encoding="utf8") as json_file:
-            json.dump(kr_json, json_file)
+        kr_json["corpus_fingerprint"] = self.get_corpus_fingerprint(doc_registry.docs)
+        return kr_json
 
     def load(self, pipeline: Pipeline, file_path: PathLike) -> None:
         """Load a KR object from a JSON serialisation.
@@ -55,26 +121,66 @@ class KRJSONSerialiser:
         file_path : PathLike
             The path to the file containing the JSON serialised KR object.
         """
-        with open(file_path, "r", encoding="utf8") as json_file:
-            kr_json = json.load(json_file)
+        self.load_kr_json(pipeline=pipeline, kr_json=self._read_kr_json(file_path))
+
+    def load_kr_json(self, pipeline: Pipeline, kr_json: dict[str, Any]) -> None:
+        """Load a KR object from its JSON serialisation into the pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to use when loading the KR.
+            It is used to access the corpus and spacy model
+            to reconstruct the linguistic realisations.
+        kr_json : dict[str, Any]
+            The KR JSON serialisation.
+        """
+        docs = None
+        cos_index = None
+        if kr_json.get("format_version", 1) >= 2:
+            docs = self.get_docs_from_fingerprint(
+                kr_json.get("corpus_fingerprint", []), pipeline.corpus
+            )
+            if docs is None:
+                logger.warning(
+                    "The KR corpus fingerprint does not match the pipeline corpus. "
+                    "Corpus occurrences are retrieved by matching their texts."
+                )
+
+        if docs is None:
+            cos_index = self.build_cos_index_from_strings(
+                co_texts=self.get_co_texts_from_json(
+                    kr_json.get("concepts", []),
+                    kr_json.get("relations", []),
+                    kr_json.get("metarelations", []),
+                ),
+                spacy_model=pipeline.spacy_model,
+                docs=pipeline.corpus,
+            )
 
         concepts_index = {}
         concepts = self.load_concepts_from_json(
             concepts_json=kr_json.get("concepts", set()),
             concepts_idx=concepts_index,
             pipeline=pipeline,
+            cos_index=cos_index,
+            docs=docs,
         )
 
         relations = self.load_relations_from_json(
             relations_json=kr_json.get("relations", set()),
             concepts_idx=concepts_index,
             pipeline=pipeline,
+            cos_index=cos_index,
+            docs=docs,
         )
 
         metarelations = self.load_metarelations_from_json(
             metarelations_json=kr_json.get("metarelations", set()),
             concepts_idx=concepts_index,
             pipeline=pipeline,
+            cos_index=cos_index,
+            docs=docs,
         )
 
         rdf_graph = Graph()
@@ -95,6 +201,8 @@ class KRJSONSerialiser:
         concepts_json: list[dict[str]],
         concepts_idx: dict[int, Concept],
         pipeline: Pipeline,
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
     ) -> set[Concept]:
         """Load concepts from the concepts portion of the KR JSON serialisation.
 
@@ -106,37 +214,74 @@ class KRJSONSerialiser:
             A dictionary object to store the concept index.
         pipeline : Pipeline
             The pipeline to use for reconstructing the linguistic realisations.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None
+            which matches the texts of the concepts portion only in the pipeline corpus.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+            If given, corpus occurrences are restored from their offsets.
 
         Returns
         -------
         set[Concept]
             The set of Concepts.
         """
-        concepts = set()
-        for concept_json in concepts_json:
-            concept_lrs = {
-                LinguisticRealisation(
-                    label=lr["label"],
-                    corpus_occurrences=self.build_cos_from_strings(
-                        co_texts=lr["co_texts"],
-                        spacy_model=pipeline.spacy_model,
-                        docs=pipeline.corpus,
-                    ),
-                )
-                for lr in concept_json.get("lrs", [])
-            }
-            concept = Concept(
-                label=concept_json["label"], linguistic_realisations=concept_lrs
+        if cos_index is None and docs is None:
+            cos_index = self.build_cos_index_from_strings(
+                co_texts=self.get_co_texts_from_json(concepts_json),
+                spacy_model=pipeline.spacy_model,
+                docs=pipeline.corpus,
             )
-            concepts_idx[concept_json["concept_id"]] = concept
-            concepts.add(concept)
+
+        concepts = {
+            self.load_concept_from_json(
+                concept_json, concepts_idx, cos_index=cos_index, docs=docs
+            )
+            for concept_json in concepts_json
+        }
         return concepts
 
+    def load_concept_from_json(
+        self,
+        concept_json: dict[str],
+        concepts_idx: dict[int, Concept],
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
+    ) -> Concept:
+        """Load a concept from its JSON serialisation and add it to the concept index.
+
+        Parameters
+        ----------
+        concept_json : dict[str]
+            The concept JSON serialisation.
+        concepts_idx : dict[int, Concept]
+            A dictionary object to store the concept index.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+
+        Returns
+        -------
+        Concept
+            The concept.
+        """
+        concept_lrs = self.build_lrs_from_json(
+            concept_json.get("lrs", []), cos_index=cos_index, docs=docs
+        )
+        concept = Concept(
+            label=concept_json["label"], linguistic_realisations=concept_lrs
+        )
+        concepts_idx[concept_json["concept_id"]] = concept
+        return concept
+
     def load_relations_from_json(
         self,
         relations_json: list[dict[str]],
         concepts_idx: dict[int, Concept],
         pipeline: Pipeline,
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
     ) -> set[Relation]:
         """Load relations from the relations portion of the KR JSON serialisation.
 
@@ -148,54 +293,88 @@ class KRJSONSerialiser:
             The concept index mapping concept IDs to concept instances.
         pipeline : Pipeline
             The pipeline to use for reconstructing the linguistic realisations.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None
+            which matches the texts of the relations portion only in the pipeline corpus.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+            If given, corpus occurrences are restored from their offsets.
 
         Returns
         -------
         set[Relation]
             The set of Relations.
         """
-
-        relations = set()
-        for rel_json in relations_json:
-            rel_lrs = {
-                LinguisticRealisation(
-                    label=lr["label"],
-                    corpus_occurrences=self.build_cos_from_strings(
-                        co_texts=lr["co_texts"],
-                        spacy_model=pipeline.spacy_model,
-                        docs=pipeline.corpus,
-                    ),
-                )
-                for lr in rel_json.get("lrs", [])
-            }
-
-            rel_source_concept = (
-                concepts_idx.get(rel_json.get("source_concept_id"))
-                if rel_json.get("source_concept_id") is not None
-                else None
-            )
-
-            rel_dest_concept = (
-                concepts_idx.get(rel_json.get("destination_concept_id"))
-                if rel_json.get("destination_concept_id") is not None
-                else None
+        if cos_index is None and docs is None:
+            cos_index = self.build_cos_index_from_strings(
+                co_texts=self.get_co_texts_from_json(relations_json),
+                spacy_model=pipeline.spacy_model,
+                docs=pipeline.corpus,
             )
 
-            relations.add(
-                Relation(
-                    label=rel_json["label"],
-                    source_concept=rel_source_concept,
-                    destination_concept=rel_dest_concept,
-                    linguistic_realisations=rel_lrs,
-                )
+        relations = {
+            self.load_relation_from_json(
+                rel_json, concepts_idx, cos_index=cos_index, docs=docs
             )
+            for rel_json in relations_json
+        }
         return relations
 
+    def load_relation_from_json(
+        self,
+        rel_json: dict[str],
+        concepts_idx: dict[int, Concept],
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
+    ) -> Relation:
+        """Load a relation from its JSON serialisation.
+
+        Parameters
+        ----------
+        rel_json : dict[str]
+            The relation JSON serialisation.
+        concepts_idx : dict[int, Concept]
+            The concept index mapping concept IDs to concept instances.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+
+        Returns
+        -------
+        Relation
+            The relation.
+        """
+        rel_lrs = self.build_lrs_from_json(
+            rel_json.get("lrs", []), cos_index=cos_index, docs=docs
+        )
+
+        rel_source_concept = (
+            concepts_idx.get(rel_json.get("source_concept_id"))
+            if rel_json.get("source_concept_id") is not None
+            else None
+        )
+
+        rel_dest_concept = (
+            concepts_idx.get(rel_json.get("destination_concept_id"))
+            if rel_json.get("destination_concept_id") is not None
+            else None
+        )
+
+        return Relation(
+            label=rel_json["label"],
+            source_concept=rel_source_concept,
+            destination_concept=rel_dest_concept,
+            linguistic_realisations=rel_lrs,
+        )
+
     def load_metarelations_from_json(
         self,
         metarelations_json: list[dict[str]],
         concepts_idx: dict[int, Concept],
         pipeline: Pipeline,
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
     ) -> set[Metarelation]:
         """Load metarelations from the metarelations portion of the KR JSON serialisation.
 
@@ -207,147 +386,449 @@ class KRJSONSerialiser:
             The concept index mapping concept IDs to concept instances.
         pipeline : Pipeline
             The pipeline to use for reconstructing the linguistic realisations.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None
+            which matches the texts of the metarelations portion only in the pipeline corpus.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+            If given, corpus occurrences are restored from their offsets.
 
         Returns
         -------
         set[Metarelation]
             The set of metarelations.
         """
+        if cos_index is None and docs is None:
+            cos_index = self.build_cos_index_from_strings(
+                co_texts=self.get_co_texts_from_json(metarelations_json),
+                spacy_model=pipeline.spacy_model,
+                docs=pipeline.corpus,
+            )
 
-        metarelations = set()
-        for rel_json in metarelations_json:
-            rel_lrs = {
+        metarelations = {
+            self.load_metarelation_from_json(
+                rel_json, concepts_idx, cos_index=cos_index, docs=docs
+            )
+            for rel_json in metarelations_json
+        }
+        return metarelations
+
+    def load_metarelation_from_json(
+        self,
+        rel_json: dict[str],
+        concepts_idx: dict[int, Concept],
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
+    ) -> Metarelation:
+        """Load a metarelation from its JSON serialisation.
+
+        Parameters
+        ----------
+        rel_json : dict[str]
+            The metarelation JSON serialisation.
+        concepts_idx : dict[int, Concept]
+            The concept index mapping concept IDs to concept instances.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+
+        Returns
+        -------
+        Metarelation
+            The metarelation.
+        """
+        rel_lrs = self.build_lrs_from_json(
+            rel_json.get("lrs", []), cos_index=cos_index, docs=docs
+        )
+
+        rel_source_concept = concepts_idx.get(rel_json["source_concept_id"])
+        rel_dest_concept = concepts_idx.get(rel_json["destination_concept_id"])
+
+        return Metarelation(
+            label=rel_json["label"],
+            source_concept=rel_source_concept,
+            destination_concept=rel_dest_concept,
+            linguistic_realisations=rel_lrs,
+        )
+
+    def get_co_texts_from_json(self, *kr_elements_json: list[dict[str]]) -> set[str]:
+        """Collect the corpus occurrence texts of KR elements JSON serialisations.
+
+        Parameters
+        ----------
+        *kr_elements_json : list[dict[str]]
+            Portions of the KR JSON serialisation, i.e., concepts, relations or metarelations.
+
+        Returns
+        -------
+        set[str]
+            The corpus occurrence texts of all the linguistic realisations.
+        """
+        return {
+            co_text
+            for elements_json in kr_elements_json
+            for element_json in elements_json
+            for lr in element_json.get("lrs", [])
+            for co_text in lr["co_texts"]
+        }
+
+    def build_lrs_from_json(
+        self,
+        lrs_json: list[dict[str]],
+        cos_index: Optional[dict[str, set[spacy.tokens.Span]]] = None,
+        docs: Optional[list[spacy.tokens.Doc]] = None,
+    ) -> set[LinguisticRealisation]:
+        """Create linguistic realisations from their JSON serialisation.
+
+        Parameters
+        ----------
+        lrs_json : list[dict[str]]
+            The linguistic realisations portion of a KR element JSON serialisation.
+        cos_index : dict[str, set[spacy.tokens.Span]], optional
+            The corpus occurrences of the linguistic realisations texts, by default None.
+        docs : list[spacy.tokens.Doc], optional
+            The documents referred to by the corpus occurrences offsets, by default None.
+            If given, corpus occurrences are restored from their offsets,
+            otherwise they are looked up by text in the corpus occurrences index.
+
+        Returns
+        -------
+        set[LinguisticRealisation]
+            The set of linguistic realisations.
+        """
+        lrs = set()
+        for lr in lrs_json:
+            if docs is not None:
+                corpus_occurrences = {
+                    self.get_co_from_offsets(co_offsets, docs)
+                    for co_offsets in lr.get("cos", [])
+                }
+            else:
+                corpus_occurrences = {
+                    co
+                    for co_text in lr["co_texts"]
+                    for co in cos_index.get(co_text, set())
+                }
+            lrs.add(
                 LinguisticRealisation(
-                    label=lr["label"],
-                    corpus_occurrences=self.build_cos_from_strings(
-                        co_texts=lr["co_texts"],
-                        spacy_model=pipeline.spacy_model,
-                        docs=pipeline.corpus,
-                    ),
+                    label=lr["label"], corpus_occurrences=corpus_occurrences
                 )
-                for lr in rel_json.get("lrs", [])
-            }
+            )
+        return lrs
 
-            rel_source_concept = concepts_idx.get(rel_json["source_concept_id"])
-            rel_dest_concept = concepts_idx.get(rel_json["destination_concept_id"])
+    def get_co_offsets(self, co: Any, doc_registry: DocRegistry) -> list:
+        """Encode a corpus occurrence as offsets.
 
-            metarelations.add(
-                Metarelation(
-                    label=rel_json["label"],
-                    source_concept=rel_source_concept,
-                    destination_concept=rel_dest_concept,
-                    linguistic_realisations=rel_lrs,
-                )
+        Parameters
+        ----------
+        co : Any
+            The corpus occurrence, i.e., a span or a tuple of optional spans.
+        doc_registry : DocRegistry
+            The registry assigning the indices of the occurrences documents.
+
+        Returns
+        -------
+        list
+            The [doc index, start, end] offsets of a span,
+            or the list of the offsets of the spans of a tuple.
+        """
+        if isinstance(co, tuple):
+            return [
+                self.get_co_offsets(span, doc_registry) if span is not None else None
+                for span in co
+            ]
+        return [doc_registry.register(co.doc), co.start, co.end]
+
+    def get_co_from_offsets(
+        self, co_offsets: list, docs: list[spacy.tokens.Doc]
+    ) -> Any:
+        """Restore a corpus occurrence from its offsets.
+
+        Parameters
+        ----------
+        co_offsets : list
+            The corpus occurrence offsets, as returned by get_co_offsets.
+        docs : list[spacy.tokens.Doc]
+            The documents referred to by the offsets doc indices.
+
+        Returns
+        -------
+        Any
+            The corpus occurrence, i.e., a span or a tuple of optional spans.
+        """
+        if co_offsets and not isinstance(co_offsets[0], int):
+            return tuple(
+                self.get_co_from_offsets(span_offsets, docs)
+                if span_offsets is not None
+                else None
+                for span_offsets in co_offsets
             )
-        return metarelations
+        doc_index, start, end = co_offsets
+        return docs[doc_index][start:end]
+
+    def get_lrs_json(
+        self,
+        lrs: Iterable[LinguisticRealisation],
+        doc_registry: Optional[DocRegistry] = None,
+    ) -> list[dict[str]]:
+        """Construct the JSON serialisation of linguistic realisations.
+
+        Parameters
+        ----------
+        lrs : Iterable[LinguisticRealisation]
+            The linguistic realisations to serialise.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
-    def get_concepts_json(self, kr: KnowledgeRepresentation) -> list[dict[str]]:
+        Returns
+        -------
+        list[dict[str]]
+            The serialised linguistic realisations JSON-like object.
+        """
+        lrs_list = []
+        for lr in lrs:
+            new_lr = {
+                "label": lr.label,
+                "co_texts": list(
+                    {
+                        co.text
+                        for co in lr.corpus_occurrences
+                        if isinstance(co, spacy.tokens.Span)
+                    }
+                ),
+            }
+            if doc_registry is not None:
+                new_lr["cos"] = [
+                    self.get_co_offsets(co, doc_registry)
+                    for co in lr.corpus_occurrences
+                ]
+            lrs_list.append(new_lr)
+        return lrs_list
+
+    def get_doc_fingerprint(self, doc: spacy.tokens.Doc) -> str:
+        """Compute the fingerprint of a document.
+
+        The fingerprint digests the number of tokens and the text of the document,
+        so that offsets are only restored in identically tokenised documents.
+
+        Parameters
+        ----------
+        doc : spacy.tokens.Doc
+            The document to fingerprint.
+
+        Returns
+        -------
+        str
+            The document fingerprint.
+        """
+        return hashlib.sha1(f"{len(doc)} {doc.text}".encode("utf8")).hexdigest()
+
+    def get_corpus_fingerprint(self, docs: Iterable[spacy.tokens.Doc]) -> list[str]:
+        """Compute the fingerprint of a corpus, i.e., the list of its documents fingerprints.
+
+        Parameters
+        ----------
+        docs : Iterable[spacy.tokens.Doc]
+            The corpus documents.
+
+        Returns
+        -------
+        list[str]
+            The corpus fingerprint.
+        """
+        return [self.get_doc_fingerprint(doc) for doc in docs]
+
+    def get_docs_from_fingerprint(
+        self, corpus_fingerprint: list[str], corpus: list[spacy.tokens.Doc]
+    ) -> Optional[list[spacy.tokens.Doc]]:
+        """Find the corpus documents matching a corpus fingerprint.
+
+        Parameters
+        ----------
+        corpus_fingerprint : list[str]
+            The fingerprints of the documents to find.
+        corpus : list[spacy.tokens.Doc]
+            The corpus in which to find the documents.
+
+        Returns
+        -------
+        Optional[list[spacy.tokens.Doc]]
+            The documents matching the fingerprints, in the fingerprint order,
+            or None if some documents are not in the corpus.
+        """
+        corpus_docs = defaultdict(list)
+        for doc in reversed(corpus):
+            corpus_docs[self.get_doc_fingerprint(doc)].append(doc)
+
+        docs = []
+        for doc_fingerprint in corpus_fingerprint:
+            matching_docs = corpus_docs.get(doc_fingerprint)
+            if not matching_docs:
+                return None
+            docs.append(matching_docs.pop())
+        return docs
+
+    def get_concepts_json(
+        self, kr: KnowledgeRepresentation, doc_registry: Optional[DocRegistry] = None
+    ) -> list[dict[str]]:
         """Construct the JSON serialisation of KR concepts.
 
         Parameters
         ----------
         kr : KnowledgeRepresentation
             The KR to serialise the concepts.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
         Returns
         -------
         list[dict[str]]
             The serialised concepts JSON-like object.
         """
-        concepts_list = []
-
-        for concept in kr.concepts:
-            new_concept = {"concept_id": id(concept)}
-            new_concept["label"] = concept.label
-            lrs = []
-            for lr in concept.linguistic_realisations:
-                new_lr = {}
-                new_lr["label"] = lr.label
-                new_lr["co_texts"] = list({co.text for co in lr.corpus_occurrences})
-                lrs.append(new_lr)
-            new_concept["lrs"] = lrs
-            concepts_list.append(new_concept)
+        concepts_list = [
+            self.get_concept_json(concept, doc_registry) for concept in kr.concepts
+        ]
 
         return concepts_list
 
-    def get_metarelations_json(self, kr: KnowledgeRepresentation) -> list[dict[str]]:
+    def get_concept_json(
+        self, concept: Concept, doc_registry: Optional[DocRegistry] = None
+    ) -> dict[str]:
+        """Construct the JSON serialisation of a concept.
+
+        Parameters
+        ----------
+        concept : Concept
+            The concept to serialise.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
+
+        Returns
+        -------
+        dict[str]
+            The serialised concept JSON-like object.
+        """
+        new_concept = {"concept_id": id(concept)}
+        new_concept["label"] = concept.label
+        new_concept["lrs"] = self.get_lrs_json(
+            concept.linguistic_realisations, doc_registry
+        )
+        return new_concept
+
+    def get_metarelations_json(
+        self, kr: KnowledgeRepresentation, doc_registry: Optional[DocRegistry] = None
+    ) -> list[dict[str]]:
         """Construct the JSON serialisation of KR metarelations.
 
         Parameters
         ----------
         kr : KnowledgeRepresentation
             The KR to serialise the metarelations.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
         Returns
         -------
         list[dict[str]]
             The serialised metarelations JSON-like object.
         """
-        metarelations_list = []
+        metarelations_list = [
+            self.get_metarelation_json(meta, doc_registry) for meta in kr.metarelations
+        ]
 
-        for meta in kr.metarelations:
-            new_meta = {
-                "source_concept_id": id(meta.source_concept),
-                "destination_concept_id": id(meta.destination_concept),
-            }
-            new_meta["label"] = meta.label
-            lrs = [
-                {
-                    "label": lr.label,
-                    "co_texts": list({co.text for co in lr.corpus_occurrences}),
-                }
-                for lr in meta.linguistic_realisations
-            ]
+        return metarelations_list
 
-            new_meta["lrs"] = lrs
+    def get_metarelation_json(
+        self, meta: Metarelation, doc_registry: Optional[DocRegistry] = None
+    ) -> dict[str]:
+        """Construct the JSON serialisation of a metarelation.
 
-            metarelations_list.append(new_meta)
+        Parameters
+        ----------
+        meta : Metarelation
+            The metarelation to serialise.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
-        return metarelations_list
+        Returns
+        -------
+        dict[str]
+            The serialised metarelation JSON-like object.
+        """
+        new_meta = {
+            "source_concept_id": id(meta.source_concept),
+            "destination_concept_id": id(meta.destination_concept),
+        }
+        new_meta["label"] = meta.label
+        new_meta["lrs"] = self.get_lrs_json(meta.linguistic_realisations, doc_registry)
+        return new_meta
 
-    def get_relations_json(self, kr: KnowledgeRepresentation) -> list[dict[str]]:
+    def get_relations_json(
+        self, kr: KnowledgeRepresentation, doc_registry: Optional[DocRegistry] = None
+    ) -> list[dict[str]]:
         """Construct the JSON serialisation of KR relations.
 
         Parameters
         ----------
         kr : KnowledgeRepresentation
             The KR to serialise the relations.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
         Returns
         -------
         list[dict[str]]
             The serialised relations JSON-like object.
         """
-        relations_list = []
+        relations_list = [
+            self.get_relation_json(relation, doc_registry) for relation in kr.relations
+        ]
 
-        for relation in kr.relations:
+        return relations_list
 
-            new_relation = {
-                "source_concept_id": (
-                    id(relation.source_concept) if relation.source_concept else None
-                ),
-                "destination_concept_id": (
-                    id(relation.destination_concept)
-                    if relation.destination_concept
-                    else None
-                ),
-            }
+    def get_relation_json(
+        self, relation: Relation, doc_registry: Optional[DocRegistry] = None
+    ) -> dict[str]:
+        """Construct the JSON serialisation of a relation.
 
-            new_relation["label"] = relation.label
+        Parameters
+        ----------
+        relation : Relation
+            The relation to serialise.
+        doc_registry : DocRegistry, optional
+            The registry assigning the indices of the corpus occurrences documents,
+            by default None. If given, the corpus occurrences offsets are serialised.
 
-            lrs = [
-                {
-                    "label": lr.label,
-                    "co_texts": list({co.text for co in lr.corpus_occurrences}),
-                }
-                for lr in relation.linguistic_realisations
-            ]
+        Returns
+        -------
+        dict[str]
+            The serialised relation JSON-like object.
+        """
+        new_relation = {
+            "source_concept_id": (
+                id(relation.source_concept) if relation.source_concept else None
+            ),
+            "destination_concept_id": (
+                id(relation.destination_concept)
+                if relation.destination_concept
+                else None
+            ),
+        }
 
-            new_relation["lrs"] = lrs
+        new_relation["label"] = relation.label
 
-            relations_list.append(new_relation)
+        new_relation["lrs"] = self.get_lrs_json(
+            relation.linguistic_realisations, doc_registry
+        )
 
-        return relations_list
+        return new_relation
 
     def build_cos_from_strings(
         self,
@@ -372,15 +853,219 @@ class KRJSONSerialiser:
             The set of corpus occurrences.
         """
 
-        phrase_matcher = PhraseMatcher(spacy_model.vocab, attr="LOWER")
+        cos_index = self.build_cos_index_from_strings(
+            co_texts=co_texts, spacy_model=spacy_model, docs=docs
+        )
+        return set().union(*cos_index.values())
 
-        for label in co_texts:
-            phrase_matcher.add(label, [spacy_model(label)])
+    def build_cos_index_from_strings(
+        self,
+        co_texts: Iterable[str],
+        spacy_model: spacy.language.Language,
+        docs: list[spacy.tokens.Doc],
+    ) -> dict[str, set[spacy.tokens.Span]]:
+        """Index the corpus occurrences of a set of strings in a corpus.
 
-        corpus_occurrences = set()
+        A single phrase matcher is built for all the strings and each document is
+        scanned once, the matches being distributed back to the strings they realise.
+
+        Parameters
+        ----------
+        co_texts : Iterable[str]
+            The strings to use for corpus occurrences extraction.
+        spacy_model : spacy.language.Language
+            The spaCy model to retrieve the corpus occurrences.
+        docs : list[spacy.tokens.Doc]
+            The corpus in which to find the corpus occurrences.
+
+        Returns
+        -------
+        dict[str, set[spacy.tokens.Span]]
+            The corpus occurrences of each string.
+        """
+        cos_index = {co_text: set() for co_text in co_texts}
+        if not cos_index:
+            return cos_index
+
+        phrase_matcher = build_phrase_matcher(
+            spacy_model, {co_text: [co_text] for co_text in cos_index}, cache=False
+        )
 
         for doc in docs:
-            matches = phrase_matcher(doc, as_spans=True)
-            corpus_occurrences.update(set(matches))
+            for match in phrase_matcher(doc, as_spans=True):
+                cos_index[match.label_].add(match)
+
+        return cos_index
+
+
+class KRMsgpackSerialiser(KRJSONSerialiser):
+    """Binary serialiser for KR objects.
+
+    The KR serialisation format is the one of the KRJSONSerialiser, written in msgpack
+    for faster saving and loading of large knowledge representations.
+    """
+
+    def _write_kr_json(self, kr_json: dict[str, Any], file_path: PathLike) -> None:
+        """Write the KR serialisation into a msgpack file.
+
+        Parameters
+        ----------
+        kr_json : dict[str, Any]
+            The KR JSON serialisation.
+        file_path : PathLike
+            The path to the file to save the serialised KR object.
+        """
+        srsly.write_msgpack(file_path, kr_json)
+
+    def _read_kr_json(self, file_path: PathLike) -> dict[str, Any]:
+        """Read the KR serialisation from a msgpack file.
 
-        return corpus_occurrences
+        Parameters
+        ----------
+        file_path : PathLike
+            The path to the file containing the serialised KR object.
+
+        Returns
+        -------
+        dict[str, Any]
+            The KR JSON serialisation.
+        """
+        return srsly.read_msgpack(file_path)
+
+
+class KRJSONLinesSerialiser(KRJSONSerialiser):
+    """Streaming JSON Lines serialiser for KR objects.
+
+    The KR serialisation format is the one of the KRJSONSerialiser, written incrementally:
+    a header line with the format version and the corpus fingerprint is followed by one
+    line per concept, relation and metarelation, concepts first.
+    The RDF graph is written in a turtle side file next to the JSON Lines file.
+    Serialising and loading never hold the whole KR serialisation in memory.
+    """
+
+    def get_rdf_graph_path(self, file_path: PathLike) -> Path:
+        """Return the path of the RDF graph side file of a KR serialisation.
+
+        Parameters
+        ----------
+        file_path : PathLike
+            The path to the JSON Lines file of the serialised KR object.
+
+        Returns
+        -------
+        Path
+            The path to the turtle file of the RDF graph.
+        """
+        return Path(file_path).with_suffix(".ttl")
+
+    def serialise(self, kr: KnowledgeRepresentation, file_path: PathLike) -> None:
+        """Serialise the KR object into a JSON Lines file and a turtle RDF graph file.
+
+        Parameters
+        ----------
+        kr : KnowledgeRepresentation
+            The KR object to serialise.
+        file_path : PathLike
+            The path to the file to save the serialised KR object.
+        """
+        doc_registry = DocRegistry()
+        for kr_element in chain(kr.concepts, kr.relations, kr.metarelations):
+            for lr in kr_element.linguistic_realisations:
+                for co in lr.corpus_occurrences:
+                    self.get_co_offsets(co, doc_registry)
+
+        rdf_graph_path = None
+        if len(kr.rdf_graph):
+            rdf_graph_path = self.get_rdf_graph_path(file_path)
+            kr.rdf_graph.serialize(destination=rdf_graph_path, format="ttl")
+
+        header = {
+            "type": "header",
+            "format_version": KR_FORMAT_VERSION,
+            "corpus_fingerprint": self.get_corpus_fingerprint(doc_registry.docs),
+            "rdf_graph": rdf_graph_path.name if rdf_graph_path is not None else None,
+        }
+        kr_lines = chain(
+            [header],
+            (
+                {"type": "concept", **self.get_concept_json(concept, doc_registry)}
+                for concept in kr.concepts
+            ),
+            (
+                {"type": "relation", **self.get_relation_json(relation, doc_registry)}
+                for relation in kr.relations
+            ),
+            (
+                {
+                    "type": "metarelation",
+                    **self.get_metarelation_json(meta, doc_registry),
+                }
+                for meta in kr.metarelations
+            ),
+        )
+        srsly.write_jsonl(file_path, kr_lines)
+
+    def load(self, pipeline: Pipeline, file_path: PathLike) -> None:
+        """Load a KR object from a JSON Lines serialisation.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to use when loading the KR.
+            It is used to access the corpus and spacy model
+            to reconstruct the linguistic realisations.
+        file_path : PathLike
+            The path to the file containing the JSON Lines serialised KR object.
+        """
+        kr_lines = srsly.read_jsonl(file_path)
+        header = next(kr_lines)
+
+        cos_index = None
+        docs = self.get_docs_from_fingerprint(
+            header["corpus_fingerprint"], pipeline.corpus
+        )
+        if docs is None:
+            logger.warning(
+                "The KR corpus fingerprint does not match the pipeline corpus. "
+                "Corpus occurrences are retrieved by matching their texts."
+            )
+            cos_index = self.build_cos_index_from_strings(
+                co_texts=self.get_co_texts_from_json(srsly.read_jsonl(file_path)),
+                spacy_model=pipeline.spacy_model,
+                docs=pipeline.corpus,
+            )
+
+        concepts_index = {}
+        concepts = set()
+        relations = set()
+        metarelations = set()
+        for kr_element_json in kr_lines:
+            if kr_element_json["type"] == "concept":
+                concepts.add(
+                    self.load_concept_from_json(
+                        kr_element_json, concepts_index, cos_index=cos_index, docs=docs
+                    )
+                )
+            elif kr_element_json["type"] == "relation":
+                relations.add(
+                    self.load_relation_from_json(
+                        kr_element_json, concepts_index, cos_index=cos_index, docs=docs
+                    )
+                )
+            elif kr_element_json["type"] == "metarelation":
+                metarelations.add(
+                    self.load_metarelation_from_json(
+                        kr_element_json, concepts_index, cos_index=cos_index, docs=docs
+                    )
+                )
+
+        rdf_graph = Graph()
+        if header["rdf_graph"] is not None:
+            rdf_graph.parse(Path(file_path).parent / header["rdf_graph"], format="ttl")
+
+        pipeline.kr = KnowledgeRepresentation(
+            concepts=concepts,
+            relations=relations,
+            metarelations=metarelations,
+            rdf_graph=rdf_graph,
+        )
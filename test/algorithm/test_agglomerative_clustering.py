@@ -2,6 +2,7 @@ from typing import List
 from olaf.algorithm import AgglomerativeClustering
 
 import pytest
+from sklearn.datasets import make_blobs
 
 @pytest.fixture(scope="session")
 def agglo_clustering_test_data() -> List[List[int]]:
@@ -21,3 +22,29 @@ def test_agglomerative_clustering_computation(agglo_clustering_test_data, agglo_
     agglo_clustering.compute_agglomerative_clustering()
     assert len(agglo_clustering.clustering_labels) == len(agglo_clustering_expected_output)
     assert all([a == b for a, b in zip(agglo_clustering.clustering_labels, agglo_clustering_expected_output)])
+
+def same_partition(labels: List[int], other_labels: List[int]) -> bool:
+    return len(set(zip(labels, other_labels))) == len(set(labels)) == len(set(other_labels))
+
+def test_agglomeratice_clustering_wrong_engine(agglo_clustering_test_data):
+    with pytest.raises(AttributeError):
+        AgglomerativeClustering(agglo_clustering_test_data, engine="spectral")
+
+def test_agglomeratice_clustering_two_stage_too_many_clusters(agglo_clustering_test_data):
+    with pytest.raises(AttributeError):
+        AgglomerativeClustering(agglo_clustering_test_data, nb_clusters=10, engine="two_stage", nb_centroids=5)
+
+@pytest.mark.parametrize("engine", ["knn_graph", "two_stage"])
+def test_agglomerative_clustering_engines_computation(engine, agglo_clustering_test_data, agglo_clustering_expected_output):
+    agglo_clustering = AgglomerativeClustering(agglo_clustering_test_data, engine=engine)
+    agglo_clustering.compute_agglomerative_clustering()
+    assert same_partition(agglo_clustering.clustering_labels, agglo_clustering_expected_output)
+
+@pytest.mark.parametrize("engine", ["exact", "knn_graph", "two_stage"])
+def test_agglomerative_clustering_engines_distance_threshold(engine):
+    points, blobs = make_blobs(300, n_features=8, centers=3, random_state=0)
+    agglo_clustering = AgglomerativeClustering(
+        points, nb_clusters=None, distance_threshold=0.5, engine=engine, nb_neighbours=5, nb_centroids=30
+    )
+    agglo_clustering.compute_agglomerative_clustering()
+    assert same_partition(agglo_clustering.clustering_labels, blobs)
@@ -3,7 +3,8 @@ from typing import Dict, List, Tuple
 
 import pytest
 
-from olaf.algorithm import Cvalue
+from olaf.algorithm import Cvalue, VectorisedCvalue
+from olaf.algorithm.c_value import count_terms_string_tokens, merge_terms_counters
 
 
 @pytest.fixture(scope="module")
@@ -155,6 +156,33 @@ class TestCvalueExtractAndCountTermsStringTokens:
                      ) in my_c_value._terms_string_tokens
 
 
+class TestCvalueShardedCounting:
+
+    def test_merge_terms_counters(self, dummy_corpus_terms) -> None:
+        shards = [dummy_corpus_terms[i:i + 100]
+                  for i in range(0, len(dummy_corpus_terms), 100)]
+        merged_terms_counter = merge_terms_counters(
+            count_terms_string_tokens(shard, 5) for shard in shards
+        )
+        terms_counter = count_terms_string_tokens(dummy_corpus_terms, 5)
+
+        assert list(merged_terms_counter.items()) == list(terms_counter.items())
+
+    def test_multi_process_c_values(self, dummy_corpus_terms, my_c_value_computed) -> None:
+        multi_process_c_value = Cvalue(
+            corpus_terms=dummy_corpus_terms,
+            max_term_token_length=5,
+            n_process=2,
+            shard_size=100
+        )
+
+        assert multi_process_c_value._terms_string_tokens == my_c_value_computed._terms_string_tokens
+
+        multi_process_c_value.compute_c_values()
+
+        assert multi_process_c_value.c_values == my_c_value_computed.c_values
+
+
 class TestCvalueOrderTermsStringTokens:
     def test_order_terms_string_tokens_token_length_order(self, my_c_value) -> None:
         substrings_token_lengths = [
@@ -230,3 +258,54 @@ class TestCvalueComputation:
         ordered_c_terms = tuple([c_val[1]
                                 for c_val in my_c_value_computed.c_values])
         assert my_c_value_computed.candidate_terms == ordered_c_terms
+
+
+class TestVectorisedCvalue:
+
+    @pytest.fixture(scope="class")
+    def corpus_terms(self, dummy_corpus_terms) -> List[str]:
+        return dummy_corpus_terms + [
+            "THE BASAL CELL CARCINOMA OF THE SKIN",
+            "CELL CARCINOMA OF THE SKIN",
+            "BASAL CELL",
+            "SKIN",
+        ]
+
+    @pytest.mark.parametrize("max_token_length", [None, 2, 3, 5])
+    @pytest.mark.parametrize("stop_list", [set(), {"THE", "OF"}])
+    @pytest.mark.parametrize("threshold", [0.0, 5.0])
+    def test_same_c_values(self, corpus_terms, max_token_length, stop_list, threshold) -> None:
+        c_value = Cvalue(
+            corpus_terms=corpus_terms,
+            max_term_token_length=max_token_length,
+            stop_list=stop_list,
+            c_value_threshold=threshold
+        )
+        vectorised_c_value = VectorisedCvalue(
+            corpus_terms=corpus_terms,
+            max_term_token_length=max_token_length,
+            stop_list=stop_list,
+            c_value_threshold=threshold
+        )
+
+        assert vectorised_c_value._terms_counter == c_value._terms_counter
+        assert vectorised_c_value._terms_string_tokens == c_value._terms_string_tokens
+
+        c_value.compute_c_values()
+        vectorised_c_value.compute_c_values()
+
+        assert vectorised_c_value.c_values == c_value.c_values
+        assert vectorised_c_value.candidate_terms == c_value.candidate_terms
+
+    def test_c_values(self, dummy_corpus_terms, c_value_expected_scores) -> None:
+        vectorised_c_value = VectorisedCvalue(
+            corpus_terms=dummy_corpus_terms,
+            max_term_token_length=5
+        )
+        vectorised_c_value.compute_c_values()
+
+        for c_val_tuple in vectorised_c_value.c_values:
+            if c_value_expected_scores.get(c_val_tuple[1]) is not None:
+                assert c_value_expected_scores.get(
+                    c_val_tuple[1]) == round(c_val_tuple[0], 4)
+
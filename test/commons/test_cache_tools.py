@@ -0,0 +1,46 @@
+from olaf.commons.cache_tools import LRUCache
+
+
+def test_lru_cache_get_or_compute() -> None:
+    computed_keys = []
+
+    def compute(key: str):
+        computed_keys.append(key)
+        return key.upper()
+
+    cache = LRUCache()
+
+    assert cache.get_or_compute("pizza", lambda: compute("pizza")) == "PIZZA"
+    assert cache.get_or_compute("pizza", lambda: compute("pizza")) == "PIZZA"
+    assert computed_keys == ["pizza"]
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_eviction() -> None:
+    cache = LRUCache(max_size=2)
+    cache.get_or_compute("pizza", lambda: 1)
+    cache.get_or_compute("cheese", lambda: 2)
+    cache.get_or_compute("pizza", lambda: 3)
+    cache.get_or_compute("tomato", lambda: 4)
+
+    assert len(cache) == 2
+    assert cache.get_or_compute("pizza", lambda: 5) == 1
+    assert cache.get_or_compute("cheese", lambda: 6) == 6
+
+
+def test_lru_cache_get_and_put() -> None:
+    cache = LRUCache(max_size=2)
+    cache.put("pizza", 1)
+    cache.put("cheese", 2)
+    cache.put("pizza", 3)
+
+    assert cache.get("pizza") == 3
+    assert cache.get("tomato") is None
+    assert cache.get("tomato", 0) == 0
+
+    cache.put("tomato", 4)
+    assert len(cache) == 2
+    assert cache.get("cheese") is None
@@ -4,6 +4,7 @@ import pytest
 import spacy.tokens
 
 from olaf.commons.candidate_term_tools import (
+    add_cts_to_concepts,
     build_cts_from_strings,
     check_ct_belongs_to_group,
     cts_have_common_synonyms,
@@ -12,10 +13,13 @@ from olaf.commons.candidate_term_tools import (
     filter_cts_on_last_token_in_term,
     filter_cts_on_token_in_term,
     group_cts_on_synonyms,
+    merge_concepts,
     split_cts_on_token,
 )
-from olaf.data_container.candidate_term_schema import CandidateTerm
+from olaf.data_container.candidate_term_schema import CandidateRelation, CandidateTerm
+from olaf.data_container.concept_schema import Concept
 from olaf.data_container.enrichment_schema import Enrichment
+from olaf.data_container.linguistic_realisation_schema import ConceptLR
 
 
 @pytest.fixture(scope="session")
@@ -304,6 +308,56 @@ def test_group_ct_on_synonyms(set_candidates):
             assert all(conditions)
 
 
+def test_group_ct_on_synonyms_connected_components() -> None:
+    candidate_terms = [
+        CandidateTerm(
+            label=f"term_{i}",
+            corpus_occurrences=set(),
+            enrichment=Enrichment({f"synonym_{i % 7}", f"synonym_{(i * i) % 11}"})
+            if i % 3
+            else None,
+        )
+        for i in range(40)
+    ]
+    candidate_terms.append(
+        CandidateTerm(label="term_0", corpus_occurrences=set()),
+    )
+
+    groups = group_cts_on_synonyms(set(candidate_terms))
+
+    # Reference groups: connected components of the pairs of terms with common synonyms.
+    expected_groups = []
+    for ct in candidate_terms:
+        linked_groups = [
+            group
+            for group in expected_groups
+            if any(cts_have_common_synonyms(ct, group_ct) for group_ct in group)
+        ]
+        new_group = {ct}
+        for group in linked_groups:
+            expected_groups.remove(group)
+            new_group.update(group)
+        expected_groups.append(new_group)
+
+    assert set(map(frozenset, groups)) == set(map(frozenset, expected_groups))
+
+
+def test_group_crs_on_synonyms_and_concepts() -> None:
+    pizza, cheese = Concept("pizza"), Concept("cheese")
+    candidate_relations = {
+        CandidateRelation("has", set(), pizza, cheese),
+        CandidateRelation("contains", set(), pizza, cheese, Enrichment({"has"})),
+        CandidateRelation("has", set(), cheese, pizza),
+        CandidateRelation("has", set(), None, None),
+    }
+
+    groups = group_cts_on_synonyms(candidate_relations)
+
+    assert sorted(len(group) for group in groups) == [1, 1, 2]
+    for group in groups:
+        assert len({(cr.source_concept, cr.destination_concept) for cr in group}) == 1
+
+
 def test_check_ct_belongs_to_group(
     candidate_term_bike,
     candidate_term_bicycle,
@@ -399,3 +453,57 @@ def test_split_cts_on_token(
 
     assert len(cts) == 6
     assert len(cts_index["bike"].corpus_occurrences) == 2
+
+
+def test_add_cts_to_concepts(en_sm_spacy_model) -> None:
+    doc = en_sm_spacy_model("My bicycle is a bike and I drink wine.")
+    bike = Concept(
+        label="bike",
+        linguistic_realisations={
+            ConceptLR(label="bike"),
+            ConceptLR(label="bicycle", corpus_occurrences={doc[1:2]}),
+        },
+    )
+    cts = {
+        CandidateTerm(label="bicycle", corpus_occurrences={doc[1:2]}),
+        CandidateTerm(label="bike", corpus_occurrences={doc[4:5]}),
+        CandidateTerm(label="wine", corpus_occurrences={doc[8:9]}),
+    }
+
+    unmatched_cts = add_cts_to_concepts(cts, {bike})
+
+    assert {ct.label for ct in unmatched_cts} == {"wine"}
+    lrs_index = {lr.label: lr for lr in bike.linguistic_realisations}
+    assert len(lrs_index) == 2
+    assert len(lrs_index["bicycle"].corpus_occurrences) == 1
+    assert len(lrs_index["bike"].corpus_occurrences) == 1
+
+
+def test_merge_concepts(en_sm_spacy_model) -> None:
+    doc = en_sm_spacy_model("A bike, a bicycle and some wine.")
+    bike = Concept(
+        label="bike",
+        linguistic_realisations={ConceptLR(label="bike")},
+        external_uids={"bike_uid"},
+    )
+    concepts = {bike}
+    new_concepts = {
+        Concept(
+            label="bike",
+            linguistic_realisations={
+                ConceptLR(label="bike", corpus_occurrences={doc[1:2]}),
+                ConceptLR(label="bicycle", corpus_occurrences={doc[4:5]}),
+            },
+            external_uids={"bicycle_uid"},
+        ),
+        Concept(label="wine", linguistic_realisations={ConceptLR(label="wine")}),
+    }
+
+    merge_concepts(concepts, new_concepts)
+
+    assert sorted(concept.label for concept in concepts) == ["bike", "wine"]
+    assert bike in concepts
+    assert bike.external_uids == {"bike_uid", "bicycle_uid"}
+    lrs_index = {lr.label: lr for lr in bike.linguistic_realisations}
+    assert set(lrs_index) == {"bike", "bicycle"}
+    assert len(lrs_index["bike"].corpus_occurrences) == 1
@@ -0,0 +1,85 @@
+import os
+import tempfile
+from typing import List
+
+import numpy as np
+import pytest
+
+from olaf.commons.embedding_tools import (
+    EmbeddingCache,
+    register_sbert_model,
+    sbert_embeddings,
+)
+
+
+class CountingEncoder:
+    """Deterministic encoder keeping track of the texts it encodes."""
+
+    def __init__(self) -> None:
+        self.encoded_texts = []
+
+    def encode(
+        self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True
+    ) -> np.ndarray:
+        self.encoded_texts.extend(texts)
+        return np.array(
+            [[len(text), text.count("a") + 1.0] for text in texts], dtype=np.float32
+        )
+
+
+@pytest.fixture
+def counting_encoder() -> CountingEncoder:
+    encoder = CountingEncoder()
+    register_sbert_model("counting-encoder", encoder)
+    return encoder
+
+
+def test_sbert_embeddings_cache(counting_encoder) -> None:
+    embedding_cache = EmbeddingCache()
+    texts = ["pizza", "cheese", "pizza"]
+
+    embeddings = sbert_embeddings(
+        "counting-encoder", texts, embedding_cache=embedding_cache
+    )
+    cached_embeddings = sbert_embeddings(
+        "counting-encoder", ["cheese", "pizza", "tomato"], embedding_cache=embedding_cache
+    )
+
+    assert embeddings.shape == (3, 2)
+    np.testing.assert_array_equal(embeddings[0], embeddings[2])
+    np.testing.assert_array_equal(cached_embeddings[:2], embeddings[[1, 0]])
+    assert counting_encoder.encoded_texts == ["pizza", "cheese", "tomato"]
+
+
+def test_sbert_embeddings_normalise(counting_encoder) -> None:
+    embeddings = sbert_embeddings(
+        "counting-encoder",
+        ["pizza", "cheese"],
+        normalise=True,
+        embedding_cache=EmbeddingCache(),
+    )
+
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-6)
+
+
+def test_embedding_cache_eviction() -> None:
+    embedding_cache = EmbeddingCache(max_size=2)
+    embedding_cache.put("model", {"pizza": np.ones(2), "cheese": np.zeros(2)})
+    embedding_cache.get("model", ["pizza"])
+    embedding_cache.put("model", {"tomato": np.ones(2)})
+
+    assert len(embedding_cache) == 2
+    assert set(embedding_cache.get("model", ["pizza", "cheese", "tomato"])) == {
+        "pizza",
+        "tomato",
+    }
+
+
+def test_embedding_cache_persistence() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "embeddings.sqlite")
+        EmbeddingCache(cache_path).put("model", {"pizza": np.array([1.0, 2.0])})
+
+        embeddings = EmbeddingCache(cache_path).get("model", ["pizza"])
+
+    np.testing.assert_array_equal(embeddings["pizza"], np.array([1.0, 2.0]))
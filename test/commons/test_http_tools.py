@@ -0,0 +1,41 @@
+import os
+import tempfile
+import time
+
+from olaf.commons.http_tools import ResponseCache
+
+
+def test_response_cache_get_put() -> None:
+    cache = ResponseCache()
+    cache.put("http://api/pizza", {"edges": ["cheese"]})
+
+    assert cache.get("http://api/pizza") == {"edges": ["cheese"]}
+    assert cache.get("http://api/tomato") is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_response_cache_max_size() -> None:
+    cache = ResponseCache(max_size=50)
+    for index in range(3 * ResponseCache.PURGE_INTERVAL):
+        cache.put(f"http://api/{index}", {"index": index})
+
+    assert len(cache) == 50
+    assert cache.get(f"http://api/{3 * ResponseCache.PURGE_INTERVAL - 1}") == {
+        "index": 3 * ResponseCache.PURGE_INTERVAL - 1
+    }
+    assert cache.get("http://api/0") is None
+
+
+def test_response_cache_purge_expired() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "responses.sqlite")
+        cache = ResponseCache(cache_path=cache_path, ttl=0.01)
+        cache.put("http://api/pizza", {"edges": []})
+        time.sleep(0.05)
+
+        assert cache.get("http://api/pizza") is None
+        assert len(cache) == 1
+        assert len(ResponseCache(cache_path=cache_path, ttl=0.01)) == 0
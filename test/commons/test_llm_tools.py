@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Any, Iterator
+
+import pytest
+
+from olaf.commons.llm_tools import (
+    LLMGenerator,
+    LLMRequestExecutor,
+    RateLimiter,
+    get_provider_rate_limiter,
+)
+
+
+class MockLatencyLLMGenerator(LLMGenerator):
+    """Generator answering the prompt in upper case after a network-like latency."""
+
+    def __init__(self, latency: float = 0.05) -> None:
+        self.latency = latency
+        self.nb_running = 0
+        self.max_nb_running = 0
+        self._lock = threading.Lock()
+
+    def check_resources(self) -> None:
+        pass
+
+    def generate_text(self, prompt: Any) -> str:
+        with self._lock:
+            self.nb_running += 1
+            self.max_nb_running = max(self.max_nb_running, self.nb_running)
+        # Prompts of varying lengths answer in varying order, to check the results order.
+        time.sleep(self.latency * (3 - len(prompt) % 3) / 3)
+        with self._lock:
+            self.nb_running -= 1
+        if prompt == "error":
+            raise ConnectionError("Connection lost.")
+        return prompt.upper()
+
+
+class MockRateLimitedLLMGenerator(MockLatencyLLMGenerator):
+    max_requests_per_minute = 600
+
+
+def test_generate_texts() -> None:
+    generator = MockLatencyLLMGenerator()
+    executor = LLMRequestExecutor(generator, max_workers=4)
+    items = [f"doc {index}" * (index % 3 + 1) for index in range(20)]
+
+    start = time.perf_counter()
+    results = list(executor.generate_texts(items, lambda item: item))
+    run_time = time.perf_counter() - start
+
+    assert results == [(item, item.upper()) for item in items]
+    assert 1 < generator.max_nb_running <= 4
+    assert run_time < len(items) * generator.latency / 3
+
+
+def test_generate_texts_error_isolation() -> None:
+    executor = LLMRequestExecutor(MockLatencyLLMGenerator(), max_workers=2)
+
+    results = list(
+        executor.generate_texts(["pizza", "error", "cheese"], lambda item: item)
+    )
+
+    assert results == [("pizza", "PIZZA"), ("error", ""), ("cheese", "CHEESE")]
+
+
+def test_generate_texts_lazy() -> None:
+    consumed_items = []
+
+    def items() -> Iterator[str]:
+        for index in range(100):
+            consumed_items.append(index)
+            yield f"doc {index}"
+
+    executor = LLMRequestExecutor(MockLatencyLLMGenerator(latency=0), max_workers=2)
+    texts = executor.generate_texts(items(), lambda item: item)
+
+    assert next(texts) == ("doc 0", "DOC 0")
+    assert len(consumed_items) <= 4
+    assert len(list(texts)) == 99
+
+
+def test_rate_limit() -> None:
+    rate_limiter = RateLimiter(max_requests_per_minute=1200)
+
+    start = time.perf_counter()
+    for _ in range(5):
+        rate_limiter.acquire()
+
+    assert time.perf_counter() - start >= 4 * 0.05
+
+
+def test_provider_rate_limit() -> None:
+    generator = MockRateLimitedLLMGenerator(latency=0)
+    executors = [LLMRequestExecutor(generator, max_workers=4) for _ in range(2)]
+
+    assert executors[0]._rate_limiter is executors[1]._rate_limiter
+    assert executors[0]._rate_limiter is get_provider_rate_limiter(
+        "MockRateLimitedLLMGenerator", 600
+    )
+    assert LLMRequestExecutor(MockLatencyLLMGenerator())._rate_limiter is None
+
+    start = time.perf_counter()
+    for executor in executors:
+        list(executor.generate_texts(["pizza", "cheese", "tomato"], lambda item: item))
+
+    assert time.perf_counter() - start >= 5 * 0.1
+
+
+@pytest.mark.parametrize("max_workers", [0, None, 2.5])
+def test_default_params_options(max_workers) -> None:
+    executor = LLMRequestExecutor(
+        MockLatencyLLMGenerator(),
+        max_workers=max_workers,
+        max_requests_per_minute=-1,
+    )
+
+    assert executor.max_workers == 4
+    assert executor.max_requests_per_minute is None
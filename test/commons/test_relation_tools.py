@@ -2,10 +2,14 @@ from typing import Set
 
 import pytest
 
-from olaf.commons.relation_tools import crs_to_relation, cts_to_crs
+from olaf.commons.relation_tools import crs_to_relation, cts_to_crs, merge_relations
 from olaf.data_container.candidate_term_schema import CandidateRelation, CandidateTerm
 from olaf.data_container.concept_schema import Concept
-from olaf.data_container.linguistic_realisation_schema import LinguisticRealisation
+from olaf.data_container.linguistic_realisation_schema import (
+    LinguisticRealisation,
+    RelationLR,
+)
+from olaf.data_container.relation_schema import Relation
 
 
 @pytest.fixture(scope="session")
@@ -143,3 +147,42 @@ def test_cts_to_crs_pairs(
     for cr in crs:
         assert cr.destination_concept.label == "mouse"
         assert cr.source_concept.label == "cat" or cr.source_concept.label == "dog"
+
+
+def test_merge_relations(c_cat, c_mouse, en_sm_spacy_model) -> None:
+    doc = en_sm_spacy_model("The cat eats the mouse and the cat hunts the mouse.")
+    eat = Relation(
+        label="eat",
+        source_concept=c_cat,
+        destination_concept=c_mouse,
+        linguistic_realisations={
+            RelationLR(
+                label="eats", corpus_occurrences={(doc[1:2], doc[2:3], doc[4:5])}
+            )
+        },
+    )
+    relations = {eat}
+    new_relations = {
+        Relation(
+            label="eat",
+            source_concept=c_cat,
+            destination_concept=c_mouse,
+            linguistic_realisations={
+                RelationLR(
+                    label="eats", corpus_occurrences={(doc[7:8], doc[8:9], doc[10:11])}
+                ),
+                RelationLR(label="devours"),
+            },
+            external_uids={"eat_uid"},
+        ),
+        Relation(label="eat", source_concept=c_mouse, destination_concept=c_cat),
+    }
+
+    merge_relations(relations, new_relations)
+
+    assert len(relations) == 2
+    assert eat in relations
+    assert eat.external_uids == {"eat_uid"}
+    lrs_index = {lr.label: lr for lr in eat.linguistic_realisations}
+    assert set(lrs_index) == {"eats", "devours"}
+    assert len(lrs_index["eats"].corpus_occurrences) == 2
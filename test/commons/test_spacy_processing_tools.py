@@ -3,6 +3,8 @@ from typing import List
 import pytest
 
 from olaf.commons.spacy_processing_tools import (
+    build_phrase_matcher,
+    clear_phrase_matcher_cache,
     is_not_num,
     is_not_punct,
     is_not_stopword,
@@ -119,3 +121,33 @@ def test_spans_overlap(en_sm_spacy_model, raw_corpus) -> None:
     assert spans_overlap(inner_span, span3)
     assert not spans_overlap(span1, inner_span)
     assert not spans_overlap(inner_span, span1)
+
+
+def test_build_phrase_matcher(en_sm_spacy_model) -> None:
+    label_strings_map = {"pizza": ["Pizza", "margherita pizza"], "beer": ["beer"]}
+    matcher = build_phrase_matcher(en_sm_spacy_model, label_strings_map)
+
+    doc = en_sm_spacy_model("A Margherita pizza and a BEER.")
+    matches = {
+        (span.label_, span.text) for span in matcher(doc, as_spans=True)
+    }
+
+    assert matches == {
+        ("pizza", "Margherita pizza"),
+        ("pizza", "pizza"),
+        ("beer", "BEER"),
+    }
+    assert (
+        build_phrase_matcher(
+            en_sm_spacy_model, {"beer": {"beer"}, "pizza": ("margherita pizza", "Pizza")}
+        )
+        is matcher
+    )
+    assert build_phrase_matcher(en_sm_spacy_model, {"beer": ["beer"]}) is not matcher
+    assert (
+        build_phrase_matcher(en_sm_spacy_model, label_strings_map, cache=False)
+        is not matcher
+    )
+
+    clear_phrase_matcher_cache()
+    assert build_phrase_matcher(en_sm_spacy_model, label_strings_map) is not matcher
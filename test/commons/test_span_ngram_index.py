@@ -0,0 +1,123 @@
+from typing import List
+
+import pytest
+import spacy.tokens
+
+from olaf.commons.span_ngram_index import (
+    SpanNgramIndex,
+    build_span_ngram_index,
+    iter_token_sequences,
+)
+from olaf.commons.spacy_processing_tools import (
+    lower_token_texts,
+    spacy_span_ngrams,
+    token_texts,
+)
+
+
+@pytest.fixture(scope="module")
+def corpus(en_sm_spacy_model) -> List[spacy.tokens.Doc]:
+    texts = [
+        "The cheesy pizza is a cheesy delight.",
+        "A cheesy pizza with tomato sauce.",
+    ]
+    return [en_sm_spacy_model(text) for text in texts]
+
+
+@pytest.fixture(scope="module")
+def span_ngram_index(corpus) -> SpanNgramIndex:
+    index = SpanNgramIndex(
+        gram_sizes=lambda sequence_length: range(1, min(3, sequence_length) + 1)
+    )
+    for doc in corpus:
+        index.add_token_sequence(doc[1:-1])
+    return index
+
+
+def test_index_matches_span_ngrams(span_ngram_index, corpus) -> None:
+    expected_index = {}
+    for doc in corpus:
+        for gram_size in range(1, 4):
+            for span in spacy_span_ngrams(doc[1:-1], gram_size):
+                expected_index.setdefault(span.text, []).append(span)
+
+    assert dict(span_ngram_index) == expected_index
+
+
+def test_occurrence_triples(span_ngram_index) -> None:
+    assert span_ngram_index.get_occurrence_triples("cheesy pizza") == [
+        (0, 1, 3),
+        (1, 1, 3),
+    ]
+    assert span_ngram_index.get_occurrence_triples("missing") == []
+    assert "missing" not in span_ngram_index
+    with pytest.raises(KeyError):
+        span_ngram_index["missing"]
+
+
+def test_extend(span_ngram_index, corpus) -> None:
+    index = SpanNgramIndex(
+        gram_sizes=lambda sequence_length: range(1, min(3, sequence_length) + 1)
+    )
+    index.add_token_sequence(corpus[1][1:-1])
+    index["cheesy"]
+
+    other_index = SpanNgramIndex()
+    other_index.add_token_sequence(corpus[0][1:-1], ["x"] * 6)
+    other_index.add("cheesy", corpus[0], 5, 6)
+    index.extend(other_index)
+
+    assert index.doc_registry.docs == [corpus[1], corpus[0]]
+    assert index.get_occurrence_triples("cheesy") == [(0, 1, 2), (1, 5, 6)]
+    assert len(index["x x x x x x"]) == 1
+    assert index["x x x x x x"][0].text == "cheesy pizza is a cheesy delight"
+
+
+def test_build_span_ngram_index(corpus) -> None:
+    index = build_span_ngram_index(iter_token_sequences(corpus), 3, token_texts)
+    unaligned_index = build_span_ngram_index(
+        iter_token_sequences(corpus),
+        3,
+        lambda span: [" ".join(token.text for token in span)],
+    )
+
+    assert index.doc_registry.docs == corpus
+    assert set(index) == set(unaligned_index)
+    assert index.get_occurrence_triples("cheesy pizza") == [(0, 1, 3), (1, 1, 3)]
+    assert len(index["."]) == 2
+    assert "pizza with tomato sauce" not in index
+
+    filtered_index = build_span_ngram_index(
+        iter_token_sequences(corpus), 3, token_texts, terms={"cheesy pizza", "missing"}
+    )
+    assert list(filtered_index) == ["cheesy pizza"]
+    assert filtered_index.get_occurrence_triples("cheesy pizza") == [
+        (0, 1, 3),
+        (1, 1, 3),
+    ]
+
+
+def test_view(en_sm_spacy_model) -> None:
+    corpus = [
+        en_sm_spacy_model("The Cheesy pizza is a cheesy  delight."),
+        en_sm_spacy_model("A cheesy Pizza with tomato sauce."),
+    ]
+    index = build_span_ngram_index(iter_token_sequences(corpus), 4, token_texts)
+
+    for max_gram_size in [1, 2, 4]:
+        lower_index = build_span_ngram_index(
+            iter_token_sequences(corpus), max_gram_size, lower_token_texts
+        )
+        lower_view = index.view(max_gram_size=max_gram_size, map_term=str.lower)
+
+        assert lower_view.doc_registry is index.doc_registry
+        assert list(lower_view) == list(lower_index)
+        for term in lower_index:
+            assert lower_view.get_occurrence_triples(
+                term
+            ) == lower_index.get_occurrence_triples(term)
+
+    unigram_view = index.view(max_gram_size=1)
+    assert "Cheesy pizza" not in unigram_view
+    assert unigram_view["Cheesy"] == index["Cheesy"]
+    assert dict(index.view()) == dict(index)
@@ -1,5 +1,8 @@
 import os
+import shutil
+import time
 
+import numpy as np
 import pytest
 from nltk.corpus.reader.wordnet import ADJ as WN_ADJ
 from nltk.corpus.reader.wordnet import ADV as WN_ADV
@@ -7,7 +10,8 @@ from nltk.corpus.reader.wordnet import NOUN as WN_NOUN
 from nltk.corpus.reader.wordnet import VERB as WN_VERB
 
 from olaf.commons.wordnet_tools import (
-    fetch_wordnet_lang, load_enrichment_wordnet_domains_from_file,
+    WordNetDomainIndex, fetch_wordnet_lang,
+    load_enrichment_wordnet_domains_from_file, load_wordnet_domain_index,
     load_wordnet_domains, spacy2wordnet_pos)
 
 
@@ -65,6 +69,49 @@ def test_load_wordnet_domains(sample_wordnet_domains_path) -> None:
     assert wordnet_domains.get("10695192-n") == {"vehicles", "transport"}
 
 
+def test_wordnet_domain_index(sample_wordnet_domains_path) -> None:
+    wordnet_domains = load_wordnet_domains(
+        wordnet_domains_path=sample_wordnet_domains_path
+    )
+    domain_index = WordNetDomainIndex.from_domains_map(wordnet_domains)
+
+    assert len(domain_index) == 16
+    assert dict(domain_index) == wordnet_domains
+    assert set(domain_index.domains) == set().union(*wordnet_domains.values())
+    assert domain_index.get_synset_domains(10695192, "n") == {"vehicles", "transport"}
+    assert domain_index.get_synset_domains(10695192, "v") == set()
+
+    synsets_matches = domain_index.match_synsets_domains(
+        [(4021798, "n"), (1352806, "v"), (10834337, "n"), (1, "n")],
+        domain_index.get_domains_bitset({"hydraulics", "unknown domain"}),
+    )
+    np.testing.assert_array_equal(synsets_matches, [True, True, False, False])
+
+
+def test_load_wordnet_domain_index(sample_wordnet_domains_path) -> None:
+    wordnet_domains_path = os.path.join(
+        os.path.dirname(sample_wordnet_domains_path), "indexed_wordnet_domains.txt"
+    )
+    shutil.copyfile(sample_wordnet_domains_path, wordnet_domains_path)
+    index_path = f"{wordnet_domains_path}.index"
+
+    compiled_index = load_wordnet_domain_index(wordnet_domains_path)
+    loaded_index = load_wordnet_domain_index(wordnet_domains_path)
+
+    assert os.path.isdir(index_path)
+    assert isinstance(loaded_index._domain_bitsets, np.memmap)
+    assert dict(loaded_index) == dict(compiled_index)
+    assert loaded_index["04154152-n"] == {"gas", "mechanics", "nautical"}
+
+    time.sleep(0.01)
+    with open(wordnet_domains_path, "a", encoding="utf8") as file:
+        file.write("00000001-n\tlaw\n")
+    updated_index = load_wordnet_domain_index(wordnet_domains_path)
+
+    assert len(updated_index) == 17
+    assert updated_index["00000001-n"] == {"law"}
+
+
 def test_load_enrichment_wordnet_domains_from_file(sample_domains_path) -> None:
     enrichment_domains = load_enrichment_wordnet_domains_from_file(
         enrichment_domains_path=sample_domains_path
@@ -0,0 +1,85 @@
+from typing import List
+
+import pytest
+import spacy.tokens
+
+from olaf.data_container.span_set_schema import (
+    DocRegistry,
+    SpanSet,
+    compact_corpus_occurrences,
+)
+
+
+@pytest.fixture(scope="module")
+def corpus(en_sm_spacy_model) -> List[spacy.tokens.Doc]:
+    texts = ["I eat pasta and pizza.", "I like cheesy pizza."]
+    return list(en_sm_spacy_model.pipe(texts))
+
+
+@pytest.fixture(scope="function")
+def doc_registry(corpus) -> DocRegistry:
+    return DocRegistry(corpus)
+
+
+def test_doc_registry(corpus, doc_registry) -> None:
+    assert len(doc_registry) == 2
+    assert doc_registry.get_doc_id(corpus[1]) == 1
+    assert doc_registry[0] is corpus[0]
+    assert doc_registry.register(corpus[0]) == 0
+
+
+def test_span_set_behaves_as_set(corpus, doc_registry) -> None:
+    spans = {corpus[0][2:3], corpus[0][4:5], corpus[1][3:4]}
+    span_set = SpanSet(spans, doc_registry)
+
+    assert span_set == spans
+    assert len(span_set) == 3
+    assert corpus[1][3:4] in span_set
+    assert corpus[1][2:4] not in span_set
+    assert "pizza" not in span_set
+
+    span_set.add(corpus[0][4:5])
+    span_set.update({corpus[1][2:4]})
+    span_set.discard(corpus[0][2:3])
+    assert set(span_set) == {corpus[0][4:5], corpus[1][3:4], corpus[1][2:4]}
+    assert all(isinstance(span, spacy.tokens.Span) for span in span_set)
+
+
+def test_span_set_operations(corpus, doc_registry) -> None:
+    spans = {corpus[0][2:3], corpus[0][4:5]}
+    other_spans = {corpus[0][4:5], corpus[1][3:4]}
+    span_set = SpanSet(spans, doc_registry)
+    other_span_set = SpanSet(other_spans, doc_registry)
+
+    assert span_set | other_span_set == spans | other_spans
+    assert span_set & other_span_set == spans & other_spans
+    assert span_set - other_span_set == spans - other_spans
+    assert span_set & other_spans == spans & other_spans
+    assert isinstance(span_set | other_span_set, SpanSet)
+    assert span_set.intersection(SpanSet(doc_registry=doc_registry)) == set()
+    assert list(other_span_set.get_doc_ids()) == [0, 1]
+
+
+def test_span_set_of_span_tuples(corpus, doc_registry) -> None:
+    occurrences = {
+        (corpus[0][2:3], corpus[0][4:5]),
+        (corpus[1][2:3], corpus[1][3:4]),
+    }
+    span_set = SpanSet(occurrences, doc_registry)
+
+    assert span_set.arity == 2
+    assert span_set == occurrences
+    assert (corpus[0][2:3], corpus[0][4:5]) in span_set
+    assert corpus[0][2:3] not in span_set
+    with pytest.raises(TypeError):
+        span_set.add(corpus[0][2:3])
+
+
+def test_compact_corpus_occurrences(corpus, doc_registry) -> None:
+    spans = {corpus[0][2:3]}
+    assert isinstance(compact_corpus_occurrences(spans, doc_registry), SpanSet)
+
+    mixed_occurrences = {corpus[0][2:3], (corpus[0][2:3], None)}
+    assert compact_corpus_occurrences(mixed_occurrences, doc_registry) is (
+        mixed_occurrences
+    )
@@ -1,13 +1,20 @@
-from typing import Any, Dict
+import os
+import tempfile
+from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 
 from olaf import Pipeline
+from olaf.commons.embedding_tools import EmbeddingCache, register_sbert_model
 from olaf.commons.errors import OptionError, ParameterError
 from olaf.data_container import CandidateTerm, KnowledgeRepresentation
 from olaf.pipeline.pipeline_component.concept_relation_extraction import (
     AgglomerativeClusteringConceptExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 
 
 @pytest.fixture(scope="session")
@@ -93,7 +100,27 @@ class TestAgglomerativeClusteringExtractionParameters:
         assert agglo_clustering._linkage == "average"
         assert agglo_clustering._distance_threshold is None
         assert agglo_clustering._embedding_model == "all-mpnet-base-v2"
+        assert agglo_clustering._embedding_batch_size == 32
+        assert agglo_clustering._normalise_embeddings is False
+        assert agglo_clustering._clustering_engine == "exact"
+        assert agglo_clustering._nb_neighbours == 15
+        assert agglo_clustering._nb_centroids == 1000
+        assert agglo_clustering._embedding_cache is None
+
+    def test_embedding_cache_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "embeddings.sqlite")
+            agglo_clustering = AgglomerativeClusteringConceptExtraction(
+                embedding_cache=cache_path
+            )
 
+            assert isinstance(agglo_clustering._embedding_cache, EmbeddingCache)
+            assert agglo_clustering._embedding_cache.cache_path == cache_path
+
+        assert (
+            AgglomerativeClusteringConceptExtraction(embedding_cache=2)._embedding_cache
+            is None
+        )
 
 
     def test_wrong_parameter_embedding_model(self, wrong_parameter_embedding_model):
@@ -126,3 +153,65 @@ class TestAgglomerativeClusteringExtractionProcess:
             assert concepts[1].label == "car"
 
         assert len(pipeline.candidate_terms) == 0
+
+
+class LabelLengthEncoder:
+    """Deterministic encoder embedding texts on their length."""
+
+    def encode(
+        self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True
+    ) -> np.ndarray:
+        return np.array([[1.0, len(text)] for text in texts], dtype=np.float32)
+
+
+def test_run_persistent_embedding_cache(en_sm_spacy_model):
+    register_sbert_model("label-length-encoder", LabelLengthEncoder())
+    doc = en_sm_spacy_model("car bike bicycle")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "embeddings.sqlite")
+        pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=[doc])
+        pipeline.kr = KnowledgeRepresentation()
+        pipeline.candidate_terms = {
+            CandidateTerm(label=label, corpus_occurrences={doc[index]})
+            for index, label in enumerate(["car", "bike", "bicycle"])
+        }
+
+        AgglomerativeClusteringConceptExtraction(
+            embedding_model="label-length-encoder", embedding_cache=cache_path
+        ).run(pipeline)
+
+        assert len(pipeline.kr.concepts) == 2
+        assert len(EmbeddingCache(cache_path=cache_path)) == 3
+
+
+def test_run_incremental(en_sm_spacy_model):
+    register_sbert_model("label-length-encoder", LabelLengthEncoder())
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("car bike")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    label: {label} for label in ["car", "bike", "bicycle", "tricycle"]
+                }
+            ),
+            AgglomerativeClusteringConceptExtraction(
+                embedding_model="label-length-encoder"
+            ),
+        ],
+    )
+    pipeline.run()
+    assert len(pipeline.kr.concepts) == 2
+
+    pipeline.add_documents(["A bicycle or a tricycle."])
+    pipeline.add_documents(["A car, a bike and a bicycle."])
+
+    concept_labels = [concept.label for concept in pipeline.kr.concepts]
+    assert len(concept_labels) == len(set(concept_labels))
+    lrs_occurrences = {
+        lr.label: len(lr.corpus_occurrences)
+        for concept in pipeline.kr.concepts
+        for lr in concept.linguistic_realisations
+    }
+    assert lrs_occurrences == {"car": 2, "bike": 2, "bicycle": 2, "tricycle": 1}
@@ -1,7 +1,9 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 
+from olaf.commons.embedding_tools import register_sbert_model
 from olaf.commons.errors import OptionError, ParameterError
 from olaf.data_container import (
     CandidateTerm,
@@ -11,6 +13,10 @@ from olaf.data_container import (
 )
 from olaf.pipeline.pipeline_component.concept_relation_extraction import (
     AgglomerativeClusteringRelationExtraction,
+    CTsToConceptExtraction,
+)
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
 )
 from olaf.pipeline.pipeline_schema import Pipeline
 
@@ -140,6 +146,12 @@ class TestAgglomerativeClusteringExtractionParameters:
         assert agglo_clustering._linkage == "average"
         assert agglo_clustering._distance_threshold is None
         assert agglo_clustering._embedding_model == "all-mpnet-base-v2"
+        assert agglo_clustering._embedding_batch_size == 32
+        assert agglo_clustering._normalise_embeddings is False
+        assert agglo_clustering._clustering_engine == "exact"
+        assert agglo_clustering._nb_neighbours == 15
+        assert agglo_clustering._nb_centroids == 1000
+        assert agglo_clustering._embedding_cache is None
 
     def test_wrong_parameter_embedding_model(self, wrong_parameter_embedding_model):
         with pytest.raises(ParameterError):
@@ -181,3 +193,53 @@ class TestAgglomerativeClusteringExtractionProcess:
                     assert len(relation.linguistic_realisations) == 1
 
         assert len(pipeline.candidate_terms) == 0
+
+
+class LabelLengthEncoder:
+    """Deterministic encoder embedding texts on their length."""
+
+    def encode(
+        self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True
+    ) -> np.ndarray:
+        return np.array([[1.0, len(text)] for text in texts], dtype=np.float32)
+
+
+def test_run_incremental(en_sm_spacy_model) -> None:
+    register_sbert_model("label-length-encoder", LabelLengthEncoder())
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("people like wine and people eat pizza.")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    label: {label} for label in ["people", "wine", "pizza"]
+                }
+            ),
+            CTsToConceptExtraction(),
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={"like": {"like"}, "eat": {"eat"}}
+            ),
+            AgglomerativeClusteringRelationExtraction(
+                embedding_model="label-length-encoder"
+            ),
+        ],
+    )
+    pipeline.run()
+    pipeline.add_documents(["people like wine.", "people eat pizza."])
+    pipeline.add_documents(["people like wine and people eat pizza."])
+
+    concept_labels = [concept.label for concept in pipeline.kr.concepts]
+    assert sorted(concept_labels) == ["people", "pizza", "wine"]
+    relations_index = {
+        (
+            relation.label,
+            relation.source_concept.label if relation.source_concept else None,
+            relation.destination_concept.label
+            if relation.destination_concept
+            else None,
+        ): relation
+        for relation in pipeline.kr.relations
+    }
+    assert len(relations_index) == len(pipeline.kr.relations)
+    like_wine = relations_index[("like", "people", "wine")]
+    assert len(next(iter(like_wine.linguistic_realisations)).corpus_occurrences) == 3
@@ -201,6 +201,28 @@ class TestConceptCoocMetarelationExtractionDefault:
         assert sent_span_cooc_count == 2
         assert sent_value_cooc_count == 0
 
+    def test_count_concepts_cooccurrences(self, default_c_cooc_rel_extract, kr_concepts) -> None:
+        concepts = list(kr_concepts)
+        cooc_counts = {
+            (concept1_index, concept2_index): concept_cooc_count
+            for concept1_index, concept2_index, concept_cooc_count in (
+                default_c_cooc_rel_extract._count_concepts_cooccurrences(concepts)
+            )
+        }
+
+        expected_cooc_counts = {}
+        for concept1_index, concept1 in enumerate(concepts):
+            for concept2_index in range(concept1_index + 1, len(concepts)):
+                concept_cooc_count = default_c_cooc_rel_extract._count_concept_cooccurrence(
+                    concept1, concepts[concept2_index]
+                )
+                if concept_cooc_count:
+                    expected_cooc_counts[(concept1_index, concept2_index)] = (
+                        concept_cooc_count
+                    )
+
+        assert cooc_counts == expected_cooc_counts
+
     def test_run(self, default_c_cooc_rel_extract, pipeline) -> None:
         pipeline.kr.metarelations = set()
         default_c_cooc_rel_extract.run(pipeline)
@@ -210,6 +232,22 @@ class TestConceptCoocMetarelationExtractionDefault:
         metarelations_label = {rel.label for rel in pipeline.kr.metarelations}
         assert metarelations_label == {"RELATED_TO"}
 
+    def test_run_incremental(
+        self, default_c_cooc_rel_extract, pipeline, corpus_docs
+    ) -> None:
+        pipeline.kr.metarelations = set()
+        default_c_cooc_rel_extract.run_incremental(pipeline, [])
+
+        assert len(pipeline.kr.metarelations) == 0
+
+        default_c_cooc_rel_extract.run_incremental(pipeline, corpus_docs[:1])
+
+        assert len(pipeline.kr.metarelations) == 8
+
+        default_c_cooc_rel_extract.run_incremental(pipeline, corpus_docs)
+
+        assert len(pipeline.kr.metarelations) == 11
+
 
 class TestConceptCoocMetarelationExtractionCustom:
     @pytest.fixture(scope="class")
@@ -299,6 +337,28 @@ class TestConceptCoocMetarelationExtractionCustom:
         assert span_sent_cooc_count == 1
         assert value_sent_cooc_count == 0
 
+    def test_count_concepts_cooccurrences(self, c_cooc_rel_extract, kr_concepts) -> None:
+        concepts = list(kr_concepts)
+        cooc_counts = {
+            (concept1_index, concept2_index): concept_cooc_count
+            for concept1_index, concept2_index, concept_cooc_count in (
+                c_cooc_rel_extract._count_concepts_cooccurrences(concepts)
+            )
+        }
+
+        expected_cooc_counts = {}
+        for concept1_index, concept1 in enumerate(concepts):
+            for concept2_index in range(concept1_index + 1, len(concepts)):
+                concept_cooc_count = c_cooc_rel_extract._count_concept_cooccurrence(
+                    concept1, concepts[concept2_index]
+                )
+                if concept_cooc_count:
+                    expected_cooc_counts[(concept1_index, concept2_index)] = (
+                        concept_cooc_count
+                    )
+
+        assert cooc_counts == expected_cooc_counts
+
     def test_run(self, c_cooc_rel_extract, pipeline) -> None:
         c_cooc_rel_extract.run(pipeline)
 
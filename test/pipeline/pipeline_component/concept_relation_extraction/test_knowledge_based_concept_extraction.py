@@ -9,6 +9,9 @@ from olaf.data_container.enrichment_schema import Enrichment
 from olaf.pipeline.pipeline_component.concept_relation_extraction.knowledge_based_concept_extraction import (
     KnowledgeBasedConceptExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 from olaf.pipeline.pipeline_schema import Pipeline
 from olaf.repository.knowledge_source.knowledge_source_schema import KnowledgeSource
 
@@ -203,3 +206,38 @@ class TestKnowledgeBasedConceptExtractionNoMerge:
         assert all(conditions)
 
         assert len(pipeline.candidate_terms) == 0
+
+
+def test_run_incremental(
+    mock_knowledge_source: KnowledgeSource, en_sm_spacy_model: Language
+) -> None:
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("I ride my bike.")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    "bike": {"bike"},
+                    "wine": {"wine"},
+                    "car": {"car"},
+                }
+            ),
+            KnowledgeBasedConceptExtraction(mock_knowledge_source),
+        ],
+    )
+    pipeline.run()
+    pipeline.add_documents(["A bike, a car and some wine."])
+    pipeline.add_documents(["Another bike and more wine."])
+
+    concepts_index = {concept.label: concept for concept in pipeline.kr.concepts}
+    assert sorted(concept.label for concept in pipeline.kr.concepts) == [
+        "bike",
+        "wine",
+    ]
+    assert concepts_index["bike"].external_uids == {
+        "some_bike_uid",
+        "another_bike_uid",
+    }
+    assert concepts_index["wine"].external_uids == {"wine_uri"}
+    bike_lr = next(iter(concepts_index["bike"].linguistic_realisations))
+    assert len(bike_lr.corpus_occurrences) == 3
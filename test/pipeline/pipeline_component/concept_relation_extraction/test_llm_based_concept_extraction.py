@@ -9,6 +9,9 @@ from olaf.data_container import CandidateTerm
 from olaf.pipeline.pipeline_component.concept_relation_extraction import (
     LLMBasedConceptExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 
 
 class MockLLMGenerator(LLMGenerator):
@@ -135,3 +138,31 @@ def test_run_component(pipeline, llm_concept_extraction) -> None:
         else:
             assert (concept.label == "water") or (concept.label == "sparkling water")
             assert len(concept.linguistic_realisations) == 2
+
+
+def test_run_incremental(en_sm_spacy_model, llm_generator) -> None:
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("I like drinking wine.")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    label: {label} for label in ["wine", "water", "sparkling water"]
+                }
+            ),
+            LLMBasedConceptExtraction(llm_generator=llm_generator),
+        ],
+    )
+    pipeline.run()
+    pipeline.add_documents(["Sparkling water is just water with some gas."])
+    pipeline.add_documents(["Wine or sparkling water ?"])
+
+    concept_labels = [concept.label for concept in pipeline.kr.concepts]
+    assert len(concept_labels) == 2
+    assert len(concept_labels) == len(set(concept_labels))
+    lrs_occurrences = {
+        lr.label: len(lr.corpus_occurrences)
+        for concept in pipeline.kr.concepts
+        for lr in concept.linguistic_realisations
+    }
+    assert lrs_occurrences == {"wine": 2, "water": 3, "sparkling water": 2}
@@ -7,8 +7,12 @@ from olaf import Pipeline
 from olaf.commons.llm_tools import LLMGenerator
 from olaf.data_container import CandidateTerm
 from olaf.pipeline.pipeline_component.concept_relation_extraction import (
+    CTsToConceptExtraction,
     LLMBasedRelationExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 
 
 class MockLLMGenerator(LLMGenerator):
@@ -127,3 +131,41 @@ def test_run_component(pipeline, llm_relation_extraction) -> None:
         else:
             assert (relation.label == "like") or (relation.label == "prefer")
             assert len(relation.linguistic_realisations) == 2
+
+
+def test_run_incremental(en_sm_spacy_model, llm_generator) -> None:
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("people like wine and people eat pizza.")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    label: {label} for label in ["people", "wine", "pizza"]
+                }
+            ),
+            CTsToConceptExtraction(),
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={"like": {"like"}, "eat": {"eat"}}
+            ),
+            LLMBasedRelationExtraction(llm_generator=llm_generator),
+        ],
+    )
+    pipeline.run()
+    pipeline.add_documents(["people like wine.", "people eat pizza."])
+    pipeline.add_documents(["people like wine and people eat pizza."])
+
+    concept_labels = [concept.label for concept in pipeline.kr.concepts]
+    assert sorted(concept_labels) == ["people", "pizza", "wine"]
+    relations_index = {
+        (
+            relation.label,
+            relation.source_concept.label if relation.source_concept else None,
+            relation.destination_concept.label
+            if relation.destination_concept
+            else None,
+        ): relation
+        for relation in pipeline.kr.relations
+    }
+    assert len(relations_index) == len(pipeline.kr.relations)
+    like_wine = relations_index[("like", "people", "wine")]
+    assert len(next(iter(like_wine.linguistic_realisations)).corpus_occurrences) == 3
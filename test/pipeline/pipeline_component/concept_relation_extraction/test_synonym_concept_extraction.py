@@ -7,6 +7,9 @@ from olaf.data_container.enrichment_schema import Enrichment
 from olaf.pipeline.pipeline_component.concept_relation_extraction.synonym_concept_extraction import (
     SynonymConceptExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 from olaf.pipeline.pipeline_schema import Pipeline
 
 
@@ -107,3 +110,27 @@ def test_run(pipeline):
                 for ct in concept.linguistic_realisations
             ]
             assert all(conditions)
+
+
+def test_run_incremental(en_sm_spacy_model):
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=[en_sm_spacy_model("I eat pizza with cheese.")],
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={"pizza": {"pizza"}, "cheese": {"cheese"}}
+            ),
+            SynonymConceptExtraction(),
+        ],
+    )
+    pipeline.run()
+    pipeline.add_documents(["Another pizza with cheese."])
+    pipeline.add_documents(["A pizza without cheese."])
+
+    assert sorted(concept.label for concept in pipeline.kr.concepts) == [
+        "cheese",
+        "pizza",
+    ]
+    for concept in pipeline.kr.concepts:
+        assert len(concept.linguistic_realisations) == 1
+        assert len(next(iter(concept.linguistic_realisations)).corpus_occurrences) == 3
@@ -106,6 +106,33 @@ def test_is_sub_hierarchy(subsumption):
     assert not (subsumption._is_sub_hierarchy(0.2, 0.4))
 
 
+def test_find_generalisation_pairs(c1, c2, c3, subsumption):
+    concepts = [c1, c2, c3]
+    generalisation_pairs = subsumption._find_generalisation_pairs(concepts)
+
+    expected_pairs = set()
+    for index_1, index_2 in [(0, 1), (0, 2), (1, 2)]:
+        concepts_cooc = subsumption._concepts_cooccurrence_count(
+            concepts[index_1], concepts[index_2]
+        )
+        sub_score = subsumption._compute_subsumption(
+            concepts_cooc,
+            subsumption._concept_occurrence_count(concepts[index_1]),
+        )
+        inv_sub_score = subsumption._compute_subsumption(
+            concepts_cooc,
+            subsumption._concept_occurrence_count(concepts[index_2]),
+        )
+        if subsumption._is_sub_hierarchy(sub_score, inv_sub_score):
+            expected_pairs.add((index_1, index_2))
+        elif subsumption._is_sub_hierarchy(inv_sub_score, sub_score):
+            expected_pairs.add((index_2, index_1))
+
+    assert len(generalisation_pairs) == len(expected_pairs)
+    assert set(generalisation_pairs) == expected_pairs
+    assert set(generalisation_pairs) == {(1, 0), (2, 0)}
+
+
 def test_running_subsumption(subsumption, pipeline):
     subsumption.run(pipeline)
     assert len(pipeline.kr.metarelations) == 2
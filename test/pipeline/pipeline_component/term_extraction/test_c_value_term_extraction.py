@@ -108,6 +108,27 @@ class TestCvalueTermExtractionOptions:
 
         assert c_val_term_extraction._c_value_threshold == expected_cval_threshold_val
 
+    @pytest.mark.parametrize("n_process, expected_n_process", [(2, 2), (-1, -1), (0, 1), (1.5, 1)])
+    def test_check_options_n_process(self, n_process, expected_n_process):
+        c_val_term_extraction = CvalueTermExtraction(
+            candidate_term_threshold=2.0,
+            n_process=n_process
+        )
+
+        assert c_val_term_extraction.n_process == expected_n_process
+
+    @pytest.mark.parametrize(
+        "c_value_engine, expected_c_value_engine",
+        [("vectorised", "vectorised"), ("default", "default"), ("numpy", "default")],
+    )
+    def test_check_options_c_value_engine(self, c_value_engine, expected_c_value_engine):
+        c_val_term_extraction = CvalueTermExtraction(
+            candidate_term_threshold=2.0,
+            c_value_engine=c_value_engine
+        )
+
+        assert c_val_term_extraction.c_value_engine == expected_c_value_engine
+
 
 class TestCvalueTermExtractionParameters:
     def test_check_parameters_no_doc_attr_set(
@@ -192,7 +213,7 @@ class TestCvalueTermExtractionMethods:
         terms = set()
         for token_seq in expected_token_sequences:
             term_spans = []
-            for i in range(2, len(token_seq)):
+            for i in range(1, len(token_seq) + 1):
                 spans = spacy_span_ngrams(token_seq, i)
                 term_spans.extend(spans)
 
@@ -280,6 +301,22 @@ class TestCvalueTermExtractionMethods:
 
         assert all(conditions)
 
+    def test_extract_terms_multi_process(
+        self,
+        c_value_term_extraction,
+        test_parameters,
+        test_options,
+        spaced_expected_token_seqs,
+    ):
+        multi_process_term_extraction = CvalueTermExtraction(
+            token_sequences_doc_attribute=test_parameters["token_sequences_doc_attribute"], candidate_term_threshold=test_options["threshold"],
+            max_term_token_length=test_options["max_term_token_length"], n_process=2
+        )
+
+        assert multi_process_term_extraction._extract_terms(
+            spaced_expected_token_seqs
+        ) == c_value_term_extraction._extract_terms(spaced_expected_token_seqs)
+
     def test_get_corpus_occurrences_no_empty_values(
         self,
         c_value_term_extraction,
@@ -296,6 +333,23 @@ class TestCvalueTermExtractionMethods:
 
         assert all(conditions)
 
+    def test_run_c_value_engines(self, en_sm_spacy_model, corpus_raw, test_options):
+        engines_candidate_terms = {}
+        for c_value_engine in ["default", "vectorised"]:
+            pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=corpus_raw)
+            CvalueTermExtraction(
+                candidate_term_threshold=0.0,
+                max_term_token_length=test_options["max_term_token_length"],
+                c_value_engine=c_value_engine,
+            ).run(pipeline)
+            engines_candidate_terms[c_value_engine] = {
+                (ct.label, frozenset(ct.corpus_occurrences))
+                for ct in pipeline.candidate_terms
+            }
+
+        assert len(engines_candidate_terms["default"]) > 0
+        assert engines_candidate_terms["default"] == engines_candidate_terms["vectorised"]
+
     def test_run_CTs_have_corpus_occ(self, example_pipeline, c_value_term_extraction):
         c_value_term_extraction.run(example_pipeline)
 
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 import spacy.tokens
 
@@ -91,6 +92,21 @@ class TestParamsOptionsDefaults:
     ) -> None:
         assert default_tfidf_term_extraction.candidate_term_threshold == 0
 
+    def test_default_streaming(self, default_tfidf_term_extraction) -> None:
+        assert not default_tfidf_term_extraction.streaming
+        assert default_tfidf_term_extraction.batch_size == 1000
+        assert default_tfidf_term_extraction.n_features == 2**20
+
+    @pytest.mark.parametrize(
+        "batch_size, n_features, expected",
+        [(10, 2**10, (10, 2**10)), (0, -1, (1000, 2**20)), (1.5, "a", (1000, 2**20))],
+    )
+    def test_check_streaming_parameters(self, batch_size, n_features, expected) -> None:
+        term_extraction = TFIDFTermExtraction(
+            streaming=True, batch_size=batch_size, n_features=n_features
+        )
+        assert (term_extraction.batch_size, term_extraction.n_features) == expected
+
     def test_default_ngram_range(self, default_tfidf_term_extraction) -> None:
         assert default_tfidf_term_extraction._ngram_range == (1, 1)
 
@@ -140,30 +156,28 @@ class TestTFIDFprocess:
 
         assert token_sequences_texts == expected_texts
 
-    def test_create_ngram_spans(
+    def test_spaced_term_corpus_occ_map_keys(
         self, custom_tfidf_term_extraction, small_corpus
     ) -> None:
         token_sequences = custom_tfidf_term_extraction._extract_token_sequences(
             corpus=small_corpus
         )
 
-        vocabulary_spans = custom_tfidf_term_extraction._create_ngram_spans(
-            token_sequences
+        spaced_term_corpus_occ_map = (
+            custom_tfidf_term_extraction._spaced_term_corpus_occ_map(token_sequences)
         )
-        vocabulary_spans_texts = {span.text for span in vocabulary_spans}
 
-        expected_texts = {
-            "This is",
+        expected_terms = {
+            "this is",
             "is the",
             "the first",
             "first document",
-            "document.",
-            "This",
+            "document .",
+            "this",
             "is",
             "the",
             "first",
             "document",
-            "document",
             ".",
             "the second",
             "second second",
@@ -171,7 +185,33 @@ class TestTFIDFprocess:
             "second",
         }
 
-        assert vocabulary_spans_texts == expected_texts
+        assert set(spaced_term_corpus_occ_map) == expected_terms
+        assert {
+            span.text for span in spaced_term_corpus_occ_map["second document"]
+        } == {"second document"}
+        assert len(spaced_term_corpus_occ_map["document"]) == 2
+
+    def test_spaced_term_corpus_occ_map_unaligned_preprocessing(
+        self, example_params, small_corpus
+    ) -> None:
+        term_extraction = TFIDFTermExtraction(
+            token_sequence_preprocessing=lambda span: [
+                token.lower_ for token in span if not token.is_punct
+            ],
+            max_term_token_length=2,
+            **example_params,
+        )
+        token_sequences = term_extraction._extract_token_sequences(corpus=small_corpus)
+
+        spaced_term_corpus_occ_map = term_extraction._spaced_term_corpus_occ_map(
+            token_sequences
+        )
+
+        assert "document ." not in spaced_term_corpus_occ_map
+        assert {span.text for span in spaced_term_corpus_occ_map["document"]} == {
+            "document",
+            "document.",
+        }
 
     @pytest.mark.filterwarnings("ignore::UserWarning")
     def test_spaced_term_corpus_occ_map(
@@ -183,17 +223,36 @@ class TestTFIDFprocess:
         token_sequences = custom_tfidf_term_extraction._extract_token_sequences(
             corpus=example_pipeline.corpus
         )
-        vocabulary_spans = custom_tfidf_term_extraction._create_ngram_spans(
-            token_sequences
-        )
         spaced_term_corpus_occ_map = (
-            custom_tfidf_term_extraction._spaced_term_corpus_occ_map(vocabulary_spans)
+            custom_tfidf_term_extraction._spaced_term_corpus_occ_map(token_sequences)
         )
 
         spaced_term_corpus_occ_map_keys = set(spaced_term_corpus_occ_map)
 
         assert candidate_terms_text <= spaced_term_corpus_occ_map_keys
 
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize("tfidf_agg_type", ["MEAN", "MAX"])
+    def test_aggregate_tfidf_values(self, tfidf_agg_type, example_corpus) -> None:
+        term_extraction = TFIDFTermExtraction(
+            max_term_token_length=2, tfidf_agg_type=tfidf_agg_type
+        )
+        tfidf_matrix = term_extraction.tfidf_vectorizer.fit_transform(
+            [doc.text.lower() for doc in example_corpus]
+        )
+
+        dense_tfidf_matrix = tfidf_matrix.toarray()
+        if tfidf_agg_type == "MEAN":
+            expected_values = dense_tfidf_matrix.sum(axis=0) / np.count_nonzero(
+                dense_tfidf_matrix, axis=0
+            )
+        else:
+            expected_values = dense_tfidf_matrix.max(axis=0)
+
+        tfidf_values = term_extraction._aggregate_tfidf_values(tfidf_matrix)
+
+        assert np.array_equal(tfidf_values, expected_values)
+
     @pytest.mark.filterwarnings("ignore::UserWarning")
     def test_tfidf_run(
         self, example_params, example_options, en_sm_spacy_model, example_corpus
@@ -211,3 +270,94 @@ class TestTFIDFprocess:
         term_extraction.run(pipeline=pipeline)
 
         assert len(pipeline.candidate_terms) == 12
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize("tfidf_agg_type", ["MEAN", "MAX"])
+    def test_tfidf_run_streaming(
+        self, tfidf_agg_type, example_params, en_sm_spacy_model, example_corpus
+    ) -> None:
+        options = {
+            "max_term_token_length": 2,
+            "tfidf_agg_type": tfidf_agg_type,
+            "candidate_term_threshold": 0.35,
+        }
+        term_extraction = TFIDFTermExtraction(**example_params, **options)
+        pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=example_corpus)
+        term_extraction.run(pipeline=pipeline)
+
+        streaming_term_extraction = TFIDFTermExtraction(
+            streaming=True, batch_size=3, **example_params, **options
+        )
+        streaming_pipeline = Pipeline(
+            spacy_model=en_sm_spacy_model, corpus=example_corpus
+        )
+        streaming_term_extraction.run(pipeline=streaming_pipeline)
+
+        assert streaming_term_extraction._nb_documents == len(example_corpus)
+        assert {
+            ct.label: ct.corpus_occurrences for ct in streaming_pipeline.candidate_terms
+        } == {ct.label: ct.corpus_occurrences for ct in pipeline.candidate_terms}
+        # Only the selected terms are kept, not the corpus token sequences and ngrams.
+        assert set(streaming_term_extraction._term_feature_map) == {
+            ct.label for ct in pipeline.candidate_terms
+        }
+        assert streaming_term_extraction._corpus_spaced_token_sequences == []
+        assert streaming_term_extraction._term_corpus_occ_maps == []
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_tfidf_run_incremental(
+        self, example_params, en_sm_spacy_model, example_corpus
+    ) -> None:
+        full_term_extraction = TFIDFTermExtraction(
+            max_term_token_length=2, **example_params
+        )
+        full_pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=example_corpus)
+        full_term_extraction.run(pipeline=full_pipeline)
+
+        term_extraction = TFIDFTermExtraction(max_term_token_length=2, **example_params)
+        pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=example_corpus[:2])
+        term_extraction.run(pipeline=pipeline)
+        pipeline.corpus.extend(example_corpus[2:])
+        term_extraction.run_incremental(
+            pipeline=pipeline, new_corpus=example_corpus[2:]
+        )
+
+        expected_cts = {
+            ct.label: ct.corpus_occurrences for ct in full_pipeline.candidate_terms
+        }
+        incremental_cts = {
+            ct.label: ct.corpus_occurrences for ct in pipeline.candidate_terms
+        }
+
+        assert len(pipeline.candidate_terms) == len(incremental_cts)
+        assert incremental_cts == expected_cts
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_tfidf_run_incremental_streaming(
+        self, example_params, en_sm_spacy_model, example_corpus
+    ) -> None:
+        full_term_extraction = TFIDFTermExtraction(
+            max_term_token_length=2, streaming=True, **example_params
+        )
+        full_pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=example_corpus)
+        full_term_extraction.run(pipeline=full_pipeline)
+
+        term_extraction = TFIDFTermExtraction(
+            max_term_token_length=2, streaming=True, **example_params
+        )
+        pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=example_corpus[:2])
+        term_extraction.run(pipeline=pipeline)
+        pipeline.corpus.extend(example_corpus[2:])
+        term_extraction.run_incremental(
+            pipeline=pipeline, new_corpus=example_corpus[2:]
+        )
+
+        assert np.array_equal(
+            term_extraction._document_frequencies,
+            full_term_extraction._document_frequencies,
+        )
+        assert term_extraction._corpus_spaced_token_sequences == []
+        assert {ct.label: ct.corpus_occurrences for ct in pipeline.candidate_terms} == {
+            ct.label: ct.corpus_occurrences for ct in full_pipeline.candidate_terms
+        }
+
@@ -1,16 +1,43 @@
+from typing import Any, Dict
+
 import pytest
 
 from olaf.commons.errors import PipelineCorpusInitialisationError
-from olaf.commons.spacy_processing_tools import is_not_stopword
+from olaf.commons.spacy_processing_tools import (
+    is_not_stopword,
+    lower_token_texts,
+    token_texts,
+)
+from olaf.data_container.span_set_schema import SpanSet
 from olaf.pipeline.data_preprocessing.token_selector_data_preprocessing import (
     TokenSelectorDataPreprocessing,
 )
+from olaf.pipeline.pipeline_component.concept_relation_extraction.candidate_terms_to_concepts import (
+    CTsToConceptExtraction,
+)
 from olaf.pipeline.pipeline_component.concept_relation_extraction.synonym_concept_extraction import (
     SynonymConceptExtraction,
 )
+from olaf.pipeline.pipeline_component.pipeline_component_schema import (
+    PipelineComponent,
+)
+from olaf.pipeline.pipeline_component.term_extraction import (
+    c_value_term_extraction,
+    tfidf_term_extraction,
+)
+from olaf.pipeline.pipeline_component.term_extraction.c_value_term_extraction import (
+    CvalueTermExtraction,
+)
+from olaf.pipeline.pipeline_component.term_extraction.manual_candidate_terms import (
+    ManualCandidateTermExtraction,
+)
 from olaf.pipeline.pipeline_component.term_extraction.pos_term_extraction import (
     POSTermExtraction,
 )
+from olaf.pipeline.pipeline_component.term_extraction.tfidf_term_extraction import (
+    TFIDFTermExtraction,
+)
+from olaf.pipeline import pipeline_schema
 from olaf.pipeline.pipeline_schema import Pipeline
 
 
@@ -116,3 +143,199 @@ def test_running_concept_pipeline(concept_pipeline) -> None:
     concept_pipeline.run()
     assert len(concept_pipeline.candidate_terms) == 0
     assert len(concept_pipeline.kr.concepts) == 4
+
+
+def test_add_documents_extraction_pipeline(extraction_pipeline) -> None:
+    extraction_pipeline.run()
+    assert len(extraction_pipeline.candidate_terms) == 4
+
+    extraction_pipeline.add_documents(["I eat pizza and cheese."])
+
+    assert len(extraction_pipeline.corpus) == 4
+    assert len(extraction_pipeline.candidate_terms) == 5
+    cts_index = {ct.label: ct for ct in extraction_pipeline.candidate_terms}
+    assert len(cts_index["pizza"].corpus_occurrences) == 2
+    assert len(cts_index["cheese"].corpus_occurrences) == 1
+
+
+def test_add_documents_concept_pipeline(en_sm_spacy_model, corpus) -> None:
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=corpus,
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={
+                    "pizza": {"pizza"},
+                    "beer": {"beer"},
+                    "cheese": {"cheese"},
+                }
+            ),
+            CTsToConceptExtraction(),
+        ],
+    )
+    pipeline.run()
+    assert {concept.label for concept in pipeline.kr.concepts} == {"pizza", "beer"}
+
+    new_doc = en_sm_spacy_model("I eat pizza with cheese.")
+    pipeline.add_documents([new_doc])
+
+    assert pipeline.corpus[-1] is new_doc
+    assert len(pipeline.candidate_terms) == 0
+    concepts_index = {concept.label: concept for concept in pipeline.kr.concepts}
+    assert set(concepts_index) == {"pizza", "beer", "cheese"}
+    pizza_occurrences = set()
+    for lr in concepts_index["pizza"].linguistic_realisations:
+        pizza_occurrences.update(lr.corpus_occurrences)
+    assert len(pizza_occurrences) == 2
+    assert any(span.doc is new_doc for span in pizza_occurrences)
+
+
+class CountingRunComponent(PipelineComponent):
+    """Component without incremental ingestion support counting its runs."""
+
+    def __init__(self) -> None:
+        self.nb_runs = 0
+
+    def check_resources(self) -> None:
+        pass
+
+    def optimise(self) -> None:
+        pass
+
+    def _compute_metrics(self) -> None:
+        pass
+
+    def get_performance_report(self) -> Dict[str, Any]:
+        return {}
+
+    def run(self, pipeline: Pipeline) -> None:
+        self.nb_runs += 1
+
+
+def test_add_documents_skips_non_incremental_component(
+    en_sm_spacy_model, corpus, caplog
+) -> None:
+    component = CountingRunComponent()
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model, corpus=corpus, pipeline_components=[component]
+    )
+    pipeline.run()
+    caplog.clear()
+    pipeline.add_documents(["I eat pizza with cheese."])
+
+    assert component.nb_runs == 1
+    assert len(pipeline.corpus) == 4
+    assert any(
+        "CountingRunComponent does not support incremental ingestion" in rec.message
+        for rec in caplog.records
+    )
+
+
+
+def test_compact_corpus_occurrences_pipeline(en_sm_spacy_model, corpus) -> None:
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=corpus,
+        pipeline_components=[
+            ManualCandidateTermExtraction(
+                ct_label_strings_map={"pizza": {"pizza"}, "cheese": {"cheese"}}
+            ),
+            CTsToConceptExtraction(),
+        ],
+        compact_corpus_occurrences=True,
+    )
+    pipeline.run()
+    pipeline.add_documents(["I eat pizza with cheese."])
+
+    concepts_index = {concept.label: concept for concept in pipeline.kr.concepts}
+    assert set(concepts_index) == {"pizza", "cheese"}
+    pizza_occurrences = set()
+    for lr in concepts_index["pizza"].linguistic_realisations:
+        assert isinstance(lr.corpus_occurrences, SpanSet)
+        assert lr.corpus_occurrences.doc_registry is pipeline.doc_registry
+        pizza_occurrences.update(lr.corpus_occurrences)
+    assert {(span.doc, span.text) for span in pizza_occurrences} == {
+        (corpus[2], "pizza"),
+        (pipeline.corpus[-1], "pizza"),
+    }
+
+
+def test_span_ngram_index_sharing(pipeline) -> None:
+    index = pipeline.get_span_ngram_index(None, 2, token_texts)
+
+    assert pipeline.get_span_ngram_index(None, 2, token_texts) is index
+    unigram_index = pipeline.get_span_ngram_index(None, 1, token_texts)
+    assert "pasta" in unigram_index
+    assert "pasta and" not in unigram_index
+    lower_index = pipeline.get_span_ngram_index(None, 2, lower_token_texts)
+    assert lower_index is not index
+    assert "i like" in lower_index
+    assert "I like" not in lower_index
+    assert len(pipeline.span_ngram_indices) == 2
+    assert {(span.doc, span.text) for span in index["pasta and"]} == {
+        (pipeline.corpus[2], "pasta and")
+    }
+
+    pipeline.run()
+    assert len(pipeline.span_ngram_indices) == 0
+
+
+def test_span_ngram_index_shared_by_term_extractions(
+    en_sm_spacy_model, corpus, monkeypatch
+) -> None:
+    built_indices = []
+    build_index = c_value_term_extraction.build_span_ngram_index
+
+    def build_span_ngram_index(*args, **kwargs):
+        built_indices.append(args)
+        return build_index(*args, **kwargs)
+
+    monkeypatch.setattr(
+        tfidf_term_extraction, "build_span_ngram_index", build_span_ngram_index
+    )
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=corpus,
+        pipeline_components=[
+            TFIDFTermExtraction(
+                token_sequence_preprocessing=token_texts, max_term_token_length=3
+            ),
+            CvalueTermExtraction(max_term_token_length=3),
+        ],
+    )
+    monkeypatch.setattr(
+        c_value_term_extraction, "build_span_ngram_index", build_span_ngram_index
+    )
+
+    pipeline.run()
+
+    assert len(built_indices) == 1
+    assert {ct.label for ct in pipeline.candidate_terms} >= {"pasta and pizza"}
+
+
+def test_span_ngram_index_shared_by_default_term_extractions(
+    en_sm_spacy_model, corpus, monkeypatch
+) -> None:
+    built_indices = []
+    build_index = pipeline_schema.build_span_ngram_index
+
+    def build_span_ngram_index(*args, **kwargs):
+        built_indices.append(args)
+        return build_index(*args, **kwargs)
+
+    for module in [pipeline_schema, c_value_term_extraction, tfidf_term_extraction]:
+        monkeypatch.setattr(module, "build_span_ngram_index", build_span_ngram_index)
+    c_value_extraction = CvalueTermExtraction()
+    tfidf_extraction = TFIDFTermExtraction()
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        corpus=corpus,
+        pipeline_components=[c_value_extraction, tfidf_extraction],
+    )
+
+    pipeline.run()
+
+    assert len(built_indices) == 1
+    assert built_indices[0][2] is token_texts
+    assert tfidf_extraction.token_sequence_preprocessing is lower_token_texts
+    assert {ct.label for ct in pipeline.candidate_terms} >= {"i", "pizza"}
@@ -0,0 +1,123 @@
+import pytest
+import spacy.tokens
+
+from olaf import Pipeline
+from olaf.commons.spacy_processing_tools import is_not_stopword
+from olaf.pipeline.data_preprocessing.token_selector_data_preprocessing import (
+    TokenSelectorDataPreprocessing,
+)
+from olaf.repository.corpus_loader import CorpusCache, TextCorpusLoader
+
+
+@pytest.fixture(scope="module")
+def corpus_file_path(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("test_data") / "corpus.txt"
+    texts = [
+        "The American cheesy pizza is a delight.",
+        "Mozzarella cheese is a pizza topping.",
+        "The tomato sauce is made with fresh tomatoes.",
+    ]
+    with open(path, "w", encoding="utf8") as corpus_file:
+        corpus_file.write("\n".join(texts))
+    return str(path)
+
+
+@pytest.fixture(scope="function")
+def corpus_cache(tmp_path) -> CorpusCache:
+    return CorpusCache(str(tmp_path / "corpus_cache"))
+
+
+def test_compute_key(corpus_cache, en_sm_spacy_model) -> None:
+    key = corpus_cache.compute_key(["a text", "another text"], en_sm_spacy_model)
+
+    assert key == corpus_cache.compute_key(
+        ["a text", "another text"], en_sm_spacy_model
+    )
+    assert key != corpus_cache.compute_key(
+        ["a textanother", " text"], en_sm_spacy_model
+    )
+    assert key != corpus_cache.compute_key(
+        ["a text", "another text"],
+        en_sm_spacy_model,
+        disable=en_sm_spacy_model.pipe_names[:1],
+    )
+
+
+def test_load_missing_key(corpus_cache, en_sm_spacy_model) -> None:
+    assert not corpus_cache.contains("missing")
+    assert corpus_cache.load("missing", en_sm_spacy_model) is None
+
+
+def test_corpus_loader_uses_cache(
+    corpus_file_path, corpus_cache, en_sm_spacy_model
+) -> None:
+    corpus = TextCorpusLoader(corpus_file_path, corpus_cache=corpus_cache)(
+        en_sm_spacy_model
+    )
+
+    cached_loader = TextCorpusLoader(corpus_file_path, corpus_cache=corpus_cache)
+    cached_corpus = cached_loader(en_sm_spacy_model)
+
+    assert corpus_cache.contains(cached_loader._corpus_cache_key)
+    assert [doc.text for doc in cached_corpus] == [doc.text for doc in corpus]
+    assert [token.pos_ for token in cached_corpus[0]] == [
+        token.pos_ for token in corpus[0]
+    ]
+
+
+def test_pipeline_caches_preprocessed_corpus(
+    corpus_file_path, corpus_cache, en_sm_spacy_model
+) -> None:
+    preprocessing = TokenSelectorDataPreprocessing(
+        selector=is_not_stopword, token_sequence_doc_attribute="selected_tokens"
+    )
+    pipeline = Pipeline(
+        spacy_model=en_sm_spacy_model,
+        preprocessing_components=[preprocessing],
+        corpus_loader=TextCorpusLoader(corpus_file_path, corpus_cache=corpus_cache),
+    )
+    pipeline.run()
+
+    cached_corpus = TextCorpusLoader(corpus_file_path, corpus_cache=corpus_cache)(
+        en_sm_spacy_model
+    )
+
+    for doc, cached_doc in zip(pipeline.corpus, cached_corpus):
+        selected_tokens = doc._.get("selected_tokens")
+        cached_selected_tokens = cached_doc._.get("selected_tokens")
+        assert len(cached_selected_tokens) == len(selected_tokens)
+        for span, cached_span in zip(selected_tokens, cached_selected_tokens):
+            assert isinstance(cached_span, spacy.tokens.Span)
+            assert cached_span.doc is cached_doc
+            assert (cached_span.start, cached_span.end) == (span.start, span.end)
+
+
+def test_pipeline_skips_unchanged_cached_corpus(
+    corpus_file_path, corpus_cache, en_sm_spacy_model, monkeypatch
+) -> None:
+    def run_pipeline() -> None:
+        Pipeline(
+            spacy_model=en_sm_spacy_model,
+            preprocessing_components=[
+                TokenSelectorDataPreprocessing(
+                    selector=is_not_stopword,
+                    token_sequence_doc_attribute="selected_tokens",
+                )
+            ],
+            corpus_loader=TextCorpusLoader(corpus_file_path, corpus_cache=corpus_cache),
+        ).run()
+
+    saved_keys = []
+    save = corpus_cache.save
+
+    def record_save(key, docs) -> None:
+        saved_keys.append(key)
+        save(key, docs)
+
+    monkeypatch.setattr(corpus_cache, "save", record_save)
+
+    run_pipeline()
+    assert len(saved_keys) == 2
+
+    run_pipeline()
+    assert len(saved_keys) == 2
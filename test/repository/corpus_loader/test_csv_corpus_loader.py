@@ -74,3 +74,23 @@ def test_corpus_loader(schneider_csv_sample, en_sm_spacy_model):
 
     assert len(corpus) == 4
     assert isinstance(corpus[0], spacy.tokens.Doc)
+
+
+def test_iter_corpus_chunks(schneider_csv_sample):
+    column_name = "content"
+    corpus_loader = CsvCorpusLoader(schneider_csv_sample, column_name, chunksize=1)
+    texts = corpus_loader._iter_corpus()
+
+    assert not isinstance(texts, list)
+    assert list(texts) == pd.read_csv(schneider_csv_sample)[column_name].to_list()
+
+
+def test_streaming_corpus_loader(schneider_csv_sample, en_sm_spacy_model):
+    column_name = "content"
+    corpus_loader = CsvCorpusLoader(
+        schneider_csv_sample, column_name, chunksize=2, streaming=True
+    )
+    corpus = corpus_loader(en_sm_spacy_model)
+
+    assert len(corpus) == 4
+    assert corpus[3].text.startswith("lexium servo motor")
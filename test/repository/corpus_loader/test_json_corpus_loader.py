@@ -5,7 +5,10 @@ import pytest
 import spacy.tokens
 
 from olaf.commons.errors import FileOrDirectoryNotFoundError
-from olaf.repository.corpus_loader.json_corpus_loader import JsonCorpusLoader
+from olaf.repository.corpus_loader.json_corpus_loader import (
+    JsonCorpusLoader,
+    iter_json_list_items,
+)
 
 
 @pytest.fixture(scope="session")
@@ -140,4 +143,99 @@ def test_corpus_loader_dict(labour_code_json_sample_dict, en_sm_spacy_model):
     corpus = corpus_loader(en_sm_spacy_model)
 
     assert len(corpus) == 4
-    assert type(corpus[0]) == spacy.tokens.Doc
\ No newline at end of file
+    assert type(corpus[0]) == spacy.tokens.Doc
+
+@pytest.fixture(scope="session")
+def json_lines_sample(tmp_path_factory):
+    path = tmp_path_factory.mktemp("test_data") / "json_lines_sample.jsonl"
+
+    file_content = [{"content": "doc1"}, {"content": "doc2"}, {"content": "doc3"}]
+
+    with open(path, "w") as outfile:
+        for json_object in file_content:
+            outfile.write(json.dumps(json_object) + "\n")
+
+    return path
+
+
+def test_read_corpus_json_lines(json_lines_sample):
+    json_field = "content"
+    corpus_loader = JsonCorpusLoader(json_lines_sample, json_field)
+    corpus = corpus_loader._read_corpus()
+
+    assert corpus == ["doc1", "doc2", "doc3"]
+
+
+def test_iter_corpus_folder_list(labour_code_json_sample_list, monkeypatch):
+    # read the files with a tiny buffer to exercise the incremental parsing
+    monkeypatch.setattr(
+        "olaf.repository.corpus_loader.json_corpus_loader.JSON_READ_SIZE", 8
+    )
+    json_field = "content"
+    corpus_loader = JsonCorpusLoader(labour_code_json_sample_list, json_field)
+    texts = corpus_loader._iter_corpus()
+
+    assert not isinstance(texts, list)
+    texts = list(texts)
+    assert len(texts) == 4
+    assert texts[0].startswith(" Les dispositions du présent livre")
+
+
+def test_streaming_corpus_loader(json_sample, en_sm_spacy_model):
+    json_field = "content"
+    corpus_loader = JsonCorpusLoader(json_sample, json_field, streaming=True)
+    corpus = corpus_loader(en_sm_spacy_model)
+
+    assert [doc.text for doc in corpus] == ["doc1", "doc2", "doc3"]
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [
+        '[{"content": "a"}, {"content": "b"}]',
+        ' [ ]  ',
+        '{"content": "a"}',
+        '[1, 23456789, -1.5e10, "x\\"]", [1, [2, "]"]], {"a": {"b": null}}, true]',
+        '[{"content": "' + "long text " * 1000 + '"}, 12]',
+    ],
+)
+def test_iter_json_list_items(tmp_path, monkeypatch, file_content):
+    monkeypatch.setattr(
+        "olaf.repository.corpus_loader.json_corpus_loader.JSON_READ_SIZE", 4
+    )
+    path = tmp_path / "sample.json"
+    path.write_text(file_content, encoding="utf-8")
+
+    with open(path, encoding="utf-8") as file:
+        items = list(iter_json_list_items(file))
+
+    expected_content = json.loads(file_content)
+    if not isinstance(expected_content, list):
+        expected_content = [expected_content]
+    assert items == expected_content
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [
+        '[,,{"content":"a"},,,{"content":"b"} {"content":"c"}]',
+        '[{"content": "a"} {"content": "b"}]',
+        '[{"content": "a"},]',
+        '[{"content": "a"}',
+        '[{"content": "a"}] []',
+        "[",
+    ],
+)
+def test_iter_json_list_items_malformed(tmp_path, monkeypatch, file_content):
+    monkeypatch.setattr(
+        "olaf.repository.corpus_loader.json_corpus_loader.JSON_READ_SIZE", 4
+    )
+    path = tmp_path / "malformed.json"
+    path.write_text(file_content, encoding="utf-8")
+
+    with open(path, encoding="utf-8") as file:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_list_items(file))
+
+    with pytest.raises(json.JSONDecodeError):
+        JsonCorpusLoader(str(path), "content")._read_corpus()
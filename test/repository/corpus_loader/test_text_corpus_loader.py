@@ -56,4 +56,34 @@ def test_read_corpus_one_doc_per_file(labour_code_sample, corpus_one_doc_per_fil
 def test_read_corpus_one_doc_per_line(labour_code_sample, corpus_one_doc_per_line_path) -> None:
     corpus_loader = TextCorpusLoader(corpus_one_doc_per_line_path)
     corpus = corpus_loader._read_corpus()
-    assert len(corpus) == len(labour_code_sample)
\ No newline at end of file
+    assert len(corpus) == len(labour_code_sample)
+
+def test_check_parameters_wrong_values(corpus_one_doc_per_line_path) -> None:
+    corpus_loader = TextCorpusLoader(
+        corpus_one_doc_per_line_path, n_process=0, batch_size=-5
+    )
+    assert corpus_loader.n_process == 1
+    assert corpus_loader.batch_size is None
+    assert corpus_loader.disable == []
+
+def test_parallel_corpus_loading_keeps_order(labour_code_sample, corpus_one_doc_per_line_path, en_sm_spacy_model) -> None:
+    corpus_loader = TextCorpusLoader(
+        corpus_one_doc_per_line_path,
+        n_process=2,
+        batch_size=1,
+        disable=["parser"],
+    )
+    corpus = corpus_loader(en_sm_spacy_model)
+
+    assert len(corpus) == len(labour_code_sample)
+    for doc, text in zip(corpus, labour_code_sample):
+        assert isinstance(doc, spacy.tokens.Doc)
+        assert doc.text.strip() == text.strip()
+        assert not doc.has_annotation("DEP")
+
+def test_iter_docs_one_doc_per_line(labour_code_sample, corpus_one_doc_per_line_path, en_sm_spacy_model) -> None:
+    corpus_loader = TextCorpusLoader(corpus_one_doc_per_line_path, streaming=True)
+    docs = corpus_loader.iter_docs(en_sm_spacy_model)
+
+    assert not isinstance(docs, list)
+    assert [doc.text.strip() for doc in docs] == [text.strip() for text in labour_code_sample]
@@ -1,4 +1,11 @@
-from typing import Any, Dict, Set
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Set
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
@@ -171,3 +178,209 @@ class TestConceptNetKGFrench:
 
         assert len(pompe_uris) > 0
         assert "http://fr.dbpedia.org/resource/Pompe" in pompe_uris
+
+
+class LocalConceptNetHandler(BaseHTTPRequestHandler):
+    """Stand-in for the ConceptNet API serving paginated external URL edges."""
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query["limit"][0])
+        term = url.path.split("/")[-1]
+        self.server.requested_paths.append(self.path)
+
+        term_edges = self.server.term_edges.get(term)
+        if term in self.server.failing_terms:
+            # Error page of a proxy in front of the API, not JSON.
+            status = self.server.failing_terms[term]
+            body = b"<html><body>Gateway error</body></html>"
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        elif term_edges is None:
+            status = 404
+            response = {"error": {"status": 404, "details": f"{term} not found"}}
+        else:
+            status = 200
+            response = {"edges": term_edges[offset : offset + limit]}
+            # Paginated responses have a view, without nextPage on the last page.
+            if len(term_edges) > limit:
+                response["view"] = {"firstPage": f"{url.path}?offset=0&limit={limit}"}
+                if offset + limit < len(term_edges):
+                    response["view"][
+                        "nextPage"
+                    ] = f"{url.path}?offset={offset + limit}&limit={limit}"
+
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def external_url_edge(uri: str, site: str) -> Dict[str, Any]:
+    return {"rel": {"@id": "/r/ExternalURL"}, "end": {"@id": uri, "site": site}}
+
+
+class TestConceptNetKGLocalServer:
+    @pytest.fixture(scope="class")
+    def term_edges(self) -> Dict[str, List[Dict[str, Any]]]:
+        term_edges = {
+            f"term_{term_index}": [
+                external_url_edge(
+                    f"http://dbpedia.org/resource/Term_{term_index}_{edge_index}",
+                    "dbpedia.org",
+                )
+                for edge_index in range(term_index % 5 + 1)
+            ]
+            for term_index in range(20)
+        }
+        term_edges["term_0"].append(
+            external_url_edge(
+                "http://en.wiktionary.org/wiki/term_0", "en.wiktionary.org"
+            )
+        )
+        term_edges["term_0"].append(
+            {"rel": {"@id": "/r/RelatedTo"}, "end": {"@id": "/c/en/other"}}
+        )
+        return term_edges
+
+    @pytest.fixture(scope="class")
+    def local_server(self, term_edges) -> Iterator[ThreadingHTTPServer]:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), LocalConceptNetHandler)
+        server.term_edges = term_edges
+        server.failing_terms = {"proxy_error": 403, "html_page": 200}
+        server.requested_paths = []
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def local_conceptnet_kg(self, local_server) -> ConceptNetKnowledgeResource:
+        local_server.requested_paths.clear()
+        kg = ConceptNetKnowledgeResource(
+            api_url=f"http://127.0.0.1:{local_server.server_port}",
+            api_resp_batch_size=2,
+            max_workers=4,
+        )
+        return kg
+
+    def test_default_params_options(self) -> None:
+        kg = ConceptNetKnowledgeResource(max_workers=0, timeout=None)
+
+        assert kg.api_url == "http://api.conceptnet.io"
+        assert kg.max_workers == 8
+        assert kg.timeout == 60
+        assert kg.response_cache is None
+
+    def test_match_external_concepts(
+        self, local_conceptnet_kg, local_server, term_edges
+    ) -> None:
+        matching_terms = {f"term {term_index}" for term_index in range(20)}
+        matching_terms.add("unknown term")
+
+        concept_uris = local_conceptnet_kg.match_external_concepts(matching_terms)
+
+        expected_uris = {
+            edge["end"]["@id"]
+            for edges in term_edges.values()
+            for edge in edges
+            if edge["rel"]["@id"] == "/r/ExternalURL"
+        }
+        assert concept_uris == expected_uris
+
+        nb_requests = len(local_server.requested_paths)
+        assert nb_requests == 1 + sum(
+            (len(edges) + 1) // 2 for edges in term_edges.values()
+        )
+
+        assert local_conceptnet_kg.match_external_concepts(matching_terms) == (
+            expected_uris
+        )
+        assert len(local_server.requested_paths) == 2 * nb_requests
+
+    def test_match_external_concepts_failing_terms(
+        self, local_conceptnet_kg, local_server
+    ) -> None:
+        concept_uris = local_conceptnet_kg.match_external_concepts(
+            {"term 1", "proxy error", "html page"}
+        )
+
+        assert concept_uris == {
+            "http://dbpedia.org/resource/Term_1_0",
+            "http://dbpedia.org/resource/Term_1_1",
+        }
+
+    def test_match_terms_groups_external_concepts(
+        self, local_conceptnet_kg, local_server
+    ) -> None:
+        terms_groups = {
+            group_index: {f"term {group_index}", f"term {group_index + 1}"}
+            for group_index in range(5)
+        }
+
+        groups_concept_uids = local_conceptnet_kg.match_terms_groups_external_concepts(
+            terms_groups
+        )
+        requested_paths = list(local_server.requested_paths)
+
+        assert groups_concept_uids == {
+            group_index: local_conceptnet_kg.match_external_concepts(group_terms)
+            for group_index, group_terms in terms_groups.items()
+        }
+        first_pages = [path for path in requested_paths if "offset" not in path]
+        assert len(first_pages) == len(set(first_pages)) == 6
+
+    def test_match_external_concepts_check_sources(self, local_server) -> None:
+        kg = ConceptNetKnowledgeResource(
+            api_url=f"http://127.0.0.1:{local_server.server_port}",
+            check_sources=True,
+            validation_sources={"en.wiktionary.org"},
+        )
+
+        assert kg.match_external_concepts({"term 0", "term 1"}) == {
+            "http://en.wiktionary.org/wiki/term_0"
+        }
+
+    def test_response_cache_persistence(self, local_server) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "conceptnet.sqlite")
+            kg_params = {
+                "api_url": f"http://127.0.0.1:{local_server.server_port}",
+                "cache_path": cache_path,
+            }
+            ConceptNetKnowledgeResource(**kg_params).match_external_concepts(
+                {"term 3", "proxy error"}
+            )
+            local_server.requested_paths.clear()
+
+            concept_uris = ConceptNetKnowledgeResource(
+                **kg_params
+            ).match_external_concepts({"term 3"})
+
+            assert len(concept_uris) == 4
+            assert local_server.requested_paths == []
+
+            ConceptNetKnowledgeResource(**kg_params).match_external_concepts(
+                {"proxy error"}
+            )
+
+            assert len(local_server.requested_paths) == 1
+            local_server.requested_paths.clear()
+
+            expired_kg = ConceptNetKnowledgeResource(**kg_params, cache_ttl=0.01)
+            time.sleep(0.05)
+            expired_kg.match_external_concepts({"term 3"})
+
+            assert len(local_server.requested_paths) == 1
@@ -0,0 +1,138 @@
+import gzip
+import os
+import tempfile
+from typing import Iterator
+
+import pytest
+
+from olaf.commons.errors import ResourcesCheckFailError
+from olaf.repository.knowledge_source.conceptnet_snapshot_kg import (
+    ConceptNetSnapshotKnowledgeResource,
+    build_conceptnet_snapshot,
+)
+
+DUMP_EDGES = [
+    ("/c/en/air_pump/n", "/r/ExternalURL", "http://dbpedia.org/resource/Air_pump"),
+    ("/c/en/air_pump", "/r/ExternalURL", "http://en.wiktionary.org/wiki/air_pump"),
+    ("/c/en/vacuum_pump", "/r/ExternalURL", "http://wikidata.org/entity/Q745694"),
+    ("/c/fr/pompe", "/r/ExternalURL", "http://fr.wiktionary.org/wiki/pompe"),
+    ("/c/en/air_pump/n", "/r/Synonym", "/c/en/vacuum_pump/n"),
+    ("/c/en/inflator", "/r/Synonym", "/c/en/air_pump"),
+    ("/c/en/air_pump", "/r/Synonym", "/c/fr/pompe_à_air"),
+    ("/c/en/hot", "/r/Antonym", "/c/en/cold/a"),
+    ("/c/en/air_pump", "/r/IsA", "/c/en/pump/n"),
+    ("/c/en/pump", "/r/IsA", "/c/en/device"),
+    ("/c/en/air_pump", "/r/RelatedTo", "/c/en/air"),
+]
+
+
+@pytest.fixture(scope="module")
+def snapshot_dir() -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(snapshot_dir) -> str:
+    dump_path = os.path.join(snapshot_dir, "assertions.csv.gz")
+    with gzip.open(dump_path, "wt", encoding="utf8") as dump_file:
+        for start, rel, end in DUMP_EDGES:
+            dump_file.write(f"/a/[{rel},{start},{end}]\t{rel}\t{start}\t{end}\t{{}}\n")
+
+    snapshot_path = os.path.join(snapshot_dir, "conceptnet.db")
+    build_conceptnet_snapshot(dump_path, snapshot_path)
+    return snapshot_path
+
+
+@pytest.fixture(scope="module")
+def snapshot_kg(snapshot_path) -> ConceptNetSnapshotKnowledgeResource:
+    return ConceptNetSnapshotKnowledgeResource(snapshot_path)
+
+
+def test_build_conceptnet_snapshot(snapshot_dir) -> None:
+    edge_list_path = os.path.join(snapshot_dir, "edges.tsv")
+    with open(edge_list_path, "w", encoding="utf8") as edge_list_file:
+        for start, rel, end in DUMP_EDGES:
+            edge_list_file.write(f"{start}\t{rel}\t{end}\n")
+
+    en_snapshot_path = os.path.join(snapshot_dir, "conceptnet_en.db")
+    nb_edges = build_conceptnet_snapshot(
+        edge_list_path, en_snapshot_path, langs={"en"}
+    )
+
+    assert nb_edges == 9
+    assert os.path.isfile(en_snapshot_path)
+
+
+def test_missing_snapshot(snapshot_dir) -> None:
+    with pytest.raises(ResourcesCheckFailError):
+        ConceptNetSnapshotKnowledgeResource(os.path.join(snapshot_dir, "missing.db"))
+
+
+def test_match_external_concepts(snapshot_kg) -> None:
+    concept_uris = snapshot_kg.match_external_concepts({"air pump", "vacuum pump"})
+
+    assert concept_uris == {
+        "http://dbpedia.org/resource/Air_pump",
+        "http://en.wiktionary.org/wiki/air_pump",
+        "http://wikidata.org/entity/Q745694",
+    }
+    assert snapshot_kg.match_external_concepts({"pompe", "unknown"}) == set()
+
+
+def test_match_external_concepts_sources(snapshot_path) -> None:
+    snapshot_kg = ConceptNetSnapshotKnowledgeResource(
+        snapshot_path, check_sources=True, validation_sources={"dbpedia.org"}
+    )
+
+    concept_uris = snapshot_kg.match_external_concepts({"air pump", "vacuum pump"})
+
+    assert concept_uris == {"http://dbpedia.org/resource/Air_pump"}
+
+
+def test_fetch_terms(snapshot_kg) -> None:
+    assert snapshot_kg.fetch_terms_synonyms({"air pump"}) == {
+        "vacuum pump",
+        "inflator",
+    }
+    assert snapshot_kg.fetch_terms_antonyms({"cold"}) == {"hot"}
+    assert snapshot_kg.fetch_terms_hypernyms({"air pump", "pump"}) == {
+        "pump",
+        "device",
+    }
+    assert snapshot_kg.fetch_terms_hyponyms({"pump"}) == {"air pump"}
+    assert snapshot_kg.fetch_terms_synonyms(set()) == set()
+
+
+def test_match_terms_groups_external_concepts(snapshot_kg) -> None:
+    terms_groups = {
+        "pump": {"air pump", "vacuum pump"},
+        "vacuum": {"vacuum pump"},
+        "unknown": {"unknown"},
+        "empty": set(),
+    }
+
+    groups_concept_uids = snapshot_kg.match_terms_groups_external_concepts(
+        terms_groups
+    )
+
+    assert groups_concept_uids == {
+        group_key: snapshot_kg.match_external_concepts(group_terms)
+        for group_key, group_terms in terms_groups.items()
+    }
+    assert groups_concept_uids["vacuum"] == {"http://wikidata.org/entity/Q745694"}
+
+
+def test_fetch_terms_groups_enrichment(snapshot_kg) -> None:
+    terms_groups = {0: {"air pump"}, 1: {"pump", "cold"}, 2: {"unknown"}}
+    enrichment_kinds = {"synonyms", "antonyms", "hypernyms", "hyponyms", "unknown"}
+
+    groups_enrichment = snapshot_kg.fetch_terms_groups_enrichment(
+        terms_groups, enrichment_kinds
+    )
+
+    assert groups_enrichment == {
+        group_key: snapshot_kg.fetch_terms_enrichment(group_terms, enrichment_kinds)
+        for group_key, group_terms in terms_groups.items()
+    }
+    assert groups_enrichment[1]["hyponyms"] == {"air pump"}
@@ -107,6 +107,7 @@ class TestDefaultWordNetKG:
         assert default_wordnet_kg.wordnet_domains_map is None
         assert default_wordnet_kg.enrichment_domains is None
         assert default_wordnet_kg.wordnet_pos is None
+        assert default_wordnet_kg.cache_size == 100000
 
     def test_get_term_wordnet_synsets(
         self, default_wordnet_kg, nut_expected_wn_synsets, nut_expected_verb_wn_synsets
@@ -185,6 +186,48 @@ class TestDefaultWordNetKG:
         assert "internal organ" in hypernyms
 
 
+    def test_fetch_terms_enrichment(self, default_wordnet_kg) -> None:
+        terms = {"screw", "pump"}
+        terms_enrichment = default_wordnet_kg.fetch_terms_enrichment(
+            terms, {"synonyms", "antonyms", "hypernyms", "hyponyms", "unknown"}
+        )
+
+        assert terms_enrichment == {
+            "synonyms": default_wordnet_kg.fetch_terms_synonyms(terms),
+            "antonyms": default_wordnet_kg.fetch_terms_antonyms(terms),
+            "hypernyms": default_wordnet_kg.fetch_terms_hypernyms(terms),
+            "hyponyms": default_wordnet_kg.fetch_terms_hyponyms(terms),
+        }
+        assert set(
+            default_wordnet_kg.fetch_terms_enrichment(terms, {"antonyms"})
+        ) == {"antonyms"}
+
+    def test_fetch_terms_groups_enrichment(self, default_wordnet_kg) -> None:
+        terms_groups = {0: {"screw", "pump"}, 1: {"pump"}, 2: set()}
+        enrichment_kinds = {"synonyms", "antonyms", "hypernyms", "hyponyms"}
+
+        groups_enrichment = default_wordnet_kg.fetch_terms_groups_enrichment(
+            terms_groups, enrichment_kinds
+        )
+
+        assert groups_enrichment == {
+            group_key: default_wordnet_kg.fetch_terms_enrichment(
+                group_terms, enrichment_kinds
+            )
+            for group_key, group_terms in terms_groups.items()
+        }
+
+    def test_lookups_cache(self) -> None:
+        wordnet_kg = WordNetKnowledgeResource(cache_size=50, preload=True)
+        wordnet_kg.preload({"screw", "pump"})
+
+        assert len(wordnet_kg._cache) == 50
+        assert wordnet_kg.fetch_terms_antonyms({"screw", "pump"}) == {"unscrew"}
+
+        wordnet_kg.clear_cache()
+        assert len(wordnet_kg._cache) == 0
+
+
 class TestWordNetKGWithDomains:
     @pytest.fixture(scope="class")
     def wordnet_kg_with_domains(
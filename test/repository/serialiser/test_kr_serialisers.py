@@ -3,8 +3,17 @@ import os
 import tempfile
 
 import pytest
+import srsly
+from rdflib import RDFS, Graph, Literal, URIRef
 
-from olaf.repository.serialiser import KRJSONSerialiser
+from olaf import Pipeline
+from olaf.data_container import KnowledgeRepresentation
+from olaf.repository.serialiser import (
+    KRJSONLinesSerialiser,
+    KRJSONSerialiser,
+    KRMsgpackSerialiser,
+)
+from olaf.repository.serialiser.kr_serialisers import KR_FORMAT_VERSION
 
 
 @pytest.fixture(scope="module")
@@ -343,3 +352,128 @@ def test_build_cos_from_strings(kr_json_serialiser, en_sm_spacy_model, american_
     )
 
     assert len(test_cos) == 8
+
+def test_build_cos_index_from_strings(kr_json_serialiser, en_sm_spacy_model, american_cheesy_pizza_doc) -> None:
+    corpus_occ_texts = ["pizza", "american", "margherita"]
+
+    cos_index = kr_json_serialiser.build_cos_index_from_strings(
+        co_texts=corpus_occ_texts,
+        spacy_model=en_sm_spacy_model,
+        docs=[american_cheesy_pizza_doc]
+    )
+
+    assert set(cos_index) == set(corpus_occ_texts)
+    assert cos_index["margherita"] == set()
+    for co_text in corpus_occ_texts:
+        assert cos_index[co_text] == kr_json_serialiser.build_cos_from_strings(
+            co_texts=[co_text],
+            spacy_model=en_sm_spacy_model,
+            docs=[american_cheesy_pizza_doc]
+        )
+
+def test_load_concepts_from_json_with_cos_index(kr_json_serialiser, kr_json, american_pizza_pipeline) -> None:
+    cos_index = kr_json_serialiser.build_cos_index_from_strings(
+        co_texts=kr_json_serialiser.get_co_texts_from_json(
+            kr_json["concepts"], kr_json["relations"], kr_json["metarelations"]
+        ),
+        spacy_model=american_pizza_pipeline.spacy_model,
+        docs=american_pizza_pipeline.corpus
+    )
+
+    indexed_concepts = kr_json_serialiser.load_concepts_from_json(
+        concepts_json=kr_json["concepts"],
+        concepts_idx={},
+        pipeline=american_pizza_pipeline,
+        cos_index=cos_index
+    )
+    concepts = kr_json_serialiser.load_concepts_from_json(
+        concepts_json=kr_json["concepts"],
+        concepts_idx={},
+        pipeline=american_pizza_pipeline
+    )
+
+    def concept_cos(concepts):
+        return {
+            (lr.label, frozenset((co.doc, co.start, co.end) for co in lr.corpus_occurrences))
+            for concept in concepts
+            for lr in concept.linguistic_realisations
+        }
+
+    assert concept_cos(indexed_concepts) == concept_cos(concepts)
+
+def kr_corpus_occurrences(kr) -> set:
+    return {
+        (kr_element.label, lr.label, frozenset((id(co.doc), co.start, co.end) for co in lr.corpus_occurrences))
+        for kr_element in kr.concepts | kr.relations | kr.metarelations
+        for lr in kr_element.linguistic_realisations
+    }
+
+@pytest.mark.parametrize("kr_serialiser", [KRJSONSerialiser(), KRMsgpackSerialiser()])
+def test_serialise_load_offsets(kr_serialiser, american_pizza_ex_kr, en_sm_spacy_model, american_cheesy_pizza_doc) -> None:
+    pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=[american_cheesy_pizza_doc])
+
+    with tempfile.TemporaryDirectory() as newpath:
+        test_kr_file_path = os.path.join(newpath, "test_kr_serialisation")
+        kr_serialiser.serialise(kr=american_pizza_ex_kr, file_path=test_kr_file_path)
+        kr_serialisation = kr_serialiser._read_kr_json(test_kr_file_path)
+        kr_serialiser.load(pipeline=pipeline, file_path=test_kr_file_path)
+
+    assert kr_serialisation["format_version"] == KR_FORMAT_VERSION
+    assert kr_serialisation["corpus_fingerprint"] == kr_serialiser.get_corpus_fingerprint([american_cheesy_pizza_doc])
+    assert kr_corpus_occurrences(pipeline.kr) == kr_corpus_occurrences(american_pizza_ex_kr)
+
+def test_get_docs_from_fingerprint(kr_json_serialiser, en_sm_spacy_model, american_cheesy_pizza_doc) -> None:
+    other_doc = en_sm_spacy_model("A margherita pizza.")
+    same_text_doc = en_sm_spacy_model(american_cheesy_pizza_doc.text)
+    corpus_fingerprint = kr_json_serialiser.get_corpus_fingerprint([same_text_doc, american_cheesy_pizza_doc])
+
+    docs = kr_json_serialiser.get_docs_from_fingerprint(
+        corpus_fingerprint, [american_cheesy_pizza_doc, other_doc, same_text_doc]
+    )
+
+    assert docs == [american_cheesy_pizza_doc, same_text_doc]
+    assert kr_json_serialiser.get_docs_from_fingerprint(corpus_fingerprint, [other_doc, same_text_doc]) is None
+
+def test_jsonl_serialise_load(american_pizza_ex_kr, en_sm_spacy_model, american_cheesy_pizza_doc) -> None:
+    kr_serialiser = KRJSONLinesSerialiser()
+    rdf_graph = Graph()
+    rdf_graph.add((URIRef("http://www.example.org/pizza"), RDFS.label, Literal("Pizza")))
+    kr = KnowledgeRepresentation(
+        concepts=american_pizza_ex_kr.concepts,
+        relations=american_pizza_ex_kr.relations,
+        metarelations=american_pizza_ex_kr.metarelations,
+        rdf_graph=rdf_graph
+    )
+    pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=[american_cheesy_pizza_doc])
+
+    with tempfile.TemporaryDirectory() as newpath:
+        test_kr_file_path = os.path.join(newpath, "test_kr_serialisation.jsonl")
+        kr_serialiser.serialise(kr=kr, file_path=test_kr_file_path)
+        kr_lines = list(srsly.read_jsonl(test_kr_file_path))
+        kr_serialiser.load(pipeline=pipeline, file_path=test_kr_file_path)
+
+    assert kr_lines[0]["type"] == "header"
+    assert kr_lines[0]["rdf_graph"] == "test_kr_serialisation.ttl"
+    assert len(kr_lines) == 1 + len(kr.concepts) + len(kr.relations) + len(kr.metarelations)
+    assert kr_corpus_occurrences(pipeline.kr) == kr_corpus_occurrences(kr)
+    assert len(pipeline.kr.rdf_graph) == 1
+
+def test_jsonl_load_other_corpus(american_pizza_ex_kr, en_sm_spacy_model, american_cheesy_pizza_text) -> None:
+    kr_serialiser = KRJSONLinesSerialiser()
+    other_doc = en_sm_spacy_model(american_cheesy_pizza_text + " Pizza is great.")
+    pipeline = Pipeline(spacy_model=en_sm_spacy_model, corpus=[other_doc])
+
+    with tempfile.TemporaryDirectory() as newpath:
+        test_kr_file_path = os.path.join(newpath, "test_kr_serialisation.jsonl")
+        kr_serialiser.serialise(kr=american_pizza_ex_kr, file_path=test_kr_file_path)
+        kr_serialiser.load(pipeline=pipeline, file_path=test_kr_file_path)
+
+    assert len(pipeline.kr.concepts) == len(american_pizza_ex_kr.concepts)
+    concepts_cos = [
+        co
+        for concept in pipeline.kr.concepts
+        for lr in concept.linguistic_realisations
+        for co in lr.corpus_occurrences
+    ]
+    assert len(concepts_cos)
+    assert all(co.doc is other_doc for co in concepts_cos)